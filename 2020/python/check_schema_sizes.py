@@ -0,0 +1,90 @@
+#This script checks that generating LAR rows does not change the valid values of the LAR and TS schemas.
+#lar_gen once appended range values to the schema lists it returned, so each generated row grew the lists and
+#slowed generation. The script records the number of valid values of every schema field, generates rows with
+#make_row, make_rows and range_and_enum, and exits with an error if any count changed.
+
+import argparse
+import json
+import sys
+
+import yaml
+
+from geo_index import geo_index
+import lar_generator
+import utils
+
+
+def schema_sizes(lar_gen):
+	"""
+	Returns a dictionary of (schema, field) to the number of valid values in the schema dataframe and in the lists
+	returned by get_schema_list without and with a blank.
+	"""
+	sizes = {}
+	for schema, schema_df in (("LAR", lar_gen.lar_schema_df), ("TS", lar_gen.ts_schema_df)):
+		for field, valid_vals in zip(schema_df.field, schema_df.valid_vals):
+			sizes[(schema, field)] = (len(valid_vals), len(lar_gen.get_schema_list(schema=schema, field=field)),
+				len(lar_gen.get_schema_list(schema=schema, field=field, empty=True)))
+	return sizes
+
+def main(rows=100000, batch_rows=10000):
+	#load configurations
+	config_file = 'configurations/clean_file_config.yaml'
+	bank_config = 'configurations/bank1_config.yaml'
+	geo_config_file = 'configurations/geographic_data.yaml'
+	filepaths_file = 'configurations/test_filepaths.yaml'
+	lar_schema_file = "../schemas/lar_schema.json"
+	ts_schema_file = "../schemas/ts_schema.json"
+
+	with open(config_file, 'r') as f:
+		lar_file_config_data = yaml.safe_load(f)
+
+	with open(bank_config, 'r') as f:
+		bank_config_data = yaml.safe_load(f)
+
+	with open(geo_config_file, 'r') as f:
+		geo_config = yaml.safe_load(f)
+
+	with open(filepaths_file, 'r') as f:
+		filepaths = yaml.safe_load(f)
+
+	with open(geo_config["zip_code_file"], 'r') as f:
+		zip_codes = json.load(f)
+	zip_codes.append("Exempt")
+
+	geographic_data = utils.load_census_data(geo_config['geographic_data_file'], geo_config['file_columns'],
+		cache_dir=filepaths["census_cache_filepath"])
+	geo = geo_index(geographic_data)
+
+	lar_gen = lar_generator.lar_gen(lar_schema_file=lar_schema_file, ts_schema_file=ts_schema_file)
+	lar_file_config_data["lei"]["value"] = bank_config_data["lei"]["value"]
+
+	sizes = schema_sizes(lar_gen)
+	print("generating", rows, "rows with make_row")
+	for i in range(rows):
+		lar_gen.make_row(lar_file_config=lar_file_config_data, geographic_data=geo,
+			state_codes=geo_config["state_codes_rev"], zip_code_list=zip_codes)
+		if i % batch_rows == 0:
+			print("row", i)
+			#range_and_enum returns new lists that callers may change
+			for field in lar_gen.lar_schema_df.field:
+				lar_gen.range_and_enum(field=field, rng_max=3, empty=True).append("changed")
+	print("generating", rows, "rows with make_rows")
+	for start in range(0, rows, batch_rows):
+		lar_gen.make_rows(min(batch_rows, rows - start), lar_file_config_data, geo, geo_config["state_codes_rev"], zip_codes)
+
+	new_sizes = schema_sizes(lar_gen)
+	changed = {key: (size, new_sizes[key]) for key, size in sizes.items() if new_sizes[key] != size}
+	for (schema, field), (before, after) in sorted(changed.items()):
+		print("{schema} {field}: valid value counts {before} before and {after} after generating rows".format(
+			schema=schema, field=field, before=before, after=after))
+	if changed:
+		print(len(changed), "schema fields changed")
+		return 1
+	print("valid value counts of", len(sizes), "schema fields unchanged after", rows, "rows")
+	return 0
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Checks that generating LAR rows does not change the schema valid values.")
+	parser.add_argument("--rows", type=int, default=100000, help="number of rows generated with each of make_row and make_rows")
+	args = parser.parse_args()
+	sys.exit(main(rows=args.rows))
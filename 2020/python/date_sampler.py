@@ -0,0 +1,91 @@
+#This file contains the date_sampler class used by the LAR generator to draw YYYYMMDD dates in an activity year.
+#Dates are drawn as day ordinals (days after January 1st) so every draw is a valid date, and the date strings for the
+#year are built once so a batch of dates is a single array lookup.
+
+import bisect
+import random
+
+import numpy as np
+
+
+class date_sampler(object):
+	"""
+	Draws valid and invalid YYYYMMDD date strings for an activity year.
+	activity_year: the year of the dates drawn
+	profile: optional list of 12 weights, one per month, giving the relative weight of each day in the month.
+		If None every day of the year is equally likely.
+	"""
+
+	def __init__(self, activity_year, profile=None):
+		self.activity_year = int(activity_year)
+		first_day = np.datetime64("{year}-01-01".format(year=self.activity_year), "D")
+		self.days = int((np.datetime64("{year}-01-01".format(year=self.activity_year + 1), "D") - first_day).astype(int))
+		dates = first_day + np.arange(self.days)
+		self.date_strings = np.char.replace(np.datetime_as_string(dates), "-", "").astype(object) #date of each ordinal
+		self.months = dates.astype("datetime64[M]").astype(int) % 12 + 1 #month number of each ordinal
+		self.month_lengths = np.bincount(self.months, minlength=13) #days in each month, indexed by month number
+		self.day_weights = None
+		self.cum_weights = None
+		if profile is not None:
+			if len(profile) != 12:
+				raise ValueError("date profile must have 12 monthly weights, got {count}".format(count=len(profile)))
+			weights = np.asarray(profile, dtype=float)[self.months - 1]
+			self.day_weights = weights / weights.sum()
+			self.cum_weights = list(np.cumsum(weights))
+
+	def ordinals(self, rng, num_rows):
+		"""Returns an array of num_rows day ordinals drawn with the numpy Generator rng."""
+		if self.day_weights is None:
+			return rng.integers(0, self.days, size=num_rows)
+		return rng.choice(self.days, size=num_rows, p=self.day_weights)
+
+	def ordinal(self):
+		"""Returns one day ordinal drawn with the random module."""
+		if self.cum_weights is None:
+			return random.randrange(self.days)
+		return min(bisect.bisect(self.cum_weights, random.random() * self.cum_weights[-1]), self.days - 1)
+
+	def choice(self):
+		"""Returns one valid date string drawn with the random module."""
+		return self.date_strings[self.ordinal()]
+
+	def choice_pair(self):
+		"""Returns a pair of valid date strings drawn with the random module, with the first on or before the second."""
+		first, second = sorted((self.ordinal(), self.ordinal()))
+		return self.date_strings[first], self.date_strings[second]
+
+	def sample(self, rng, num_rows):
+		"""Returns an object array of num_rows valid date strings drawn with the numpy Generator rng."""
+		return self.date_strings[self.ordinals(rng, num_rows)]
+
+	def sample_pair(self, rng, num_rows):
+		"""
+		Returns two object arrays of num_rows valid date strings, such as application and action dates.
+		Two days are drawn for each row and the earlier is returned in the first array, so each first date is on
+		or before the second date of its row.
+		"""
+		days = np.sort(np.stack((self.ordinals(rng, num_rows), self.ordinals(rng, num_rows))), axis=0)
+		return self.date_strings[days[0]], self.date_strings[days[1]]
+
+	def invalid_sample(self, rng, num_rows):
+		"""
+		Returns an object array of num_rows date strings in the activity year that are not valid dates.
+		Half of the dates have a month of 00 or 13 to 99, the other half have a day of 00 or past the end of the month.
+		"""
+		months = self.months[self.ordinals(rng, num_rows)]
+		bad_month = rng.random(num_rows) < 0.5
+		days = np.where(bad_month, rng.integers(1, self.month_lengths[months] + 1),
+			rng.integers(self.month_lengths[months] + 1, 101) % 100)
+		months = np.where(bad_month, rng.integers(13, 101, size=num_rows) % 100, months)
+		return np.array(["{year}{month:02d}{day:02d}".format(year=self.activity_year, month=month, day=day)
+			for month, day in zip(months, days)], dtype=object)
+
+	def invalid_choice(self):
+		"""Returns one date string in the activity year that is not a valid date, drawn with the random module."""
+		month = self.months[self.ordinal()]
+		if random.random() < 0.5:
+			day = random.randint(1, self.month_lengths[month])
+			month = random.randint(13, 100) % 100
+		else:
+			day = random.randint(self.month_lengths[month] + 1, 100) % 100
+		return "{year}{month:02d}{day:02d}".format(year=self.activity_year, month=month, day=day)
@@ -15,7 +15,9 @@ import yaml
 
 #Edit report configurations are located in configurations/edit_report_config.yaml
 import lar_generator
+from result_cache import result_cache, edit_rules_version
 from rules_engine import rules_engine
+import utils
 
 pd.options.display.max_columns = 999
 pd.options.display.max_rows = 999
@@ -73,12 +75,9 @@ zip_codes.append("Exempt")
 # In[4]:
 
 
-geographic_data = pd.read_csv(geo_config['geographic_data_file'], delimiter='|', header=0,
-	names=geo_config['file_columns'], dtype=object) #instantiate Census file data as dataframe
-
-#create 11 digit Census Tract codes from 5 digit county and 6 digit tract
-geographic_data['county_fips'] = geographic_data.apply(lambda x: str(x.state_code) + str(x.county), axis=1)
-geographic_data["tract_fips"] = geographic_data.apply(lambda x: str(x.county_fips) + str(x.tracts), axis=1)
+#instantiate Census file data as dataframe with 5 digit county and 11 digit tract codes
+geographic_data = utils.load_census_data(geo_config['geographic_data_file'], geo_config['file_columns'],
+	cache_dir=filepaths["census_cache_filepath"])
 
 with open(geo_config["zip_code_file"], 'r') as f: 
 	zip_codes = json.load(f)
@@ -92,6 +91,10 @@ lar_gen = lar_generator.lar_gen(lar_schema_file=lar_schema_file, ts_schema_file=
 rules_engine = rules_engine(config_data=lar_file_config_data, state_codes=geo_config["state_codes"], state_codes_rev=geo_config["state_codes_rev"],
 	geographic_data=geographic_data, full_lar_file_check=False)
 
+#cache of edit report results for files that have not changed since they were last checked
+cache = result_cache(filepaths["result_cache_filepath"], edit_rules_version([lar_config_file, geo_config_file, 
+	lar_schema_file, ts_schema_file], data_files=[geo_config['geographic_data_file']]))
+
 
 # In[5]:
 
@@ -141,27 +144,39 @@ def get_file_names(filepaths):
     return file_names
 
 def generate_edit_report(file_list, save_name, edits_list=["s","v","q","m"], save_path=edit_report_path, 
-                         save_report=True):
+                         save_report=True, cache=cache):
     """
     file_list: list of files to check against rules engine
     edits_list: list of edit types to check options are s, v, q, m
+    cache: result_cache used to skip files that have not changed, or None to check all files
     """
     #set up data frame seed for edit report to use as a base for concatenation
     report_df = pd.DataFrame([], columns=['file_name', 'edit_name', 'row_type', 'field', 'fail_count', 'failed_rows', "file_edit_name"], index=[0])
     for file in file_list: #iterate over clean test files and create report results for each
-        rules_engine.reset_results() #clear previous edit report results
-        #print(file) #display current working file
-        ts_df, lar_df = rules_engine.split_ts_row(file) #split TS row from LAR data for dataframe usage
-        #load current file data to rules engine to create edit report
-        rules_engine.load_ts_data(ts_df)
-        rules_engine.load_lar_data(lar_df)
-        #generate edit report
-        new_results_df = rules_engine.create_edit_report(edits_list)
+        results = None
+        if cache is not None:
+            key = cache.key(file, edits_list)
+            results = cache.get(key)
+        if results is None:
+            rules_engine.reset_results() #clear previous edit report results
+            #print(file) #display current working file
+            ts_df, lar_df = rules_engine.split_ts_row(file) #split TS row from LAR data for dataframe usage
+            #load current file data to rules engine to create edit report
+            rules_engine.load_ts_data(ts_df)
+            rules_engine.load_lar_data(lar_df)
+            #generate edit report
+            rules_engine.create_edit_report(edits_list)
+            results = rules_engine.results
+            if cache is not None:
+                cache.put(key, results)
+        new_results_df = pd.DataFrame(results)
         new_results_df["file_name"] = file #label file_name in report
         new_results_df["file_edit_name"] = new_results_df.file_name.apply(lambda x: x.split("/")[-1].split("_")[-1].replace(".txt",""))
         report_df = pd.concat([report_df, new_results_df])
         report_df.reset_index(drop=True, inplace=True)
         report_df.drop(0, inplace=True)
+    if cache is not None:
+        cache.print_stats()
     if save_report:
         if not os.path.exists(save_path):
             os.makedirs(save_path)
@@ -0,0 +1,91 @@
+#This file contains the registry used to declare numbered HMDA edit functions (for example s300_1, v628_3, q601 or m646)
+#along with the metadata that describes each edit.
+#Classes register their edit functions with a decorator when the module is imported so that callers can select
+#edits from the registry instead of scanning dir(self) for function names.
+
+from collections import OrderedDict, namedtuple
+
+#fields value for edits that read every field in the LAR row (for example s305 duplicate rows)
+ALL_FIELDS = "all"
+
+edit_meta = namedtuple("edit_meta", ["edit_id", "edit_type", "row_type", "fields", "file_level"])
+
+
+def is_edit_name(name):
+	"""Returns True if the passed name is a numbered syntax, validity, quality or macro edit name"""
+	return name[:1] in ("s", "v", "q", "m") and name[1:4].isdigit()
+
+
+class edit_registry(object):
+	"""
+	Holds the edit functions declared for a class and the metadata for each edit:
+	edit_id: the function name, for example v628_3
+	edit_type: s (syntax), v (validity), q (quality) or m (macro)
+	row_type: the data the edit reads: TS, LAR or TS/LAR
+	fields: tuple of LAR fields read by the edit, or ALL_FIELDS if the edit reads the full LAR row
+	file_level: True if the edit compares rows across the whole file (duplicates, row counts and macro ratios)
+		and cannot be run on part of a file at a time
+	"""
+
+	def __init__(self):
+		self.edits = OrderedDict()
+
+	def register(self, row_type="LAR", fields=(), edit_type=None, file_level=False):
+		"""
+		Decorator that adds an edit function to the registry. The edit id is the function name.
+		The edit type defaults to the first letter of the edit id.
+		"""
+		def decorator(func):
+			edit_id = func.__name__
+			if not is_edit_name(edit_id):
+				raise ValueError("{name} is not a numbered edit name".format(name=edit_id))
+			if fields == ALL_FIELDS:
+				edit_fields = ALL_FIELDS
+			else:
+				edit_fields = tuple(fields)
+			self.edits[edit_id] = edit_meta(edit_id=edit_id, edit_type=edit_type or edit_id[:1], row_type=row_type,
+				fields=edit_fields, file_level=file_level)
+			return func
+		return decorator
+
+	def __contains__(self, edit_id):
+		return edit_id in self.edits
+
+	def __getitem__(self, edit_id):
+		return self.edits[edit_id]
+
+	def __len__(self):
+		return len(self.edits)
+
+	def select(self, edit_types=None, row_types=None, edit_ids=None, file_level=None):
+		"""
+		Returns a list of registered edit ids filtered by edit type, row type, edit id and file level flag.
+		Filters left as None are not applied.
+		Edit ids are returned in name order, matching the order edits were run in when they were found with dir().
+		"""
+		selected = []
+		for edit_id in sorted(self.edits):
+			meta = self.edits[edit_id]
+			if edit_types is not None and meta.edit_type not in edit_types:
+				continue
+			if row_types is not None and meta.row_type not in row_types:
+				continue
+			if edit_ids is not None and edit_id not in edit_ids:
+				continue
+			if file_level is not None and meta.file_level != file_level:
+				continue
+			selected.append(edit_id)
+		return selected
+
+	def fields_for(self, edit_ids):
+		"""
+		Returns the set of LAR fields read by the passed edits.
+		Returns ALL_FIELDS if any of the edits reads the full LAR row.
+		"""
+		fields = set()
+		for edit_id in edit_ids:
+			meta = self.edits[edit_id]
+			if meta.fields == ALL_FIELDS:
+				return ALL_FIELDS
+			fields.update(meta.fields)
+		return fields
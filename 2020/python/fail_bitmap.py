@@ -0,0 +1,86 @@
+#This file contains the fail_bitmap class used to record which LAR rows failed each edit run by the rules engine.
+#Each edit is a row of bits, one bit per LAR row, packed with numpy so that the rows failing any of a set of edits
+#are found with a single bitwise or across the selected edits.
+
+import numpy as np
+
+
+class fail_bitmap(object):
+	"""
+	Packed boolean matrix of edits (matrix rows) by LAR rows (bits).
+	row_count: number of LAR rows in the checked data
+	ulis: optional array of the ULIs of the LAR rows, saved with the matrix for later analysis
+	"""
+
+	def __init__(self, row_count, ulis=None):
+		self.row_count = row_count
+		self.ulis = ulis
+		self.edits = [] #edit names in the order they were added
+		self.edit_rows = {} #edit name to position in self.packed_rows
+		self.packed_rows = [] #packed fail bits for each edit
+
+	def __len__(self):
+		return len(self.edits)
+
+	def add(self, edit, fail_rows):
+		"""
+		Marks the LAR rows at the positions in fail_rows as failing the edit.
+		Rows are added to any rows already marked for the edit.
+		"""
+		bits = np.zeros(self.row_count, dtype=bool)
+		bits[fail_rows] = True
+		self.add_packed(edit, np.packbits(bits))
+
+	def add_packed(self, edit, packed):
+		"""Adds a packed row of fail bits for the edit, for example one returned by packed_row from another bitmap."""
+		if edit in self.edit_rows:
+			self.packed_rows[self.edit_rows[edit]] = self.packed_rows[self.edit_rows[edit]] | packed
+		else:
+			self.edit_rows[edit] = len(self.edits)
+			self.edits.append(edit)
+			self.packed_rows.append(packed)
+
+	def packed_row(self, edit):
+		"""Returns the packed fail bits for the edit."""
+		return self.packed_rows[self.edit_rows[edit]]
+
+	def matrix(self, edits=None):
+		"""
+		Returns the packed matrix as a uint8 array of shape (edits, ceil(row_count/8)), for the passed edits
+		or all edits if None. Edits that were not run are skipped.
+		"""
+		if edits is None:
+			edits = self.edits
+		rows = [self.packed_row(edit) for edit in edits if edit in self.edit_rows]
+		if not rows:
+			return np.zeros((0, (self.row_count + 7) // 8), dtype=np.uint8)
+		return np.vstack(rows)
+
+	def rows_failing(self, edits=None):
+		"""
+		Returns a boolean array over the LAR rows that is True for rows failing any of the passed edits
+		(all edits if None).
+		"""
+		packed = np.bitwise_or.reduce(self.matrix(edits), axis=0)
+		return np.unpackbits(packed, count=self.row_count).astype(bool)
+
+	def fail_counts(self):
+		"""Returns a dictionary of edit name to the number of LAR rows failing the edit."""
+		return {edit: int(np.unpackbits(self.packed_row(edit), count=self.row_count).sum()) for edit in self.edits}
+
+	def save(self, path):
+		"""Saves the matrix, edit names, row count and ULIs (if present) to a compressed numpy .npz file."""
+		arrays = {"bits": self.matrix(), "edits": np.array(self.edits, dtype=str), "row_count": np.array(self.row_count)}
+		if self.ulis is not None:
+			arrays["ulis"] = np.asarray(self.ulis, dtype=str)
+		np.savez_compressed(path, **arrays)
+
+	@classmethod
+	def load(cls, path):
+		"""Loads a bitmap saved with save."""
+		with np.load(path) as data:
+			ulis = data["ulis"] if "ulis" in data.files else None
+			bitmap = cls(int(data["row_count"]), ulis=ulis)
+			for edit, packed in zip(data["edits"], data["bits"]):
+				bitmap.add_packed(str(edit), packed)
+		return bitmap
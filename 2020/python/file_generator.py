@@ -7,8 +7,10 @@ import pandas as pd
 import numpy as np
 import yaml
 
+from geo_index import geo_index
 import lar_constraints
 import lar_generator
+from row_validator import row_validator
 from rules_engine import rules_engine
 from test_file_generator import test_data
 import utils
@@ -30,9 +32,6 @@ class FileGenerator(object):
 			# Uses safe_load instead of load.
 			self.geographic = yaml.safe_load(f) 
 
-		with open(self.geographic["geographic_data_file"]) as f:
-			self.geo_data = yaml.safe_load(f)
-
 		#Loads the clean file configuration. 
 		with open(clean_file_config) as f:
 			# Uses safe_load instead of load.
@@ -58,13 +57,12 @@ class FileGenerator(object):
 		#Loads geographic geographic data from filepaths named in the test_filepaths
 		#yaml file. 
 		print("loading geo data to file generator")
-		self.geographic_data = pd.read_csv(self.geographic['geographic_data_file'], delimiter='|', header=None, 
-			names=self.geographic['file_columns'], dtype=object)
-		#create 5 digit County Codes from 2 digit state and 3 digit county
-		self.geographic_data['county_fips'] = self.geographic_data.apply(lambda x: str(x.state_code) + str(x.county), axis=1)
-		#create 11 digit Census Tract codes from 5 digit county and 6 digit tract
-		self.geographic_data["tract_fips"] = self.geographic_data.apply(lambda x: str(x.county_fips) + str(x.tracts), axis=1)
-		self.small_counties = list(self.geographic_data.county_fips[self.geographic_data.small_county=="S"])
+		#census data with 5 digit County Codes and 11 digit Census Tract codes
+		self.geographic_data = utils.load_census_data(self.geographic['geographic_data_file'],
+			self.geographic['file_columns'], header=None, cache_dir=self.filepaths["census_cache_filepath"])
+		#small and big counties are classified by geo_index, as in the rules engine and test file creator
+		self.geo = geo_index(self.geographic_data)
+		self.small_counties = self.geo.small_counties
 		print("geo data loaded to file generator")
 		#Loads schemas for LAR and TS.
 		#Schemas contain valid enumerations, including NA values, for each field in the dataset. 
@@ -84,15 +82,14 @@ class FileGenerator(object):
 		print("lar constraints loading")
 		self.lar_const = lar_constraints.lar_constraints() 
 		print("lar constraints loaded")
-		self.constraints = []
-		for func in dir(self.lar_const):
-			if func[:1] in ("s", "v") and func[1:4].isdigit()==True:
-				self.constraints.append(func)
+		self.constraints = self.lar_const.registry.select(edit_types=("s", "v"))
 		#lar_validator checks a dataframe and returns a JSON with 
 		#edit pass/fail results. 
 		print("rules engine loading")
-		self.lar_validator = rules_engine(geo_config_file=self.geo_config_file)
-					#tracts=tracts, counties=counties, small_counties=small_counties) 
+		self.lar_validator = rules_engine(config_data=self.clean_config, state_codes=self.geographic["state_codes"],
+			state_codes_rev=self.geographic["state_codes_rev"], geographic_data=self.geo)
+		#row_checker checks single LAR rows, as dictionaries, with the row level edits of the rules engine
+		self.row_checker = row_validator(self.lar_validator)
 
 		print("rules engine loaded")
 		print("file generator initialization complete")
@@ -101,25 +98,12 @@ class FileGenerator(object):
 	def validation(self, row, ts_row):
 		"""
 		Applies the syntax and validity rules engine logic 
-		to the LAR row to create an edit report.
+		to the LAR row and returns the list of failed edits.
 		"""
 
-		#Creates dataframes of LAR and TS data. 
-		lar_data = pd.DataFrame(row, index=[1])
-		ts_data = pd.DataFrame(ts_row, index=[0])
-
-		#Instantiates a rules checker to check the row against edits in the rules engine. 
-		#Loads LAR and TS data to the rules engine to validate LAR data and return an edit report
-		self.lar_validator.load_lar_data(lar_data)
-		self.lar_validator.load_ts_data(ts_data)
-
-		#Runs the edits against the LAR row and produces edit check results. 
-		for func in dir(self.lar_validator):
-			if func[:1] in ("s", "v") and func[1:4].isdigit()==True:
-				getattr(self.lar_validator, func)(row)
-		
-		#Returns edit check results. 
-		return self.lar_validator.results
+		#Checks the LAR row against the row level edits without building a dataframe.
+		self.row_checker.load_ts_row(ts_row)
+		return self.row_checker.failed_edits(row, edit_types=("s", "v"))
 
 	def make_clean_lar_row(self, ts_row):
 		"""Uses the lar_gen object and a TS row to create a LAR row that 
@@ -144,25 +128,23 @@ class FileGenerator(object):
 			#this helps troubleshoot where lar generation gets stuck
 			row_base = row.copy() 
 			
-			#Creates an edit report based on the validation.
-			res = pd.DataFrame(self.validation(row, ts_row))
+			#Creates a list of failed edits based on the validation.
+			failed_edits = self.validation(row, ts_row)
 			
 			#debugging print section
 			print("*"*25)
 			print("iterations:", iters)
-			#print(logging.info(res[res.status=="failed"]))
-			print(len(res[res.status=="failed"]), "row fails")
-			#print((res[res.status=="failed"]))
-			#print(res)
+			print(len(failed_edits), "row fails")
+			#print(failed_edits)
 
 			#If there are no syntax or validity edits present, the stop condition is invoked and the row is returned
 			#and added to the LAR dataset 
 
-			if len(res[res.status=="failed"])<=0:
+			if len(failed_edits)<=0:
 				stop = True
 			else:
 				#Logs the results of edits that have failed. 
-				logging.info(res[res.status=="failed"]) 
+				logging.info(failed_edits) 
 				message = "\nstarting constraints iteration {iter}".format(iter=iters)
 				logging.info(message)
 				
@@ -246,14 +228,11 @@ class FileGenerator(object):
 			#Generates a file for each edit function in file maker. 
 			edits = []
 			
-			#Loops over all data modification functions. 
-			for func in dir(file_maker): 
-
-				#Checks if function is a numbered syntax or validity edit.
-				if func[:1] in ("s", "v", "q") and func[1:4].isdigit()==True: 
-					print("applying:", func)
-					#Applies data modification functions and produces files.
-					getattr(file_maker, func)()
+			#Loops over all numbered syntax, validity, and quality data modification functions. 
+			for func in file_maker.test_file_funcs: 
+				print("applying:", func)
+				#Applies data modification functions and produces files.
+				getattr(file_maker, func)()
 
 
 	def validate_quality_edit_file(self, quality_filename):
@@ -275,9 +254,8 @@ class FileGenerator(object):
 		"""
 
 		try: 
-			#Instantiates an edit checker object with rules_engine.
-			checker = rules_engine(lar_schema=self.lar_schema_df, 
-				ts_schema=self.ts_schema_df, geographic_data=self.geographic_data)
+			#Uses the rules engine loaded at initialization as the edit checker.
+			checker = self.lar_validator
 
 			#Reads the files and separates data into TS and LAR frames.
 			ts_df, lar_df = utils.read_data_file(
@@ -288,24 +266,20 @@ class FileGenerator(object):
 			original_length = len(lar_df.index)
 
 			#Loads data into the checker object. 
-			checker.load_data_frames(ts_df, lar_df)
+			checker.load_ts_data(ts_df)
+			checker.load_lar_data(lar_df)
+			checker.reset_results()
 
-			#Produces a report as to which syntax or validity
-			#edits have passed or failed based on logic in the rules_engine.
-			for func in dir(checker):
-				if func[:1] in ("s", "v") and func[1:4].isdigit()==True:
-					getattr(checker, func)()
+			#Runs the syntax and validity edits in the rules_engine, marking
+			#the LAR rows that fail them. 
+			for func in checker.registry.select(edit_types=("s", "v")):
+				getattr(checker, func)()
 			
-			#Creates a results dataframe and keeps the results that 
-			#have failed. 
-			report_df = pd.DataFrame(checker.results)
-			report_df = report_df[(report_df['status']=='failed')]
-
-			# The function ignores TS edits and drops results related
-			# to edit fails from the TS.  
-			report_df = report_df[report_df['row_ids'] != 'TS']
+			#Rows that failed any syntax or validity edit. The function ignores 
+			#TS edits and edit fails reported against the TS. 
+			bad_rows = checker.rows_failing(edit_types=["s", "v"])
 
-			if len(report_df) == 0:
+			if not bad_rows.any():
 				#If there are no syntax or validity edits
 				#the data is written to a new directory for quality 
 				#test files that pass syntax and validity edits. 
@@ -319,42 +293,9 @@ class FileGenerator(object):
 			#The case if there are rows that failed syntax or validity edits.
 			
 			else: 
-				#Creates an empty list for storing row numbers
-				#where edits have failed. 
-				uli_list = []
-
-				#Iterates through each row and appends the list of ULI's
-				#of rows where syntax or validity edits have failed. 
-				for index, row in report_df.iterrows():
-					uli_list.append(row.row_ids)
-
-				#Drops not-a-numbers from the ULI list. 
-				if np.nan in uli_list:
-					uli_list.remove(np.nan)
-
-				#Creates a new list to store the ULI's without nested brackets. 
-				new_list = []
-				for i in range(len(uli_list)):
-					for n in range(len(uli_list[i])):
-						new_list.append(uli_list[i][n])
-
-				#Creates a list that removes ULI's that are repeated. 
-				unique_uli_list = []
-				for i in new_list:
-					if i not in unique_uli_list:
-						unique_uli_list.append(i)
-
-				#Creates a list of row numbers corresponding to the
-				#ULI's that have failed syntax or validity edits. 
-				bad_rows = []
-				for index, row in lar_df.iterrows():
-					if row['uli'] in unique_uli_list:
-						failed_uli = row['uli']
-						bad_rows.append(lar_df[lar_df['uli']==failed_uli].index.values.astype(int)[0])
-
 				#Drops all rows that failed syntax or validity edits
 				#from the original LAR dataframe. 
-				lar_df = lar_df.drop(bad_rows)
+				lar_df = lar_df[~bad_rows]
 
 				#Creates new lar rows to the original length of the file
 				#using the utils new lar rows function. 
@@ -404,9 +345,8 @@ class FileGenerator(object):
 
 		#Applies each function in the rules engine that checks for edits
 		#and creates a results list of edits failed or passed. 
-		for func in dir(checker):
-			if func[:1] in ("s", "v", "q") and func[1:4].isdigit()==True:
-				getattr(checker, func)()
+		for func in checker.registry.select(edit_types=("s", "v", "q")):
+			getattr(checker, func)()
 
 		#Creates a dataframe of results from the checker. 
 		report_df = pd.DataFrame(checker.results)
@@ -446,68 +386,25 @@ class FileGenerator(object):
 		for key, value in dictionary.items():
 			lar_df[key] = value
 
-		checker = rules_engine(lar_schema=self.lar_schema_df, 
-					ts_schema=self.ts_schema_df, 
-					geographic_data=self.geographic_data)
+		checker = self.lar_validator
 
-		#Produces a report as to which syntax or validity
-		#edits have passed or failed based on logic in the rules_engine.
 		#Loads the TS and LAR dataframes into the checker object. 
-
-		checker.load_data_frames(ts_df, lar_df)
-
-		for func in dir(checker):
-			if func[:1] in ("s", "v") and func[1:4].isdigit()==True:
-				getattr(checker, func)()
-
-	
-		#Produces a report as to which syntax or validity
-		#edits have passed or failed based on logic in the rules_engine.
-		for func in dir(checker):
-			if func[:1] in ("s", "v") and func[1:4].isdigit()==True:
-				getattr(checker, func)()
-		
-		#Creates a results dataframe and keeps the results that 
-		#have failed. 
-		report_df = pd.DataFrame(checker.results)
-		report_df = report_df[(report_df['status']=='failed')].copy()
-
-		# The function ignores TS edits and drops results related
-		# to edit fails from the TS.  
-		report_df = report_df[report_df['row_ids'] != 'TS']
-
-		if len(report_df) == 0:
-			#If there are no syntax or validity edits
-			#the data is written to a new directory for quality 
-			#test files that pass syntax and validity edits. 
-
-			#Takes the first row of data. 
-			lar_row = lar_df[0:1]
-
-		#The case if there are rows that failed syntax or validity edits.
-		
-		else: 
-			#Creates a list of ULI's corresponding to rows where 
-			#syntax or validity edits have failed. 
-
-			#The resulting list is a list of lists, a list of ulis failed for each
-			#edit failed. 
-			uli_list = list(report_df.row_ids)
-
-			#Converts the list of lists to a single list.
-			single_uli_list = []
-			for i in uli_list:
-				single_uli_list = single_uli_list + i
-
-			#Creates a list that removes ULI's that are repeated. 
-			unique_uli_list = set(single_uli_list)
-
-			#Drops rows in the data containing syntax or validity edits.
-			lar_df = lar_df[lar_df.uli.isin(unique_uli_list)].copy()
-
-			#Only one row is needed for output. 
-			#The following, takes the first row of data from the clean dataframe 
-			lar_row = lar_df[0:1]
+		checker.load_ts_data(ts_df)
+		checker.load_lar_data(lar_df)
+		checker.reset_results()
+
+		#Runs the syntax and validity edits in the rules_engine, marking
+		#the LAR rows that fail them. 
+		for func in checker.registry.select(edit_types=("s", "v")):
+			getattr(checker, func)()
+
+		#Drops rows in the data containing syntax or validity edits.
+		#The function ignores TS edits and edit fails reported against the TS. 
+		lar_df = lar_df[~checker.rows_failing(edit_types=["s", "v"])]
+
+		#Only one row is needed for output. 
+		#The following, takes the first row of data from the clean dataframe 
+		lar_row = lar_df[0:1]
 
 		return(lar_row)
 
@@ -5,8 +5,10 @@ import os
 import pandas as pd
 import yaml
 
+from geo_index import geo_index
 from lar_constraints import lar_data_constraints
 import lar_generator
+from row_validator import row_validator
 from rules_engine import rules_engine
 import utils
 
@@ -42,12 +44,11 @@ if not os.path.exists(filepaths["log_filepath"]):
 logging.basicConfig(filename=filepaths["log_filepath"]+filepaths['log_filename'], format='%(asctime)s %(message)s', 
 					datefmt='%m/%d/%Y %I:%M:%S %p', filemode=filepaths['log_mode'], level=logging.INFO)
 
-geographic_data = pd.read_csv(geo_config['geographic_data_file'], delimiter='|', header=0,
-	names=geo_config['file_columns'], dtype=object) #instantiate Census file data as dataframe
-
-#create 11 digit Census Tract codes from 5 digit county and 6 digit tract
-geographic_data['county_fips'] = geographic_data.apply(lambda x: str(x.state_code) + str(x.county), axis=1)
-geographic_data["tract_fips"] = geographic_data.apply(lambda x: str(x.county_fips) + str(x.tracts), axis=1)
+#instantiate Census file data as dataframe with 5 digit county and 11 digit tract codes
+geographic_data = utils.load_census_data(geo_config['geographic_data_file'], geo_config['file_columns'],
+	cache_dir=filepaths["census_cache_filepath"])
+#build census lookups once for the generator, rules engine and constraints
+geo = geo_index(geographic_data)
 
 with open(geo_config["zip_code_file"], 'r') as f:
 	zip_codes = json.load(f)
@@ -60,37 +61,43 @@ lar_gen = lar_generator.lar_gen(lar_schema_file=lar_schema_file, ts_schema_file=
 lar_file_config_data["lei"]["value"] = bank_config_data["lei"]["value"]
 #instantiate rules engine to check conformity of synthetic data to FIG schema
 rules_engine = rules_engine(config_data=lar_file_config_data, state_codes=geo_config["state_codes"], state_codes_rev=geo_config["state_codes_rev"],
-	geographic_data=geographic_data, full_lar_file_check=False)
+	geographic_data=geo, full_lar_file_check=False)
 
 #instantiate constraints logic to force LAR data to conform to FIG schema
-lar_constraints = lar_data_constraints(lar_file_config=lar_file_config_data, geographic_data=geographic_data)
+lar_constraints = lar_data_constraints(lar_file_config=lar_file_config_data, geographic_data=geo)
 
 #store original row for diff comparison to see what elements are being changed
 
 ts_row = lar_gen.make_ts_row(bank_file_config=bank_config_data) #create TS row, we only need one
 ts_df = pd.DataFrame(ts_row, index=[0])
 rules_engine.load_ts_data(ts_df) #loading ts_row to rules_engine converts it to a dataframe for value checking
+#check generated rows as dictionaries with the row level edits instead of loading each row to the rules engine
+row_checker = row_validator(rules_engine, ts_row=ts_row)
+#compare the row checks with the rules engine edits on a sample of unconstrained rows, which fail many edits,
+#and stop if any edit differs so that an edit changed only in the rules engine is not checked with its old copy
+PARITY_SAMPLE_ROWS = 2000
+print("checking row validator against rules engine on {rows} rows".format(rows=PARITY_SAMPLE_ROWS))
+row_checker.check_engine(lar_gen.make_rows(PARITY_SAMPLE_ROWS, lar_file_config_data, geo, geo_config["state_codes_rev"], zip_codes))
 lar_rows = [] #list to hold all OrderedDict LAR records before writing to file
 
 for i in range(bank_config_data["file_length"]["value"]):
 	print("generating row {count}".format(count=i))
 	#create initial LAR row
-	lar_row = lar_gen.make_row(lar_file_config=lar_file_config_data, geographic_data=geographic_data, 
+	lar_row = lar_gen.make_row(lar_file_config=lar_file_config_data, geographic_data=geo, 
 							   state_codes=geo_config["state_codes_rev"], zip_code_list=zip_codes)
-	rules_engine.load_lar_data(lar_row) #loading lar_row to rules engine converts it to a dataframe for value checking
 
-	#generate error report
-	edit_report_df = rules_engine.create_edit_report(rules_list=["s", "v", "q"])
+	#list edits failed by the row, stopping at the first failed edit unless the fails are logged or printed
+	failed_edits = row_checker.any_failures(lar_row, edit_types=("s", "v", "q"), stop_early=not (LOGGING or DEBUG))
 	if LOGGING:
 		logging.info("generating row {count}".format(count=i))
 	if DEBUG:
-		print(edit_report_df)
+		print(failed_edits)
 
 	#apply constraints to force conformity with FIG schema for LAR data
 	constraints_iter = 0
-	while len(edit_report_df[edit_report_df.fail_count>0]):
+	while len(failed_edits):
 		if LOGGING:
-			logging.info(edit_report_df[edit_report_df.fail_count>0]) #log the edit fails for the row
+			logging.info(failed_edits) #log the edit fails for the row
 			logging.info("constraints iteration {}. checking difference in rows".format(constraints_iter))
 		lar_row_start_items = set(lar_row.items()) #capture initial row data before modifications to log difference between initial and changed row
 		
@@ -99,15 +106,12 @@ for i in range(bank_config_data["file_length"]["value"]):
 		if LOGGING:
 			logging.info(set(lar_row.items() - lar_row_start_items))
 		constraints_iter += 1
-		#prepare new edit fails report for checking lar generation process this is the loop break condition
-		rules_engine.reset_results()
-		rules_engine.load_lar_data(lar_row)
-		edit_report_df = rules_engine.create_edit_report() 
-		
+		#prepare new edit fails list for checking lar generation process this is the loop break condition
+		failed_edits = row_checker.any_failures(lar_row, edit_types=("s", "v"), stop_early=not (LOGGING or DEBUG))
 
 		if DEBUG:
-			print(len(edit_report_df[edit_report_df.fail_count>0]))
-			print(edit_report_df[edit_report_df.fail_count>0])
+			print(len(failed_edits))
+			print(failed_edits)
 	lar_rows.append(lar_row)
 
 lar_rows_df = pd.DataFrame(lar_rows)
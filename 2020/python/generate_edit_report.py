@@ -1,147 +1,205 @@
+import argparse
 import json
+import multiprocessing
 import os
 from os.path import join, isfile
 from os import listdir, makedirs, path
+import time
 
 import pandas as pd
 import yaml
 
 #Edit report configurations are located in configurations/edit_report_config.yaml
+from result_cache import result_cache, edit_rules_version
 from rules_engine import rules_engine
+import utils
+
+
+#check_seconds is the time taken to check the file in the run that wrote the report, cached is True when the results
+#were read from the result cache instead of checking the file
+report_columns = ['file_name', 'edit_name', 'row_type', 'field', 'fail_count', 'failed_rows', 'check_seconds', 'cached']
+
+#rules engine used to check files, created once per process
+engine = None
+
+def init_worker(engine_args):
+	"""
+	Pool initializer. Forked workers inherit the rules engine from the parent process and engine_args is None.
+	Otherwise each worker builds its own rules engine once from engine_args.
+	"""
+	global engine
+	if engine_args is not None:
+		engine = rules_engine(**engine_args)
+
+def check_file(task):
+	"""
+	Runs edits against a single file and returns the report name, rules engine results, file name and seconds taken.
+	task is a tuple of (report, file_path, file_name, edits). If edits is None all S/V/Q edits are run on the full file.
+	"""
+	report, file_path, file_name, edits = task
+	start = time.time()
+	engine.reset_results() #clear previous edit report results
+	if edits is None:
+		edits = engine.svq_edit_functions
+		ts_df, lar_df = engine.split_ts_row(file_path)
+	else:
+		#only parse the LAR fields needed by the edits being tested
+		ts_df, lar_df = engine.split_ts_row(file_path, edits=edits)
+	for rule in edits:
+		getattr(engine, rule)()
+	return report, engine.results, file_name, time.time() - start
+
+def main(jobs=1, use_cache=True):
+	global engine
+	#load configurations
+	lar_config_file = 'configurations/clean_file_config.yaml'
+	bank_config = 'configurations/fake0_config.yaml'
+	geo_config_file='configurations/geographic_data.yaml'
+	filepaths_file = 'configurations/test_filepaths.yaml'
+	lar_schema_file="../schemas/lar_schema.json"
+	ts_schema_file="../schemas/ts_schema.json"
+
+	#open configuration files and load data
+	with open(bank_config) as f:
+		bank_config_data = yaml.safe_load(f)
+
+	with open(lar_config_file, 'r') as f:
+		lar_file_config_data = yaml.safe_load(f)
+
+	with open(filepaths_file, 'r') as f:
+		filepaths = yaml.safe_load(f)
+
+	with open(geo_config_file, 'r') as f:
+		geo_config = yaml.safe_load(f)
+
+	with open(bank_config, 'r') as f:
+		bank_config_data = yaml.safe_load(f)
+
+	with open(geo_config["zip_code_file"], 'r') as f:
+		zip_codes = json.load(f)
+	zip_codes.append("Exempt")
+
+	#set location for edit report CSV writing
+	edit_report_path = filepaths["edit_report_output_filepath"] 
+	#get paths to check for clean files (by bank name)
+	bank_clean_dir = filepaths["clean_filepath"].format(bank_name=bank_config_data["name"]["value"])
+
+	#instantiate Census file data as dataframe with 5 digit county and 11 digit tract codes
+	geographic_data = utils.load_census_data(geo_config['geographic_data_file'], geo_config['file_columns'],
+		cache_dir=filepaths["census_cache_filepath"])
+
+	engine_args = dict(config_data=lar_file_config_data, state_codes=geo_config["state_codes"], 
+		state_codes_rev=geo_config["state_codes_rev"], geographic_data=geographic_data, full_lar_file_check=True)
+	#instantiate rules engine to test clean and error files
+	engine = rules_engine(**engine_args)
+
+	#get all files in clean folder(s)
+	clean_file_names = [f for f in listdir(bank_clean_dir) if isfile(join(bank_clean_dir, f))]
+	if '.DS_Store' in clean_file_names:
+		clean_file_names.remove('.DS_Store')
+
+	#get directories to check for files
+	bank_test_v_dir = filepaths["validity_filepath"].format(bank_name=bank_config_data["name"]["value"])
+	bank_test_s_dir = filepaths["syntax_filepath"].format(bank_name=bank_config_data["name"]["value"])
+	bank_test_q_dir = filepaths["quality_filepath"].format(bank_name=bank_config_data["name"]["value"])
+	bank_test_q_pass_dir = filepaths["quality_pass_s_v_filepath"].format(bank_name=bank_config_data["name"]["value"])
+
+	#FIXME add bank_test_q_pass_dir when logic is ready 
+	edit_filepaths = [bank_test_v_dir, bank_test_s_dir, bank_test_q_dir]
+
+	edit_file_names = []
+	for path in edit_filepaths:
+		#concat edit file path to edit file name to make looping easier in edit check
+		file_names = [path+f for f in listdir(path) if isfile(join(path, f))]
+		edit_file_names = edit_file_names + file_names
 
-
-#load configurations
-lar_config_file = 'configurations/clean_file_config.yaml'
-bank_config = 'configurations/fake0_config.yaml'
-geo_config_file='configurations/geographic_data.yaml'
-filepaths_file = 'configurations/test_filepaths.yaml'
-lar_schema_file="../schemas/lar_schema.json"
-ts_schema_file="../schemas/ts_schema.json"
-
-#open configuration files and load data
-with open(bank_config) as f:
-	bank_config_data = yaml.safe_load(f)
-
-with open(lar_config_file, 'r') as f:
-	lar_file_config_data = yaml.safe_load(f)
-
-with open(filepaths_file, 'r') as f:
-	filepaths = yaml.safe_load(f)
-
-with open(geo_config_file, 'r') as f:
-	geo_config = yaml.safe_load(f)
-
-with open(bank_config, 'r') as f:
-	bank_config_data = yaml.safe_load(f)
-
-with open(geo_config["zip_code_file"], 'r') as f:
-	zip_codes = json.load(f)
-zip_codes.append("Exempt")
-
-#set location for edit report CSV writing
-edit_report_path = filepaths["edit_report_output_filepath"] 
-#get paths to check for clean files (by bank name)
-bank_clean_dir = filepaths["clean_filepath"].format(bank_name=bank_config_data["name"]["value"])
-
-geographic_data = pd.read_csv(geo_config['geographic_data_file'], delimiter='|', header=0,
-	names=geo_config['file_columns'], dtype=object) #instantiate Census file data as dataframe
-
-#create 11 digit Census Tract codes from 5 digit county and 6 digit tract
-geographic_data['county_fips'] = geographic_data.apply(lambda x: str(x.state_code) + str(x.county), axis=1)
-geographic_data["tract_fips"] = geographic_data.apply(lambda x: str(x.county_fips) + str(x.tracts), axis=1)
-
-#instantiate rules engine to test clean and error files
-rules_engine = rules_engine(config_data=lar_file_config_data, state_codes=geo_config["state_codes"], 
-	state_codes_rev=geo_config["state_codes_rev"], geographic_data=geographic_data, full_lar_file_check=True)
-
-#get all files in clean folder(s)
-clean_file_names = listdir(bank_clean_dir)
-clean_file_names = [f for f in listdir(bank_clean_dir) if isfile(join(bank_clean_dir, f))]
-if '.DS_Store' in clean_file_names:
-	clean_file_names.remove('.DS_Store')
-
-#get directories to check for files
-bank_test_v_dir = filepaths["validity_filepath"].format(bank_name=bank_config_data["name"]["value"])
-bank_test_s_dir = filepaths["syntax_filepath"].format(bank_name=bank_config_data["name"]["value"])
-bank_test_q_dir = filepaths["quality_filepath"].format(bank_name=bank_config_data["name"]["value"])
-bank_test_q_pass_dir = filepaths["quality_pass_s_v_filepath"].format(bank_name=bank_config_data["name"]["value"])
-
-#FIXME add bank_test_q_pass_dir when logic is ready 
-edit_filepaths = [bank_test_v_dir, bank_test_s_dir, bank_test_q_dir]
-
-edit_file_names = []
-for path in edit_filepaths:
-	#concat edit file path to edit file name to make looping easier in edit check
-	file_names = [path+f for f in listdir(path) if isfile(join(path, f))]
-	edit_file_names = edit_file_names + file_names
-
-try:
 	edit_file_names = [f for f in edit_file_names if '.DS_Store' not in f]
-except:
-	print("no DS Store to remove")
-
-edit_file_names.sort()
-print(len(clean_file_names), "clean files to check")
-print(len(edit_file_names), "edit files to check")
-#set up data structures to hold edit report data
-clean_report_df = pd.DataFrame([], columns=['file_name', 'edit_name', 'row_type', 'field', 'fail_count', 'failed_rows'], index=[0])
-edit_report_df = pd.DataFrame([], columns=['file_name', 'edit_name', 'row_type', 'field', 'fail_count', 'failed_rows'], index=[0])
-
-
-#loop over each clean file and compile report of files that failed edits. 
-#Produce edit report for each file with fails
-
-print("starting clean file loop")
-for file in clean_file_names:
-	rules_engine.reset_results() #clear previous edit report results
-	#print(file)
-	ts_df, lar_df = rules_engine.split_ts_row(bank_clean_dir+file)
-	for rule in rules_engine.svq_edit_functions:
-		if rule[:1] in ("s", "v", "q") and rule[1:4].isdigit()==True:
-					getattr(rules_engine, rule)()
-	if len(rules_engine.results)>0:
-		new_results_df = pd.DataFrame(rules_engine.results)
-		#add filename for edit tracking and reorder columns for concatenation of output
-		new_results_df["file_name"] = file
-		new_results_df = new_results_df[['file_name', 'edit_name', 'row_type', 'field', 'fail_count', 'failed_rows']] 
-		clean_report_df = pd.concat([clean_report_df, new_results_df])
-
-print("starting test file loop")
-all_edits = False
-for file in edit_file_names:
-	#print(file)
-	rules_engine.reset_results() #clear previous edit report results
-	ts_df, lar_df = rules_engine.split_ts_row(file)
-	for rule in rules_engine.svq_edit_functions:
-		if all_edits == False: #only test for the edit in the file name
-			if rule in file:
-				#print("in rule", rule)
-				getattr(rules_engine, rule)()
+	edit_file_names.sort()
+	print(len(clean_file_names), "clean files to check")
+	print(len(edit_file_names), "edit files to check")
+
+	#clean files are checked against all edits. Test files are only checked for the edit in the file name
+	tasks = [("clean", bank_clean_dir+file, file, None) for file in clean_file_names]
+	all_edits = False
+	for file in edit_file_names:
+		if all_edits == False:
+			file_rules = [rule for rule in engine.svq_edit_functions if rule in file]
+		else:
+			file_rules = None
+		tasks.append(("edit", file, file, file_rules))
+
+	#look up results for files that are unchanged since they were last checked
+	task_results = [None] * len(tasks)
+	task_keys = [None] * len(tasks)
+	task_seconds = [0.0] * len(tasks)
+	cache = None
+	if use_cache:
+		version = edit_rules_version([lar_config_file, geo_config_file, lar_schema_file, ts_schema_file],
+			data_files=[geo_config['geographic_data_file']])
+		cache = result_cache(filepaths["result_cache_filepath"], version)
+		for index, (report, file_path, file_name, edits) in enumerate(tasks):
+			lookup_start = time.time()
+			if edits is None:
+				edits = engine.svq_edit_functions
+			task_keys[index] = cache.key(file_path, edits)
+			task_results[index] = cache.get(task_keys[index])
+			task_seconds[index] = time.time() - lookup_start
+	check_indexes = [index for index, results in enumerate(task_results) if results is None]
+	check_tasks = [tasks[index] for index in check_indexes]
+
+	start = time.time()
+	print("checking", len(check_tasks), "files with", jobs, "job(s)")
+	if jobs > 1 and len(check_tasks) > 1:
+		if "fork" in multiprocessing.get_all_start_methods():
+			context = multiprocessing.get_context("fork")
+			init_args = None #workers inherit the rules engine
 		else:
-			getattr(rules_engine, rule)()
-
-	if len(rules_engine.results)>0:
-		new_results_df = pd.DataFrame(rules_engine.results)
-	#add filename for edit tracking and reorder columns for concatenation of output
-		new_results_df["file_name"] = file
-		new_results_df = new_results_df[['file_name', 'edit_name', 'row_type', 'field', 'fail_count', 'failed_rows']] 
-		edit_report_df = pd.concat([edit_report_df, new_results_df])
-
-print(len(clean_report_df), "clean file edit report rows")
-print(len(edit_report_df), "edit file edit report rows")
-
-#save report outputs
-if not os.path.exists(edit_report_path):
-	os.makedirs(edit_report_path)
-
-#reset index to drop starter row
-clean_report_df.reset_index(drop=True, inplace=True)
-edit_report_df.reset_index(drop=True, inplace=True)
-#remove starter row
-clean_report_df.drop(0, inplace=True)
-edit_report_df.drop(0, inplace=True)
-
-clean_report_df.to_csv(edit_report_path + filepaths['clean_file_report_output_filename'].format(bank_name=bank_config_data["name"]["value"])
-	,sep="|", index=False)
-edit_report_df.to_csv(edit_report_path + filepaths['edit_report_output_filename'].format(bank_name=bank_config_data["name"]["value"]),
-	 sep="|", index=False)
+			context = multiprocessing.get_context()
+			init_args = engine_args
+		pool = context.Pool(processes=jobs, initializer=init_worker, initargs=(init_args,))
+		file_results = pool.imap(check_file, check_tasks, chunksize=1)
+	else:
+		pool = None
+		file_results = map(check_file, check_tasks)
+	try:
+		for index, (report, results, file_name, seconds) in zip(check_indexes, file_results):
+			task_results[index] = results
+			task_seconds[index] = seconds
+			if cache is not None:
+				cache.put(task_keys[index], results)
+			print("{report} file {file} checked in {seconds:.2f} seconds".format(report=report, file=file_name, seconds=seconds))
+	finally:
+		if pool is not None:
+			pool.close()
+			pool.join()
+	print(len(check_tasks), "files checked in {seconds:.2f} seconds".format(seconds=time.time() - start))
+	if cache is not None:
+		cache.print_stats()
+
+	#collect edit report records for all files, with the file name for edit tracking, and build each report once
+	report_records = {"clean": [], "edit": []}
+	checked = set(check_indexes)
+	for index, ((report, file_path, file_name, edits), results) in enumerate(zip(tasks, task_results)):
+		report_records[report].extend(dict(result, file_name=file_name, check_seconds=round(task_seconds[index], 3),
+			cached=index not in checked) for result in results)
+
+	clean_report_df = pd.DataFrame(report_records["clean"], columns=report_columns)
+	edit_report_df = pd.DataFrame(report_records["edit"], columns=report_columns)
+	print(len(clean_report_df), "clean file edit report rows")
+	print(len(edit_report_df), "edit file edit report rows")
+
+	#save report outputs
+	if not os.path.exists(edit_report_path):
+		os.makedirs(edit_report_path)
+
+	clean_report_df.to_csv(edit_report_path + filepaths['clean_file_report_output_filename'].format(bank_name=bank_config_data["name"]["value"])
+		,sep="|", index=False)
+	edit_report_df.to_csv(edit_report_path + filepaths['edit_report_output_filename'].format(bank_name=bank_config_data["name"]["value"]),
+		 sep="|", index=False)
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Runs the HMDA edits against clean and edit test files and writes edit reports.")
+	parser.add_argument("--jobs", type=int, default=1, help="number of worker processes used to check files")
+	parser.add_argument("--no-cache", action="store_true", help="check all files instead of reusing cached results")
+	args = parser.parse_args()
+	main(jobs=args.jobs, use_cache=not args.no_cache)
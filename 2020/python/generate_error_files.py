@@ -8,6 +8,7 @@ import yaml
 import pandas as pd
 
 
+from geo_index import geo_index
 from lar_constraints import lar_data_constraints
 import lar_generator
 from rules_engine import rules_engine
@@ -42,30 +43,26 @@ with open(geo_config_file, 'r') as f:
 with open(bank_config, 'r') as f:
 	bank_config_data = yaml.safe_load(f)
 
-with open(geo_config["geographic_data_file"], 'r') as f:
-	geographic_data = yaml.safe_load(f)
-
 #set quality filepath to the name of the bank being used
 filepaths["quality_filepath"] = filepaths["quality_filepath"].format(bank_name=bank_config_data["name"]["value"]) 
 
 DEBUG = False
 
 #load geographic data
-geographic_data = pd.read_csv(geo_config['geographic_data_file'], delimiter='|', header=0,
-	names=geo_config['file_columns'], dtype=object) #instantiate Census file data as dataframe
-
-#create 11 digit Census Tract codes from 5 digit county and 6 digit tract
-geographic_data['county_fips'] = geographic_data.apply(lambda x: str(x.state_code) + str(x.county), axis=1)
-geographic_data["tract_fips"] = geographic_data.apply(lambda x: str(x.county_fips) + str(x.tracts), axis=1)
+#instantiate Census file data as dataframe with 5 digit county and 11 digit tract codes
+geographic_data = utils.load_census_data(geo_config['geographic_data_file'], geo_config['file_columns'],
+	cache_dir=filepaths["census_cache_filepath"])
+#census lookups shared by the test file creator and the rules engine
+geo = geo_index(geographic_data)
 
 
 test_file_gen = test_data_creator(ts_schema_file=ts_schema_file, lar_schema_file=lar_schema_file, 
 								  bank_config_data=bank_config_data, state_codes=geo_config["state_codes"], 
-								  county_df=geographic_data[["county_fips", "small_county"]])
+								  geographic_data=geo)
 
 #config_data, state_codes, state_codes_rev, geographic_data
 checker = rules_engine(state_codes=geo_config["state_codes"], state_codes_rev=geo_config["state_codes_rev"],
-					   config_data=lar_file_config_data, geographic_data=geographic_data)
+					   config_data=lar_file_config_data, geographic_data=geo)
 
 clean_data_path = filepaths["clean_filepath"].format(bank_name=bank_config_data["name"]["value"])
 clean_file_name = filepaths["clean_filename"].format(bank_name=bank_config_data["name"]["value"], 
@@ -111,27 +108,17 @@ for quality_file in quality_files:
 	checker.reset_results()
 	#generate an edits report for the file
 	#this will mark the rows that need to be removed to ensure the file passes S/V edits
-	for func in dir(checker):
-		if func[:1] in ("s", "v") and func[1:4].isdigit()==True:
-			getattr(checker, func)()
+	for func in checker.registry.select(edit_types=("s", "v")):
+		getattr(checker, func)()
 
-	#capture edit report results
-	report_df = pd.DataFrame(checker.results)
-	report_df = report_df[report_df['row_type'] != 'TS'].copy() #remove records relating to TS fails
-	#remove report rows that did not have fails
-	report_df = report_df[report_df.apply(lambda x: len(x.failed_rows)>0, axis=1)].copy()
+	#mark lar rows failing S/V edits, fails reported against the TS are not included
+	bad_rows = checker.rows_failing(edit_types=["s", "v"])
+	print(bad_rows.sum(), "bad rows")
+	print(list(lar_df.uli[bad_rows]))
+	print(len(lar_df), "before dropping bad rows")
 
 	#copy rows that pass S/V edits and remove ones that do not to make a test file free of S/V edits
-	#remove lar rows with S/V fails
-	bad_uli_list = report_df.failed_rows.to_list()
-	#flat_list = [item for sublist in l for item in sublist]
-	bad_uli_list = [uli for sublist in bad_uli_list for uli in sublist]
-	bad_uli_list = set(bad_uli_list) #convert to set to remove duplicates
-	print(len(bad_uli_list), "bad ULIs")
-	print(bad_uli_list)
-	print(len(lar_df), "before dropping bad ulis")
-
-	clean_lar_df = lar_df[~lar_df.uli.isin(bad_uli_list)].copy() #drop rows failing S/V from lar_df
+	clean_lar_df = lar_df[~bad_rows].copy() #drop rows failing S/V from lar_df
 
 	if len(clean_lar_df) <=0:
 		print("all LAR records removed")
@@ -0,0 +1,88 @@
+#This file contains the geo_index class used to look up census geography for LAR generation, constraints and edits.
+#The index is built once from the FFIEC census data so that per row geography checks are set lookups
+#instead of scans of the census dataframe.
+
+import random
+
+import numpy as np
+import pandas as pd
+
+
+class geo_index(object):
+	"""
+	Lookup structures for census tracts, counties, states and MSA/MDs.
+	geographic_data is the HMDA Ops cut of the FFIEC Census Flat File with county_fips (5 digit) and tract_fips (11 digit)
+	columns added.
+	small_county_flag is the value of the small_county column that marks a county with a population of 30,000 or less.
+	"""
+
+	def __init__(self, geographic_data, small_county_flag="1"):
+
+		self.geographic_data = geographic_data
+
+		tract_fips = geographic_data["tract_fips"].astype(str)
+		county_fips = geographic_data["county_fips"].astype(str)
+
+		#arrays of unique codes for random selection and isin checks, sets for single value checks
+		self.tracts = np.array(pd.unique(tract_fips), dtype=object)
+		self.counties = np.array(pd.unique(county_fips), dtype=object)
+		self.tract_set = frozenset(self.tracts)
+		self.county_set = frozenset(self.counties)
+
+		#county to tracts and state to counties
+		self.county_tracts = {county: np.array(tracts, dtype=object) for county, tracts in
+			tract_fips.groupby(county_fips.to_numpy(), sort=False).unique().items()}
+		self.state_counties = {state: np.array(counties, dtype=object) for state, counties in
+			county_fips.groupby(county_fips.str[:2].to_numpy(), sort=False).unique().items()}
+
+		#counties with population of 30,000 or less and all others
+		small_counties = pd.unique(county_fips[geographic_data["small_county"].astype(str)==small_county_flag])
+		self.small_counties = frozenset(small_counties)
+		self.big_counties = np.array([county for county in self.counties if county not in self.small_counties], dtype=object)
+
+		#MSA/MD lookups
+		msa_md = geographic_data["msa_md"].astype(str)
+		self.tract_msa = dict(zip(tract_fips, msa_md))
+		self.county_msa = dict(zip(county_fips, msa_md))
+
+	@classmethod
+	def load(cls, geographic_data, **kwargs):
+		"""
+		Returns geographic_data if it is already a geo_index, otherwise builds one from the census dataframe.
+		"""
+		if isinstance(geographic_data, cls):
+			return geographic_data
+		return cls(geographic_data, **kwargs)
+
+	def valid_tract(self, tract):
+		"""Returns True if the 11 digit tract is in the census data"""
+		return tract in self.tract_set
+
+	def valid_county(self, county):
+		"""Returns True if the 5 digit county is in the census data"""
+		return county in self.county_set
+
+	def small_county(self, county):
+		"""Returns True if the county has a population of 30,000 or less"""
+		return county in self.small_counties
+
+	def random_tract(self, county=None):
+		"""Returns a random census tract, limited to the passed county if one is passed"""
+		if county is None:
+			return random.choice(self.tracts)
+		return random.choice(self.county_tracts[county])
+
+	def random_county(self, state=None, big=False):
+		"""
+		Returns a random county, limited to the passed 2 digit state FIPS code if one is passed.
+		If big is True only counties with a population over 30,000 are returned.
+		"""
+		if big:
+			counties = self.big_counties
+			if state is not None:
+				counties = [county for county in self.state_counties[state] if county not in self.small_counties]
+		elif state is not None:
+			counties = self.state_counties[state]
+		else:
+			counties = self.counties
+		return random.choice(counties)
@@ -4,21 +4,25 @@ import string
 import pandas as pd
 import yaml
 
+from edit_registry import edit_registry
+from geo_index import geo_index
+
+#registry of constraint functions, populated by the register decorator on each constraint
+constraint_funcs = edit_registry()
 
 class lar_data_constraints(object):
+	registry = constraint_funcs
 
 	def __init__(self, lar_file_config, geographic_data):
 		"""
 		lar_file_cnfig is a dictionary like object usually loaded from clean_file_config.yaml
-		geographic_data is the HMDA Ops cut of the FFIEC Census Flat File
+		geographic_data is the HMDA Ops cut of the FFIEC Census Flat File, or a geo_index built from it
 		"""
 		self.config_data = lar_file_config
-		self.geographic_data = geographic_data
+		self.geo = geo_index.load(geographic_data)
+		self.geographic_data = self.geo.geographic_data
 		#create list of LAR data constraint functions
-		self.constraints = []
-		for func in dir(self):
-			if func[:1] in ("s", "v") and func[1:4].isdigit()==True:
-				self.constraints.append(func)
+		self.constraints = self.registry.select(edit_types=("s", "v"))
 
 
 	def no_enum_dupes(self, fields=[], enum_list=None):
@@ -43,6 +47,7 @@ class lar_data_constraints(object):
 	#	"""duplicate row, checks all fields to determine if it is a duplicate record"""
 	#	pass
 
+	@constraint_funcs.register()
 	def v610_const(self, row):
 		"""application date must be NA when action taken = 6, reverse must also be true"""
 		if row["app_date"] == "NA" or row["action_taken"] == "6":
@@ -50,12 +55,14 @@ class lar_data_constraints(object):
 			row["action_taken"] = "6"
 		return row
 
+	@constraint_funcs.register()
 	def v612_const(self, row):
 		"""if preapproval = 1 then loan purpose = 1"""
 		if row["preapproval"] == "1" and row["loan_purpose"] != "1":
 			row["preapproval"] = "2"
 		return row
 
+	@constraint_funcs.register()
 	def v613_2_const(self, row):
 		"""2) If Action Taken equals 7 or 8, then Preapproval must equal 1."""
 		if row["action_taken"] in ("7", "8") and row["preapproval"] != "1":
@@ -63,42 +70,49 @@ class lar_data_constraints(object):
 			row["affordable_units"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v613_3_const(self, row):
 		"""3) If Action Taken equals 3, 4, 5 or 6, then Preapproval must equal 2."""
 		if row["action_taken"] in ("3", "4", "5", "6") and row["preapproval"] != "2":
 			row["preapproval"] = "2"
 		return row
 
+	@constraint_funcs.register()
 	def v613_4_const(self, row):
 		""" 4) If Preapproval equals 1, then Action Taken must equal 1, 2, 7 or 8."""
 		if row["preapproval"] == "1" and row["action_taken"] not in ("1", "2", "7", "8"):
 			row["preapproval"] = "2"
 		return row
 
+	@constraint_funcs.register()
 	def v614_1_const(self, row):
 		"""1) If Loan Purpose equals 2, 4, 31, 32, or 5, then Preapproval must equal 2."""
 		if row["loan_purpose"] in ("2", "4", "31", "32", "5"):
 			row["preapproval"] = "2"
 		return row
 
+	@constraint_funcs.register()
 	def v614_2_const(self, row):
 		"""2) If Multifamily Affordable Units is a number, then Preapproval must equal 2."""
 		if row["affordable_units"].isdigit() == True:
 			row["preapproval"] = "2"
 		return row
 
+	@constraint_funcs.register()
 	def v614_3_const(self, row):
 		"""3) If Reverse Mortgage equals 1, then Preapproval must equal 2."""
 		if row["reverse_mortgage"] == "1":
 			row["preapproval"] = "2"
 		return row
 
+	@constraint_funcs.register()
 	def v614_4_const(self, row):
 		""" 4) If Open-End Line of Credit equals 1, then Preapproval must equal 2."""
 		if row["open_end_credit"] == "1":
 			row["preapproval"] = "2"
 		return row
 
+	@constraint_funcs.register()
 	def v615_const(self, row):
 		"""2) If Manufactured Home Land Property Interest equals 1, 2, 3 or 4, then Construction Method must equal 2.
 		   3) If Manufactured Home Secured Property Type equals 1 or 2 then Construction Method must equal 2."""
@@ -109,6 +123,7 @@ class lar_data_constraints(object):
 			row["const_method"] = "2"
 		return row
 
+	@constraint_funcs.register()
 	def v619_const(self, row):
 		"""2) The Action Taken Date must be in the reporting year.
 		3) The Action Taken Date must be on or after the Application Date."""
@@ -120,6 +135,7 @@ class lar_data_constraints(object):
 				row["action_date"] = row["app_date"]
 		return row
 
+	@constraint_funcs.register()
 	def v622_const(self, row):
 		"""1) If Street Address was not reported NA, then City, State, and Zip Code must be provided, and not reported NA."""
 		if row["street_address"] != "NA":
@@ -131,16 +147,18 @@ class lar_data_constraints(object):
 				row["zip_code"] = "12345"
 		return row
 
+	@constraint_funcs.register()
 	def v627_const(self, row):
 		"""1) If County and Census Tract are not reported NA, they must be a valid combination of information.
 		   The first five digits of the Census Tract must match the reported five digit County FIPS code. """
 		if row["tract"] != "NA" and row["county"] != "NA":
-			if row["tract"] not in list(self.geographic_data["tract_fips"]) or row["county"] not in list(self.geographic_data['county_fips']):
-				row["tract"] = random.choice(self.geographic_data["tract_fips"])
+			if not self.geo.valid_tract(row["tract"]) or not self.geo.valid_county(row["county"]):
+				row["tract"] = self.geo.random_tract()
 				row["county"] = row["tract"][:5]
 				print(row["tract"], row["county"])
 		return row
 
+	@constraint_funcs.register()
 	def v628_1_const(self, row):
 		"""1) Ethnicity of Applicant or Borrower: 1 must equal 1, 11, 12, 13, 14, 2, 3, or 4, and cannot be left blank,
 			   unless an ethnicity is provided in Ethnicity of Applicant or Borrower: Free Form Text Field for Other
@@ -150,12 +168,14 @@ class lar_data_constraints(object):
 			row["app_eth_1"] = random.choice(eth_enums)
 		return row
 
+	@constraint_funcs.register()
 	def v628_2_const(self, row):
 		"""2) Ethnicity of Applicant or Borrower: 2; Ethnicity of Applicant or Borrower: 3; Ethnicity of Applicant or
 	   	Borrower: 4; Ethnicity of Applicant or Borrower: 5 must equal 1, 11, 12, 13, 14, 2, or be left blank."""
 		#this should be handled by lar_generation
 		return row
 
+	@constraint_funcs.register()
 	def v628_3_const(self, row):
 		"""3) Each Ethnicity of Applicant or Borrower code can only be reported once."""
 		eth_enums = ["1", "11", "12", "13", "14", "2"]
@@ -171,6 +191,7 @@ class lar_data_constraints(object):
 			self.no_enum_dupes(fields=eth_fields,  enum_list=eth_enums)
 		return row
 
+	@constraint_funcs.register()
 	def v628_4_const(self, row):
 		"""4) If Ethnicity of Applicant or Borrower: 1 equals 3 or 4; then Ethnicity of Applicant or Borrower: 2; Ethnicity
 	   	of Applicant or Borrower: 3; Ethnicity of Applicant or Borrower: 4; Ethnicity of Applicant or Borrower: 5
@@ -182,6 +203,7 @@ class lar_data_constraints(object):
 			row["app_eth_5"] = ""
 		return row
 
+	@constraint_funcs.register()
 	def v629_2_const(self, row):
 		"""2) If Ethnicity of Applicant or Borrower Collected on the Basis of Visual Observation or Surname equals 1,
          			then Ethnicity of Applicant or Borrower: 1 must equal 1 or 2;
@@ -200,6 +222,7 @@ class lar_data_constraints(object):
 				row["app_eth_2"] = random.choice(("1", "2"))
 		return row
 
+	@constraint_funcs.register()
 	def v629_3_const(self, row):
 		"""3) If Ethnicity of Applicant or Borrower Collected on the Basis of Visual Observation or Surname equals 2,
 		then Ethnicity of Applicant or Borrower: 1 must equal 1, 11, 12, 13, 14, 2 or 3. """
@@ -207,6 +230,7 @@ class lar_data_constraints(object):
 			row["app_eth_1"] = random.choice(("1", "11", "12", "13", "14", "2", "3"))
 		return row
 
+	@constraint_funcs.register()
 	def v630_const(self, row):
 		"""1) If Ethnicity of Applicant or Borrower: 1 equals 4, then Ethnicity of Applicant or Borrower Collected on the Basis of Visual Observation or Surname 
 			must equal 3.
@@ -218,6 +242,7 @@ class lar_data_constraints(object):
 			row["app_eth_1"] = random.choice(("3", "4"))
 		return row
 
+	@constraint_funcs.register()
 	def v631_1_const(self, row):
 		"""1) Ethnicity of Co-Applicant or Co-Borrower: 1 must equal 1, 11, 12, 13, 14, 2, 3, 4, or 5, and cannot be
 			left blank, unless an ethnicity is provided in Ethnicity of Co-Applicant or Co-Borrower: Free Form Text
@@ -226,12 +251,14 @@ class lar_data_constraints(object):
 			row["co_app_eth_1"] = random.choice(["1","11", "12", "13", "14", "2", "3", "4", "5"])
 		return row
 
+	@constraint_funcs.register()
 	def v631_2_const(self, row):
 		"""2) Ethnicity of Co-Applicant or Co-Borrower: 2; Ethnicity of Co-Applicant or Co-Borrower: 3; Ethnicity
 			of Co-Applicant or Co-Borrower: 4; Ethnicity of CoApplicant or Co-Borrower: 5 must equal 1, 11, 12, 13, 14, 2, or be left blank."""
 		#this should be done by the lar_generator code
 		return row
 
+	@constraint_funcs.register()
 	def v631_3_const(self, row):
 		"""3) Each Ethnicity of Co-Applicant or Co-Borrower code can only be reported once."""
 		co_app_eth_enums=["1","11", "12", "13", "14", "2", ""]
@@ -247,6 +274,7 @@ class lar_data_constraints(object):
 				self.no_enum_dupes(fields=co_app_eth_fields,  enum_list=co_app_eth_enums)
 		return row
 
+	@constraint_funcs.register()
 	def v631_4_const(self, row):
 		"""4) If Ethnicity of Co-Applicant or Co-Borrower: 1 equals 3, 4, or 5; then Ethnicity of Co-Applicant or
 		Co-Borrower: 2; Ethnicity of Co-Applicant or CoBorrower:  3; Ethnicity of Co-Applicant or CoBorrower:
@@ -258,6 +286,7 @@ class lar_data_constraints(object):
 			row["co_app_eth_5"] = ""
 		return row
 
+	@constraint_funcs.register()
 	def v632_const(self, row):
 		"""1) If Ethnicity of Co-Applicant or Co-Borrower Collected on the Basis of Visual Observation or Surname equals 1; 
 			then Ethnicity of Co-Applicant or Co-Borrower: 1 must equal 1 or 2; and Ethnicity of Co-Applicant or Co-Borrower: 2 
@@ -283,6 +312,7 @@ class lar_data_constraints(object):
 				row["co_app_eth_1"] = random.choice(("1", "11", "12", "13", "14", "2", "3"))
 		return row
 
+	@constraint_funcs.register()
 	def v633_const(self, row):
 		"""1) If Ethnicity of Co-Applicant or Co-Borrower: 1 equals 4, then Ethnicity of Co-Applicant or CoBorrower
 			Collected on the Basis of Visual Observation or Surname must equal 3. 
@@ -291,6 +321,7 @@ class lar_data_constraints(object):
 			row["co_app_eth_basis"] = "3"
 		return row
 
+	@constraint_funcs.register()
 	def v634_const(self, row):
 		"""1) If Ethnicity of Co-Applicant or Co-Borrower: 1 equals 5, then Ethnicity of Co-Applicant or CoBorrower
 			Collected on the Basis of Visual Observation or Surname must equal 4, and the reverse must be true."""
@@ -300,6 +331,7 @@ class lar_data_constraints(object):
 			row["co_app_eth_1"] = "5"
 		return row
 
+	@constraint_funcs.register()
 	def v635_1_const(self, row):
 		"""1) Race of Applicant or Borrower: 1 must equal 1, 2, 21, 22, 23, 24, 25, 26, 27, 3, 4, 41, 42, 43, 44, 5, 6, or 7,
 			and cannot be left blank, unless a race is provided in Race of Applicant or Borrower: Free Form Text
@@ -309,12 +341,14 @@ class lar_data_constraints(object):
 			row["app_race_1"] = random.choice(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6", "7"))
 		return row
 
+	@constraint_funcs.register()
 	def v635_2_const(self, row):
 		"""2) Race of Applicant or Borrower: 2; Race of Applicant or Borrower: 3; Race of Applicant or Borrower: 4;
 		Race of Applicant or Borrower: 5 must equal 1, 2, 21, 22, 23, 24, 25, 26, 27, 3, 4, 41, 42, 43, 44, 5, or be left blank."""
 		#this should be handled by the lar schema
 		return row
 
+	@constraint_funcs.register()
 	def v635_3_const(self, row):
 		"""3) Each Race of Applicant or Borrower code can only be reported once."""
 		race_fields = [row["app_race_1"], row["app_race_2"], row["app_race_3"], row["app_race_4"], row["app_race_5"]]
@@ -330,6 +364,7 @@ class lar_data_constraints(object):
 			self.no_enum_dupes(fields=race_fields,  enum_list=race_enums)
 		return row
 
+	@constraint_funcs.register()
 	def v635_4_const(self, row):
 		"""4) If Race of Applicant or Borrower: 1 equals 6 or 7; then Race of Applicant or Borrower: 2; Race of Applicant or Borrower: 3;
 			Race of Applicant or Borrower: 4; Race of Applicant or Borrower: 5 must all be left blank."""
@@ -340,6 +375,7 @@ class lar_data_constraints(object):
 			row["app_race_5"] = ""
 		return row
 
+	@constraint_funcs.register()
 	def v636_const(self, row):
 		"""1) If Race of Applicant or Borrower Collected on the Basis of Visual Observation or Surname equals 1;
 			then Race of Applicant or Borrower: 1 must equal 1, 2, 3, 4, or 5; and Race of Applicant or Borrower: 2;
@@ -365,6 +401,7 @@ class lar_data_constraints(object):
 				row["app_race_1"] = random.choice(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6"))
 		return row
 
+	@constraint_funcs.register()
 	def v637_const(self, row):
 		"""1) If Race of Applicant or Borrower: 1 equals 7, then Race of Applicant or Borrower Collected on the Basis of Visual Observation 
 			or Surname must equal 3.
@@ -377,6 +414,7 @@ class lar_data_constraints(object):
 				row["app_race_1"] = random.choice(("6", "7"))
 		return row
 
+	@constraint_funcs.register()
 	def v638_const(self, row):
 		"""1) Race of Co-Applicant or Co-Borrower: 1 must equal 1, 2, 21, 22, 23, 24, 25, 26, 27, 3, 4, 41, 42, 43, 44, 5, 6, 7, or 8, 
 			and cannot be left blank, unless a race is provided in Race of Co-Applicant or CoBorrower: Free Form Text Field 
@@ -409,6 +447,7 @@ class lar_data_constraints(object):
 			row["co_app_race_5"] = ""
 		return row
 
+	@constraint_funcs.register()
 	def v639_const(self, row):
 		"""1) If Race of Co-Applicant or Co-Borrower Collected on the Basis of Visual Observation or Surname equals 1, 
 			then Race of Co-Applicant or Co-Borrower: 1 must equal 1, 2, 3, 4, or 5; and Race of CoApplicant or 
@@ -432,6 +471,7 @@ class lar_data_constraints(object):
 				row["co_app_race_1"] = random.choice(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6"))
 		return row
 
+	@constraint_funcs.register()
 	def v640_const(self, row):
 		"""If Race of Co-Applicant or Co-Borrower: 1 equals 7, then Race of Co-Applicant or Co-Borrower Collected 
 			on the Basis of Visual Observation or Surname must equal 3.
@@ -440,6 +480,7 @@ class lar_data_constraints(object):
 			row["co_app_race_basis"] = "3"
 		return row
 
+	@constraint_funcs.register()
 	def v641_const(self, row):
 		"""1) If Race of Co-Applicant or Co-Borrower: 1 equals 8, then Race of Co-Applicant or Co-Borrower
 			Collected on the Basis of Visual Observation or Surname must equal 4, and the reverse must be true."""
@@ -449,6 +490,7 @@ class lar_data_constraints(object):
 			row["co_app_race_1"] = "8"
 		return row
 
+	@constraint_funcs.register()
 	def v643_const(self, row):
 		"""If Sex of Applicant or Borrower Collected on the Basis of Visual Observation or Surname equals 1, then
 			Sex of Applicant or Borrower must equal 1 or 2.
@@ -457,6 +499,7 @@ class lar_data_constraints(object):
 			row["app_sex"] = random.choice(("1","2"))
 		return row
 
+	@constraint_funcs.register()
 	def v644_const(self, row):
 		"""1) If Sex of Applicant or Borrower Collected on the Basis of Visual Observation or Surname equals 2,
 			then Sex of Applicant or Borrower must equal 1, 2, 3, or 6.
@@ -470,6 +513,7 @@ class lar_data_constraints(object):
 			row["app_sex_basis"] = random.choice(("2", "3"))
 		return row
 
+	@constraint_funcs.register()
 	def v645_const(self, row):
 		"""
 		If Sex of Applicant or Borrower equals 4, then Sex of Applicant or Borrower Collected on the Basis of
@@ -479,6 +523,7 @@ class lar_data_constraints(object):
 			row["app_sex_basis"] = "3"
 		return row
 
+	@constraint_funcs.register()
 	def v647_const(self, row):
 		"""If Sex of Co-Applicant or Co-Borrower Collected on the Basis of Visual Observation or Surname equals 1,
 			then Sex of Co-Applicant or Co-Borrower must equal 1 or 2.
@@ -487,6 +532,7 @@ class lar_data_constraints(object):
 			row["co_app_sex"] = random.choice(("1", "2"))
 		return row
 
+	@constraint_funcs.register()
 	def v648_const(self, row):
 		"""1) If Sex of Co-Applicant or Co-Borrower Collected on the Basis of Visual Observation or Surname equals 2,
 			then Sex of Co-Applicant or Co-Borrower must equal 1, 2, 3 or 6.
@@ -501,6 +547,7 @@ class lar_data_constraints(object):
 			row["co_app_sex_basis"] = random.choice(("2","3"))
 		return row
 
+	@constraint_funcs.register()
 	def v649_const(self, row):
 		"""If Sex of Co-Applicant or Co-Borrower equals 4, then Sex of Co-Applicant or Co-Borrower Collected
 			on the Basis of Visual Observation or Surname must equal 3."""
@@ -508,6 +555,7 @@ class lar_data_constraints(object):
 			row["co_app_sex_basis"] = "3"
 		return row
 
+	@constraint_funcs.register()
 	def v650_const(self, row):
 		"""1) If Sex of Co-Applicant or Co-Borrower Collected on the Basis of Visual Observation or Surname equals 4, 
 			then Sex of Co-Applicant or Co-Borrower must equal 5, and the reverse must be true."""
@@ -517,6 +565,7 @@ class lar_data_constraints(object):
 			row["co_app_sex_basis"] = "4"
 		return row
 
+	@constraint_funcs.register()
 	def v651_const(self, row):
 		"""1) If the Ethnicity of Applicant or Borrower: 1 equals 4; and Race of Applicant or Borrower: 1 equals 7;
 			and Sex of Applicant or Borrower equals 4 indicating the applicant or borrower is a non-natural person,
@@ -525,6 +574,7 @@ class lar_data_constraints(object):
 			row["app_age"] = "8888"
 		return row
 
+	@constraint_funcs.register()
 	def v652_const(self, row): 
 		"""1) If the Ethnicity of Co-Applicant or Co-Borrower: 1 equals 4; and Race of Co-Applicant or Co-Borrower: 1 equals 7; 
 			and Sex of Co-Applicant or Co-Borrower: 1 equals 4 indicating that the co-applicant or coborrower
@@ -533,12 +583,14 @@ class lar_data_constraints(object):
 			row["co_app_age"] = "8888"
 		return row
 
+	@constraint_funcs.register()
 	def v654_const(self,row):
 		"""1) If Multifamily Affordable Units is a number, then Income must be NA."""
 		if row["affordable_units"] != "NA" and row["affordable_units"] !="":
 			row["income"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v655_const(self, row):
 		"""1) If Ethnicity of Applicant or Borrower: 1 equals 4; and Race of Applicant or Borrower: 1 equals 7; and
 			Sex of Applicant or Borrower: 1 equals 4 indicating the applicant is a non-natural person, then Income must be NA.
@@ -551,12 +603,14 @@ class lar_data_constraints(object):
 			row["income"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v656_const(self, row): 
 		"""2) If Action Taken equals 2, 3, 4, 5, 7 or 8, then Type of Purchaser must equal 0."""
 		if row["action_taken"] in ("2", "3", "4", "5", "7", "8"):
 			row["purchaser_type"] = "0"
 		return row
 
+	@constraint_funcs.register()
 	def v657_const(self, row):
 		"""1) If Action Taken equals 3, 4, 5, 6, or 7, then Rate Spread must be NA.
 		3) If Reverse Mortgage equals 1, then Rate Spread must be NA."""
@@ -564,12 +618,14 @@ class lar_data_constraints(object):
 			row["rate_spread"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v658_const(self, row): 
 		"""1) If Action Taken equals 2, 3, 4, 5, 7, or 8, then HOEPA Status must be 3."""
 		if row["action_taken"] in ("2", "3", "4", "5", "7", "8"):
 			row["hoepa"] = "3"
 		return row
 
+	@constraint_funcs.register()
 	def v661_const(self, row): 
 		"""1) If Credit Score of Applicant or Borrower equals 8888 indicating not applicable, then Applicant or
 			Borrower, Name and Version of Credit Scoring Model must equal 9, and the reverse must be true."""
@@ -579,6 +635,7 @@ class lar_data_constraints(object):
 			row["app_credit_score"] ="8888"
 		return row
 
+	@constraint_funcs.register()
 	def v662_const(self, row): 
 		"""1) If Applicant or Borrower, Name and Version of Credit Scoring Model equals 1, 2, 3, 4, 5, 6, 7, or 9,
 			then Applicant or Borrower, Name and Version of Credit Scoring Model: Conditional Free Form Text
@@ -597,6 +654,7 @@ class lar_data_constraints(object):
 			row["app_score_name"] = "8"
 		return row
 
+	@constraint_funcs.register()
 	def v663_const(self, row): 
 		"""1) If Action Taken equals 4, 5, or 6, then Credit Score of Applicant or Borrower must equal 8888; and
 			Applicant or Borrower, Name and Version of Credit Scoring Model must equal 9; and Applicant or
@@ -608,6 +666,7 @@ class lar_data_constraints(object):
 			row["app_score_code_8"] = ""
 		return row
 
+	@constraint_funcs.register()
 	def v664_const(self, row): 
 		"""1) If Action Taken equals 4, 5, or 6, then Credit Score of Co-Applicant or Co-Borrower must equal 8888;
 			and Co-Applicant or Co-Borrower, Name and Version
@@ -619,6 +678,7 @@ class lar_data_constraints(object):
 			row["co_app_score_code_8"] = ""
 		return row
 
+	@constraint_funcs.register()
 	def v666_const(self,row):
 		"""1) If Credit Score of Co-Applicant or Co-Borrower equals 8888 indicating not applicable, then CoApplicant
 			or Co-Borrower, Name and Version of Credit Scoring Model must equal 9, and the reverse must be true.
@@ -634,6 +694,7 @@ class lar_data_constraints(object):
 			row["co_app_credit_score"] = "9999"
 		return row
 
+	@constraint_funcs.register()
 	def v667_const(self, row): 
 		"""1) If Co-Applicant or Co-Borrower, Name and Version of Credit Scoring Model equals 1, 2, 3, 4, 5, 6, 7, 9, or
 			10, then Co-Applicant or Co-Borrower, Name and Version of Credit Scoring Model: Conditional Free
@@ -651,6 +712,7 @@ class lar_data_constraints(object):
 			row["co_app_score_name"] = "8"
 		return row
 
+	@constraint_funcs.register()
 	def v668_const(self, row):
 		"""1) If Ethnicity of Applicant or Borrower: 1 equals 4; and Race of Applicant or Borrower: 1 equals 7; and
 			Sex of Applicant or Borrower equals 4 indicating the applicant is a non-natural person then Credit Score of
@@ -665,6 +727,7 @@ class lar_data_constraints(object):
 			row["co_app_credit_score"] = "8888"
 		return row
 
+	@constraint_funcs.register()
 	def v669_const(self,row):
 		"""1) Reason for Denial: 1 must equal 1, 2, 3, 4, 5, 6, 7, 8, 9, or 10, and cannot be left blank.
 		2) Reason for Denial: 2; Reason for Denial: 3; and Reason for Denial: 4 must equal 1, 2, 3, 4, 5, 6, 7, 8,
@@ -692,6 +755,7 @@ class lar_data_constraints(object):
 			row["denial_4"] = ""
 		return row
 
+	@constraint_funcs.register()
 	def v670_const(self, row): 
 		"""1) If Action Taken equals 3 or 7, then the Reason for Denial: 1 must equal 1, 2, 3, 4, 5, 6, 7, 8, or 9, and the reverse must be true.
 		2) If Action Taken equals 1, 2, 4, 5, 6, or 8, then Reason for Denial: 1 must equal 10, and the reverse must be true."""
@@ -705,6 +769,7 @@ class lar_data_constraints(object):
 		#	row["action_taken"] = random.choice(("1", "2", "4", "5", "6", "8"))
 		return row
 
+	@constraint_funcs.register()
 	def v671_const(self, row):
 		""" 1) Reason for Denial: 1; Reason for Denial: 2; Reason for Denial: 3; or Reason for Denial: 4 was
 			reported Code 9: Other; however, the Reason for Denial: Conditional Free Form Text Field for Code 9
@@ -717,6 +782,7 @@ class lar_data_constraints(object):
 			row["denial_code_9"] = ""
 		return row
 
+	@constraint_funcs.register()
 	def v672_const(self, row):
 		"""1) Total Loan Costs must be a number greater than or equal to 0 or NA, and cannot be left blank.
 		2) If Total Points and Fees is a number greater than or equal to 0, then Total Loan Costs must be NA.
@@ -740,6 +806,7 @@ class lar_data_constraints(object):
 			row["loan_costs"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v673_const(self, row): 
 		"""1) Total Points and Fees must be a number greater than or equal to 0 or NA, and cannot be left blank.
 		2) If Action Taken equals 2, 3, 4, 5, 6, 7 or 8 then Total Points and Fees must be NA.
@@ -757,6 +824,7 @@ class lar_data_constraints(object):
 				row["points_fees"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v674_const(self, row):
 		"""1) Origination Charges must be a number greater than or equal to 0 or NA, and cannot be left blank.
 		2) If Reverse Mortgage equals 1, then Origination Charges must be NA.
@@ -773,6 +841,7 @@ class lar_data_constraints(object):
 			row["origination_fee"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v675_const(self, row):
 		"""1) Discount Points must be a number greater than 0, blank, or NA.
 		2) If Reverse Mortgage equals 1, then Discount Points must be NA.
@@ -789,6 +858,7 @@ class lar_data_constraints(object):
 			row["discount_points"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v676_const(self, row):
 		"""1) Lender Credits must be a number greater than 0, blank, or NA.
 		2) If Reverse Mortgage equals 1, then Lender Credits must be NA.
@@ -805,6 +875,7 @@ class lar_data_constraints(object):
 			row["lender_credits"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v677_const(self, row):
 		"""1) Interest Rate must be a number greater than or equal to 0, NA or Exempt, and cannot be left blank.
 		2) If Action Taken equals 3, 4, 5, or 7; then Interest Rate must be NA."""
@@ -812,6 +883,7 @@ class lar_data_constraints(object):
 			row["interest_rate"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v678_const(self, row): 
 		"""1) Prepayment Penalty Term must be a whole number greater than 0 or NA, and cannot be left blank.
 		2) If Action Taken equals 6, then Prepayment Penalty Term must be NA.
@@ -831,6 +903,7 @@ class lar_data_constraints(object):
 				row["prepayment_penalty"] = row["loan_term"]
 		return row
 
+	@constraint_funcs.register()
 	def v679_const(self, row): 
 		"""1) Debt-to-Income Ratio must be either a number or NA, and cannot be left blank.
 		2) If Action Taken equals 4, 5 or 6, then Debt-to-Income Ratio must be NA.
@@ -841,6 +914,7 @@ class lar_data_constraints(object):
 			row["dti"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v680_const(self, row): 
 		"""1) If Ethnicity of Applicant or Borrower: 1 equals 4; and Race of Applicant or Borrower: 1 equals 7; and
  			Sex of Applicant or Borrower: 1 equals 4 indicating the applicant or borrower is a non-natural person;
@@ -860,6 +934,7 @@ class lar_data_constraints(object):
 			row["dti"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v681_const(self, row): 
 		"""1) Combined Loan-to-Value Ratio must be either a number greater than 0 or NA, and cannot be left blank.
 		2) If Action Taken equals 4, 5, or 6, then Combined Loan-to-Value ratio must be NA."""
@@ -867,6 +942,7 @@ class lar_data_constraints(object):
 			row["cltv"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v682_const(self, row): 
 		"""1) Loan Term must be either a whole number greater than zero or NA, and cannot be left blank.
 		2) If Reverse Mortgage equals 1, then Loan Term must be NA."""
@@ -874,6 +950,7 @@ class lar_data_constraints(object):
 			row["loan_term"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v688_const(self, row):
 		"""1) Property Value must be either a number greater than 0 or NA, and cannot be left blank.
 		2) If Action Taken equals 4 or 5, then Property Value must be NA."""
@@ -881,6 +958,7 @@ class lar_data_constraints(object):
 			row["property_value"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v689_const(self, row): 
 		"""1) Manufactured Home Secured Property Type must equal 1, 2 or 3, and cannot be left blank.
 		2) If Multifamily Affordable Units is a number, then Manufactured Home Secured Property Type must equal 3.
@@ -891,6 +969,7 @@ class lar_data_constraints(object):
 			row["manufactured_type"] = "3"
 		return row
 
+	@constraint_funcs.register()
 	def v690_const(self, row): 
 		"""1) Manufactured Home Land Property Interest must equal 1, 2, 3, 4, or 5, and cannot be left blank.
 		2) If Multifamily Affordable Units is a number, then Manufactured Home Land Property Interest must equal 5.
@@ -901,6 +980,7 @@ class lar_data_constraints(object):
 			row["manufactured_interest"] = "5"
 		return row
 
+	@constraint_funcs.register()
 	def v692_const(self, row): 
 		"""2) If Total Units is less than 5, then Multifamily Affordable Units must be NA.
 		3) If Total Units is greater than or equal to 5, then Multifamily Affordable Units must be less than or
@@ -911,6 +991,7 @@ class lar_data_constraints(object):
 			row["affordable_units"] = row["total_units"]
 		return row
 
+	@constraint_funcs.register()
 	def v693_const(self, row):
 		"""1) If Action Taken equals 6, then Submission of Application must equal 3, and the reverse must be true."""
 		if row["action_taken"] == "6":
@@ -919,6 +1000,7 @@ class lar_data_constraints(object):
 			row["action_taken"] = "6"
 		return row
 
+	@constraint_funcs.register()
 	def v694_const(self, row): 
 		"""1) Initially Payable to Your Institution must equal 1, 2 or 3, and cannot be left blank.
 		2) If Action Taken equals 6, then Initially Payable to Your Institution must equal 3.
@@ -928,11 +1010,13 @@ class lar_data_constraints(object):
 		if row["action_taken"] == "1" and row["initially_payable"] not in ("1", "2"):
 			row["initially_payable"] = random.choice(("1", "2"))
 		return row
+	@constraint_funcs.register()
 	def v695_const(self, row):
 		"""Adds an MLO ID if necessary"""
 		row["mlo_id"] = "NA"
 		return row
 
+	@constraint_funcs.register()
 	def v696_const(self, row):
 		"""1. Automated Underwriting System: 1 must equal
 			1111, 1, 2, 3, 4, 5, or 6, and cannot be left blank.
@@ -1011,6 +1095,7 @@ class lar_data_constraints(object):
 
 		return row
 
+	@constraint_funcs.register()
 	def v699_const(self, row): 
 		"""1) If Automated Underwriting System: 1; Automated Underwriting System: 2; Automated Underwriting
 			System: 3; Automated Underwriting System: 4; or Automated Underwriting System: 5 equals 5,
@@ -1029,6 +1114,7 @@ class lar_data_constraints(object):
 						"20", "21", "22", "23", "24"))
 		return row
 
+	@constraint_funcs.register()
 	def v700_const(self, row):
 		"""1) If Automated Underwriting System: 1 equals 6, then the corresponding Automated Underwriting
 			System Result: 1 must equal 17; 
@@ -1063,6 +1149,7 @@ class lar_data_constraints(object):
 		return row
 
 
+	@constraint_funcs.register()
 	def v701_const(self, row): 
 		"""1) If Automated Underwriting System: 2; Automated Underwriting System: 3; Automated Underwriting
 			System: 4; or Automated Underwriting System: 5 was left blank, then the corresponding reported
@@ -1077,6 +1164,7 @@ class lar_data_constraints(object):
 					row["aus_result_"+str(i+1)] = random.choice(("1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13", "14", "15"))
 		return row
 
+	@constraint_funcs.register()
 	def v702_const(self, row): 
 		"""1) Automated Underwriting System: 1; Automated Underwriting System: 2; Automated Underwriting
 			System: 3; Automated Underwriting System: 4; or Automated Underwriting System: 5 was reported
@@ -1095,6 +1183,7 @@ class lar_data_constraints(object):
 			row["aus_code_5"] = ""
 		return row
 
+	@constraint_funcs.register()
 	def v703_const(self, row):
 		"""1) Automated Underwriting System Result: 1; Automated Underwriting System Result: 2;
 			Automated Underwriting System Result: 3; Automated Underwriting System Result: 4; or
@@ -1116,6 +1205,7 @@ class lar_data_constraints(object):
 			row["aus_code_16"] = ""
 		return row
 
+	@constraint_funcs.register()
 	def v704_const(self, row): 
 		"""1) If Action Taken equals 6, then Automated Underwriting System: 1 must equal 6.
 		2) If Action Taken equals 6, then Automated Underwriting System Result: 1 must equal 17."""
@@ -1123,6 +1213,7 @@ class lar_data_constraints(object):
 			row["aus_1"] = "6"
 			row["aus_result_1"] = "17"
 		return row
+	@constraint_funcs.register()
 	def v705_const(self, row): 
 		"""1) If Ethnicity of Applicant or Borrower: 1 equals 4; and Race of Applicant or Borrower: 1 equals 7; and
 			Sex of Applicant or Borrower: 1 equals 4 indicating the applicant is a non-natural person; and the
@@ -1145,6 +1236,7 @@ class lar_data_constraints(object):
 			row["aus_result_1"] = "17"
 		return row
 	
+	@constraint_funcs.register()
 	def v709_const(self, row):
 		"""1) If Street Address, City, and Zip Code is reported Exempt, then all three
 			 must be reported Exempt."""
@@ -1154,6 +1246,7 @@ class lar_data_constraints(object):
 			row["zip_code"] = "Exempt"
 		return row
 	
+	@constraint_funcs.register()
 	def v710_const(self, row):
 		
 		"""If the Credit Score exemption election is taken,"""
@@ -1180,6 +1273,7 @@ class lar_data_constraints(object):
 		return row
 
 
+	@constraint_funcs.register()
 	def v711_const(self, row):
 
 		"""1) If the Reason for Denial exemption election is
@@ -1199,6 +1293,7 @@ class lar_data_constraints(object):
 		return row
 
 
+	@constraint_funcs.register()
 	def v712_const(self, row):
 		"""1) If the Total Loan Costs or Total Points and Fees
 			  exemption election is taken, Total Loan Costs and
@@ -1209,6 +1304,7 @@ class lar_data_constraints(object):
 
 		return row
 
+	@constraint_funcs.register()
 	def v713_const(self, row):
 		"""If the Automated Underwriting exemption election is taken,
 		1) Automated Underwriting System: 1 and
@@ -1240,6 +1336,7 @@ class lar_data_constraints(object):
 
 		return row
 		
+	@constraint_funcs.register()
 	def v714_const(self, row):
 		"""1) If the Application Channel exemption election is
 			taken, Submission of Application and Initially Payable
@@ -1250,6 +1347,7 @@ class lar_data_constraints(object):
 			row["initially_payable"] = "1111"
 		return row
 		
+	@constraint_funcs.register()
 	def v715_const(self, row):
 		"""1) If the Non-Amortizing Features exemption election
 				is taken, Balloon Payment, Interest-Only Payments,
@@ -1,26 +1,38 @@
 import json
 import os
+import numpy as np
 import pandas as pd
 import random
 import string
-import time
 import yaml
 
 from collections import OrderedDict
+from geo_index import geo_index
 import utils
+from date_sampler import date_sampler
+from value_sampler import value_sampler
+
+#free text fields filled with random characters and the maximum length (exclusive) of their text
+TEXT_FIELDS = OrderedDict([("app_eth_free", 100), ("co_app_eth_free", 100), ("app_race_native_text", 100), ("app_race_asian_text", 100),
+	("app_race_islander_text", 100), ("co_app_race_native_text", 100), ("co_app_race_asian_text", 100), ("co_app_race_islander_text", 100),
+	("app_score_code_8", 100), ("co_app_score_code_8", 100), ("denial_code_9", 255), ("mlo_id", 25), ("aus_code_5", 255), ("aus_code_16", 255)])
 
 class lar_gen(object):
 	"""
 	Contains functions to create a valid LAR and TS record
 	Functions:
 	- date_gen
+	- activity_dates
 	- random_enum
 	- get_schema_val
 	- get_schema_list
+	- get_schema_array
 	- range_and_enum
+	- range_sampler
 	- tract_from_county
 	- make_ts_row
 	- make_row
+	- make_rows
 	"""
 	def __init__(self, lar_schema_file="../schemas/lar_schema.json", ts_schema_file="../schemas/ts_schema.json"):
 	#, config_file='configurations/clean_file_config.yaml', geo_config_file='configurations/geographic_data.yaml'):
@@ -40,6 +52,9 @@ class lar_gen(object):
 		with open(ts_schema_file, 'r') as f:
 			ts_schema_json = json.load(f)
 		self.ts_schema_df = pd.DataFrame(ts_schema_json)
+		#valid values of each field, compiled once so lookups do not filter the schema dataframes
+		self.schema_enums = {"LAR": self.compile_schema(self.lar_schema_df), "TS": self.compile_schema(self.ts_schema_df)}
+		self.samplers = {} #value_samplers by field and range, see range_sampler
 
 		#with open(self.geo_config["zip_code_file"], 'r') as f:
 		#	self.zip_codes = json.load(f)
@@ -49,60 +64,69 @@ class lar_gen(object):
 		#del self.geo_config
 		del lar_schema_json
 		del ts_schema_json
+		self.geo = None #geo_index of census data, set from the geographic data passed to make_row
 		print("LAR generator initialization complete")
 
-	def date_gen(self, activity_year, valid=True):
-		"""Generates and returns a semi-valid date string or an invalid date string. Does not check days per month."""
-		months = list(range(1,13))
-		days = list(range(1,32))
+	def date_gen(self, activity_year, valid=True, profile=None):
+		"""
+		Returns a valid date string in the activity year, or an invalid date string (bad month or day) if valid is False.
+		profile is an optional list of 12 monthly weights, see date_sampler.
+		"""
 		if valid:
-			valid_date = False
-			while valid_date == False:
-				date = str(activity_year)+str(random.choice(months)).zfill(2)+str(random.choice(days)).zfill(2)
-				try:
-					time.strptime(date,'%Y%m%d')
-					valid_date = True
-				except:
-					valid_date = False
-		else:
-			date = str(lar_file_config["calendar_year"]["value"])+str(16)+str(33)
-		return date
+			return self.activity_dates(activity_year, profile=profile).choice()
+		return self.activity_dates(activity_year, profile=profile).invalid_choice()
+
+	def activity_dates(self, activity_year, profile=None):
+		"""Returns a date_sampler for the activity year and monthly profile. Samplers are created once for each year and profile."""
+		key = ("dates", int(activity_year), None if profile is None else tuple(profile))
+		if key not in self.samplers:
+			self.samplers[key] = date_sampler(activity_year, profile=profile)
+		return self.samplers[key]
+
+	def compile_schema(self, schema_df):
+		"""
+		Returns a dictionary of field name to the field's valid values from a schema dataframe, as tuples without and
+		with a blank added, and as numpy arrays of the values as strings without and with a blank added.
+		The tuples and arrays are shared by all callers and are not changed by them.
+		"""
+		schema_enums = {}
+		for field, valid_vals in zip(schema_df.field, schema_df.valid_vals):
+			values = tuple(valid_vals)
+			arrays = []
+			for strings in ([str(value) for value in values], [str(value) for value in values] + [""]):
+				array = np.array(strings, dtype=object)
+				array.flags.writeable = False
+				arrays.append(array)
+			schema_enums[field] = (values, values + ("",), arrays[0], arrays[1])
+		return schema_enums
 
 	def get_schema_val(self, schema="LAR", position=0, item=0, field=None):
 		"""Returns a value from the valid_vals list in the schema for the named field. Default is the first value in the list."""
 		if not field:
 			raise ValueError("must specify which field")
-		if schema=="LAR":
-			return self.lar_schema_df.valid_vals[self.lar_schema_df.field==field].iloc[position][item]
-		elif schema=="TS":
-			return self.ts_schema_df.valid_vals[self.ts_schema_df.field==field].iloc[position][item]
-		else:
-			pass
+		if schema in self.schema_enums:
+			return self.schema_enums[schema][field][0][item]
 
 	def get_schema_list(self, schema="LAR", field=None, empty=False):
 		"""
-		Returns the list of valid values for the specified schema and field. 
-		Optionally adds blanks to the list of values.
+		Returns a tuple of valid values for the specified schema and field. 
+		Optionally adds a blank to the end of the values.
 		"""
 		
 		if not field:
 			raise ValueError("must specify which field")
+		if schema in self.schema_enums:
+			return self.schema_enums[schema][field][1 if empty else 0]
 
-		if schema=="LAR":
-			if empty:
-				schema_enums = self.lar_schema_df.valid_vals[self.lar_schema_df.field==field].iloc[0]
-				schema_enums.append("")
-				return schema_enums
-			else: 
-				return self.lar_schema_df.valid_vals[self.lar_schema_df.field==field].iloc[0]
-
-		elif schema=="TS":
-			if empty:
-				schema_enums = self.ts_schema_df.valid_vals[self.ts_schema_df.field==field].iloc[0]
-				schema_enums.append("")
-				return schema_enums
-			else:
-				return self.ts_schema_df.valid_vals[self.ts_schema_df.field==field].iloc[0]
+	def get_schema_array(self, schema="LAR", field=None, empty=False):
+		"""
+		Returns a read only numpy array of the valid values for the specified schema and field as strings.
+		Optionally adds a blank to the end of the values.
+		"""
+		if not field:
+			raise ValueError("must specify which field")
+		if schema in self.schema_enums:
+			return self.schema_enums[schema][field][3 if empty else 2]
 
 	def range_and_enum(self, field=None, rng_min=1, rng_max=100, dtype="int", empty=False):
 		"""
@@ -111,8 +135,7 @@ class lar_gen(object):
 		if empty is True the returned list will contain an empty string
 		"""
 
-		lst=[]
-		lst = self.get_schema_list(field=field) #get NA values from schema if present
+		lst = list(self.get_schema_list(field=field)) #get NA values from schema if present
 		if dtype=="int":
 			for i in range(rng_min, rng_max):
 				lst.append(i)
@@ -123,10 +146,36 @@ class lar_gen(object):
 			lst.append("")
 		return lst
 
+	def range_sampler(self, field=None, rng_min=1, rng_max=100, dtype="int", empty=False, weights=None):
+		"""
+		Returns a value_sampler drawing from the values range_and_enum lists for the field, without building the list.
+		If no field is passed only numbers (and a blank if empty is True) are drawn.
+		Samplers are created once for each field and range.
+		"""
+		key = (field, rng_min, rng_max, dtype, empty, None if weights is None else tuple(weights))
+		if key not in self.samplers:
+			codes = self.get_schema_list(field=field) if field else ()
+			self.samplers[key] = value_sampler(codes=codes, rng_min=rng_min, rng_max=rng_max, dtype=dtype, empty=empty, weights=weights)
+		return self.samplers[key]
+
+	def date_profile(self, lar_file_config):
+		"""Returns the optional date_profile value (12 monthly weights) from the LAR file configuration, or None."""
+		if "date_profile" not in lar_file_config:
+			return None
+		return lar_file_config["date_profile"]["value"]
+
+	def load_geo_index(self, geographic_data):
+		"""
+		Sets the geo_index used for geography lookups. geographic_data is the census dataframe or a geo_index.
+		The index is only rebuilt when different geographic data is passed.
+		"""
+		if self.geo is None or (geographic_data is not self.geo and geographic_data is not self.geo.geographic_data):
+			self.geo = geo_index.load(geographic_data)
+		return self.geo
+
 	def tract_from_county(self, county):
 		"""Returns a Census Tract FIPS that is valid for the passed county."""
-		valid_tracts = [tract for tract in self.tract_list if tract[:5]==county]
-		return random.choice(valid_tracts)
+		return self.geo.random_tract(county=county)
 
 	def make_ts_row(self, bank_file_config):
 		"""Creates a TS row as a dictionary and returns it."""
@@ -153,26 +202,32 @@ class lar_gen(object):
 	def make_row(self, lar_file_config, geographic_data, state_codes, zip_code_list):
 		"""Make num_rows LAR rows and return them as a list of ordered dicts"""
 		valid_lar_row = OrderedDict() 
-		valid_lar_row["record_id"] = str(self.lar_schema_df.valid_vals[self.lar_schema_df.field=="record_id"].iloc[0][0])
+		valid_lar_row["record_id"] = str(self.get_schema_val(field="record_id"))
 		valid_lar_row["lei"] = lar_file_config["lei"]["value"]
-		valid_lar_row["uli"] = valid_lar_row['lei'] + utils.char_string_gen(23)
-		valid_lar_row["uli"] = valid_lar_row["uli"] + utils.check_digit_gen(ULI=valid_lar_row["uli"])
-		valid_lar_row["uli"] = random.choice([valid_lar_row["uli"], utils.char_string_gen(22)])
-		valid_lar_row["app_date"] = str(self.date_gen(activity_year=lar_file_config["activity_year"]["value"]))
+		#the random text of the row is drawn in one call: a ULI body, a loan ID and the free text fields
+		uli_body, loan_id, *text = utils.char_string_batch([23, 22] + [random.randrange(max_length) for max_length in TEXT_FIELDS.values()])
+		text = dict(zip(TEXT_FIELDS, text))
+		valid_lar_row["uli"] = valid_lar_row['lei'] + uli_body
+		valid_lar_row["uli"] = valid_lar_row["uli"] + utils.check_digit_batch([valid_lar_row["uli"]])[0]
+		valid_lar_row["uli"] = random.choice([valid_lar_row["uli"], loan_id])
+		#application and action dates are drawn together so the application date is not after the action date
+		app_date, action_date = self.activity_dates(lar_file_config["activity_year"]["value"],
+			profile=self.date_profile(lar_file_config)).choice_pair()
+		valid_lar_row["app_date"] = app_date
 		valid_lar_row["loan_type"] = str(random.choice(self.get_schema_list(field="loan_type")))
 		valid_lar_row["loan_purpose"] = str(random.choice(self.get_schema_list(field="loan_purpose")))
 		valid_lar_row["preapproval"] = str(random.choice(self.get_schema_list(field="preapproval")))
 		valid_lar_row["const_method"] = str(random.choice(self.get_schema_list(field="const_method")))
 		valid_lar_row["occ_type"] = str(random.choice(self.get_schema_list(field="occ_type")))
-		valid_lar_row["loan_amount"] = str(random.choice(range(1, lar_file_config["max_amount"]["value"])))
+		valid_lar_row["loan_amount"] = self.range_sampler(rng_max=lar_file_config["max_amount"]["value"]).choice()
 		valid_lar_row["action_taken"] = str(random.choice(self.get_schema_list(field='action_taken')))
-		valid_lar_row["action_date"] = str(self.date_gen(activity_year=lar_file_config["activity_year"]["value"]))
+		valid_lar_row["action_date"] = action_date
 		valid_lar_row["street_address"] = random.choice([lar_file_config["street_addy"]["value"], lar_file_config["street_addy"]["value"], "Exempt"])
 		valid_lar_row["city"] = lar_file_config["city"]["value"]
 		valid_lar_row["state"] = "" #placeholder to preserve LAR order
 		valid_lar_row["zip_code"] = random.choice(zip_code_list)
 		valid_lar_row["county"] = "" #placeholder to preserve LAR order
-		valid_lar_row["tract"] = random.choice(geographic_data["tract_fips"])
+		valid_lar_row["tract"] = self.load_geo_index(geographic_data).random_tract()
 		valid_lar_row["state"] = state_codes[str(valid_lar_row["tract"][:2])]
 		valid_lar_row["county"] = valid_lar_row["tract"][:5]
 		valid_lar_row["app_eth_1"] = str(random.choice(self.get_schema_list(field="app_eth_1", empty=True)))
@@ -180,13 +235,13 @@ class lar_gen(object):
 		valid_lar_row["app_eth_3"] = str(random.choice(self.get_schema_list(field="app_eth_3", empty=True)))
 		valid_lar_row["app_eth_4"] = str(random.choice(self.get_schema_list(field="app_eth_4", empty=True)))
 		valid_lar_row["app_eth_5"] = str(random.choice(self.get_schema_list(field="app_eth_5", empty=True)))
-		valid_lar_row["app_eth_free"] = utils.char_string_gen(random.choice(range(100)))
+		valid_lar_row["app_eth_free"] = text["app_eth_free"]
 		valid_lar_row["co_app_eth_1"] = str(random.choice(self.get_schema_list(field="co_app_eth_1", empty=True)))
 		valid_lar_row["co_app_eth_2"] = str(random.choice(self.get_schema_list(field="co_app_eth_2", empty=True)))
 		valid_lar_row["co_app_eth_3"] = str(random.choice(self.get_schema_list(field="co_app_eth_3", empty=True)))
 		valid_lar_row["co_app_eth_4"] = str(random.choice(self.get_schema_list(field="co_app_eth_4", empty=True)))
 		valid_lar_row["co_app_eth_5"] = str(random.choice(self.get_schema_list(field="co_app_eth_5", empty=True)))
-		valid_lar_row["co_app_eth_free"] = utils.char_string_gen(random.choice(range(100)))
+		valid_lar_row["co_app_eth_free"] = text["co_app_eth_free"]
 		valid_lar_row["app_eth_basis"] = str(random.choice(self.get_schema_list(field="app_eth_basis")))
 		valid_lar_row["co_app_eth_basis"] = str(random.choice(self.get_schema_list(field="co_app_eth_basis")))
 		valid_lar_row["app_race_1"] = str(random.choice(self.get_schema_list(field="app_race_1", empty=True)))
@@ -194,78 +249,191 @@ class lar_gen(object):
 		valid_lar_row["app_race_3"] = str(random.choice(self.get_schema_list(field="app_race_3", empty=True)))
 		valid_lar_row["app_race_4"] = str(random.choice(self.get_schema_list(field="app_race_4", empty=True)))
 		valid_lar_row["app_race_5"] = str(random.choice(self.get_schema_list(field="app_race_5", empty=True)))
-		valid_lar_row["app_race_native_text"] = utils.char_string_gen(random.choice(range(100)))
-		valid_lar_row["app_race_asian_text"] = utils.char_string_gen(random.choice(range(100)))
-		valid_lar_row["app_race_islander_text"] = utils.char_string_gen(random.choice(range(100)))
+		valid_lar_row["app_race_native_text"] = text["app_race_native_text"]
+		valid_lar_row["app_race_asian_text"] = text["app_race_asian_text"]
+		valid_lar_row["app_race_islander_text"] = text["app_race_islander_text"]
 		valid_lar_row["co_app_race_1"] = str(random.choice(self.get_schema_list(field="co_app_race_1", empty=True)))
 		valid_lar_row["co_app_race_2"] = str(random.choice(self.get_schema_list(field="co_app_race_2", empty=True)))
 		valid_lar_row["co_app_race_3"] = str(random.choice(self.get_schema_list(field="co_app_race_3", empty=True)))
 		valid_lar_row["co_app_race_4"] = str(random.choice(self.get_schema_list(field="co_app_race_4", empty=True)))
 		valid_lar_row["co_app_race_5"] = str(random.choice(self.get_schema_list(field="co_app_race_5", empty=True)))
-		valid_lar_row["co_app_race_native_text"] = utils.char_string_gen(random.choice(range(100)))
-		valid_lar_row["co_app_race_asian_text"] = utils.char_string_gen(random.choice(range(100)))
-		valid_lar_row["co_app_race_islander_text"] = utils.char_string_gen(random.choice(range(100)))
+		valid_lar_row["co_app_race_native_text"] = text["co_app_race_native_text"]
+		valid_lar_row["co_app_race_asian_text"] = text["co_app_race_asian_text"]
+		valid_lar_row["co_app_race_islander_text"] = text["co_app_race_islander_text"]
 		valid_lar_row["app_race_basis"] = str(random.choice(self.get_schema_list(field="app_race_basis")))
 		valid_lar_row["co_app_race_basis"] = str(random.choice(self.get_schema_list(field="co_app_race_basis")))
 		valid_lar_row["app_sex"] = str(random.choice(self.get_schema_list(field="app_sex")))
 		valid_lar_row["co_app_sex"] = str(random.choice(self.get_schema_list(field="co_app_sex")))
 		valid_lar_row["app_sex_basis"] = str(random.choice(self.get_schema_list(field="app_sex_basis")))
 		valid_lar_row["co_app_sex_basis"] = str(random.choice(self.get_schema_list(field="co_app_sex_basis")))
-		valid_lar_row["app_age"] = str(random.choice(self.range_and_enum(field="app_age", rng_max=lar_file_config["max_age"]["value"])))
-		valid_lar_row["co_app_age"] = str(random.choice(self.range_and_enum(field="co_app_age", rng_max=lar_file_config["max_age"]["value"])))
-		valid_lar_row["income"] = str(random.choice(range(1, lar_file_config["max_income"]["value"])))
+		valid_lar_row["app_age"] = self.range_sampler(field="app_age", rng_max=lar_file_config["max_age"]["value"]).choice()
+		valid_lar_row["co_app_age"] = self.range_sampler(field="co_app_age", rng_max=lar_file_config["max_age"]["value"]).choice()
+		valid_lar_row["income"] = self.range_sampler(rng_max=lar_file_config["max_income"]["value"]).choice()
 		valid_lar_row["purchaser_type"] = str(random.choice(self.get_schema_list(field="purchaser_type")))
-		valid_lar_row["rate_spread"]= str(random.choice(self.range_and_enum(field="rate_spread", rng_max=lar_file_config["max_rs"]["value"], dtype="float")))
+		valid_lar_row["rate_spread"]= self.range_sampler(field="rate_spread", rng_max=lar_file_config["max_rs"]["value"], dtype="float").choice()
 		valid_lar_row["hoepa"] = str(random.choice(self.get_schema_list(field="hoepa")))
 		valid_lar_row["lien"] = str(random.choice(self.get_schema_list(field="lien")))
-		valid_lar_row["app_credit_score"] = str(random.choice(self.range_and_enum(field="app_credit_score", rng_min=lar_file_config["min_credit_score"]["value"], rng_max=lar_file_config["max_credit_score"]["value"])))
-		valid_lar_row["co_app_credit_score"] = str(random.choice(self.range_and_enum(field="co_app_credit_score", rng_min=lar_file_config["min_credit_score"]["value"], rng_max=lar_file_config["max_credit_score"]["value"])))
+		valid_lar_row["app_credit_score"] = self.range_sampler(field="app_credit_score", rng_min=lar_file_config["min_credit_score"]["value"], rng_max=lar_file_config["max_credit_score"]["value"]).choice()
+		valid_lar_row["co_app_credit_score"] = self.range_sampler(field="co_app_credit_score", rng_min=lar_file_config["min_credit_score"]["value"], rng_max=lar_file_config["max_credit_score"]["value"]).choice()
 		valid_lar_row["app_score_name"] = str(random.choice(self.get_schema_list(field="app_score_name")))
-		valid_lar_row["app_score_code_8"] = str(utils.char_string_gen(random.choice(range(100))))
+		valid_lar_row["app_score_code_8"] = text["app_score_code_8"]
 		valid_lar_row["co_app_score_name"] = str(random.choice(self.get_schema_list(field="co_app_score_name")))
-		valid_lar_row["co_app_score_code_8"] = utils.char_string_gen(random.choice(range(100)))
+		valid_lar_row["co_app_score_code_8"] = text["co_app_score_code_8"]
 		valid_lar_row["denial_1"] = str(random.choice(self.get_schema_list(field="denial_1")))
 		valid_lar_row["denial_2"] = str(random.choice(self.get_schema_list(field="denial_2", empty=True)))
 		valid_lar_row["denial_3"] = str(random.choice(self.get_schema_list(field="denial_3", empty=True)))
 		valid_lar_row["denial_4"] = str(random.choice(self.get_schema_list(field="denial_4", empty=True)))
-		valid_lar_row["denial_code_9"] = utils.char_string_gen(random.choice(range(255)))
-		valid_lar_row["loan_costs"] = str(random.choice(self.range_and_enum(field="loan_costs",rng_max=lar_file_config["loan_costs"]["value"])))
-		valid_lar_row["points_fees"] = str(random.choice(self.range_and_enum(field="points_fees", rng_max=lar_file_config["points_and_fees"]["value"])))
-		valid_lar_row["origination_fee"] = str(random.choice(self.range_and_enum(field="origination_fee", rng_max=lar_file_config["orig_charges"]["value"])))
-		valid_lar_row["discount_points"] = str(random.choice(self.range_and_enum(field="discount_points", rng_max=lar_file_config["discount_points"]["value"], empty=True)))
-		valid_lar_row["lender_credits"] = str(random.choice(self.range_and_enum(field="lender_credits", rng_max=lar_file_config["lender_credits"]["value"], empty=True)))
-		valid_lar_row["interest_rate"] = str(random.choice(self.range_and_enum(field="interest_rate", rng_max=lar_file_config["interest_rate"]["value"], dtype="float")))
-		valid_lar_row["prepayment_penalty"] = str(random.choice(self.range_and_enum(field="prepayment_penalty", rng_max=lar_file_config["penalty_max"]["value"])))
-		valid_lar_row["dti"] = str(random.choice(self.range_and_enum(field="dti", rng_max=lar_file_config["dti"]["value"])))
-		valid_lar_row["cltv"] = str(random.choice(self.range_and_enum(field="cltv", rng_max=lar_file_config["cltv"]["value"])))
-		valid_lar_row["loan_term"] = str(random.choice(self.range_and_enum(field="loan_term", rng_max=lar_file_config["loan_term"]["value"])))
-		valid_lar_row["intro_rate"] = str(random.choice(self.range_and_enum(field="intro_rate", rng_max=lar_file_config["intro_rate"]["value"])))
+		valid_lar_row["denial_code_9"] = text["denial_code_9"]
+		valid_lar_row["loan_costs"] = self.range_sampler(field="loan_costs",rng_max=lar_file_config["loan_costs"]["value"]).choice()
+		valid_lar_row["points_fees"] = self.range_sampler(field="points_fees", rng_max=lar_file_config["points_and_fees"]["value"]).choice()
+		valid_lar_row["origination_fee"] = self.range_sampler(field="origination_fee", rng_max=lar_file_config["orig_charges"]["value"]).choice()
+		valid_lar_row["discount_points"] = self.range_sampler(field="discount_points", rng_max=lar_file_config["discount_points"]["value"], empty=True).choice()
+		valid_lar_row["lender_credits"] = self.range_sampler(field="lender_credits", rng_max=lar_file_config["lender_credits"]["value"], empty=True).choice()
+		valid_lar_row["interest_rate"] = self.range_sampler(field="interest_rate", rng_max=lar_file_config["interest_rate"]["value"], dtype="float").choice()
+		valid_lar_row["prepayment_penalty"] = self.range_sampler(field="prepayment_penalty", rng_max=lar_file_config["penalty_max"]["value"]).choice()
+		valid_lar_row["dti"] = self.range_sampler(field="dti", rng_max=lar_file_config["dti"]["value"]).choice()
+		valid_lar_row["cltv"] = self.range_sampler(field="cltv", rng_max=lar_file_config["cltv"]["value"]).choice()
+		valid_lar_row["loan_term"] = self.range_sampler(field="loan_term", rng_max=lar_file_config["loan_term"]["value"]).choice()
+		valid_lar_row["intro_rate"] = self.range_sampler(field="intro_rate", rng_max=lar_file_config["intro_rate"]["value"]).choice()
 		valid_lar_row["balloon"] = str(random.choice(self.get_schema_list(field="balloon")))
 		valid_lar_row["int_only_pmts"] = str(random.choice(self.get_schema_list(field="int_only_pmts")))
 		valid_lar_row["neg_amort"] = str(random.choice(self.get_schema_list(field="neg_amort")))
 		valid_lar_row["non_amort_features"] = str(random.choice(self.get_schema_list(field="non_amort_features")))
-		valid_lar_row["property_value"] = str(random.choice(self.range_and_enum(field="property_value", rng_min=lar_file_config["prop_val_min"]["value"], rng_max=lar_file_config["prop_val_max"]["value"])))
+		valid_lar_row["property_value"] = self.range_sampler(field="property_value", rng_min=lar_file_config["prop_val_min"]["value"], rng_max=lar_file_config["prop_val_max"]["value"]).choice()
 		valid_lar_row["manufactured_type"] = str(random.choice(self.get_schema_list(field="manufactured_type")))
 		valid_lar_row["manufactured_interest"] = str(random.choice(self.get_schema_list(field="manufactured_interest")))
-		valid_lar_row["total_units"] = str(random.choice(self.range_and_enum(field="total_units", rng_min=1, rng_max=lar_file_config["max_units"]["value"])))
-		valid_lar_row["affordable_units"] = str(random.choice(self.range_and_enum(field="affordable_units", rng_min=0, rng_max=int(valid_lar_row["total_units"]))))
+		valid_lar_row["total_units"] = self.range_sampler(field="total_units", rng_min=1, rng_max=lar_file_config["max_units"]["value"]).choice()
+		valid_lar_row["affordable_units"] = self.range_sampler(field="affordable_units", rng_min=0).choice(rng_max=int(valid_lar_row["total_units"]))
 		valid_lar_row["app_submission"] = str(random.choice(self.get_schema_list(field="app_submission")))
 		valid_lar_row["initially_payable"] = str(random.choice(self.get_schema_list(field="initially_payable")))
-		valid_lar_row["mlo_id"] = utils.char_string_gen(random.choice(range(25)))
+		valid_lar_row["mlo_id"] = text["mlo_id"]
 		valid_lar_row["aus_1"] = str(random.choice(self.get_schema_list(field="aus_1")))
 		valid_lar_row["aus_2"] = str(random.choice(self.get_schema_list(field="aus_2", empty=True)))
 		valid_lar_row["aus_3"] = str(random.choice(self.get_schema_list(field="aus_3", empty=True)))
 		valid_lar_row["aus_4"] = str(random.choice(self.get_schema_list(field="aus_4", empty=True)))
 		valid_lar_row["aus_5"] = str(random.choice(self.get_schema_list(field="aus_5", empty=True)))
-		valid_lar_row["aus_code_5"] = utils.char_string_gen(random.choice(range(255)))
+		valid_lar_row["aus_code_5"] = text["aus_code_5"]
 		valid_lar_row["aus_result_1"] = str(random.choice(self.get_schema_list(field="aus_result_1")))
 		valid_lar_row["aus_result_2"] = str(random.choice(self.get_schema_list(field="aus_result_2", empty=True)))
 		valid_lar_row["aus_result_3"] = str(random.choice(self.get_schema_list(field="aus_result_3", empty=True)))
 		valid_lar_row["aus_result_4"] = str(random.choice(self.get_schema_list(field="aus_result_4", empty=True)))
 		valid_lar_row["aus_result_5"] = str(random.choice(self.get_schema_list(field="aus_result_5", empty=True)))
-		valid_lar_row["aus_code_16"] = utils.char_string_gen(random.choice(range(255)))
+		valid_lar_row["aus_code_16"] = text["aus_code_16"]
 		valid_lar_row["reverse_mortgage"] = str(random.choice(self.get_schema_list(field="reverse_mortgage")))
 		valid_lar_row["open_end_credit"] = str(random.choice(self.get_schema_list(field="open_end_credit")))
 		valid_lar_row["business_purpose"] = str(random.choice(self.get_schema_list(field="business_purpose")))
 
-		return valid_lar_row
\ No newline at end of file
+		return valid_lar_row
+
+	def enum_batch(self, rng, num_rows, field, empty=False):
+		"""Returns a numpy object array of num_rows values drawn from the schema valid values for the field as strings."""
+		values = self.get_schema_array(field=field, empty=empty)
+		return values[rng.integers(0, len(values), size=num_rows)]
+
+	def text_batch(self, rng, num_rows):
+		"""
+		Returns a dictionary of the TEXT_FIELDS and the ULI body (uli_body) and loan ID (loan_id) to num_rows strings
+		of random characters. Text field lengths are drawn from 0 to the field's maximum length (exclusive), as
+		make_row uses. The characters for all fields are drawn in one call to utils.char_string_batch.
+		"""
+		max_lengths = np.array(list(TEXT_FIELDS.values()))
+		lengths = np.column_stack([np.full(num_rows, 23), np.full(num_rows, 22), rng.integers(0, max_lengths, size=(num_rows, len(max_lengths)))])
+		strings = utils.char_string_batch(lengths.ravel(), rng=rng).reshape(lengths.shape)
+		return dict(zip(["uli_body", "loan_id"] + list(TEXT_FIELDS), strings.T))
+
+	def make_rows(self, num_rows, lar_file_config, geographic_data, state_codes, zip_code_list, seed=None):
+		"""
+		Makes num_rows LAR rows and returns them as a dataframe with the columns of make_row in the same order.
+		Each field is drawn for all rows at once with numpy from the values make_row chooses from.
+		Application and action dates are drawn as pairs over the days of the activity year, application date first.
+		seed is passed to numpy.random.default_rng to make the rows repeatable.
+		"""
+		rng = np.random.default_rng(seed)
+		geo = self.load_geo_index(geographic_data)
+		activity_year = lar_file_config["activity_year"]["value"]
+		config = lambda name: lar_file_config[name]["value"]
+
+		lar_rows = OrderedDict()
+		lar_rows["record_id"] = np.full(num_rows, str(self.get_schema_val(field="record_id")), dtype=object)
+		lar_rows["lei"] = np.full(num_rows, config("lei"), dtype=object)
+		text = self.text_batch(rng, num_rows)
+		ulis = config("lei") + text["uli_body"]
+		ulis = ulis + utils.check_digit_batch(ulis)
+		lar_rows["uli"] = np.where(rng.integers(0, 2, size=num_rows) == 0, ulis, text["loan_id"])
+		app_dates, action_dates = self.activity_dates(activity_year, profile=self.date_profile(lar_file_config)).sample_pair(rng, num_rows)
+		lar_rows["app_date"] = app_dates
+		for field in ("loan_type", "loan_purpose", "preapproval", "const_method", "occ_type"):
+			lar_rows[field] = self.enum_batch(rng, num_rows, field)
+		lar_rows["loan_amount"] = self.range_sampler(rng_max=config("max_amount")).sample(rng, num_rows)
+		lar_rows["action_taken"] = self.enum_batch(rng, num_rows, "action_taken")
+		lar_rows["action_date"] = action_dates
+		lar_rows["street_address"] = np.array([config("street_addy"), config("street_addy"), "Exempt"], dtype=object)[rng.integers(0, 3, size=num_rows)]
+		lar_rows["city"] = np.full(num_rows, config("city"), dtype=object)
+		tracts = geo.tracts[rng.integers(0, len(geo.tracts), size=num_rows)]
+		state_fips, state_rows = np.unique(tracts.astype("<U2"), return_inverse=True)
+		lar_rows["state"] = np.array([state_codes[str(fips)] for fips in state_fips], dtype=object)[state_rows]
+		lar_rows["zip_code"] = np.array(zip_code_list, dtype=object)[rng.integers(0, len(zip_code_list), size=num_rows)]
+		lar_rows["county"] = tracts.astype("<U5").astype(object)
+		lar_rows["tract"] = tracts
+		for prefix in ("app", "co_app"):
+			for i in range(1, 6):
+				lar_rows["{prefix}_eth_{i}".format(prefix=prefix, i=i)] = self.enum_batch(rng, num_rows, "{prefix}_eth_{i}".format(prefix=prefix, i=i), empty=True)
+			lar_rows["{prefix}_eth_free".format(prefix=prefix)] = text["{prefix}_eth_free".format(prefix=prefix)]
+		lar_rows["app_eth_basis"] = self.enum_batch(rng, num_rows, "app_eth_basis")
+		lar_rows["co_app_eth_basis"] = self.enum_batch(rng, num_rows, "co_app_eth_basis")
+		for prefix in ("app", "co_app"):
+			for i in range(1, 6):
+				lar_rows["{prefix}_race_{i}".format(prefix=prefix, i=i)] = self.enum_batch(rng, num_rows, "{prefix}_race_{i}".format(prefix=prefix, i=i), empty=True)
+			for race in ("native", "asian", "islander"):
+				lar_rows["{prefix}_race_{race}_text".format(prefix=prefix, race=race)] = text["{prefix}_race_{race}_text".format(prefix=prefix, race=race)]
+		for field in ("app_race_basis", "co_app_race_basis", "app_sex", "co_app_sex", "app_sex_basis", "co_app_sex_basis"):
+			lar_rows[field] = self.enum_batch(rng, num_rows, field)
+		lar_rows["app_age"] = self.range_sampler(field="app_age", rng_max=config("max_age")).sample(rng, num_rows)
+		lar_rows["co_app_age"] = self.range_sampler(field="co_app_age", rng_max=config("max_age")).sample(rng, num_rows)
+		lar_rows["income"] = self.range_sampler(rng_max=config("max_income")).sample(rng, num_rows)
+		lar_rows["purchaser_type"] = self.enum_batch(rng, num_rows, "purchaser_type")
+		lar_rows["rate_spread"] = self.range_sampler(field="rate_spread", rng_max=config("max_rs"), dtype="float").sample(rng, num_rows)
+		lar_rows["hoepa"] = self.enum_batch(rng, num_rows, "hoepa")
+		lar_rows["lien"] = self.enum_batch(rng, num_rows, "lien")
+		for field in ("app_credit_score", "co_app_credit_score"):
+			lar_rows[field] = self.range_sampler(field=field, rng_min=config("min_credit_score"), rng_max=config("max_credit_score")).sample(rng, num_rows)
+		lar_rows["app_score_name"] = self.enum_batch(rng, num_rows, "app_score_name")
+		lar_rows["app_score_code_8"] = text["app_score_code_8"]
+		lar_rows["co_app_score_name"] = self.enum_batch(rng, num_rows, "co_app_score_name")
+		lar_rows["co_app_score_code_8"] = text["co_app_score_code_8"]
+		lar_rows["denial_1"] = self.enum_batch(rng, num_rows, "denial_1")
+		for field in ("denial_2", "denial_3", "denial_4"):
+			lar_rows[field] = self.enum_batch(rng, num_rows, field, empty=True)
+		lar_rows["denial_code_9"] = text["denial_code_9"]
+		lar_rows["loan_costs"] = self.range_sampler(field="loan_costs", rng_max=config("loan_costs")).sample(rng, num_rows)
+		lar_rows["points_fees"] = self.range_sampler(field="points_fees", rng_max=config("points_and_fees")).sample(rng, num_rows)
+		lar_rows["origination_fee"] = self.range_sampler(field="origination_fee", rng_max=config("orig_charges")).sample(rng, num_rows)
+		lar_rows["discount_points"] = self.range_sampler(field="discount_points", rng_max=config("discount_points"), empty=True).sample(rng, num_rows)
+		lar_rows["lender_credits"] = self.range_sampler(field="lender_credits", rng_max=config("lender_credits"), empty=True).sample(rng, num_rows)
+		lar_rows["interest_rate"] = self.range_sampler(field="interest_rate", rng_max=config("interest_rate"), dtype="float").sample(rng, num_rows)
+		lar_rows["prepayment_penalty"] = self.range_sampler(field="prepayment_penalty", rng_max=config("penalty_max")).sample(rng, num_rows)
+		for field in ("dti", "cltv", "loan_term", "intro_rate"):
+			lar_rows[field] = self.range_sampler(field=field, rng_max=config(field)).sample(rng, num_rows)
+		for field in ("balloon", "int_only_pmts", "neg_amort", "non_amort_features"):
+			lar_rows[field] = self.enum_batch(rng, num_rows, field)
+		lar_rows["property_value"] = self.range_sampler(field="property_value", rng_min=config("prop_val_min"), rng_max=config("prop_val_max")).sample(rng, num_rows)
+		lar_rows["manufactured_type"] = self.enum_batch(rng, num_rows, "manufactured_type")
+		lar_rows["manufactured_interest"] = self.enum_batch(rng, num_rows, "manufactured_interest")
+		lar_rows["total_units"] = self.range_sampler(field="total_units", rng_min=1, rng_max=config("max_units")).sample(rng, num_rows)
+		lar_rows["affordable_units"] = self.range_sampler(field="affordable_units", rng_min=0).sample(rng, num_rows,
+			rng_max=lar_rows["total_units"].astype(np.int64))
+		lar_rows["app_submission"] = self.enum_batch(rng, num_rows, "app_submission")
+		lar_rows["initially_payable"] = self.enum_batch(rng, num_rows, "initially_payable")
+		lar_rows["mlo_id"] = text["mlo_id"]
+		lar_rows["aus_1"] = self.enum_batch(rng, num_rows, "aus_1")
+		for field in ("aus_2", "aus_3", "aus_4", "aus_5"):
+			lar_rows[field] = self.enum_batch(rng, num_rows, field, empty=True)
+		lar_rows["aus_code_5"] = text["aus_code_5"]
+		lar_rows["aus_result_1"] = self.enum_batch(rng, num_rows, "aus_result_1")
+		for field in ("aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5"):
+			lar_rows[field] = self.enum_batch(rng, num_rows, field, empty=True)
+		lar_rows["aus_code_16"] = text["aus_code_16"]
+		for field in ("reverse_mortgage", "open_end_credit", "business_purpose"):
+			lar_rows[field] = self.enum_batch(rng, num_rows, field)
+
+		return pd.DataFrame(lar_rows)
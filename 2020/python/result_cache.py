@@ -0,0 +1,97 @@
+#This file contains the result_cache class used to store edit report records for test files on disk.
+#Records are keyed by a hash of the file contents, the rules version and the edits run, so that re-running an edit
+#report only validates files that changed since the last run.
+
+import hashlib
+import os
+import pickle
+
+import edit_registry
+import geo_index
+import rules_engine
+import utils
+
+#modules whose source determines edit results
+rules_modules = [rules_engine, edit_registry, geo_index, utils]
+
+
+def hash_file(path, block_size=1<<20):
+	"""Returns the sha256 hex digest of the contents of the file at path."""
+	digest = hashlib.sha256()
+	with open(path, "rb") as f:
+		for block in iter(lambda: f.read(block_size), b""):
+			digest.update(block)
+	return digest.hexdigest()
+
+
+def rules_version(source_files, data_files=()):
+	"""
+	Returns a version string for a set of rules.
+	source_files: paths to files whose contents determine edit results (rules engine source, configuration files)
+	data_files: paths to large files that are identified by size and modification time instead of contents
+	"""
+	digest = hashlib.sha256()
+	for path in source_files:
+		digest.update(hash_file(path).encode())
+	for path in data_files:
+		stat = os.stat(path)
+		digest.update("{size}:{mtime}".format(size=stat.st_size, mtime=stat.st_mtime_ns).encode())
+	return digest.hexdigest()
+
+
+def edit_rules_version(config_files, data_files=()):
+	"""
+	Returns the rules version for the rules engine source and the passed configuration and data files
+	(for example the LAR config, schemas and census file).
+	"""
+	return rules_version([module.__file__ for module in rules_modules] + list(config_files), data_files=data_files)
+
+
+class result_cache(object):
+	"""
+	Persistent cache of the edit report records (the rules_engine results list) for each file.
+	cache_dir: directory holding one pickle file per cached result
+	version: rules version from rules_version. Results stored under a different version are not used.
+	"""
+
+	def __init__(self, cache_dir, version):
+		self.cache_dir = cache_dir
+		self.version = version
+		self.hits = 0
+		self.misses = 0
+		if not os.path.exists(self.cache_dir):
+			os.makedirs(self.cache_dir)
+
+	def key(self, data_file, edits):
+		"""Returns the cache key for running the passed edits (edit ids or edit types) against data_file."""
+		key_data = "|".join([hash_file(data_file), self.version] + sorted(edits))
+		return hashlib.sha256(key_data.encode()).hexdigest()
+
+	def get(self, key):
+		"""Returns the cached results records for key, or None if they are not cached."""
+		cache_file = os.path.join(self.cache_dir, key + ".pkl")
+		try:
+			with open(cache_file, "rb") as f:
+				records = pickle.load(f)
+		except (OSError, EOFError, pickle.UnpicklingError):
+			self.misses += 1
+			return None
+		self.hits += 1
+		return records
+
+	def put(self, key, records):
+		"""Stores the results records for key. The file is written under a temporary name and renamed into place."""
+		cache_file = os.path.join(self.cache_dir, key + ".pkl")
+		temp_file = cache_file + ".{pid}.tmp".format(pid=os.getpid())
+		with open(temp_file, "wb") as f:
+			pickle.dump(records, f, protocol=pickle.HIGHEST_PROTOCOL)
+		os.replace(temp_file, cache_file)
+
+	def print_stats(self):
+		"""Prints the number of cache hits and misses."""
+		total = self.hits + self.misses
+		hit_rate = 0.0
+		if total > 0:
+			hit_rate = self.hits * 100.0 / total
+		print("result cache: {hits} hits, {misses} misses ({rate:.1f}% hit rate)".format(hits=self.hits,
+			misses=self.misses, rate=hit_rate))
@@ -0,0 +1,1705 @@
+#This file contains the row_validator class used to check single LAR rows while generating test files.
+#Each check evaluates the predicate of the rules engine edit of the same name directly on an OrderedDict LAR row,
+#so that generated rows can be checked without building a one row dataframe and running the pandas edits on it.
+#Only row level edits are included: TS edits and file level edits (duplicates, row counts and macro ratios)
+#do not change with the LAR row being generated. Use verify to compare the checks with the rules engine, or check_engine
+#to raise an error when they differ. generate_clean_files runs check_engine on a generated sample before making a file.
+
+from collections import Counter
+from datetime import datetime
+import re
+import string
+
+from edit_registry import edit_registry
+import utils
+
+#registry of row check functions, populated by the register decorator on each check
+row_checks = edit_registry()
+
+#LAR date fields must be 8 digits to be parsed, matching rules_engine.parsed_dates
+date_format = re.compile(r"\d{8}")
+
+
+class row_validator(object):
+	"""
+	Checks a single LAR row, passed as a dictionary like object, against the row level S/V/Q edits.
+	Each check returns True if the row fails the edit.
+	"""
+	registry = row_checks
+
+	def __init__(self, engine, ts_row=None):
+		"""
+		engine: rules_engine whose configuration, census data and helper functions are used by the checks
+		ts_row: dictionary like TS row, used for the LEI check in s301. See load_ts_row.
+		"""
+		self.engine = engine
+		self.config_data = engine.config_data
+		self.state_codes = engine.state_codes
+		self.state_codes_rev = engine.state_codes_rev
+		self.geo = engine.geo
+		self.activity_year = str(self.config_data["activity_year"]["value"])
+		self.invalid_chars = set(string.punctuation)
+		self.check_lists = {} #check functions by edit types, see checks
+		self.ordered_checks = {} #check functions by edit types ordered by fail counts, see any_failures
+		self.edit_fail_counts = Counter() #number of any_failures calls in which each edit failed
+		self.ts_lei = None
+		self.file_lei = None #LEI of the first LAR row of a file, used by v609 when rows of a file are verified
+		if ts_row is not None:
+			self.load_ts_row(ts_row)
+
+	def load_ts_row(self, ts_row):
+		"""Sets the TS row that LAR rows are checked against."""
+		self.ts_lei = ts_row["lei"]
+
+	def checks(self, edit_types):
+		"""Returns a list of (edit name, check function) pairs for the passed edit types, selected once per edit types."""
+		edit_types = tuple(edit_types)
+		if edit_types not in self.check_lists:
+			self.check_lists[edit_types] = [(edit, getattr(self, edit)) for edit in self.registry.select(edit_types=edit_types)]
+		return self.check_lists[edit_types]
+
+	def failed_edits(self, row, edit_types=("s", "v", "q")):
+		"""Returns the list of edits of the passed edit types that the row fails."""
+		return [edit for edit, check in self.checks(edit_types) if check(row)]
+
+	def any_failures(self, row, edit_types=("s", "v"), stop_early=True):
+		"""
+		Returns the list of edits of the passed edit types that the row fails, stopping at the first failed edit if
+		stop_early is True. Checks are run in order of how often they failed in earlier calls, most frequent first.
+		"""
+		edit_types = tuple(edit_types)
+		if edit_types not in self.ordered_checks:
+			self.ordered_checks[edit_types] = sorted(self.checks(edit_types), key=lambda check: -self.edit_fail_counts[check[0]])
+		failed_edits = []
+		for edit, check in self.ordered_checks[edit_types]:
+			if check(row):
+				self.edit_fail_counts[edit] += 1
+				failed_edits.append(edit)
+				if stop_early:
+					break
+		if failed_edits:
+			del self.ordered_checks[edit_types] #reordered with the new fail counts on the next call
+		return failed_edits
+
+	def passes(self, row, edit_types=("s", "v")):
+		"""Returns True if the row passes all edits of the passed edit types. Stops at the first failed edit."""
+		return not self.any_failures(row, edit_types=edit_types)
+
+	def verify(self, lar_df=None, edit_types=("s", "v", "q")):
+		"""
+		Runs the checks on each row of lar_df (the LAR data loaded in the rules engine if None) and compares the failing
+		rows with the results of the rules engine edits of the same name.
+		Edits that raise an error in the rules engine for the data are skipped.
+		Returns a dictionary of edit name to the list of ULIs reported differently by the checks and the rules engine.
+		Row level edits missing from the row validator are reported with the value None.
+		"""
+		if lar_df is None:
+			lar_df = self.engine.lar_df
+		else:
+			self.engine.load_lar_data(lar_df)
+		if self.ts_lei is None:
+			self.load_ts_row(self.engine.ts_df.iloc[0])
+		rows = lar_df.to_dict(orient="records")
+		mismatches = {}
+		if len(rows) > 0:
+			self.file_lei = rows[0]["lei"]
+		try:
+			for edit in self.engine.registry.select(edit_types=edit_types):
+				meta = self.engine.registry[edit]
+				if meta.row_type == "TS" or meta.file_level:
+					continue
+				if edit not in self.registry:
+					mismatches[edit] = None
+					continue
+				try:
+					engine_results = self.engine.run_edit(edit)
+				except Exception:
+					continue
+				check_fails = Counter(row["uli"] for row in rows if getattr(self, edit)(row))
+				if all(result["row_type"] == "LAR" for result in engine_results):
+					engine_fails = Counter(uli for result in engine_results for uli in result["failed_rows"])
+					if engine_fails != check_fails:
+						mismatches[edit] = sorted(set((engine_fails - check_fails) + (check_fails - engine_fails)))
+				elif sum(result["fail_count"] for result in engine_results) != sum(check_fails.values()):
+					#edits reported against the TS row only have a fail count to compare
+					mismatches[edit] = sorted(check_fails)
+		finally:
+			self.file_lei = None
+		return mismatches
+
+	def check_engine(self, lar_df, edit_types=("s", "v", "q")):
+		"""
+		Runs verify on lar_df and raises a ValueError naming each row level edit whose check fails different rows than
+		the rules engine edit, or that has no check. Edits changed in the rules engine but not in the row validator
+		then stop file generation instead of producing files checked with the old edit.
+		"""
+		mismatches = self.verify(lar_df, edit_types=edit_types)
+		self.engine.reset_results()
+		if mismatches:
+			details = ["{edit}: {problem}".format(edit=edit, problem="no row check" if ulis is None else
+				"{count} rows reported differently".format(count=len(ulis))) for edit, ulis in sorted(mismatches.items())]
+			raise ValueError("row_validator checks do not match the rules engine edits\n" + "\n".join(details))
+
+	def parsed_date(self, value):
+		"""Returns a LAR date field as a datetime, or None if it is not a valid YYYYMMDD date."""
+		value = str(value)
+		if not date_format.fullmatch(value):
+			return None
+		try:
+			return datetime.strptime(value, "%Y%m%d")
+		except ValueError:
+			return None
+
+	def dupes(self, row, fields):
+		"""Returns True if a code is repeated in the passed fields. Blanks are not counted as duplicates."""
+		for i in range(len(fields)):
+			for j in range(i+1, len(fields)):
+				if row[fields[i]] == row[fields[j]] and row[fields[j]] != "":
+					return True
+		return False
+
+	#### Edit Rules from FIG
+	@row_checks.register(row_type="LAR")
+	def s300_2(self, row):
+		"""LAR rows must begin with a 2"""
+		return row["record_id"] != "2"
+
+	@row_checks.register(row_type="TS/LAR")
+	def s301(self, row):
+		"""The LEI must match the LEI in the TS row"""
+		return row["lei"] != self.ts_lei
+
+	@row_checks.register(row_type="LAR")
+	def v600(self, row):
+		"""LEI must be 20 characters"""
+		return row["lei"] == "" or len(row["lei"]) != 20
+
+	@row_checks.register(row_type="LAR")
+	def v609(self, row):
+		"""ULIs starting with the LEI must have a valid check digit"""
+		lei = self.file_lei if self.file_lei is not None else row["lei"]
+		uli = row["uli"]
+		if uli[:20] != lei:
+			return False
+		return uli[-2:] != utils.check_digit_batch([uli[:-2]])[0]
+
+	@row_checks.register(row_type="LAR")
+	def v610_1(self, row):
+		"""application date must be a valid date or NA"""
+		return row["app_date"] != "NA" and self.parsed_date(row["app_date"]) is None
+
+	@row_checks.register(row_type="LAR")
+	def v610_2(self, row):
+		"""application date is NA if and only if action taken is 6"""
+		return (row["app_date"] == "NA" and row["action_taken"] != "6") or (row["action_taken"] == "6" and row["app_date"] != "NA")
+
+	@row_checks.register(row_type="LAR")
+	def v611(self, row):
+		"""loan type must be valid"""
+		return row["loan_type"] not in ("1", "2", "3", "4")
+
+	@row_checks.register(row_type="LAR")
+	def v612_1(self, row):
+		"""loan purpose must be valid"""
+		return row["loan_purpose"] not in ("1", "2", "31", "32", "4", "5")
+
+	@row_checks.register(row_type="LAR")
+	def v612_2(self, row):
+		"""preapproval 1 requires loan purpose 1"""
+		return row["preapproval"] == "1" and row["loan_purpose"] != "1"
+
+	@row_checks.register(row_type="LAR")
+	def v613_1(self, row):
+		"""preapproval must be valid"""
+		return row["preapproval"] not in ("1", "2")
+
+	@row_checks.register(row_type="LAR")
+	def v613_2(self, row):
+		"""action taken 7 or 8 requires preapproval 1"""
+		return row["action_taken"] in ("7", "8") and row["preapproval"] != "1"
+
+	@row_checks.register(row_type="LAR")
+	def v613_3(self, row):
+		"""action taken 3, 4, 5 or 6 requires preapproval 2"""
+		return row["action_taken"] in ("3", "4", "5", "6") and row["preapproval"] != "2"
+
+	@row_checks.register(row_type="LAR")
+	def v613_4(self, row):
+		"""preapproval 1 requires action taken 1, 2, 7 or 8"""
+		return row["preapproval"] == "1" and row["action_taken"] not in ("1", "2", "7", "8")
+
+	@row_checks.register(row_type="LAR")
+	def v614_1(self, row):
+		"""loan purpose 2, 4, 31, 32 or 5 requires preapproval 2"""
+		return row["loan_purpose"] in ("2", "4", "31", "32", "5") and row["preapproval"] != "2"
+
+	@row_checks.register(row_type="LAR")
+	def v614_2(self, row):
+		"""numeric affordable units require preapproval 2"""
+		return row["affordable_units"].isdigit() and row["preapproval"] != "2"
+
+	@row_checks.register(row_type="LAR")
+	def v614_3(self, row):
+		"""reverse mortgage 1 requires preapproval 2"""
+		return row["reverse_mortgage"] == "1" and row["preapproval"] != "2"
+
+	@row_checks.register(row_type="LAR")
+	def v614_4(self, row):
+		"""open end credit 1 requires preapproval 2"""
+		return row["open_end_credit"] == "1" and row["preapproval"] != "2"
+
+	@row_checks.register(row_type="LAR")
+	def v615_1(self, row):
+		"""construction method must be valid"""
+		return row["const_method"] not in ("1", "2")
+
+	@row_checks.register(row_type="LAR")
+	def v615_2(self, row):
+		"""manufactured home land interest 1-4 requires construction method 2"""
+		return row["manufactured_interest"] in ("1", "2", "3", "4") and row["const_method"] != "2"
+
+	@row_checks.register(row_type="LAR")
+	def v615_3(self, row):
+		"""manufactured home secured property type 1 or 2 requires construction method 2"""
+		return row["manufactured_type"] in ("1", "2") and row["const_method"] != "2"
+
+	@row_checks.register(row_type="LAR")
+	def v616(self, row):
+		"""occupancy type must be valid"""
+		return row["occ_type"] not in ("1", "2", "3")
+
+	@row_checks.register(row_type="LAR")
+	def v617(self, row):
+		"""loan amount must be greater than 0"""
+		amount = row["loan_amount"]
+		if amount == "":
+			amount = 0
+		return float(amount) <= 0
+
+	@row_checks.register(row_type="LAR")
+	def v618(self, row):
+		"""action taken must be valid"""
+		return row["action_taken"] not in ("1", "2", "3", "4", "5", "6", "7", "8") or row["action_taken"] == ""
+
+	@row_checks.register(row_type="LAR")
+	def v619_1(self, row):
+		"""action date must be a valid date"""
+		return row["action_date"] == "" or self.parsed_date(row["action_date"]) is None
+
+	@row_checks.register(row_type="LAR")
+	def v619_2(self, row):
+		"""action date must be in the activity year"""
+		return str(row["action_date"])[:4] != self.activity_year
+
+	@row_checks.register(row_type="LAR")
+	def v619_3(self, row):
+		"""action date must not be before application date"""
+		action_date = self.parsed_date(row["action_date"])
+		app_date = self.parsed_date(row["app_date"])
+		if action_date is None or app_date is None:
+			return False
+		return action_date < app_date and row["app_date"] != "NA"
+
+	@row_checks.register(row_type="LAR")
+	def v620(self, row):
+		"""street address must not be blank"""
+		return row["street_address"] == ""
+
+	@row_checks.register(row_type="LAR")
+	def v621(self, row):
+		"""city must not be blank"""
+		return row["city"] == ""
+
+	@row_checks.register(row_type="LAR")
+	def v622_1(self, row):
+		"""city must not be NA if street address is reported"""
+		return row["street_address"] not in ("NA", "Exempt") and row["city"] == "NA"
+
+	@row_checks.register(row_type="LAR")
+	def v622_2(self, row):
+		"""state must not be NA if street address is reported"""
+		return row["street_address"] not in ("NA", "Exempt") and row["state"] == "NA"
+
+	@row_checks.register(row_type="LAR")
+	def v622_3(self, row):
+		"""zip code must not be NA if street address is reported"""
+		return row["street_address"] not in ("NA", "Exempt") and row["zip_code"] == "NA"
+
+	@row_checks.register(row_type="LAR")
+	def v623(self, row):
+		"""state must be a valid state code"""
+		return row["state"] not in self.state_codes or row["state"] == "NA"
+
+	@row_checks.register(row_type="LAR")
+	def v624(self, row):
+		"""zip code must be 5 or 9 digits, NA or Exempt"""
+		zip_code = row["zip_code"]
+		return (len(zip_code) not in (10, 5) or not zip_code.replace("-", "").isdigit()) and zip_code not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v625_1(self, row):
+		"""tract must be 11 digits or NA"""
+		tract = row["tract"]
+		return tract != "NA" and (len(tract) != 11 or not tract.isdigit())
+
+	@row_checks.register(row_type="LAR")
+	def v625_2(self, row):
+		"""tract must be a valid census tract or NA"""
+		return row["tract"] != "NA" and not self.geo.valid_tract(row["tract"])
+
+	@row_checks.register(row_type="LAR")
+	def v626(self, row):
+		"""county must be 5 digits or NA"""
+		county = row["county"]
+		return county != "NA" and (len(county) != 5 or not county.isdigit())
+
+	@row_checks.register(row_type="LAR")
+	def v627(self, row):
+		"""tract must be in the reported county"""
+		return row["county"] != "NA" and row["tract"] != "NA" and str(row["tract"])[:5] != row["county"]
+
+	@row_checks.register(row_type="LAR")
+	def v628_1(self, row):
+		"""applicant ethnicity 1 must be valid and not blank with blank free form text"""
+		return row["app_eth_1"] not in ("1", "11", "12", "13", "14", "2", "3", "4") or (row["app_eth_free"] == "" and row["app_eth_1"] == "")
+
+	@row_checks.register(row_type="LAR")
+	def v628_2(self, row):
+		"""applicant ethnicities 2-5 must be valid or blank"""
+		eths = ("1", "11", "12", "13", "14", "2", "")
+		return row["app_eth_2"] not in eths or row["app_eth_3"] not in eths or row["app_eth_4"] not in eths or row["app_eth_5"] not in eths
+
+	@row_checks.register(row_type="LAR")
+	def v628_3(self, row):
+		"""applicant ethnicities must not repeat"""
+		return self.dupes(row, ["app_eth_1", "app_eth_2", "app_eth_3", "app_eth_4", "app_eth_5"])
+
+	@row_checks.register(row_type="LAR")
+	def v628_4(self, row):
+		"""applicant ethnicity 1 of 3 or 4 requires blank ethnicities 2-5"""
+		return row["app_eth_1"] in ("3", "4") and (row["app_eth_2"] != "" or row["app_eth_3"] != "" or row["app_eth_4"] != "" or row["app_eth_5"] != "")
+
+	@row_checks.register(row_type="LAR")
+	def v629_1(self, row):
+		"""applicant ethnicity basis must be valid"""
+		return row["app_eth_basis"] not in ("1", "2", "3")
+
+	@row_checks.register(row_type="LAR")
+	def v629_2(self, row):
+		"""applicant ethnicity basis 1 limits applicant ethnicities"""
+		return row["app_eth_basis"] == "1" and (row["app_eth_1"] not in ("1", "2") or row["app_eth_2"] not in ("1", "2", "") or
+			row["app_eth_3"] != "" or row["app_eth_4"] != "" or row["app_eth_5"] != "")
+
+	@row_checks.register(row_type="LAR")
+	def v629_3(self, row):
+		"""applicant ethnicity basis 2 limits applicant ethnicity 1"""
+		return row["app_eth_basis"] == "2" and row["app_eth_1"] not in ("1", "11", "12", "13", "14", "2", "3")
+
+	@row_checks.register(row_type="LAR")
+	def v630(self, row):
+		"""applicant ethnicity 1 of 4 requires ethnicity basis 3"""
+		return row["app_eth_basis"] != "3" and row["app_eth_1"] == "4"
+
+	@row_checks.register(row_type="LAR")
+	def v631_1(self, row):
+		"""co-applicant ethnicity 1 must be valid if free form text is blank"""
+		return row["co_app_eth_free"] == "" and row["co_app_eth_1"] not in ("1", "11", "12", "13", "14", "2", "3", "4", "5")
+
+	@row_checks.register(row_type="LAR")
+	def v631_2(self, row):
+		"""co-applicant ethnicities 2-5 must be valid or blank"""
+		eths = ("1", "11", "12", "13", "14", "2", "")
+		return (row["co_app_eth_2"] not in eths or row["co_app_eth_3"] not in eths or row["co_app_eth_4"] not in eths or
+			row["co_app_eth_5"] not in eths)
+
+	@row_checks.register(row_type="LAR")
+	def v631_3(self, row):
+		"""co-applicant ethnicities must not repeat"""
+		return self.dupes(row, ["co_app_eth_1", "co_app_eth_2", "co_app_eth_3", "co_app_eth_4", "co_app_eth_5"])
+
+	@row_checks.register(row_type="LAR")
+	def v631_4(self, row):
+		"""co-applicant ethnicity 1 of 3, 4 or 5 requires blank ethnicities 2-5"""
+		return row["co_app_eth_1"] in ("3", "4", "5") and (row["co_app_eth_2"] != "" or row["co_app_eth_3"] != "" or
+			row["co_app_eth_4"] != "" or row["co_app_eth_5"] != "")
+
+	@row_checks.register(row_type="LAR")
+	def v632_1(self, row):
+		"""co-applicant ethnicity basis must be valid"""
+		return row["co_app_eth_basis"] not in ("1", "2", "3", "4")
+
+	@row_checks.register(row_type="LAR")
+	def v632_2(self, row):
+		"""co-applicant ethnicity basis 1 limits co-applicant ethnicities"""
+		return row["co_app_eth_basis"] == "1" and (row["co_app_eth_1"] not in ("1", "2") or row["co_app_eth_2"] not in ("1", "2") or
+			row["co_app_eth_3"] != "" or row["co_app_eth_4"] != "" or row["co_app_eth_5"] != "")
+
+	@row_checks.register(row_type="LAR")
+	def v632_3(self, row):
+		"""co-applicant ethnicity basis 2 limits co-applicant ethnicity 1"""
+		return row["co_app_eth_basis"] == "2" and row["co_app_eth_1"] not in ("1", "11", "12", "13", "14", "2", "3")
+
+	@row_checks.register(row_type="LAR")
+	def v633(self, row):
+		"""co-applicant ethnicity 1 of 4 requires ethnicity basis 3"""
+		return row["co_app_eth_1"] == "4" and row["co_app_eth_basis"] != "3"
+
+	@row_checks.register(row_type="LAR")
+	def v634(self, row):
+		"""co-applicant ethnicity 1 is 5 if and only if ethnicity basis is 4"""
+		return (row["co_app_eth_1"] == "5" and row["co_app_eth_basis"] != "4") or (row["co_app_eth_basis"] == "4" and row["co_app_eth_1"] != "5")
+
+	@row_checks.register(row_type="LAR")
+	def v635_1(self, row):
+		"""applicant race 1 must be valid and not blank with blank free form text"""
+		races = ("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6", "7")
+		return row["app_race_1"] not in races or (row["app_race_1"] == "" and (row["app_race_native_text"] == "" and
+			row["app_race_islander_text"] == "" and row["app_race_asian_text"] == ""))
+
+	@row_checks.register(row_type="LAR")
+	def v635_2(self, row):
+		"""applicant races 2-5 must be valid or blank"""
+		races = ("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")
+		return row["app_race_2"] not in races or row["app_race_3"] not in races or row["app_race_4"] not in races or row["app_race_5"] not in races
+
+	@row_checks.register(row_type="LAR")
+	def v635_3(self, row):
+		"""applicant races must not repeat"""
+		return self.dupes(row, ["app_race_1", "app_race_2", "app_race_3", "app_race_4", "app_race_5"])
+
+	@row_checks.register(row_type="LAR")
+	def v635_4(self, row):
+		"""applicant race 1 of 6 or 7 requires blank races 2-5"""
+		return row["app_race_1"] in ("6", "7") and (row["app_race_2"] != "" or row["app_race_3"] != "" or row["app_race_4"] != "" or
+			row["app_race_5"] != "")
+
+	@row_checks.register(row_type="LAR")
+	def v636_1(self, row):
+		"""applicant race basis must be valid"""
+		return row["app_race_basis"] not in ("1", "2", "3")
+
+	@row_checks.register(row_type="LAR")
+	def v636_2(self, row):
+		"""applicant race basis 1 limits applicant races"""
+		races = ("1", "2", "3", "4", "5", "")
+		return row["app_race_basis"] == "1" and (row["app_race_1"] not in races[:-1] or row["app_race_2"] not in races or
+			row["app_race_3"] not in races or row["app_race_4"] not in races or row["app_race_5"] not in races)
+
+	@row_checks.register(row_type="LAR")
+	def v636_3(self, row):
+		"""applicant race basis 2 limits applicant races 1-4"""
+		app_1_races = ("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6")
+		app_n_races = app_1_races[:-1] + ("",)
+		return row["app_race_basis"] == "2" and (row["app_race_1"] not in app_1_races or row["app_race_2"] not in app_n_races or
+			row["app_race_3"] not in app_n_races or row["app_race_4"] not in app_n_races)
+
+	@row_checks.register(row_type="LAR")
+	def v637(self, row):
+		"""applicant race 1 of 7 requires race basis 3"""
+		return row["app_race_1"] == "7" and row["app_race_basis"] != "3"
+
+	@row_checks.register(row_type="LAR")
+	def v638_1(self, row):
+		"""co-applicant race 1 must not be blank with blank free form text"""
+		races = ("1", "2", "21", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6", "7", "8")
+		return row["co_app_race_1"] not in races and (row["co_app_race_1"] == "" and (row["co_app_race_native_text"] == "" and
+			row["co_app_race_islander_text"] == "" and row["co_app_race_asian_text"] == ""))
+
+	@row_checks.register(row_type="LAR")
+	def v638_2(self, row):
+		"""co-applicant races 2-5 must be valid or blank"""
+		races = ("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")
+		return (row["co_app_race_2"] not in races or row["co_app_race_3"] not in races or row["co_app_race_4"] not in races or
+			row["co_app_race_5"] not in races)
+
+	@row_checks.register(row_type="LAR")
+	def v638_3(self, row):
+		"""co-applicant races must not repeat"""
+		return self.dupes(row, ["co_app_race_1", "co_app_race_2", "co_app_race_3", "co_app_race_4", "co_app_race_5"])
+
+	@row_checks.register(row_type="LAR")
+	def v638_4(self, row):
+		"""co-applicant race 1 of 6, 7 or 8 requires blank races 2-5"""
+		return row["co_app_race_1"] in ("6", "7", "8") and (row["co_app_race_2"] != "" or row["co_app_race_3"] != "" or
+			row["co_app_race_4"] != "" or row["co_app_race_5"] != "")
+
+	@row_checks.register(row_type="LAR")
+	def v639_1(self, row):
+		"""co-applicant race basis must be valid"""
+		return row["co_app_race_basis"] not in ("1", "2", "3", "4")
+
+	@row_checks.register(row_type="LAR")
+	def v639_2(self, row):
+		"""co-applicant race basis 1 limits co-applicant races"""
+		races = ("1", "2", "3", "4", "5", "")
+		return row["co_app_race_basis"] == "1" and (row["co_app_race_1"] not in races or row["co_app_race_2"] not in races or
+			row["co_app_race_3"] not in races or row["co_app_race_4"] not in races or row["co_app_race_5"] not in races)
+
+	@row_checks.register(row_type="LAR")
+	def v639_3(self, row):
+		"""co-applicant race basis 2 limits co-applicant races"""
+		race_1 = ("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6")
+		race_n = race_1[:-1] + ("",)
+		return row["co_app_race_basis"] == "2" and (row["co_app_race_1"] not in race_1 or row["co_app_race_2"] not in race_n or
+			row["co_app_race_3"] not in race_n or row["co_app_race_4"] not in race_n or row["co_app_race_5"] not in race_n)
+
+	@row_checks.register(row_type="LAR")
+	def v640(self, row):
+		"""co-applicant race 1 of 7 requires race basis 3"""
+		return row["co_app_race_1"] == "7" and row["co_app_race_basis"] != "3"
+
+	@row_checks.register(row_type="LAR")
+	def v641(self, row):
+		"""co-applicant race 1 is 8 if and only if race basis is 4"""
+		return (row["co_app_race_1"] == "8" and row["co_app_race_basis"] != "4") or (row["co_app_race_basis"] == "4" and row["co_app_race_1"] != "8")
+
+	@row_checks.register(row_type="LAR")
+	def v642_1(self, row):
+		"""applicant sex must be valid"""
+		return row["app_sex"] not in ("1", "2", "3", "4", "6")
+
+	@row_checks.register(row_type="LAR")
+	def v642_2(self, row):
+		"""applicant sex basis must be valid"""
+		return row["app_sex_basis"] not in ("1", "2", "3")
+
+	@row_checks.register(row_type="LAR")
+	def v643(self, row):
+		"""applicant sex basis 1 requires applicant sex 1 or 2"""
+		return row["app_sex_basis"] == "1" and row["app_sex"] not in ("1", "2")
+
+	@row_checks.register(row_type="LAR")
+	def v644_1(self, row):
+		"""applicant sex basis 2 requires applicant sex 1, 2, 3 or 6"""
+		return row["app_sex_basis"] == "2" and row["app_sex"] not in ("1", "2", "3", "6")
+
+	@row_checks.register(row_type="LAR")
+	def v644_2(self, row):
+		"""applicant sex 6 requires sex basis 2 or 3"""
+		return row["app_sex"] == "6" and row["app_sex_basis"] not in ("2", "3")
+
+	@row_checks.register(row_type="LAR")
+	def v645(self, row):
+		"""applicant sex 4 requires sex basis 3"""
+		return row["app_sex"] == "4" and row["app_sex_basis"] != "3"
+
+	@row_checks.register(row_type="LAR")
+	def v646_1(self, row):
+		"""co-applicant sex must be valid"""
+		return row["co_app_sex"] not in ("1", "2", "3", "4", "5", "6")
+
+	@row_checks.register(row_type="LAR")
+	def v646_2(self, row):
+		"""co-applicant sex basis must be valid"""
+		return row["co_app_sex_basis"] not in ("1", "2", "3", "4")
+
+	@row_checks.register(row_type="LAR")
+	def v647(self, row):
+		"""co-applicant sex basis 1 requires co-applicant sex 1 or 2"""
+		return row["co_app_sex_basis"] == "1" and row["co_app_sex"] not in ("1", "2")
+
+	@row_checks.register(row_type="LAR")
+	def v648_1(self, row):
+		"""co-applicant sex basis 2 requires co-applicant sex 1, 2, 3 or 6"""
+		return row["co_app_sex_basis"] == "2" and row["co_app_sex"] not in ("1", "2", "3", "6")
+
+	@row_checks.register(row_type="LAR")
+	def v648_2(self, row):
+		"""co-applicant sex 6 requires sex basis 2 or 3"""
+		return row["co_app_sex"] == "6" and row["co_app_sex_basis"] not in ("2", "3")
+
+	@row_checks.register(row_type="LAR")
+	def v649(self, row):
+		"""co-applicant sex 4 requires sex basis 3"""
+		return row["co_app_sex"] == "4" and row["co_app_sex_basis"] != "3"
+
+	@row_checks.register(row_type="LAR")
+	def v650(self, row):
+		"""co-applicant sex is 5 if and only if sex basis is 4"""
+		return (row["co_app_sex_basis"] == "4" and row["co_app_sex"] != "5") or (row["co_app_sex"] == "5" and row["co_app_sex_basis"] != "4")
+
+	@row_checks.register(row_type="LAR")
+	def v651_1(self, row):
+		"""applicant age must be a number greater than 0"""
+		return self.engine.check_number(field=row["app_age"], min_val=0) == False
+
+	@row_checks.register(row_type="LAR")
+	def v651_2(self, row):
+		"""non natural person applicants require applicant age 8888"""
+		return (row["app_eth_1"] == "4" and row["app_race_1"] == "7" and row["app_sex"] == "4" and row["app_age"] != "8888" and
+			row["action_taken"] != "6")
+
+	@row_checks.register(row_type="LAR")
+	def v652_1(self, row):
+		"""co-applicant age must be a number greater than 0"""
+		return self.engine.check_number(field=row["co_app_age"], min_val=0) == False
+
+	@row_checks.register(row_type="LAR")
+	def v652_2(self, row):
+		"""non natural person co-applicants require co-applicant age 8888"""
+		return (row["co_app_eth_1"] == "4" and row["co_app_race_1"] == "7" and row["co_app_sex"] == "4" and row["co_app_age"] != "8888" and
+			row["action_taken"] != "6")
+
+	@row_checks.register(row_type="LAR")
+	def v654_1(self, row):
+		"""income must be a whole number or NA"""
+		return row["income"] != "NA" and not row["income"].isdigit()
+
+	@row_checks.register(row_type="LAR")
+	def v654_2(self, row):
+		"""numeric affordable units require income NA"""
+		return row["affordable_units"].isdigit() and row["income"] != "NA"
+
+	@row_checks.register(row_type="LAR")
+	def v655_1(self, row):
+		"""non natural person applicants require income NA"""
+		return (row["app_eth_1"] == "4" and row["app_race_1"] == "7" and row["app_sex"] == "4" and row["income"] != "NA" and
+			row["action_taken"] != "6")
+
+	@row_checks.register(row_type="LAR")
+	def v655_2(self, row):
+		"""non natural person co-applicants require income NA"""
+		return (row["co_app_eth_1"] == "4" and row["co_app_race_1"] == "7" and row["co_app_sex"] == "4" and row["income"] != "NA" and
+			row["action_taken"] != "6")
+
+	@row_checks.register(row_type="LAR")
+	def v656_1(self, row):
+		"""purchaser type must be valid"""
+		return row["purchaser_type"] not in ("0", "1", "2", "3", "4", "5", "6", "71", "72", "8", "9")
+
+	@row_checks.register(row_type="LAR")
+	def v656_2(self, row):
+		"""action taken 2, 3, 4, 5, 7 or 8 requires purchaser type 0"""
+		return row["action_taken"] in ("2", "3", "4", "5", "7", "8") and row["purchaser_type"] != "0"
+
+	@row_checks.register(row_type="LAR")
+	def v657_1(self, row):
+		"""rate spread must be a number, NA or Exempt"""
+		return row["rate_spread"] not in ("NA", "Exempt") and self.engine.check_number(row["rate_spread"]) == False
+
+	@row_checks.register(row_type="LAR")
+	def v657_2(self, row):
+		"""action taken 3, 4, 5, 6 or 7 requires rate spread NA or Exempt"""
+		return row["action_taken"] in ("3", "4", "5", "6", "7") and row["rate_spread"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v657_3(self, row):
+		"""reverse mortgage 1 requires rate spread NA or Exempt"""
+		return row["reverse_mortgage"] == "1" and row["rate_spread"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v658_1(self, row):
+		"""HOEPA status must be valid"""
+		return row["hoepa"] not in ("1", "2", "3")
+
+	@row_checks.register(row_type="LAR")
+	def v658_2(self, row):
+		"""action taken 2, 3, 4, 5, 7 or 8 requires HOEPA status 3"""
+		return row["action_taken"] in ("2", "3", "4", "5", "7", "8") and row["hoepa"] != "3"
+
+	@row_checks.register(row_type="LAR")
+	def v659(self, row):
+		"""lien status must be valid"""
+		return row["lien"] not in ("1", "2")
+
+	@row_checks.register(row_type="LAR")
+	def v660_1(self, row):
+		"""applicant credit score must be a number"""
+		return self.engine.check_number(row["app_credit_score"]) == False
+
+	@row_checks.register(row_type="LAR")
+	def v660_2(self, row):
+		"""applicant credit score model must be valid"""
+		return row["app_score_name"] not in ("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9")
+
+	@row_checks.register(row_type="LAR")
+	def v661(self, row):
+		"""applicant credit score is 8888 if and only if score model is 9"""
+		return ((row["app_credit_score"] == "8888" and row["app_score_name"] != "9") or
+			(row["app_score_name"] == "9" and row["app_credit_score"] != "8888"))
+
+	@row_checks.register(row_type="LAR")
+	def v662_1(self, row):
+		"""applicant score model conditional text must be blank unless score model is 8"""
+		return ((row["app_score_name"] in ("1111", "1", "2", "3", "4", "5", "6", "7", "9") and row["app_score_code_8"] != "") or
+			(row["app_score_code_8"] == "" and row["app_score_name"] not in ("1", "2", "3", "4", "5", "6", "7", "9")))
+
+	@row_checks.register(row_type="LAR")
+	def v662_2(self, row):
+		"""applicant score model 8 requires conditional text"""
+		return ((row["app_score_name"] == "8" and row["app_score_code_8"] == "") or
+			(row["app_score_code_8"] != "" and row["app_score_name"] != "8"))
+
+	@row_checks.register(row_type="LAR")
+	def v663(self, row):
+		"""action taken 4, 5 or 6 requires applicant credit score 8888 and score model 9"""
+		return row["action_taken"] in ("4", "5", "6") and (row["app_credit_score"] not in ("8888", "Exempt") or
+			row["app_score_name"] not in ("9", "Exempt") or row["app_score_code_8"] != "")
+
+	@row_checks.register(row_type="LAR")
+	def v664(self, row):
+		"""action taken 4, 5 or 6 requires co-applicant credit score 8888 and score model 9"""
+		return row["action_taken"] in ("4", "5", "6") and (row["co_app_credit_score"] not in ("8888", "Exempt") or
+			row["co_app_score_name"] not in ("9", "Exempt") or row["co_app_score_code_8"] != "")
+
+	@row_checks.register(row_type="LAR")
+	def v665_1(self, row):
+		"""co-applicant credit score must be a number"""
+		return self.engine.check_number(row["co_app_credit_score"]) == False
+
+	@row_checks.register(row_type="LAR")
+	def v665_2(self, row):
+		"""co-applicant credit score model must be valid"""
+		return row["co_app_score_name"] not in ("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10")
+
+	@row_checks.register(row_type="LAR")
+	def v666_1(self, row):
+		"""co-applicant credit score is 8888 if and only if score model is 9"""
+		return ((row["co_app_credit_score"] == "8888" and row["co_app_score_name"] != "9") or
+			(row["co_app_score_name"] == "9" and row["co_app_credit_score"] != "8888"))
+
+	@row_checks.register(row_type="LAR")
+	def v666_2(self, row):
+		"""co-applicant credit score is 9999 if and only if score model is 10"""
+		return ((row["co_app_credit_score"] == "9999" and row["co_app_score_name"] != "10") or
+			(row["co_app_score_name"] == "10" and row["co_app_credit_score"] != "9999"))
+
+	@row_checks.register(row_type="LAR")
+	def v667_1(self, row):
+		"""co-applicant score model conditional text must be blank unless score model is 8"""
+		names = ("1111", "1", "2", "3", "4", "5", "6", "7", "9", "10")
+		return ((row["co_app_score_name"] in names and row["co_app_score_code_8"] != "") or
+			(row["co_app_score_code_8"] == "" and row["co_app_score_name"] not in names))
+
+	@row_checks.register(row_type="LAR")
+	def v667_2(self, row):
+		"""co-applicant score model 8 requires conditional text"""
+		return ((row["co_app_score_name"] == "8" and row["co_app_score_code_8"] == "") or
+			(row["co_app_score_code_8"] != "" and row["co_app_score_name"] != "8"))
+
+	@row_checks.register(row_type="LAR")
+	def v668_1(self, row):
+		"""non natural person applicants require credit score 8888 or Exempt"""
+		return (row["app_eth_1"] == "4" and row["app_race_1"] == "7" and row["app_sex"] == "4" and
+			row["app_credit_score"] not in ("8888", "Exempt"))
+
+	@row_checks.register(row_type="LAR")
+	def v668_2(self, row):
+		"""non natural person co-applicants require credit score 8888 or Exempt"""
+		return (row["co_app_eth_1"] == "4" and row["co_app_race_1"] == "7" and row["co_app_sex"] == "4" and
+			row["co_app_credit_score"] not in ("8888", "Exempt"))
+
+	@row_checks.register(row_type="LAR")
+	def v669_1(self, row):
+		"""denial reason 1 must be valid"""
+		return row["denial_1"] not in ("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10")
+
+	@row_checks.register(row_type="LAR")
+	def v669_2(self, row):
+		"""denial reasons 2-4 must be valid or blank"""
+		denials = ("1", "2", "3", "4", "5", "6", "7", "8", "9", "")
+		return row["denial_2"] not in denials or row["denial_3"] not in denials or row["denial_4"] not in denials
+
+	@row_checks.register(row_type="LAR")
+	def v669_3(self, row):
+		"""denial reasons must not repeat"""
+		return self.dupes(row, ["denial_1", "denial_2", "denial_3", "denial_4"])
+
+	@row_checks.register(row_type="LAR")
+	def v669_4(self, row):
+		"""denial reason 1 of 1111 or 10 requires blank denial reasons 2-4"""
+		return row["denial_1"] in ("1111", "10") and (row["denial_2"] != "" or row["denial_3"] != "" or row["denial_4"] != "")
+
+	@row_checks.register(row_type="LAR")
+	def v670_1(self, row):
+		"""action taken 3 or 7 requires a denial reason"""
+		return row["action_taken"] in ("3", "7") and row["denial_1"] not in ("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9")
+
+	@row_checks.register(row_type="LAR")
+	def v670_2(self, row):
+		"""denial reasons 1-9 require action taken 3 or 7"""
+		return row["denial_1"] in ("1", "2", "3", "4", "5", "6", "7", "8", "9") and row["action_taken"] not in ("3", "7")
+
+	@row_checks.register(row_type="LAR")
+	def v670_3(self, row):
+		"""action taken 1, 2, 4, 5, 6 or 8 requires denial reason 10 or 1111"""
+		return row["action_taken"] in ("1", "2", "4", "5", "6", "8") and row["denial_1"] not in ("1111", "10")
+
+	@row_checks.register(row_type="LAR")
+	def v670_4(self, row):
+		"""denial reason 10 or 1111 requires action taken 1, 2, 4, 5, 6 or 8"""
+		return row["denial_1"] in ("1111", "10") and row["action_taken"] not in ("1", "2", "4", "5", "6", "8")
+
+	@row_checks.register(row_type="LAR")
+	def v671_1(self, row):
+		"""denial reason 9 requires conditional text"""
+		return ((row["denial_1"] == "9" or row["denial_2"] == "9" or row["denial_3"] == "9" or row["denial_4"] == "9") and
+			row["denial_code_9"] == "")
+
+	@row_checks.register(row_type="LAR")
+	def v671_2(self, row):
+		"""denial reason conditional text must be blank without denial reason 9"""
+		return ((row["denial_1"] != "9" and row["denial_2"] != "9" and row["denial_3"] != "9" and row["denial_4"] != "9") and
+			row["denial_code_9"] != "")
+
+	@row_checks.register(row_type="LAR")
+	def v672_1(self, row):
+		"""total loan costs must be a number, NA or Exempt"""
+		return row["loan_costs"] not in ("NA", "Exempt") and self.engine.check_number(row["loan_costs"], min_val=0) == False
+
+	@row_checks.register(row_type="LAR")
+	def v672_2(self, row):
+		"""total loan costs must be NA if total points and fees are reported"""
+		return row["loan_costs"] != "NA" and self.engine.check_number(row["points_fees"], min_val=0) == True
+
+	@row_checks.register(row_type="LAR")
+	def v672_3(self, row):
+		"""reverse mortgage 1 requires total loan costs NA or Exempt"""
+		return row["reverse_mortgage"] == "1" and row["loan_costs"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v672_4(self, row):
+		"""open end credit 1 requires total loan costs NA or Exempt"""
+		return row["open_end_credit"] == "1" and row["loan_costs"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v672_5(self, row):
+		"""business purpose 1 requires total loan costs NA or Exempt"""
+		return row["business_purpose"] == "1" and row["loan_costs"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v672_6(self, row):
+		"""action taken 2, 3, 4, 5, 7 or 8 requires total loan costs NA or Exempt"""
+		return row["action_taken"] in ("2", "3", "4", "5", "7", "8") and row["loan_costs"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v673_1(self, row):
+		"""total points and fees must be a number, NA or Exempt"""
+		return row["points_fees"] not in ("NA", "Exempt") and self.engine.check_number(row["points_fees"], min_val=0) == False
+
+	@row_checks.register(row_type="LAR")
+	def v673_2(self, row):
+		"""action taken 2-8 requires total points and fees NA or Exempt"""
+		return row["action_taken"] in ("2", "3", "4", "5", "6", "7", "8") and row["points_fees"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v673_3(self, row):
+		"""reverse mortgage 1 requires total points and fees NA or Exempt"""
+		return row["reverse_mortgage"] == "1" and row["points_fees"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v673_4(self, row):
+		"""business purpose 1 requires total points and fees NA or Exempt"""
+		return row["business_purpose"] == "1" and row["points_fees"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v673_5(self, row):
+		"""total points and fees must be NA if total loan costs are reported"""
+		return row["points_fees"] != "NA" and self.engine.check_number(row["loan_costs"], min_val=0) == True
+
+	@row_checks.register(row_type="LAR")
+	def v674_1(self, row):
+		"""origination charges must be a number, NA or Exempt"""
+		return row["origination_fee"] not in ("NA", "Exempt") and self.engine.check_number(row["origination_fee"], min_val=0) == False
+
+	@row_checks.register(row_type="LAR")
+	def v674_2(self, row):
+		"""reverse mortgage 1 requires origination charges NA or Exempt"""
+		return row["reverse_mortgage"] == "1" and row["origination_fee"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v674_3(self, row):
+		"""open end credit 1 requires origination charges NA or Exempt"""
+		return row["open_end_credit"] == "1" and row["origination_fee"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v674_4(self, row):
+		"""business purpose 1 requires origination charges NA or Exempt"""
+		return row["business_purpose"] == "1" and row["origination_fee"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v674_5(self, row):
+		"""action taken 2, 3, 4, 5, 7 or 8 requires origination charges NA or Exempt"""
+		return row["action_taken"] in ("2", "3", "4", "5", "7", "8") and row["origination_fee"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v675_1(self, row):
+		"""discount points must be a number, blank, NA or Exempt"""
+		return (row["discount_points"] not in ("NA", "Exempt", "") and
+			self.engine.check_number(row["discount_points"], min_val=0) == False)
+
+	@row_checks.register(row_type="LAR")
+	def v675_2(self, row):
+		"""reverse mortgage 1 requires discount points NA or Exempt"""
+		return row["reverse_mortgage"] == "1" and row["discount_points"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v675_3(self, row):
+		"""open end credit 1 requires discount points NA or Exempt"""
+		return row["open_end_credit"] == "1" and row["discount_points"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v675_4(self, row):
+		"""business purpose 1 requires discount points NA or Exempt"""
+		return row["business_purpose"] == "1" and row["discount_points"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v675_5(self, row):
+		"""action taken 2, 3, 4, 5, 7 or 8 requires discount points NA or Exempt"""
+		return row["action_taken"] in ("2", "3", "4", "5", "7", "8") and row["discount_points"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v676_1(self, row):
+		"""lender credits must be a number, blank, NA or Exempt"""
+		return (row["lender_credits"] not in ("NA", "Exempt", "") and
+			self.engine.check_number(row["lender_credits"], min_val=0) == False)
+
+	@row_checks.register(row_type="LAR")
+	def v676_2(self, row):
+		"""reverse mortgage 1 requires lender credits NA or Exempt"""
+		return row["reverse_mortgage"] == "1" and row["lender_credits"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v676_3(self, row):
+		"""open end credit 1 requires lender credits NA or Exempt"""
+		return row["open_end_credit"] == "1" and row["lender_credits"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v676_4(self, row):
+		"""business purpose 1 requires lender credits NA or Exempt"""
+		return row["business_purpose"] == "1" and row["lender_credits"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v676_5(self, row):
+		"""action taken 2, 3, 4, 5, 7 or 8 requires lender credits NA or Exempt"""
+		return row["action_taken"] in ("2", "3", "4", "5", "7", "8") and row["lender_credits"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v677_1(self, row):
+		"""interest rate must be a number, NA or Exempt"""
+		return row["interest_rate"] not in ("NA", "Exempt") and self.engine.check_number(row["interest_rate"], min_val=0) == False
+
+	@row_checks.register(row_type="LAR")
+	def v677_2(self, row):
+		"""action taken 3, 4, 5 or 7 requires interest rate NA or Exempt"""
+		return row["action_taken"] in ("3", "4", "5", "7") and row["interest_rate"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v678_1(self, row):
+		"""prepayment penalty term must be a number, NA or Exempt"""
+		return (row["prepayment_penalty"] not in ("NA", "Exempt") and
+			self.engine.check_number(row["prepayment_penalty"], min_val=0) == False)
+
+	@row_checks.register(row_type="LAR")
+	def v678_2(self, row):
+		"""action taken 6 requires prepayment penalty term NA or Exempt"""
+		return row["action_taken"] == "6" and row["prepayment_penalty"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v678_3(self, row):
+		"""reverse mortgage 1 requires prepayment penalty term NA or Exempt"""
+		return row["reverse_mortgage"] == "1" and row["prepayment_penalty"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v678_4(self, row):
+		"""business purpose 1 requires prepayment penalty term NA or Exempt"""
+		return row["business_purpose"] == "1" and row["prepayment_penalty"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v678_5(self, row):
+		"""prepayment penalty term must not be greater than loan term"""
+		return self.engine.compare_nums(row, fields=["prepayment_penalty", "loan_term"])
+
+	@row_checks.register(row_type="LAR")
+	def v679_1(self, row):
+		"""debt to income ratio must be a number, NA or Exempt"""
+		return self.engine.check_number(row["dti"]) == False and row["dti"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v679_2(self, row):
+		"""action taken 4, 5 or 6 requires debt to income ratio NA or Exempt"""
+		return row["action_taken"] in ("4", "5", "6") and row["dti"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v679_3(self, row):
+		"""numeric affordable units require debt to income ratio NA or Exempt"""
+		return self.engine.check_number(row["affordable_units"]) == True and row["dti"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v680_1(self, row):
+		"""non natural person applicant and no co-applicant require debt to income ratio NA or Exempt"""
+		return (row["app_eth_1"] == "4" and row["app_race_1"] == "7" and row["app_sex"] == "4" and row["co_app_eth_1"] == "5" and
+			row["co_app_race_1"] == "8" and row["co_app_sex"] == "5" and row["dti"] not in ("NA", "Exempt"))
+
+	@row_checks.register(row_type="LAR")
+	def v680_2(self, row):
+		"""non natural person applicant and co-applicant require debt to income ratio NA or Exempt"""
+		return (row["app_eth_1"] == "4" and row["app_race_1"] == "7" and row["app_sex"] == "4" and row["co_app_eth_1"] == "4" and
+			row["co_app_race_1"] == "7" and row["co_app_sex"] == "4" and row["dti"] not in ("NA", "Exempt"))
+
+	@row_checks.register(row_type="LAR")
+	def v681_1(self, row):
+		"""combined loan to value ratio must be a number, NA or Exempt"""
+		return self.engine.check_number(row["cltv"], min_val=0) == False and row["cltv"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v681_2(self, row):
+		"""action taken 4, 5 or 6 requires combined loan to value ratio NA or Exempt"""
+		return row["action_taken"] in ("4", "5", "6") and row["cltv"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v682_1(self, row):
+		"""loan term must be a number, NA or Exempt"""
+		return self.engine.check_number(row["loan_term"], min_val=0) == False and row["loan_term"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v682_2(self, row):
+		"""reverse mortgage 1 requires loan term NA or Exempt"""
+		return row["reverse_mortgage"] == "1" and row["loan_term"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v683(self, row):
+		"""introductory rate period must be a number, NA or Exempt"""
+		return row["intro_rate"] not in ("NA", "Exempt") and self.engine.check_number(row["intro_rate"], min_val=0) == False
+
+	@row_checks.register(row_type="LAR")
+	def v684(self, row):
+		"""balloon payment must be valid"""
+		return row["balloon"] not in ("1111", "1", "2")
+
+	@row_checks.register(row_type="LAR")
+	def v685(self, row):
+		"""interest only payments must be valid"""
+		return row["int_only_pmts"] not in ("1111", "1", "2")
+
+	@row_checks.register(row_type="LAR")
+	def v686(self, row):
+		"""negative amortization must be valid"""
+		return row["neg_amort"] not in ("1111", "1", "2")
+
+	@row_checks.register(row_type="LAR")
+	def v687(self, row):
+		"""other non-amortizing features must be valid"""
+		return row["non_amort_features"] not in ("1111", "1", "2")
+
+	@row_checks.register(row_type="LAR")
+	def v688_1(self, row):
+		"""property value must be a number, NA or Exempt"""
+		return row["property_value"] not in ("NA", "Exempt") and self.engine.check_number(row["property_value"], min_val=0) == False
+
+	@row_checks.register(row_type="LAR")
+	def v688_2(self, row):
+		"""action taken 4 or 5 requires property value NA or Exempt"""
+		return row["action_taken"] in ("4", "5") and row["property_value"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v689_1(self, row):
+		"""manufactured home secured property type must be valid"""
+		return row["manufactured_type"] not in ("1111", "1", "2", "3")
+
+	@row_checks.register(row_type="LAR")
+	def v689_2(self, row):
+		"""numeric affordable units require manufactured home secured property type 3 or 1111"""
+		return row["affordable_units"].isdigit() and row["manufactured_type"] not in ("1111", "3")
+
+	@row_checks.register(row_type="LAR")
+	def v689_3(self, row):
+		"""construction method 1 requires manufactured home secured property type 3 or 1111"""
+		return row["const_method"] == "1" and row["manufactured_type"] not in ("3", "1111")
+
+	@row_checks.register(row_type="LAR")
+	def v690_1(self, row):
+		"""manufactured home land property interest must be valid"""
+		return row["manufactured_interest"] not in ("1111", "1", "2", "3", "4", "5")
+
+	@row_checks.register(row_type="LAR")
+	def v690_2(self, row):
+		"""numeric affordable units require manufactured home land property interest 5 or 1111"""
+		return row["affordable_units"].isdigit() and row["manufactured_interest"] not in ("5", "1111")
+
+	@row_checks.register(row_type="LAR")
+	def v690_3(self, row):
+		"""construction method 1 requires manufactured home land property interest 5 or 1111"""
+		return row["const_method"] == "1" and row["manufactured_interest"] not in ("5", "1111")
+
+	@row_checks.register(row_type="LAR")
+	def v691(self, row):
+		"""total units must be a number greater than 0"""
+		return self.engine.check_number(row["total_units"], min_val=0) == False
+
+	@row_checks.register(row_type="LAR")
+	def v692_1(self, row):
+		"""affordable units must be a number, NA or Exempt"""
+		return self.engine.check_number(row["affordable_units"]) == False and row["affordable_units"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v692_2(self, row):
+		"""total units less than 5 require affordable units NA or Exempt"""
+		return int(row["total_units"]) < 5 and row["affordable_units"] not in ("NA", "Exempt")
+
+	@row_checks.register(row_type="LAR")
+	def v692_3(self, row):
+		"""affordable units must not be greater than total units"""
+		return row["affordable_units"] not in ("Exempt", "NA") and self.engine.compare_nums(row, fields=["affordable_units", "total_units"])
+
+	@row_checks.register(row_type="LAR")
+	def v693_1(self, row):
+		"""submission of application must be valid"""
+		return row["app_submission"] not in ("1111", "1", "2", "3")
+
+	@row_checks.register(row_type="LAR")
+	def v693_2(self, row):
+		"""action taken 6 requires submission of application 3 or 1111"""
+		return row["action_taken"] == "6" and row["app_submission"] not in ("3", "1111")
+
+	@row_checks.register(row_type="LAR")
+	def v693_3(self, row):
+		"""submission of application 3 requires action taken 6"""
+		return row["app_submission"] == "3" and row["action_taken"] != "6"
+
+	@row_checks.register(row_type="LAR")
+	def v694_1(self, row):
+		"""initially payable to institution must be valid"""
+		return row["initially_payable"] not in ("1111", "1", "2", "3")
+
+	@row_checks.register(row_type="LAR")
+	def v694_2(self, row):
+		"""action taken 6 requires initially payable to institution 3 or 1111"""
+		return row["action_taken"] == "6" and row["initially_payable"] not in ("1111", "3")
+
+	@row_checks.register(row_type="LAR")
+	def v694_3(self, row):
+		"""action taken 1 requires initially payable to institution 1, 2 or 1111"""
+		return row["action_taken"] == "1" and row["initially_payable"] not in ("1111", "1", "2")
+
+	@row_checks.register(row_type="LAR")
+	def v695(self, row):
+		"""NMLSR ID must not be blank"""
+		return row["mlo_id"] == ""
+
+	@row_checks.register(row_type="LAR")
+	def v696_1(self, row):
+		"""automated underwriting systems must be valid"""
+		aus_n = ("1", "2", "3", "4", "5", "")
+		return (row["aus_1"] not in ("1111", "1", "2", "3", "4", "5", "6") or row["aus_2"] not in aus_n or row["aus_3"] not in aus_n or
+			row["aus_4"] not in aus_n or row["aus_5"] not in aus_n)
+
+	@row_checks.register(row_type="LAR")
+	def v696_2(self, row):
+		"""automated underwriting system results must be valid"""
+		aus_n_results = ("1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13", "14", "15", "16", "17", "18", "19", "20",
+			"21", "22", "23", "24", "")
+		aus_1_results = ("1111",) + aus_n_results[:-1]
+		return (row["aus_result_1"] not in aus_1_results or row["aus_result_2"] not in aus_n_results or
+			row["aus_result_3"] not in aus_n_results or row["aus_result_4"] not in aus_n_results or row["aus_result_5"] not in aus_n_results)
+
+	@row_checks.register(row_type="LAR")
+	def v696_3(self, row):
+		"""the number of automated underwriting systems and results must match"""
+		fields_1 = ["aus_1", "aus_2", "aus_3", "aus_4", "aus_5"]
+		fields_2 = ["aus_result_1", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5"]
+		vals_1 = ("1111", "1", "2", "3", "4", "5", "6")
+		vals_2 = ("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13", "14", "15",
+			"16", "17", "18", "19", "20", "21", "22", "23", "24")
+		return self.engine.check_counts(row, fields_1=fields_1, fields_2=fields_2, vals_1=vals_1, vals_2=vals_2) == False
+
+	@row_checks.register(row_type="LAR")
+	def v699(self, row):
+		"""automated underwriting system 5 requires a valid result"""
+		aus_results = ("1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13", "14", "15", "16", "18", "19", "20", "21",
+			"22", "23", "24")
+		for i in range(1, 6):
+			if row["aus_{i}".format(i=i)] == "5" and row["aus_result_{i}".format(i=i)] not in aus_results:
+				return True
+		return False
+
+	@row_checks.register(row_type="LAR")
+	def v700_1(self, row):
+		"""automated underwriting system 6 requires result 17 and no other systems or results"""
+		return row["aus_1"] == "6" and (row["aus_result_1"] != "17" or row["aus_result_2"] != "" or row["aus_result_3"] != "" or
+			row["aus_result_4"] != "" or row["aus_result_5"] != "" or row["aus_2"] != "" or row["aus_3"] != "" or row["aus_4"] != "" or
+			row["aus_5"] != "")
+
+	@row_checks.register(row_type="LAR")
+	def v700_2(self, row):
+		"""automated underwriting system result 17 requires system 6 and no other systems or results"""
+		return row["aus_result_1"] == "17" and (row["aus_1"] != "6" or row["aus_result_2"] != "" or row["aus_result_3"] != "" or
+			row["aus_result_4"] != "" or row["aus_result_5"] != "" or row["aus_2"] != "" or row["aus_3"] != "" or row["aus_4"] != "" or
+			row["aus_5"] != "")
+
+	@row_checks.register(row_type="LAR")
+	def v701(self, row):
+		"""blank automated underwriting systems require blank results"""
+		for i in range(2, 6):
+			if row["aus_{i}".format(i=i)] == "" and row["aus_result_{i}".format(i=i)] != "":
+				return True
+		return False
+
+	@row_checks.register(row_type="LAR")
+	def v702_1(self, row):
+		"""automated underwriting system 5 requires conditional text"""
+		return ((row["aus_1"] == "5" or row["aus_2"] == "5" or row["aus_3"] == "5" or row["aus_4"] == "5" or row["aus_5"] == "5") and
+			row["aus_code_5"] == "")
+
+	@row_checks.register(row_type="LAR")
+	def v702_2(self, row):
+		"""automated underwriting system conditional text must be blank without system 5"""
+		return ((row["aus_1"] != "5" and row["aus_2"] != "5" and row["aus_3"] != "5" and row["aus_4"] != "5" and row["aus_5"] != "5") and
+			row["aus_code_5"] != "")
+
+	@row_checks.register(row_type="LAR")
+	def v703_1(self, row):
+		"""automated underwriting system result 16 requires conditional text"""
+		return ((row["aus_result_1"] == "16" or row["aus_result_2"] == "16" or row["aus_result_3"] == "16" or row["aus_result_4"] == "16" or
+			row["aus_result_5"] == "16") and row["aus_code_16"] == "")
+
+	@row_checks.register(row_type="LAR")
+	def v703_2(self, row):
+		"""automated underwriting system result conditional text must be blank without result 16"""
+		return row["aus_code_16"] != "" and (row["aus_result_1"] != "16" and row["aus_result_2"] != "16" and row["aus_result_3"] != "16" and
+			row["aus_result_4"] != "16" and row["aus_result_5"] != "16")
+
+	@row_checks.register(row_type="LAR")
+	def v704_1(self, row):
+		"""action taken 6 requires automated underwriting system 6 or 1111"""
+		return row["action_taken"] == "6" and row["aus_1"] not in ("6", "1111")
+
+	@row_checks.register(row_type="LAR")
+	def v704_2(self, row):
+		"""action taken 6 requires automated underwriting system result 17 or 1111"""
+		return row["action_taken"] == "6" and row["aus_result_1"] not in ("17", "1111")
+
+	@row_checks.register(row_type="LAR")
+	def v705_1(self, row):
+		"""non natural person applicant and no co-applicant require automated underwriting system 6 and result 17"""
+		return (row["app_eth_1"] == "4" and row["app_race_1"] == "7" and row["app_sex"] == "4" and row["co_app_eth_1"] == "5" and
+			row["co_app_race_1"] == "8" and row["co_app_sex"] == "5" and
+			(row["aus_1"] not in ("1111", "6") or row["aus_result_1"] not in ("17", "1111")))
+
+	@row_checks.register(row_type="LAR")
+	def v705_2(self, row):
+		"""non natural person applicant and co-applicant require automated underwriting system 6 and result 17"""
+		return (row["app_eth_1"] == "4" and row["app_race_1"] == "7" and row["app_sex"] == "4" and row["co_app_eth_1"] == "4" and
+			row["co_app_race_1"] == "7" and row["co_app_sex"] == "4" and
+			(row["aus_1"] not in ("6", "1111") or row["aus_result_1"] not in ("17", "1111")))
+
+	@row_checks.register(row_type="LAR")
+	def v706(self, row):
+		"""reverse mortgage must be valid"""
+		return row["reverse_mortgage"] not in ("1111", "1", "2")
+
+	@row_checks.register(row_type="LAR")
+	def v707(self, row):
+		"""open end line of credit must be valid"""
+		return row["open_end_credit"] not in ("1111", "1", "2")
+
+	@row_checks.register(row_type="LAR")
+	def v708(self, row):
+		"""business or commercial purpose must be valid"""
+		return row["business_purpose"] not in ("1111", "1", "2")
+
+	@row_checks.register(row_type="LAR")
+	def v709(self, row):
+		"""street address, city and zip code must all be Exempt if one is Exempt"""
+		exempt = (row["street_address"] == "Exempt", row["city"] == "Exempt", row["zip_code"] == "Exempt")
+		return any(exempt) and not all(exempt)
+
+	@row_checks.register(row_type="LAR")
+	def v710_1(self, row):
+		"""exempt applicant credit score requires exempt co-applicant credit score and score models"""
+		return row["app_credit_score"] == "1111" and (row["co_app_credit_score"] != "1111" or row["app_score_name"] != "1111" or
+			row["co_app_score_name"] != "1111")
+
+	@row_checks.register(row_type="LAR")
+	def v710_2(self, row):
+		"""exempt applicant credit score requires blank score models and conditional text"""
+		return row["app_credit_score"] == "1111" and (row["app_score_name"] != "" or row["app_score_code_8"] != "" or
+			row["co_app_score_name"] != "" or row["co_app_score_code_8"] != "")
+
+	@row_checks.register(row_type="LAR")
+	def v711(self, row):
+		"""denial reason 1111 requires blank denial reasons 2-4 and conditional text"""
+		return row["denial_1"] == "1111" and (row["denial_2"] != "" or row["denial_3"] != "" or row["denial_4"] != "" or
+			row["denial_code_9"] != "")
+
+	@row_checks.register(row_type="LAR")
+	def v712(self, row):
+		"""total loan costs and total points and fees must both be Exempt if one is Exempt"""
+		exempt = (row["loan_costs"] == "Exempt", row["points_fees"] == "Exempt")
+		return any(exempt) and not all(exempt)
+
+	@row_checks.register(row_type="LAR")
+	def v713_1(self, row):
+		"""automated underwriting system 1111 requires result 1111"""
+		return row["aus_1"] == "1111" and row["aus_result_1"] != "1111"
+
+	@row_checks.register(row_type="LAR")
+	def v713_2(self, row):
+		"""automated underwriting system 1111 requires blank systems, results and conditional text"""
+		fields = ["aus_2", "aus_3", "aus_4", "aus_5", "aus_code_5", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5",
+			"aus_code_16"]
+		return row["aus_1"] == "1111" and any(row[field] != "" for field in fields)
+
+	@row_checks.register(row_type="LAR")
+	def v714(self, row):
+		"""submission of application and initially payable must both be 1111 if one is 1111"""
+		exempt = (row["app_submission"] == "1111", row["initially_payable"] == "1111")
+		return any(exempt) and not all(exempt)
+
+	@row_checks.register(row_type="LAR")
+	def v715(self, row):
+		"""non-amortizing features must all be 1111 if one is 1111"""
+		exempt = (row["non_amort_features"] == "1111", row["balloon"] == "1111", row["int_only_pmts"] == "1111",
+			row["neg_amort"] == "1111")
+		return any(exempt) and not all(exempt)
+
+	@row_checks.register(row_type="LAR")
+	def v716(self, row):
+		"""state must match the state of the county"""
+		return (row["state"] != "NA" and row["county"] != "NA" and
+			row["state"] != self.state_codes_rev.get(str(row["county"])[:2]))
+
+	@row_checks.register(row_type="LAR")
+	def q601(self, row):
+		"""application date should be within 2 years of action date"""
+		if row["app_date"] == "NA":
+			return False
+		app_date = self.parsed_date(row["app_date"])
+		action_date = self.parsed_date(row["action_date"])
+		if app_date is None or action_date is None:
+			return True
+		return abs((action_date - app_date).days) / 365 > 2.0
+
+	@row_checks.register(row_type="LAR")
+	def q602(self, row):
+		"""street address should be reported if city, state and zip code are reported"""
+		return row["street_address"] == "NA" and row["city"] != "NA" and row["state"] != "NA" and row["zip_code"] != "NA"
+
+	@row_checks.register(row_type="LAR")
+	def q603(self, row):
+		"""tract should be reported in counties with 30,000 or more people"""
+		county = row["county"]
+		return row["tract"] == "NA" and self.geo.valid_county(county) and not self.geo.small_county(county)
+
+	@row_checks.register(row_type="LAR")
+	def q605_1(self, row):
+		"""purchaser type 1 or 3 should have loan type 1"""
+		return row["purchaser_type"] in ("1", "3") and row["loan_type"] != "1"
+
+	@row_checks.register(row_type="LAR")
+	def q605_2(self, row):
+		"""purchaser type 2 should have loan type 2, 3 or 4"""
+		return row["purchaser_type"] == "2" and row["loan_type"] not in ("2", "3", "4")
+
+	@row_checks.register(row_type="LAR")
+	def q606(self, row):
+		"""income should be less than $10 million"""
+		return row["income"] != "NA" and float(row["income"]) >= 10000
+
+	@row_checks.register(row_type="LAR")
+	def q607(self, row):
+		"""subordinate lien loan amounts should not be greater than $250,000"""
+		if row["loan_amount"] == "NA":
+			return False
+		return int(row["loan_amount"]) > 250000 and row["lien"] == "2"
+
+	@row_checks.register(row_type="LAR")
+	def q608(self, row):
+		"""originated loans should have an action date after the application date"""
+		return row["action_taken"] == "1" and row["action_date"] <= row["app_date"]
+
+	@row_checks.register(row_type="LAR")
+	def q609(self, row):
+		"""rate spread for sold loans should not exceed 10%"""
+		if row["rate_spread"] in ("NA", "Exempt", ""):
+			return False
+		return float(row["rate_spread"]) > 10 and row["purchaser_type"] in ("1", "2", "3", "4")
+
+	@row_checks.register(row_type="LAR")
+	def q610(self, row):
+		"""first lien originations with rate spread over 6.5% should be HOEPA loans"""
+		if row["rate_spread"] in ("NA", "Exempt", ""):
+			return False
+		return float(row["rate_spread"]) > 6.5 and row["action_taken"] == "1" and row["lien"] == "1" and row["hoepa"] != "1"
+
+	@row_checks.register(row_type="LAR")
+	def q611(self, row):
+		"""subordinate lien originations with rate spread over 8.5% should be HOEPA loans"""
+		if row["rate_spread"] in ("NA", "Exempt", ""):
+			return False
+		return float(row["rate_spread"]) > 8.5 and row["action_taken"] == "1" and row["lien"] == "2" and row["hoepa"] != "1"
+
+	@row_checks.register(row_type="LAR")
+	def q612(self, row):
+		"""purchaser type 1 or 3 should have HOEPA status 2 or 3"""
+		return row["purchaser_type"] in ("1", "3") and row["hoepa"] not in ("2", "3")
+
+	@row_checks.register(row_type="LAR")
+	def q613(self, row):
+		"""business purpose 1 should have loan purpose 1, 2, 31, 32 or 5"""
+		return row["business_purpose"] == "1" and row["loan_purpose"] not in ("1", "2", "31", "32", "5")
+
+	@row_checks.register(row_type="LAR")
+	def q614_1(self, row):
+		"""applicant age should be between 18 and 100"""
+		if row["app_age"] in ("NA", "8888"):
+			return False
+		return not (18 <= int(row["app_age"]) <= 100)
+
+	@row_checks.register(row_type="LAR")
+	def q614_2(self, row):
+		"""co-applicant age should be between 18 and 100"""
+		if row["co_app_age"] in ("NA", "8888"):
+			return False
+		return not (18 <= int(row["co_app_age"]) <= 100)
+
+	@row_checks.register(row_type="LAR")
+	def q615_1(self, row):
+		"""total loan costs should be greater than origination charges"""
+		if row["origination_fee"] in ("NA", "Exempt") or row["loan_costs"] in ("NA", "Exempt"):
+			return False
+		return row["loan_costs"] < row["origination_fee"]
+
+	@row_checks.register(row_type="LAR")
+	def q615_2(self, row):
+		"""total points and fees should be greater than origination charges"""
+		if row["origination_fee"] in ("NA", "Exempt", "") or row["points_fees"] in ("NA", "Exempt"):
+			return False
+		if row["points_fees"] == "":
+			return True
+		origination_fee = float(row["origination_fee"])
+		return float(row["points_fees"]) < origination_fee
+
+	@row_checks.register(row_type="LAR")
+	def q616_1(self, row):
+		"""total loan costs should be greater than discount points"""
+		if row["loan_costs"] in ("NA", "Exempt") or row["discount_points"] in ("NA", "Exempt"):
+			return False
+		loan_costs = float(row["loan_costs"])
+		return loan_costs < float(row["discount_points"])
+
+	@row_checks.register(row_type="LAR")
+	def q616_2(self, row):
+		"""total points and fees should be greater than discount points"""
+		if row["points_fees"] in ("Exempt", "NA") or row["discount_points"] in ("NA", "Exempt"):
+			return False
+		if row["points_fees"] == "":
+			return True
+		points_fees = float(row["points_fees"])
+		return float(row["discount_points"]) > points_fees
+
+	@row_checks.register(row_type="LAR")
+	def q617(self, row):
+		"""combined loan to value ratio should not be less than the loan to value ratio"""
+		if row["cltv"] in ("NA", "Exempt", "") or row["property_value"] in ("NA", "Exempt", ""):
+			return False
+		cltv = float(row["cltv"])
+		loan_amount = float(row["loan_amount"])
+		property_value = float(row["property_value"])
+		if property_value == 0:
+			#matches division of pandas Series: x/0 is inf, -inf or nan
+			if loan_amount == 0:
+				return False
+			return loan_amount > 0
+		return cltv < (loan_amount / property_value) * 100
+
+	@row_checks.register(row_type="LAR")
+	def q618(self, row):
+		"""site built homes should not have manufactured home secured property type 3"""
+		return row["const_method"] == "2" and row["manufactured_type"] == "3"
+
+	@row_checks.register(row_type="LAR")
+	def q619(self, row):
+		"""site built homes should not have manufactured home land property interest 5"""
+		return row["const_method"] == "2" and row["manufactured_interest"] == "5"
+
+	@row_checks.register(row_type="LAR")
+	def q620(self, row):
+		"""business purpose 2 should have an NMLSR ID"""
+		return row["business_purpose"] == "2" and row["mlo_id"] == "NA"
+
+	@row_checks.register(row_type="LAR")
+	def q621(self, row):
+		"""NMLSR ID should be at most 12 characters without punctuation"""
+		return len(row["mlo_id"]) > 12 or any(char in self.invalid_chars for char in row["mlo_id"])
+
+	@row_checks.register(row_type="LAR")
+	def q622(self, row):
+		"""reverse mortgage applicants should be at least 62"""
+		app_age = int(row["app_age"])
+		return row["reverse_mortgage"] == "1" and app_age < 62
+
+	@row_checks.register(row_type="LAR")
+	def q623(self, row):
+		"""loans of $2 million or more for 1-4 units should not have income of $200,000 or less"""
+		if row["income"] == "NA":
+			return False
+		small_building = int(row["total_units"]) <= 4
+		low_income = float(row["income"]) <= 200
+		return small_building and low_income and int(row["loan_amount"]) >= 2000000
+
+	@row_checks.register(row_type="LAR")
+	def q624(self, row):
+		"""single unit FHA loans should not exceed $637,000"""
+		loan_amount = int(row["loan_amount"])
+		return row["loan_type"] == "2" and row["total_units"] == "1" and loan_amount > 637000
+
+	@row_checks.register(row_type="LAR")
+	def q625(self, row):
+		"""VA loans for 1-4 units should not exceed $1,050,000"""
+		small_building = int(row["total_units"]) <= 4
+		loan_amount = int(row["loan_amount"])
+		return row["loan_type"] == "3" and small_building and loan_amount > 1050000
+
+	@row_checks.register(row_type="LAR")
+	def q626(self, row):
+		"""loans for 1-4 units sold to government sponsored enterprises should not exceed $1,225,000"""
+		small_building = int(row["total_units"]) <= 4
+		loan_amount = int(row["loan_amount"])
+		return row["purchaser_type"] in ("1", "2", "3", "4") and small_building and loan_amount > 1225000
+
+	@row_checks.register(row_type="LAR")
+	def q627(self, row):
+		"""loans for 5 or more units should be between $100,000 and $10 million"""
+		large_building = int(row["total_units"]) >= 5
+		loan_amount = int(row["loan_amount"])
+		return (large_building and loan_amount <= 100000) or loan_amount >= 10000000
+
+	@row_checks.register(row_type="LAR")
+	def q628(self, row):
+		"""home purchase loans for 1-4 units should be more than $10,000"""
+		small_building = int(row["total_units"]) <= 4
+		loan_amount = int(row["loan_amount"])
+		return row["loan_purpose"] == "1" and small_building and loan_amount <= 10000
+
+	@row_checks.register(row_type="LAR")
+	def q629(self, row):
+		"""loans for 1-4 units should report income"""
+		small_building = int(row["total_units"]) <= 4
+		return (row["action_taken"] in ("1", "2", "3", "4", "5", "7", "8") and small_building and row["loan_purpose"] in ("1", "2", "4") and
+			row["income"] == "NA")
+
+	@row_checks.register(row_type="LAR")
+	def q630(self, row):
+		"""loans for 5 or more units should have HOEPA status 3"""
+		return int(row["total_units"]) >= 5 and row["hoepa"] != "3"
+
+	@row_checks.register(row_type="LAR")
+	def q631(self, row):
+		"""FHA, VA and FSA/RHS loans should be for 1-4 units"""
+		large_building = int(row["total_units"]) > 4
+		return row["loan_type"] in ("2", "3", "4") and large_building
+
+	@row_checks.register(row_type="LAR")
+	def q632(self, row):
+		"""automated underwriting system 3 should have a matching result"""
+		aus_results = ("1", "2", "3", "4", "8", "13", "16", "18", "19")
+		for i in range(1, 6):
+			if row["aus_{i}".format(i=i)] == "3" and row["aus_result_{i}".format(i=i)] not in aus_results:
+				return True
+		return False
+
+	@row_checks.register(row_type="LAR")
+	def q633(self, row):
+		"""automated underwriting system 4 should have a matching result"""
+		aus_results = ("3", "4", "10", "15", "16", "18", "19", "20", "21", "22", "23", "24")
+		for i in range(1, 6):
+			if row["aus_{i}".format(i=i)] == "4" and row["aus_result_{i}".format(i=i)] not in aus_results:
+				return True
+		return False
+
+	@row_checks.register(row_type="LAR")
+	def q642_1(self, row):
+		"""applicant credit score 7777 should have score model 7 or 8"""
+		return row["app_credit_score"] == "7777" and row["app_score_name"] not in ("7", "8")
+
+	@row_checks.register(row_type="LAR")
+	def q642_2(self, row):
+		"""co-applicant credit score 7777 should have score model 7 or 8"""
+		return row["co_app_credit_score"] == "7777" and row["co_app_score_name"] not in ("7", "8")
+
+	@row_checks.register(row_type="LAR")
+	def q643(self, row):
+		"""automated underwriting system 1 should have a matching result"""
+		aus_results = ("1", "2", "3", "4", "5", "6", "7", "15", "16")
+		for i in range(1, 6):
+			if row["aus_{i}".format(i=i)] == "1" and row["aus_result_{i}".format(i=i)] not in aus_results:
+				return True
+		return False
+
+	@row_checks.register(row_type="LAR")
+	def q644(self, row):
+		"""automated underwriting system 2 should have a matching result"""
+		aus_results = ("8", "9", "10", "11", "12", "13", "16")
+		for i in range(1, 6):
+			if row["aus_{i}".format(i=i)] == "2" and row["aus_result_{i}".format(i=i)] not in aus_results:
+				return True
+		return False
+
+	@row_checks.register(row_type="LAR")
+	def q645_1(self, row):
+		"""loan amount should be at least $500"""
+		return int(row["loan_amount"]) < 500
+
+	@row_checks.register(row_type="LAR")
+	def q645_2(self, row):
+		"""home purchase loan amounts should be more than $1,000"""
+		loan_amount = int(row["loan_amount"])
+		return row["loan_purpose"] == "1" and loan_amount <= 1000
+
+	@row_checks.register(row_type="LAR")
+	def q648(self, row):
+		"""ULIs should begin with the LEI"""
+		return row["action_taken"] in ("1", "2", "3", "4", "5", "7", "8") and row["uli"][:20] != row["lei"]
+
+	@row_checks.register(row_type="LAR")
+	def q649_1(self, row):
+		"""applicant credit score should be between 300 and 900"""
+		return (row["app_credit_score"] not in ("7777", "8888", "1111") and
+			self.engine.check_number(row["app_credit_score"], min_val=301, max_val=901) == False)
+
+	@row_checks.register(row_type="LAR")
+	def q649_2(self, row):
+		"""co-applicant credit score should be between 300 and 900"""
+		return (row["co_app_credit_score"] not in ("7777", "8888", "1111") and
+			self.engine.check_number(row["co_app_credit_score"], min_val=301, max_val=901) == False)
+
+	@row_checks.register(row_type="LAR")
+	def q650(self, row):
+		"""interest rate should not be less than 0.5%"""
+		return row["interest_rate"] not in ("Exempt", "NA") and 0 < float(row["interest_rate"]) < 0.5
+
+	@row_checks.register(row_type="LAR")
+	def q651(self, row):
+		"""combined loan to value ratio should not be less than 1%"""
+		return row["cltv"] not in ("NA", "Exempt") and 0 < float(row["cltv"]) < 1
+
+	@row_checks.register(row_type="LAR")
+	def q652(self, row):
+		"""debt to income ratio should be a percentage"""
+		return row["dti"] not in ("NA", "Exempt") and self.engine.check_number(row["dti"], min_val=0, max_val=1) == False
+
+	@row_checks.register(row_type="LAR")
+	def q653_1(self, row):
+		"""originated and purchased loans should have a combined loan to value ratio between 0% and 250%"""
+		if row["cltv"] in ("NA", "Exempt"):
+			return False
+		valid_cltv = 0.0 < float(row["cltv"]) < 250
+		return row["action_taken"] in ("1", "2", "8") and not valid_cltv
+
+	@row_checks.register(row_type="LAR")
+	def q653_2(self, row):
+		"""declined, withdrawn and closed applications should have a combined loan to value ratio between 0% and 1000%"""
+		if row["cltv"] in ("NA", "Exempt"):
+			return False
+		valid_cltv = 0 < float(row["cltv"]) < 1000
+		return row["action_taken"] in ("3", "4", "5", "6", "7") and not valid_cltv
+
+	@row_checks.register(row_type="LAR")
+	def q654(self, row):
+		"""debt to income ratio should be less than 80% for applicants with income over $5,000"""
+		if row["dti"] in ("NA", "Exempt") or row["income"] == "NA":
+			return False
+		high_income = float(row["income"]) > 5
+		return (high_income and row["action_taken"] in ("1", "2", "8") and
+			self.engine.check_number(row["dti"], min_val=0.0, max_val=80) == True)
@@ -3,25 +3,88 @@
 #The return should be JSON formatted data, written to a file?
 #input to the class will be a pandas dataframe
 
-from collections import OrderedDict
+from collections import Counter, OrderedDict
 from datetime import datetime
 import json
+import multiprocessing
 import string
 import time
 import yaml
 
+import numpy as np
 import pandas as pd
 
+from edit_registry import edit_registry, ALL_FIELDS
+from fail_bitmap import fail_bitmap
+from geo_index import geo_index
 import utils
 
+#registry of edit functions in the rules engine, populated by the register decorator on each edit
+edit_rules = edit_registry()
+
+#fields counted together by rules_engine.macro_counts for the macro edits
+MACRO_FIELDS = ("action_taken", "loan_purpose", "preapproval")
+
+#rules engine used by worker processes in run_edits_parallel
+_worker_engine = None
+
+def _is_number(value):
+	"""Returns True for strings of digits with optional decimal points, the values check_number accepts as numbers."""
+	return isinstance(value, str) and value.replace(".","").isdigit()
+
+def _number_value(value):
+	"""Returns a value accepted by _is_number as a float, NaN for other values or numbers that do not convert."""
+	if not _is_number(value):
+		return np.nan
+	try:
+		return float(value)
+	except ValueError:
+		return np.nan
+
+def _float_value(value):
+	"""Returns float(value), NaN if the value does not convert."""
+	try:
+		return float(value)
+	except (TypeError, ValueError):
+		return np.nan
+
+#classifications of LAR field values available from rules_engine.field_view
+_field_classifiers = {
+	"digits": lambda value: isinstance(value, str) and value.isdigit(),
+	"number": _is_number,
+	"numeric": _number_value,
+	"float": _float_value}
+
+def _init_worker(engine):
+	"""Pool initializer. engine is None when workers are forked and inherit _worker_engine from the parent."""
+	global _worker_engine
+	if engine is not None:
+		_worker_engine = engine
+
+def _run_worker_edits(edits):
+	"""
+	Runs a group of edits in a worker process and returns a list of (edit, results) pairs and a list of
+	(edit name, packed fail bits) pairs from the worker's fail bitmap.
+	"""
+	_worker_engine.fail_bits = None
+	edit_results = [(edit, _worker_engine.run_edit(edit)) for edit in edits]
+	bitmap = _worker_engine.failure_bitmap()
+	return edit_results, [(edit, bitmap.packed_row(edit)) for edit in bitmap.edits]
+
 class rules_engine(object):
 	"""
 	Contains the business rules of the HMDA Platform for a given year
 	Contains logic to create and edit report of rows that fail edit rules
 	"""
+	registry = edit_rules
 
 	def __init__(self, config_data, state_codes, state_codes_rev, geographic_data, full_lar_file_check=False,
-		lar_schema_file="../schemas/lar_schema.json", ts_schema_file="../schemas/ts_schema.json"):
+		lar_schema_file="../schemas/lar_schema.json", ts_schema_file="../schemas/ts_schema.json", compact_enums=False,
+		debug=False):
+		"""
+		compact_enums: if True, LAR enumeration fields are stored as pandas Categoricals when LAR data is loaded
+		debug: if True, create_edit_report prints the hit rate of the field mask cache, see field_mask
+		"""
 
 		print("initializing rules engine")
 
@@ -31,7 +94,12 @@ class rules_engine(object):
 		self.config_data = config_data
 		self.state_codes = state_codes
 		self.state_codes_rev = state_codes_rev
+		#geographic_data may be passed as the census dataframe or as a geo_index built from it
+		self.geo = None
 		self.geographic_data = geographic_data
+		if geographic_data is not None:
+			self.geo = geo_index.load(geographic_data)
+			self.geographic_data = self.geo.geographic_data
 		print("opening json schema files")
 
 		with open(lar_schema_file, 'r') as f:
@@ -42,14 +110,25 @@ class rules_engine(object):
 			ts_schema_json = json.load(f)
 		self.ts_schema_df = pd.DataFrame(ts_schema_json)
 
+		self.compact_enums = compact_enums
+		self.enum_categories = self.schema_enum_categories()
+
 		print("schema loaded")
 		self.results = []
-
-		self.svq_edit_functions = []
-
-		for func in dir(self):
-			if func[:1] in ("s", "v", "q") and func[1:4].isdigit()==True:
-				self.svq_edit_functions.append(func)
+		self.date_cache = {} #parsed LAR date fields, cleared when new LAR data is loaded
+		self.fail_bits = None #fail_bitmap of LAR rows failing each edit run on the loaded LAR data, see failure_bitmap
+		self.uli_array = None #ULIs of the loaded LAR data, see uli_values
+		self.debug = debug
+		self.mask_cache = {} #field comparison masks for the loaded LAR data, see field_mask
+		self.mask_cache_hits = 0
+		self.mask_cache_misses = 0
+		self.field_views = {} #per field classifications of the loaded LAR data, see field_view
+		self.hash_cache = {} #row hashes of the loaded LAR data, see row_hashes
+		self.macro_stats = None #row counts by MACRO_FIELDS values for the loaded LAR data, see macro_counts
+		self.file_lei = None #LEI of the first LAR row when a file is validated in chunks, see validate_file_streaming
+		self.edit_fail_counts = Counter() #number of any_failures calls in which each edit failed, used to order edits
+
+		self.svq_edit_functions = self.registry.select(edit_types=("s", "v", "q"))
 		print("rules engine finished initializing")
 
 
@@ -58,7 +137,7 @@ class rules_engine(object):
 		Takes a dataframe of LAR data and stores it as a class variable.
 		attempts a converstion to dataframe if passed object is not a dataframe
 		"""
-		if type(lar_df) != "pandas.core.frame.DataFrame":
+		if not isinstance(lar_df, pd.DataFrame):
 	
 			try: 
 				lar_df = pd.DataFrame(lar_df, index=[0])
@@ -69,6 +148,9 @@ class rules_engine(object):
 				#lar_df = pd.DataFrame(lar_df, index=[1], keep_default_na=False)
 		else:
 			self.lar_df = lar_df
+		if self.compact_enums:
+			self.lar_df = self.compact_lar_df(self.lar_df)
+		self.clear_lar_caches()
 
 	def load_ts_data(self, ts_df):
 		"""
@@ -82,34 +164,133 @@ class rules_engine(object):
 			
 		self.ts_df = ts_df
 
+	def schema_enum_categories(self):
+		"""
+		Returns a dictionary of LAR enumeration fields and their schema values as strings, followed by blank.
+		Enumeration fields are those whose schema valid values are all integer codes, with at least one below 1000.
+		Fields such as app_age or app_credit_score list only NA and exemption codes (8888, 1111) for a numeric range.
+		"""
+		enum_categories = OrderedDict()
+		for field, valid_vals in zip(self.lar_schema_df.field, self.lar_schema_df.valid_vals):
+			if not isinstance(valid_vals, list) or len(valid_vals) == 0:
+				continue
+			if all(isinstance(val, int) for val in valid_vals) and min(valid_vals) < 1000:
+				enum_categories[field] = [str(val) for val in valid_vals] + [""]
+		return enum_categories
+
+	def compact_lar_df(self, lar_df):
+		"""
+		Returns a copy of lar_df with enumeration fields stored as pandas Categoricals.
+		Categories are the schema values and blank, followed by any out of schema values in the data, so that codes
+		for invalid values are kept and all edits return the same results as on string data.
+		See enum_out_of_schema for a mask of out of schema values.
+		"""
+		lar_df = lar_df.copy(deep=False)
+		for field, schema_vals in self.enum_categories.items():
+			if field not in lar_df.columns:
+				continue
+			values = lar_df[field].astype("category")
+			extra_vals = [val for val in values.cat.categories if val not in schema_vals]
+			lar_df[field] = values.cat.set_categories(schema_vals + sorted(extra_vals))
+		return lar_df
+
+	def enum_out_of_schema(self, field):
+		"""
+		Returns a boolean Series that is True where a compacted enumeration field holds a value not in the schema or blank.
+		"""
+		return pd.Series(self.lar_df[field].cat.codes >= len(self.enum_categories[field]), index=self.lar_df.index)
+
+	@property
+	def results(self):
+		"""
+		List of edit result dictionaries, see results_wrapper.
+		Failed LAR rows are held as arrays of row positions while edits run and are mapped to lists of ULIs when the
+		results are read, using the ULIs of the LAR data the edit was run on.
+		"""
+		for result, ulis in self.pending_rows:
+			result["failed_rows"] = ulis[result["failed_rows"]].tolist()
+		self.pending_rows = []
+		return self.edit_results
+
+	@results.setter
+	def results(self, results):
+		self.edit_results = results
+		self.pending_rows = [] #(result, ULI array) pairs for results whose failed rows are still row positions
+
+	def uli_values(self):
+		"""Returns the ULIs of the loaded LAR rows as an object array, built once per loaded LAR frame."""
+		if self.uli_array is None:
+			self.uli_array = self.lar_df.uli.to_numpy(dtype=object)
+		return self.uli_array
+
 	def reset_results(self):
 		"""
 		Resets results list to empty.
 		"""
 		self.results = []
 
-	def split_ts_row(self, data_file, load=True):
+	def clear_lar_caches(self):
+		"""
+		Clears values derived from the loaded LAR data. Called whenever new LAR data is loaded.
+		"""
+		self.date_cache = {}
+		self.fail_bits = None
+		self.uli_array = None
+		self.mask_cache = {}
+		self.field_views = {}
+		self.hash_cache = {}
+		self.macro_stats = None
+
+	def edit_fields(self, edits):
+		"""
+		Returns the list of LAR fields, in schema order, needed to run the passed edits and report their results.
+		Returns None if the edits need every LAR field.
+		"""
+		fields = self.registry.fields_for(edits)
+		if fields == ALL_FIELDS:
+			return None
+		fields.add("uli") #failed rows are reported by ULI
+		return [field for field in self.lar_schema_df.field if field in fields]
+
+	def split_ts_row(self, data_file, load=True, edits=None):
 		"""
 		Separates TS and LAR portions of a file and returns each as a dataframe.
+		If a list of edits is passed, only the LAR fields needed by those edits are parsed.
 		"""
+		lar_fields = None
+		if edits is not None:
+			lar_fields = self.edit_fields(edits)
+		if self.compact_enums and lar_fields is None:
+			lar_fields = list(self.lar_schema_df.field) #parse with read_lar_columns to avoid a full object frame
 
 		with open(data_file, 'r') as infile:
 			ts_row = infile.readline().strip("\n")
 			ts_data = []
 			ts_data.append(ts_row.split("|"))
-
-			lar_rows = infile.readlines()
-			lar_data = [line.strip("\n").split("|") for line in lar_rows]
-
 			ts_df = pd.DataFrame(data=ts_data, dtype=object, columns=list(self.ts_schema_df.field))
-			lar_df  = pd.DataFrame(data=lar_data, dtype=object, columns=list(self.lar_schema_df.field))
+
+			if lar_fields is None:
+				lar_rows = infile.readlines()
+				lar_data = [line.strip("\n").split("|") for line in lar_rows]
+				lar_df  = pd.DataFrame(data=lar_data, dtype=object, columns=list(self.lar_schema_df.field))
+
+		if lar_fields is not None:
+			dtypes = None
+			if self.compact_enums:
+				#parse enumeration fields straight to Categoricals
+				dtypes = {field: "category" for field in self.enum_categories if field in lar_fields}
+			lar_df = utils.read_lar_columns(data_file, lar_fields=lar_fields, all_fields=list(self.lar_schema_df.field),
+				dtypes=dtypes)
+		if self.compact_enums:
+			lar_df = self.compact_lar_df(lar_df)
 		if load == True:	
 			self.lar_df = lar_df
 			self.ts_df = ts_df
+			self.clear_lar_caches()
 		
 		return ts_df, lar_df
 
-	def create_edit_report(self, rules_list=["s","v"]):
+	def create_edit_report(self, rules_list=["s","v"], jobs=1):
 		"""
 		Uses the self.results list generated by results wrapper to create a dataframe showing:
 		edit_name
@@ -117,34 +298,298 @@ class rules_engine(object):
 		row_type
 		data_fields
 		Row IDS (as ULI or TS)
+		jobs: number of worker processes used to run the edits, see run_edits_parallel
 		"""
-		rules = dir(self)
-		rules = [rule for rule in rules if rule[:1] in rules_list]
-		for rule in rules:
-			if rule[:1] in rules_list and rule[1:4].isdigit()==True:
+		edits = self.registry.select(edit_types=rules_list)
+		if jobs > 1:
+			self.run_edits_parallel(edits, jobs=jobs)
+		else:
+			for rule in edits:
 				getattr(self, rule)()
+		if self.debug:
+			self.print_mask_cache_stats()
+		res_df = pd.DataFrame(self.results)
+		return res_df
+
+	def any_failures(self, rules_list=["s","v"], stop_early=True):
+		"""
+		Runs the edits in rules_list against the loaded data and returns the list of edit ids with at least one failed row.
+		If stop_early is True, returns after the first failing edit, so an empty list means the data is clean.
+		Edits are run in order of how often they failed in earlier calls, most frequent first.
+		Does not change self.results.
+		"""
+		edits = self.registry.select(edit_types=rules_list)
+		edits.sort(key=lambda edit: -self.edit_fail_counts[edit]) #stable sort keeps registry order for ties
+		failed_edits = []
+		results, pending_rows = self.edit_results, self.pending_rows
+		try:
+			for edit in edits:
+				self.results = []
+				getattr(self, edit)()
+				if any(result["fail_count"] > 0 for result in self.edit_results):
+					self.edit_fail_counts[edit] += 1
+					failed_edits.append(edit)
+					if stop_early:
+						break
+		finally:
+			self.edit_results, self.pending_rows = results, pending_rows
+		return failed_edits
+
+	def run_edits_parallel(self, edits, jobs):
+		"""
+		Runs the passed edits against the loaded TS and LAR data in a pool of jobs worker processes and adds their
+		results to self.results in the order of edits, as if the edits had been run one after another.
+		Where processes can be forked, workers inherit the loaded data from this process and nothing is pickled
+		except edit names and results. Otherwise the rules engine is pickled once per worker, not once per edit.
+		"""
+		global _worker_engine
+		#interleave edits so that each group mixes cheap and expensive edits
+		group_count = min(len(edits), jobs * 4)
+		groups = [edits[i::group_count] for i in range(group_count)]
+		if "fork" in multiprocessing.get_all_start_methods():
+			context = multiprocessing.get_context("fork")
+			_worker_engine = self
+			init_engine = None
+		else:
+			context = multiprocessing.get_context()
+			init_engine = self
+		try:
+			with context.Pool(processes=jobs, initializer=_init_worker, initargs=(init_engine,)) as pool:
+				group_results = pool.map(_run_worker_edits, groups, chunksize=1)
+		finally:
+			_worker_engine = None
+		edit_results = dict(pair for group, bits in group_results for pair in group)
+		bitmap = self.failure_bitmap()
+		for group, bits in group_results:
+			for edit, packed in bits:
+				bitmap.add_packed(edit, packed)
+		for edit in edits:
+			self.results.extend(edit_results[edit])
+
+	def validate_file_streaming(self, data_file, chunk_rows=100000, rules_list=["s","v"]):
+		"""
+		Runs the edits in rules_list against a file chunk_rows LAR rows at a time and returns the same edit report
+		dataframe as split_ts_row followed by create_edit_report, without holding the full LAR data in memory.
+		Row level edits are run on each chunk and their results combined.
+		File level edits (registered with file_level=True) keep a few bytes of state per row across chunks:
+		- duplicate edits (s305 on full rows, s306 and q600 on ULIs) hash the ULI of each row, then run on the rows
+		  whose ULI hash repeats
+		- the other file level edits (s304 and macro edits) run once on a frame of only the fields they read,
+		  with row positions in place of ULIs
+		A second pass over the file reads the duplicate candidates and the ULIs of rows failing file level edits.
+		"""
+		edits = self.registry.select(edit_types=rules_list)
+		ts_edits = [edit for edit in edits if self.registry[edit].row_type == "TS"]
+		file_edits = [edit for edit in edits if self.registry[edit].file_level]
+		row_edits = [edit for edit in edits if edit not in ts_edits and edit not in file_edits]
+		row_dupe_edits = [edit for edit in file_edits if self.registry[edit].fields == ALL_FIELDS]
+		uli_dupe_edits = [edit for edit in file_edits if edit not in row_dupe_edits and "uli" in self.registry[edit].fields]
+		total_edits = [edit for edit in file_edits if edit not in row_dupe_edits and edit not in uli_dupe_edits]
+
+		all_fields = list(self.lar_schema_df.field)
+		lar_fields = self.edit_fields(row_edits + file_edits) or all_fields
+		total_fields = [field for field in lar_fields if field in self.registry.fields_for(total_edits) and field != "uli"]
+		uli_dupe_fields = self.edit_fields(uli_dupe_edits)
+		dtypes = None
+		if self.compact_enums:
+			dtypes = {field: "category" for field in self.enum_categories if field in lar_fields}
+
+		with open(data_file, 'r') as infile:
+			ts_row = infile.readline().strip("\n")
+		self.ts_df = pd.DataFrame(data=[ts_row.split("|")], dtype=object, columns=list(self.ts_schema_df.field))
+
+		edit_results = OrderedDict((edit, []) for edit in edits)
+		for edit in ts_edits:
+			edit_results[edit] = self.run_edit(edit)
+
+		#first pass: row level edits and file level state
+		row_count = 0
+		total_chunks = []
+		uli_hashes = []
+		try:
+			for lar_df in utils.read_lar_chunks(data_file, lar_fields, all_fields, chunk_rows, dtypes=dtypes):
+				if self.file_lei is None and "lei" in lar_df.columns and len(lar_df) > 0:
+					self.file_lei = lar_df.lei.iloc[0]
+				self.load_lar_data(lar_df)
+				for edit in row_edits:
+					self.merge_results(edit_results[edit], self.run_edit(edit))
+				row_count += len(lar_df)
+				if total_edits:
+					total_chunks.append(self.lar_df[total_fields].astype("category"))
+				if row_dupe_edits or uli_dupe_edits:
+					uli_hashes.append(self.row_hashes(["uli"]))
+		finally:
+			self.file_lei = None
+
+		if total_edits:
+			total_df = pd.DataFrame(index=pd.RangeIndex(row_count))
+			for field in total_fields:
+				values = pd.api.types.union_categoricals([chunk[field] for chunk in total_chunks])
+				if field not in self.enum_categories:
+					values = np.asarray(values, dtype=object) #shares one string per distinct value
+				total_df[field] = values
+			total_df["uli"] = total_df.index #row positions, replaced with ULIs in the second pass
+			self.lar_df = total_df
+			self.clear_lar_caches()
+			for edit in total_edits:
+				edit_results[edit] = self.run_edit(edit)
+			del total_df, total_chunks
+
+		#rows whose ULI hash is repeated are candidates for the duplicate edits, exact duplicate rows also repeat their ULI
+		uli_candidates = self.repeated_positions(uli_hashes)
+		row_candidates = uli_candidates if row_dupe_edits else np.array([], dtype=np.int64)
+		if not uli_dupe_edits:
+			uli_candidates = np.array([], dtype=np.int64)
+		total_fail_rows = set()
+		for edit in total_edits:
+			for result in edit_results[edit]:
+				if result["row_type"] == "LAR":
+					total_fail_rows.update(result["failed_rows"])
+		total_fail_rows = np.array(sorted(total_fail_rows), dtype=np.int64)
+
+		#second pass: read duplicate candidates and ULIs of failing rows
+		row_dupe_df = pd.DataFrame([], columns=all_fields, dtype=object)
+		uli_dupe_df = pd.DataFrame([], columns=uli_dupe_fields, dtype=object)
+		fail_ulis = {}
+		if len(row_candidates) > 0 or len(uli_candidates) > 0 or len(total_fail_rows) > 0:
+			if len(row_candidates) > 0:
+				pass_fields = all_fields
+			else:
+				pass_fields = sorted(set(uli_dupe_fields or []) | {"uli"}, key=all_fields.index)
+			row_dupe_chunks = []
+			uli_dupe_chunks = []
+			for lar_df in utils.read_lar_chunks(data_file, pass_fields, all_fields, chunk_rows):
+				if len(row_candidates) > 0:
+					row_dupe_chunks.append(lar_df[lar_df.index.isin(row_candidates)])
+				if len(uli_candidates) > 0:
+					uli_dupe_chunks.append(lar_df.loc[lar_df.index.isin(uli_candidates), uli_dupe_fields])
+				fail_rows = lar_df.uli[lar_df.index.isin(total_fail_rows)]
+				fail_ulis.update(zip(fail_rows.index, fail_rows))
+			if row_dupe_chunks:
+				row_dupe_df = pd.concat(row_dupe_chunks)
+			if uli_dupe_chunks:
+				uli_dupe_df = pd.concat(uli_dupe_chunks)
+
+		for dupe_edits, dupe_df in ((row_dupe_edits, row_dupe_df), (uli_dupe_edits, uli_dupe_df)):
+			if dupe_edits:
+				self.lar_df = dupe_df
+				self.clear_lar_caches()
+				for edit in dupe_edits:
+					edit_results[edit] = self.run_edit(edit)
+		for edit in total_edits:
+			for result in edit_results[edit]:
+				if result["row_type"] == "LAR":
+					result["failed_rows"] = [fail_ulis[row] for row in result["failed_rows"]]
+
+		self.reset_results()
+		self.fail_bits = None #rows of the last chunk read do not cover the file
+		for edit in edits:
+			self.results.extend(edit_results[edit])
 		res_df = pd.DataFrame(self.results)
 		return res_df
 
-	def results_wrapper(self, fail_df, field_name, edit_name, row_type="LAR"):
+	def run_edit(self, edit):
+		"""
+		Runs a single edit against the loaded data and returns the list of results it added.
+		"""
+		self.reset_results()
+		getattr(self, edit)()
+		results = self.results
+		self.reset_results()
+		return results
+
+	def merge_results(self, merged, results):
+		"""
+		Adds the results of an edit run on one chunk of LAR data to the results for the earlier chunks in merged.
+		"""
+		if not merged:
+			merged.extend(results)
+			return
+		for total, result in zip(merged, results):
+			total["fail_count"] += result["fail_count"]
+			if result["row_type"] == "LAR":
+				total["failed_rows"].extend(result["failed_rows"])
+			elif result["failed_rows"]:
+				total["failed_rows"] = result["failed_rows"] #TS rows are reported once
+
+	def repeated_positions(self, hashes):
+		"""
+		Takes a list of per chunk arrays of row hashes and returns the row positions of hashes that occur more than once.
+		"""
+		if not hashes:
+			return np.array([], dtype=np.int64)
+		repeated = pd.Series(np.concatenate(hashes)).duplicated(keep=False).to_numpy()
+		return np.flatnonzero(repeated)
+
+	def row_hashes(self, fields=None):
+		"""
+		Returns a uint64 hash of each loaded LAR row over the passed fields (all loaded fields if None).
+		Hashes are computed with vectorized pandas hashing and cached until new LAR data is loaded.
+		Equal rows have equal hashes whether or not fields are categorical, so the hashes of the chunks
+		of a file can be combined to find rows repeated anywhere in the file, see repeated_positions.
+		"""
+		key = None if fields is None else tuple(fields)
+		if key not in self.hash_cache:
+			lar_df = self.lar_df if fields is None else self.lar_df[list(fields)]
+			self.hash_cache[key] = pd.util.hash_pandas_object(lar_df, index=False).to_numpy()
+		return self.hash_cache[key]
+
+	def duplicate_mask(self, fields=None, rows=None):
+		"""
+		Returns a boolean array marking the loaded LAR rows that have the same values as another row in the passed
+		fields (all loaded fields if None). rows is an optional boolean mask limiting the rows compared.
+		Rows with repeated hashes are candidates, which are then compared by value so hash collisions are not reported.
+		"""
+		hashes = self.row_hashes(fields)
+		positions = np.arange(len(hashes)) if rows is None else np.flatnonzero(np.asarray(rows, dtype=bool))
+		candidates = positions[pd.Series(hashes[positions]).duplicated(keep=False).to_numpy()]
+		dupes = np.zeros(len(hashes), dtype=bool)
+		if len(candidates) > 0:
+			candidate_df = self.lar_df.iloc[candidates]
+			if fields is not None:
+				candidate_df = candidate_df[list(fields)]
+			dupes[candidates] = candidate_df.duplicated(keep=False).to_numpy()
+		return dupes
+
+	def results_wrapper(self, field_name, edit_name, fail_df=None, fail_mask=None, row_type="LAR"):
 		"""
 		Creates results dictionary/JSON object used in checking which LAR/TS rows failed edit checks
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="LAR")
+		Failed rows are passed either as a dataframe of failing rows (fail_df) or as a boolean mask over the loaded LAR
+		rows (fail_mask), which avoids copying the failing rows of the LAR dataframe.
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask, row_type="LAR")
 		"""
-		if len(fail_df) > 0:
+		if fail_mask is not None:
+			fail_rows = np.flatnonzero(np.asarray(fail_mask, dtype=bool))
+			fail_count = len(fail_rows)
+		else:
 			fail_count = len(fail_df)
-			result = "failed"
 
+		if row_type == "LAR":
+			if fail_mask is None and fail_count > 0:
+				fail_rows = np.flatnonzero(self.lar_df.index.isin(fail_df.index))
+			elif fail_mask is None:
+				fail_rows = []
+			self.failure_bitmap().add(edit_name, fail_rows)
+
+		pending = False
+		if fail_count > 0:
 			if row_type == "LAR":
-				failed_rows = list(fail_df.uli)
+				#positions of failed rows are kept as an integer array and mapped to ULIs when the results are read
+				if fail_mask is not None:
+					failed_rows = fail_rows
+					pending = True
+				elif self.lar_df.index.is_unique and (self.lar_df.index.get_indexer(fail_df.index) >= 0).all():
+					failed_rows = self.lar_df.index.get_indexer(fail_df.index)
+					pending = True
+				else:
+					#rows that are not in the loaded LAR data are reported by their own ULIs
+					failed_rows = fail_df.uli.tolist()
 				#self.update_results(edit_name=edit_name, edit_field_results=result, row_type=row_type, fields=field_name, row_ids=failed_rows, fail_count=count)
 			else:
 				failed_rows = ["ts"]
 				#Adding an edit report row for an edit related to the Transmittal Sheet. As TS is one row, the fail count is set to 1.  
 				#self.update_results(edit_name=edit_name, edit_field_results=result, row_type=row_type, fields=field_name, row_ids='TS', fail_count=1)
 		else:
-			result = "passed"
-			fail_count = 0
 			failed_rows = []
 
 		results_dict = {
@@ -155,9 +600,37 @@ class rules_engine(object):
 			"failed_rows": failed_rows
 		}
 
-		self.results.append(results_dict)
+		self.edit_results.append(results_dict)
+		if pending:
+			self.pending_rows.append((results_dict, self.uli_values()))
 			#self.update_results(edit_name=edit_name, edit_field_results=result, row_type=row_type, fields=field_name, row_ids=[], fail_count=0)
 
+	def failure_bitmap(self):
+		"""
+		Returns the fail_bitmap of the loaded LAR rows failing each LAR edit run since the data was loaded.
+		Edits reported against the TS row are not included. The bitmap is not kept by validate_file_streaming.
+		"""
+		if self.fail_bits is None:
+			self.fail_bits = fail_bitmap(len(self.lar_df), ulis=self.uli_values())
+		return self.fail_bits
+
+	def rows_failing(self, edit_types=["s","v"]):
+		"""
+		Returns a boolean array over the loaded LAR rows that is True for rows failing any edit of the passed edit types
+		that has been run on the data.
+		"""
+		return self.failure_bitmap().rows_failing(self.registry.select(edit_types=edit_types))
+
+	def masked_apply(self, mask, func, *fields):
+		"""
+		Returns a boolean array that is True where mask is True and func, called with the values of the passed LAR fields,
+		returns True. func is only called for rows where mask is True, so it may raise for the others (for example float on NA).
+		"""
+		mask = np.asarray(mask, dtype=bool)
+		result = np.zeros(len(mask), dtype=bool)
+		values = [self.lar_df[field].to_numpy(dtype=object)[mask] for field in fields]
+		result[mask] = [bool(func(*row)) for row in zip(*values)]
+		return result
 
 	def valid_date(self, date):
 		"""
@@ -171,18 +644,118 @@ class rules_engine(object):
 		except:
 			return False
 
-	def check_dupes(self, row, fields=[]):
+	def field_mask(self, field, op, values):
 		"""
-		Checks for duplicate entries in the list of fields
+		Returns a boolean Series comparing a LAR field with a value (op "==" or "!=") or a collection of values (op "isin").
+		Masks are cached until new LAR data is loaded, keyed by field and value or set of values, so a comparison
+		shared by several edits is computed once per file. "!=" returns the negation of the cached "==" mask.
+		The returned Series is shared between edits and must not be modified in place.
 		"""
-		dct = {i:row[fields[i]] for i in range(len(fields))}
-		result = "pass"
-		for key, value in dct.items():
-			for key2, value2 in dct.items():
-				if not key == key2:
-					if value == value2 and value2 != "":
-						result = "fail"
-		return result
+		if op == "isin":
+			key = (field, op, frozenset(values))
+		else:
+			key = (field, "==", values)
+		mask = self.mask_cache.get(key)
+		if mask is None:
+			self.mask_cache_misses += 1
+			if op == "isin":
+				mask = self.lar_df[field].isin(values)
+			else:
+				mask = self.lar_df[field]==values
+			self.mask_cache[key] = mask
+		else:
+			self.mask_cache_hits += 1
+		if op == "!=":
+			return ~mask
+		return mask
+
+	def print_mask_cache_stats(self):
+		"""
+		Prints the hits and misses of the field mask cache since the rules engine was created.
+		"""
+		lookups = self.mask_cache_hits + self.mask_cache_misses
+		if lookups > 0:
+			print("field mask cache: {hits} hits, {misses} misses, {rate:.1%} hit rate".format(hits=self.mask_cache_hits,
+				misses=self.mask_cache_misses, rate=self.mask_cache_hits / lookups))
+
+	def field_view(self, kind, field):
+		"""
+		Returns a numpy array classifying each value of a LAR field. kind is one of:
+		"digits": True for values made only of digits (str.isdigit)
+		"number": True for values check_number accepts as numbers, digits with optional decimal points
+		"numeric": float64 of "number" values, NaN for others (NA, Exempt, blanks, negative numbers)
+		"float": float64 of values that convert with float, NaN for others (as compared by compare_nums)
+		Each distinct value is classified once and views are cached until new LAR data is loaded.
+		NA, Exempt and blank masks are available from field_mask.
+		"""
+		key = (kind, field)
+		if key not in self.field_views:
+			classify = _field_classifiers[kind]
+			codes, uniques = pd.factorize(self.lar_df[field])
+			#missing values have code -1, which selects the classification of NaN appended at the end
+			classes = [classify(value) for value in np.asarray(uniques, dtype=object)] + [classify(np.nan)]
+			self.field_views[key] = np.array(classes)[codes]
+		return self.field_views[key]
+
+	def parsed_dates(self, field):
+		"""
+		Returns a LAR date field as a datetime64 Series. Values that are not valid YYYYMMDD dates (including NA)
+		are NaT. Each field is parsed once per loaded LAR frame and cached for use by all date edits.
+		"""
+		if field not in self.date_cache:
+			dates = self.lar_df[field].astype(str)
+			eight_digits = dates.str.match(r"^\d{8}$")
+			parsed = pd.Series(pd.NaT, index=dates.index, dtype="datetime64[ns]")
+			#only 8 digit strings are converted, to_datetime warns when casting NA and blanks to numbers
+			parsed[eight_digits] = pd.to_datetime(dates[eight_digits], format="%Y%m%d", errors="coerce")
+			self.date_cache[field] = parsed
+		return self.date_cache[field]
+
+	def macro_counts(self):
+		"""
+		Returns a Counter of LAR rows by their MACRO_FIELDS values, keyed by tuples in MACRO_FIELDS order with None for
+		fields that are not loaded. The counts are taken in one pass over the data and cached until new LAR data
+		is loaded, so each macro edit reads its counts without another pass over the rows.
+		"""
+		if self.macro_stats is None:
+			fields = [field for field in MACRO_FIELDS if field in self.lar_df.columns]
+			#each row's combination of field values as one integer built from the factorized codes of the fields,
+			#counted with numpy (groupby only keeps missing values with dropna=False from pandas 1.1)
+			keys = np.zeros(len(self.lar_df), dtype=np.int64)
+			for field in fields:
+				codes, uniques = pd.factorize(self.lar_df[field])
+				keys = keys * (len(uniques) + 1) + codes + 1
+			_, first_rows, counts = np.unique(keys, return_index=True, return_counts=True)
+			self.macro_stats = Counter()
+			for row, count in zip(first_rows, counts):
+				values = {field: self.lar_df[field].iat[row] for field in fields}
+				self.macro_stats[tuple(values.get(field) for field in MACRO_FIELDS)] += int(count)
+		return self.macro_stats
+
+	def macro_count(self, **values):
+		"""
+		Returns the number of loaded LAR rows matching the passed MACRO_FIELDS values, each a value or a list of values.
+		For example macro_count(action_taken="1", loan_purpose=["1", "2"]).
+		"""
+		checks = []
+		for field, allowed in values.items():
+			if field not in self.lar_df.columns:
+				raise KeyError(field)
+			checks.append((MACRO_FIELDS.index(field), [allowed] if isinstance(allowed, str) else allowed))
+		return sum(count for key, count in self.macro_counts().items() if all(key[i] in allowed for i, allowed in checks))
+
+	def check_dupes(self, fields=[]):
+		"""
+		Checks for duplicate entries in the list of fields across all rows of the LAR data.
+		The fields are compared pairwise as columns of a 2-D array, blanks are not counted as duplicates.
+		Returns a boolean Series where True indicates a row with a repeated code.
+		"""
+		values = self.lar_df[fields].to_numpy(dtype=object)
+		dupes = np.zeros(len(values), dtype=bool)
+		for i in range(len(fields)):
+			for j in range(i+1, len(fields)):
+				dupes |= (values[:,i] == values[:,j]) & (values[:,j] != "")
+		return pd.Series(dupes, index=self.lar_df.index)
 
 	def check_number(self, field, min_val=None, max_val=None):
 		"""
@@ -246,18 +819,19 @@ class rules_engine(object):
 		date1: initial date (application date)
 		date2: second date (action date)
 
-		Returns a year approximation of the time between two dates
+		Returns True if the year approximation of the time between two dates is greater than thresh
+		or if either date is not valid
 		"""
 		if self.valid_date(date1) and self.valid_date(date2):
 			date1 = datetime.strptime(date1, "%Y%m%d")
 			date2 = datetime.strptime(date2, "%Y%m%d")
 			delta_years = abs((date2 - date1).days)/365
-			if delta_years > thresh:
-				return False
+			return delta_years > thresh
 		else:
 			return True
 
 	#### Edit Rules from FIG
+	@edit_rules.register(row_type="TS")
 	def s300_1(self):
 		"""
 		1) The first row of your file must begin with a 1
@@ -267,24 +841,27 @@ class rules_engine(object):
 		fail_df = self.ts_df[self.ts_df.record_id!="1"]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit_rules.register(row_type="LAR", fields=("record_id",))
 	def s300_2(self):
 		"""
 		2) Any subsequent rows [of your file must begin with a 2
 		"""
 		field = "record_id"
 		edit_name = "s300_2"
-		fail_df = self.lar_df[self.lar_df.record_id!="2"]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="LAR")
+		fail_mask = self.field_mask("record_id", "!=", "2")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask, row_type="LAR")
 
+	@edit_rules.register(row_type="TS/LAR", fields=("lei",))
 	def s301(self):
 		"""
 		The LEI in this row does not match the reported LEI in the transmittal sheet (the first row of your file). Please update your file accordingly.
 		"""
 		field="LEI"
 		edit_name = "s301"
-		fail_df = self.lar_df[self.lar_df.lei!=self.ts_df.at[0,"lei"]]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
+		fail_mask = self.lar_df.lei!=self.ts_df.at[0,"lei"]
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask, row_type="TS")
 	
+	@edit_rules.register(row_type="TS")
 	def s302(self):
 		"""
 		The reported Calendar Year does not match the filing year indicated at the start of the filing.
@@ -298,6 +875,7 @@ class rules_engine(object):
 
 	#S303 note: this requires panel data to implement the check and is beyond the scope of this project
 
+	@edit_rules.register(row_type="TS/LAR", file_level=True)
 	def s304(self):
 		"""
 		The reported Total Number of Entries Contained in Submission does not match the total number of LARs in the HMDA file.
@@ -316,33 +894,39 @@ class rules_engine(object):
 		else:
 			pass
 
+	@edit_rules.register(row_type="LAR", fields=ALL_FIELDS, file_level=True)
 	def s305(self):
 		"""A duplicate transaction has been reported. No transaction can be an exact duplicate in a LAR file."""
 		edit_name = "s305"
 		field = "all"
 		#dupe_row = self.lar_df.iloc[0:1] #create dupe row for testing
-		fail_df = self.lar_df[self.lar_df.duplicated(keep=False)==True] #pull frame of duplicates
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		#exact duplicate rows also repeat their ULI, so only rows with a repeated ULI are compared in full
+		candidates = np.flatnonzero(self.duplicate_mask(["uli"]))
+		fail_mask = np.zeros(len(self.lar_df), dtype=bool)
+		fail_mask[candidates] = self.lar_df.iloc[candidates].duplicated(keep=False).to_numpy() #mark duplicate rows
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("uli", "action_taken"), file_level=True)
 	def s306(self):
 		"""
 		If Action Taken equals 1, a duplicate ULI cannot be reported
 		"""
 		edit_name = "s306"
 		field = "uli"
-		fail_df = self.lar_df[self.lar_df.action_taken=="1"].copy()
-		fail_df = fail_df[fail_df.duplicated(subset=["uli"], keep=False)==True]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="LAR")
+		fail_mask = self.duplicate_mask(["uli"], rows=self.field_mask("action_taken", "==", "1"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask, row_type="LAR")
 
+	@edit_rules.register(row_type="LAR", fields=("lei",))
 	def v600(self):
 		"""
 		1) The required format for LEI is alphanumeric with 20 characters, and it cannot be left blank.
 		"""
 		field = "LEI"
 		edit_name = "v600"
-		fail_df = self.lar_df[(self.lar_df.lei=="")|(self.lar_df.lei.map(lambda x: len(x))!=20)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="LAR")
+		fail_mask = (self.field_mask("lei", "==", ""))|(self.lar_df.lei.map(lambda x: len(x))!=20)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask, row_type="LAR")
 
+	@edit_rules.register(row_type="TS")
 	def v601_1(self):
 		"""
 		The following data fields are required, and cannot be left blank. A blank value(s) was provided.
@@ -353,6 +937,7 @@ class rules_engine(object):
 		fail_df = self.ts_df[self.ts_df.inst_name==""]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit_rules.register(row_type="TS")
 	def v601_2(self):
 		"""T
 		he following data fields are required, and cannot be left blank. A blank value(s) was provided.
@@ -363,6 +948,7 @@ class rules_engine(object):
 		fail_df = self.ts_df[self.ts_df.contact_name==""]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit_rules.register(row_type="TS")
 	def v601_3(self):
 		"""
 		The following data fields are required, and cannot be left blank. A blank value(s) was provided.
@@ -373,6 +959,7 @@ class rules_engine(object):
 		fail_df = self.ts_df[self.ts_df.contact_email==""]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit_rules.register(row_type="TS")
 	def v601_4(self):
 		"""
 		The following data fields are required, and cannot be left blank. A blank value(s) was provided.
@@ -383,6 +970,7 @@ class rules_engine(object):
 		fail_df = self.ts_df[self.ts_df.contact_street_address==""]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit_rules.register(row_type="TS")
 	def v601_5(self):
 		"""
 		The following data fields are required, and cannot be left blank. A blank value(s) was provided.
@@ -393,6 +981,7 @@ class rules_engine(object):
 		fail_df = self.ts_df[self.ts_df.office_city==""]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit_rules.register(row_type="TS")
 	def v602(self):
 		"""
 		An invalid Calendar Quarter was reported. 1) Calendar Quarter must equal 4, and cannot be left blank.
@@ -404,6 +993,7 @@ class rules_engine(object):
 		fail_df = fail_df[(fail_df.calendar_quarter!=4)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit_rules.register(row_type="TS")
 	def v603(self):
 		"""
 		An invalid Contact Person's Telephone Number was provided.
@@ -415,6 +1005,7 @@ class rules_engine(object):
 							 (self.ts_df.contact_tel.map(lambda x: x.replace("-","").isdigit())==False)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit_rules.register(row_type="TS")
 	def v604(self):
 		"""
 		An invalid Contact Person's Office State was provided. Please review the information below and update your file accordingly.
@@ -426,6 +1017,7 @@ class rules_engine(object):
 		fail_df = self.ts_df[~(self.ts_df.office_state.isin(self.state_codes.keys()))]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit_rules.register(row_type="TS")
 	def v605(self):
 		"""
 		An invalid Contact Person's ZIP Code was provided. Please review the information below and update your file accordingly.
@@ -436,6 +1028,7 @@ class rules_engine(object):
 		fail_df = self.ts_df[~(self.ts_df.office_zip.map(lambda x: len(x) in (5,10)))|(self.ts_df.office_zip.map(lambda x: x.replace("-","").isdigit())==False)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit_rules.register(row_type="TS")
 	def v606(self):
 		"""
 		The reported Total Number of Entries Contained in Submission is not in the valid format.
@@ -447,6 +1040,7 @@ class rules_engine(object):
 		fail_df = self.ts_df[(self.ts_df.lar_entries.map(lambda x: self.check_number(x, min_val=0))==False)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit_rules.register(row_type="TS")
 	def v607(self):
 		"""
 		An invalid Federal Taxpayer Identification Number was provided.
@@ -487,6 +1081,7 @@ class rules_engine(object):
 	#	fail_df = fail_df[(fail_df.uli=="")|(fail_df.uli.apply(lambda x: len(x)>22))]
 	#	self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
 
+	@edit_rules.register(row_type="LAR", fields=("lei", "uli"))
 	def v609(self):
 		"""
 		An invalid ULI was reported. Please review the information below and update your file accordingly.
@@ -498,14 +1093,15 @@ class rules_engine(object):
 		"""
 		edit_name = "v609"
 		field = "ULI"
-		check_digit = utils.check_digit_gen #establish check digit function alias
-
 		#limit check digit checking to records with a ULI
-		fail_df = self.lar_df[self.lar_df.uli.apply(lambda x: x[:20]==self.lar_df.lei.iloc[0])]
-		#get dataframe of check digit failures
-		fail_df = fail_df[fail_df.uli.map(lambda x: str(x)[-2:]) != fail_df.uli.map(lambda x: check_digit(ULI=str(x)[:-2]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
-
+		lei = self.file_lei if self.file_lei is not None else self.lar_df.lei.iloc[0]
+		fail_mask = (self.lar_df.uli.str[:20]==lei).to_numpy()
+		#mark check digit failures
+		ulis = self.lar_df.uli[fail_mask]
+		fail_mask[fail_mask] = ulis.str[-2:] != utils.check_digit_batch(ulis.str[:-2])
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
+
+	@edit_rules.register(row_type="LAR", fields=("app_date",))
 	def v610_1(self):
 		"""
 		An invalid date field was reported.
@@ -513,9 +1109,10 @@ class rules_engine(object):
 		"""
 		edit_name = "v610_1"
 		field = "app_date"
-		fail_df = self.lar_df[(self.lar_df.app_date!="NA")&(self.lar_df.app_date.map(lambda x: self.valid_date(x))==False)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("app_date", "!=", "NA"))&(self.parsed_dates("app_date").isna())
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_date", "action_taken"))
 	def v610_2(self):
 		"""
 		An invalid date field was reported.
@@ -523,10 +1120,11 @@ class rules_engine(object):
 		"""
 		edit_name = "v610_2"
 		field = "app_date"
-		fail_df = self.lar_df[((self.lar_df.app_date=="NA")&(self.lar_df.action_taken!="6"))|
-				((self.lar_df.action_taken=="6")&(self.lar_df.app_date!="NA"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("app_date", "==", "NA"))&(self.field_mask("action_taken", "!=", "6")))|
+				((self.field_mask("action_taken", "==", "6"))&(self.field_mask("app_date", "!=", "NA"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_type",))
 	def v611(self):
 		"""
 		An invalid Loan Type was reported.
@@ -534,10 +1132,11 @@ class rules_engine(object):
 		"""
 		edit_name = "v611"
 		field = "loan_type"
-		fail_df = self.lar_df[~(self.lar_df.loan_type.isin(("1", "2", "3", "4")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("loan_type", "isin", ("1", "2", "3", "4")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
 
+	@edit_rules.register(row_type="LAR", fields=("loan_purpose",))
 	def v612_1(self):
 		"""
 		An invalid Loan Purpose was reported.
@@ -545,9 +1144,10 @@ class rules_engine(object):
 		"""
 		edit_name = "v612_1"
 		field = "loan_purpose"
-		fail_df = self.lar_df[~self.lar_df.loan_purpose.isin(("1", "2", "31", "32", "4", "5"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~self.field_mask("loan_purpose", "isin", ("1", "2", "31", "32", "4", "5"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_purpose", "preapproval"))
 	def v612_2(self):
 		"""
 		An invalid Loan Purpose was reported.
@@ -555,9 +1155,10 @@ class rules_engine(object):
 		"""
 		field = "loan_purpose"
 		edit_name = "v612_2"
-		fail_df = self.lar_df[((self.lar_df.preapproval=="1")&(self.lar_df.loan_purpose!="1"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("preapproval", "==", "1"))&(self.field_mask("loan_purpose", "!=", "1"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("preapproval",))
 	def v613_1(self):
 		"""
 		An invalid Preapproval data field was provided.
@@ -565,9 +1166,10 @@ class rules_engine(object):
 		"""
 		edit_name = "v613_1"
 		field = "preapproval"
-		fail_df = self.lar_df[~(self.lar_df.preapproval.isin(("1", "2")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("preapproval", "isin", ("1", "2")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("preapproval", "action_taken"))
 	def v613_2(self):
 		"""
 		An invalid Preapproval data field was provided.
@@ -575,9 +1177,10 @@ class rules_engine(object):
 		"""
 		field = "preapproval"
 		edit_name = "v613_2"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("7", "8")))&(self.lar_df.preapproval!="1")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_taken", "isin", ("7", "8")))&(self.field_mask("preapproval", "!=", "1"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("preapproval", "action_taken"))
 	def v613_3(self):
 		"""
 		An invalid Preapproval data field was provided.
@@ -585,9 +1188,10 @@ class rules_engine(object):
 		"""
 		field = "preapproval"
 		edit_name = "v613_3"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("3", "4", "5", "6")))&(self.lar_df.preapproval!="2")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_taken", "isin", ("3", "4", "5", "6")))&(self.field_mask("preapproval", "!=", "2"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("preapproval", "action_taken"))
 	def v613_4(self):
 		"""
 		An invalid Preapproval data field was provided.
@@ -595,9 +1199,10 @@ class rules_engine(object):
 		"""
 		field = "preapproval"
 		edit_name = "v613_4"
-		fail_df = self.lar_df[(self.lar_df.preapproval=="1")&(~(self.lar_df.action_taken.isin(("1","2","7","8"))))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("preapproval", "==", "1"))&(~(self.field_mask("action_taken", "isin", ("1","2","7","8"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_purpose", "preapproval"))
 	def v614_1(self):
 		"""
 		An invalid Preapproval was provided.
@@ -605,9 +1210,10 @@ class rules_engine(object):
 		"""
 		field = "preapproval"
 		edit_name = "v614_1"
-		fail_df = self.lar_df[(self.lar_df.loan_purpose.isin(("2", "4", "31", "32", "5")))&(self.lar_df.preapproval!="2")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("loan_purpose", "isin", ("2", "4", "31", "32", "5")))&(self.field_mask("preapproval", "!=", "2"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 	
+	@edit_rules.register(row_type="LAR", fields=("preapproval", "affordable_units"))
 	def v614_2(self):
 		"""
 		An invalid Preapproval was provided.
@@ -615,9 +1221,10 @@ class rules_engine(object):
 		"""
 		field = "preapproval"
 		edit_name = "v614_2"
-		fail_df = self.lar_df[(self.lar_df.affordable_units.map(lambda x: x.isdigit())==True)&(self.lar_df.preapproval!="2")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.field_view("digits", "affordable_units")&(self.field_mask("preapproval", "!=", "2"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 	
+	@edit_rules.register(row_type="LAR", fields=("preapproval", "reverse_mortgage"))
 	def v614_3(self):
 		"""
 		An invalid Preapproval was provided.
@@ -625,9 +1232,10 @@ class rules_engine(object):
 		"""
 		field = "preapproval"
 		edit_name = "v614_3"
-		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&(self.lar_df.preapproval!="2")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("reverse_mortgage", "==", "1"))&(self.field_mask("preapproval", "!=", "2"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 	
+	@edit_rules.register(row_type="LAR", fields=("preapproval", "open_end_credit"))
 	def v614_4(self):
 		"""
 		An invalid Preapproval was provided.
@@ -635,9 +1243,10 @@ class rules_engine(object):
 		"""
 		field = "preapproval"
 		edit_name = "v614_4"
-		fail_df = self.lar_df[(self.lar_df.open_end_credit=="1")&(self.lar_df.preapproval!="2")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("open_end_credit", "==", "1"))&(self.field_mask("preapproval", "!=", "2"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("const_method",))
 	def v615_1(self):
 		"""
 		An invalid Construction Method was reported.
@@ -645,9 +1254,10 @@ class rules_engine(object):
 		"""
 		field = "const_method"
 		edit_name = "v615_1"
-		fail_df = self.lar_df[~self.lar_df.const_method.isin(("1","2"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~self.field_mask("const_method", "isin", ("1","2"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("const_method", "manufactured_interest"))
 	def v615_2(self):
 		"""
 		An invalid Construction Method was reported.
@@ -655,10 +1265,11 @@ class rules_engine(object):
 		"""
 		field = "const_method"
 		edit_name = "v615_2"
-		fail_df = self.lar_df[(self.lar_df.manufactured_interest.isin(("1", "2", "3", "4")))&
-							  (self.lar_df.const_method!="2")].copy()
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("manufactured_interest", "isin", ("1", "2", "3", "4")))&
+							  (self.field_mask("const_method", "!=", "2")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("const_method", "manufactured_type"))
 	def v615_3(self):
 		"""
 		An invalid Construction Method was reported.
@@ -666,9 +1277,10 @@ class rules_engine(object):
 		"""
 		field = "const_method"
 		edit_name = "v615_3"
-		fail_df = self.lar_df[(self.lar_df.manufactured_type.isin(("1","2")))&(self.lar_df.const_method!="2")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("manufactured_type", "isin", ("1","2")))&(self.field_mask("const_method", "!=", "2"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("occ_type",))
 	def v616(self):
 		"""
 		An invalid Occupancy Type was reported.
@@ -676,9 +1288,10 @@ class rules_engine(object):
 		"""
 		field = "occupancy"
 		edit_name = "v616"
-		fail_df = self.lar_df[~(self.lar_df.occ_type.isin(("1","2","3")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("occ_type", "isin", ("1","2","3")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_amount",))
 	def v617(self):
 		"""
 		An invalid Loan Amount was reported.
@@ -686,12 +1299,10 @@ class rules_engine(object):
 		"""
 		field = "loan_amount"
 		edit_name = "v617"
-		fail_df = self.lar_df.copy()
-		fail_df["amount"] = fail_df.loan_amount
-		fail_df.amount = fail_df.amount.map(lambda x: 0 if x == "" else x)
-		fail_df = fail_df[(fail_df.amount.map(lambda x: float(x))<=0)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.lar_df.loan_amount.map(lambda x: float(0 if x == "" else x)<=0)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken",))
 	def v618(self):
 		"""
 		An invalid Action Taken was reported.
@@ -699,9 +1310,10 @@ class rules_engine(object):
 		"""
 		field = "action_taken"
 		edit_name = "v618"
-		fail_df = self.lar_df[~(self.lar_df.action_taken.isin(("1","2","3","4","5","6","7","8")))|(self.lar_df.action_taken=="")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("action_taken", "isin", ("1","2","3","4","5","6","7","8")))|(self.field_mask("action_taken", "==", ""))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_date",))
 	def v619_1(self):
 		"""
 		An invalid Action Taken Date was reported.
@@ -709,9 +1321,10 @@ class rules_engine(object):
 		"""
 		field = "action_date"
 		edit_name = "v619_1"
-		fail_df = self.lar_df[(self.lar_df.action_date=="")|(self.lar_df.action_date.map(lambda x: self.valid_date(x))==False)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_date", "==", ""))|(self.parsed_dates("action_date").isna())
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_date",))
 	def v619_2(self):
 		"""
 		An invalid Action Taken Date was reported.
@@ -719,9 +1332,10 @@ class rules_engine(object):
 		"""
 		field = "action_date"
 		edit_name = "v619_2"
-		fail_df = self.lar_df[(self.lar_df.action_date.map(lambda x: str(x)[:4])!=str(self.config_data["activity_year"]["value"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.lar_df.action_date.astype(str).str[:4]!=str(self.config_data["activity_year"]["value"])
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_date", "action_date"))
 	def v619_3(self):
 		"""
 		An invalid Action Taken Date was reported.
@@ -729,9 +1343,10 @@ class rules_engine(object):
 		"""
 		field = "action_date"
 		edit_name = "v619_3"
-		fail_df = self.lar_df[(self.lar_df.action_date < self.lar_df.app_date)&(self.lar_df.app_date!="NA")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.parsed_dates("action_date") < self.parsed_dates("app_date"))&(self.field_mask("app_date", "!=", "NA"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("street_address",))
 	def v620(self):
 		"""
 		An invalid Street Address was provided.
@@ -739,9 +1354,10 @@ class rules_engine(object):
 		"""
 		field = "street_address"
 		edit_name = "v620"
-		fail_df = self.lar_df[(self.lar_df.street_address=="")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.field_mask("street_address", "==", "")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("city",))
 	def v621(self):
 		"""
 		An invalid City was provided.
@@ -749,9 +1365,10 @@ class rules_engine(object):
 		"""
 		field = "city"
 		edit_name = "v621"
-		fail_df = self.lar_df[(self.lar_df.city=="")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.field_mask("city", "==", "")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("street_address", "city"))
 	def v622_1(self):
 		"""
 		An invalid City, State and/or Zip Code were provided.
@@ -759,9 +1376,10 @@ class rules_engine(object):
 		"""
 		field = "city"
 		edit_name = "v622_1"
-		fail_df = self.lar_df[~(self.lar_df.street_address.isin(["NA", "Exempt"]))&(self.lar_df.city=="NA")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("street_address", "isin", ["NA", "Exempt"]))&(self.field_mask("city", "==", "NA"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("street_address", "state"))
 	def v622_2(self):
 		"""
 		An invalid City, State and/or Zip Code were provided.
@@ -769,9 +1387,10 @@ class rules_engine(object):
 		"""
 		field = "state"
 		edit_name = "v622_2"
-		fail_df = self.lar_df[~(self.lar_df.street_address.isin(["NA", "Exempt"]))&(self.lar_df.state=="NA")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("street_address", "isin", ["NA", "Exempt"]))&(self.field_mask("state", "==", "NA"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("street_address", "zip_code"))
 	def v622_3(self):
 		"""
 		An invalid City, State and/or Zip Code were provided.
@@ -779,17 +1398,19 @@ class rules_engine(object):
 		"""
 		field = "zip_code"
 		edit_name = "v622_3"
-		fail_df = self.lar_df[~(self.lar_df.street_address.isin(["NA", "Exempt"]))&(self.lar_df.zip_code=="NA")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("street_address", "isin", ["NA", "Exempt"]))&(self.field_mask("zip_code", "==", "NA"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("state",))
 	def v623(self):
 		"""An invalid State was provided.
 		1) State must be either a two letter state code or NA, and cannot be left blank."""
 		field = "state"
 		edit_name = "v623"
-		fail_df = self.lar_df[~(self.lar_df.state.isin(self.state_codes))|(self.lar_df.state=="NA")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.lar_df.state.isin(self.state_codes))|(self.field_mask("state", "==", "NA"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("zip_code",))
 	def v624(self):
 		"""
 		An invalid Zip Code was provided.
@@ -798,11 +1419,12 @@ class rules_engine(object):
 		"""
 		field = "zip_code"
 		edit_name = "v624"
-		fail_df = self.lar_df[((self.lar_df.zip_code.map(lambda x: len(x) 
+		fail_mask = (((self.lar_df.zip_code.map(lambda x: len(x) 
 			not in (10, 5)))|(self.lar_df.zip_code.map(lambda x: x.replace("-","").isdigit())==False)).copy()
-		&(~self.lar_df.zip_code.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		&(~self.field_mask("zip_code", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("tract",))
 	def v625_1(self):
 		"""
 		An invalid Census Tract was provided.
@@ -810,9 +1432,10 @@ class rules_engine(object):
 		"""
 		field = "tract"
 		edit_name = "v625_1"
-		fail_df = self.lar_df[(self.lar_df.tract!="NA")&((self.lar_df.tract.map(lambda x: len(x)!=11))|(self.lar_df.tract.map(lambda x: x.isdigit())==False))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("tract", "!=", "NA"))&((self.lar_df.tract.map(lambda x: len(x)!=11))|(~self.field_view("digits", "tract")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("tract",))
 	def v625_2(self):
 		"""
 		An invalid Census Tract was provided.
@@ -820,10 +1443,11 @@ class rules_engine(object):
 		"""
 		field = "tract"
 		edit_name = "v625_2"
-		fail_df = self.lar_df[(self.lar_df.tract!="NA")&(~self.lar_df.tract.isin(self.geographic_data["tract_fips"]))].copy()
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("tract", "!=", "NA"))&(~self.lar_df.tract.isin(self.geo.tracts))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
 
+	@edit_rules.register(row_type="LAR", fields=("county",))
 	def v626(self):
 		"""
 		v626 An invalid County was provided.
@@ -831,9 +1455,10 @@ class rules_engine(object):
 		"""
 		field = "county"
 		edit_name = "v626"
-		fail_df = self.lar_df[(self.lar_df.county!="NA")&((self.lar_df.county.map(lambda x: len(x))!=5)|(self.lar_df.county.map(lambda x: x.isdigit())==False))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("county", "!=", "NA"))&((self.lar_df.county.map(lambda x: len(x))!=5)|(~self.field_view("digits", "county")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("county", "tract"))
 	def v627(self):
 		"""
 		An invalid Census Tract or County was provided.
@@ -842,9 +1467,10 @@ class rules_engine(object):
 		"""
 		field = "tract/county"
 		edit_name = "v627"
-		fail_df = self.lar_df[((self.lar_df.county!="NA")&(self.lar_df.tract!="NA"))&(self.lar_df.tract.map(lambda x: str(x)[:5])!=self.lar_df.county)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("county", "!=", "NA"))&(self.field_mask("tract", "!=", "NA")))&(self.lar_df.tract.map(lambda x: str(x)[:5])!=self.lar_df.county)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_eth_1", "app_eth_free"))
 	def v628_1(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -853,9 +1479,10 @@ class rules_engine(object):
 		"""
 		field = "app_eth_1"
 		edit_name = "v628_1"
-		fail_df = self.lar_df[~(self.lar_df.app_eth_1.isin(("1","11", "12", "13", "14", "2", "3","4")))|((self.lar_df.app_eth_free=="")&(self.lar_df.app_eth_1==""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("app_eth_1", "isin", ("1","11", "12", "13", "14", "2", "3","4")))|((self.field_mask("app_eth_free", "==", ""))&(self.field_mask("app_eth_1", "==", "")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_eth_2", "app_eth_3", "app_eth_4", "app_eth_5"))
 	def v628_2(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -863,12 +1490,13 @@ class rules_engine(object):
 		"""
 		field = "app ethnicities 2-4"
 		edit_name = "v628_2"
-		fail_df = self.lar_df[~(self.lar_df.app_eth_2.isin(("1","11", "12", "13", "14", "2","")))|
-							  ~(self.lar_df.app_eth_3.isin(("1","11", "12", "13", "14", "2","")))|
-							  ~(self.lar_df.app_eth_4.isin(("1","11", "12", "13", "14", "2","")))|
-							  ~(self.lar_df.app_eth_5.isin(("1","11", "12", "13", "14", "2","")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~(self.field_mask("app_eth_2", "isin", ("1","11", "12", "13", "14", "2","")))|
+							  ~(self.field_mask("app_eth_3", "isin", ("1","11", "12", "13", "14", "2","")))|
+							  ~(self.field_mask("app_eth_4", "isin", ("1","11", "12", "13", "14", "2","")))|
+							  ~(self.field_mask("app_eth_5", "isin", ("1","11", "12", "13", "14", "2",""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 	
+	@edit_rules.register(row_type="LAR", fields=("app_eth_1", "app_eth_2", "app_eth_3", "app_eth_4", "app_eth_5"))
 	def v628_3(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -877,9 +1505,10 @@ class rules_engine(object):
 		field = "applicant ethnicities"
 		edit_name = "v628_3"
 		dupe_fields = ["app_eth_1", "app_eth_2", "app_eth_3", "app_eth_4", "app_eth_5"]
-		fail_df = self.lar_df[(self.lar_df.apply(lambda x: self.check_dupes(x, fields=dupe_fields), axis=1)=="fail")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.check_dupes(fields=dupe_fields)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_eth_1", "app_eth_2", "app_eth_3", "app_eth_4", "app_eth_5"))
 	def v628_4(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -888,9 +1517,10 @@ class rules_engine(object):
 		"""
 		field = "applicant ethnicities"
 		edit_name = "v628_4"
-		fail_df = self.lar_df[(self.lar_df.app_eth_1.isin(("3","4")))&((self.lar_df.app_eth_2!="")|(self.lar_df.app_eth_3!="")|(self.lar_df.app_eth_4!="")|(self.lar_df.app_eth_5!=""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("app_eth_1", "isin", ("3","4")))&((self.field_mask("app_eth_2", "!=", ""))|(self.field_mask("app_eth_3", "!=", ""))|(self.field_mask("app_eth_4", "!=", ""))|(self.field_mask("app_eth_5", "!=", "")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_eth_basis",))
 	def v629_1(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -898,9 +1528,10 @@ class rules_engine(object):
 		"""
 		field = "app ethnicity basis"
 		edit_name = "v629_1"
-		fail_df = self.lar_df[~(self.lar_df.app_eth_basis.isin(("1", "2", "3")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("app_eth_basis", "isin", ("1", "2", "3")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_eth_1", "app_eth_2", "app_eth_3", "app_eth_4", "app_eth_5", "app_eth_basis"))
 	def v629_2(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -910,10 +1541,11 @@ class rules_engine(object):
 		"""
 		field = "app ethnicity basis"
 		edit_name = "v629_2"
-		fail_df = self.lar_df[(self.lar_df.app_eth_basis=="1")&(~(self.lar_df.app_eth_1.isin(("1","2")))|(~self.lar_df.app_eth_2.isin(("1", "2", "")))|
-			(self.lar_df.app_eth_3!="")|(self.lar_df.app_eth_4!="")|(self.lar_df.app_eth_5!=""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("app_eth_basis", "==", "1"))&(~(self.field_mask("app_eth_1", "isin", ("1","2")))|(~self.field_mask("app_eth_2", "isin", ("1", "2", "")))|
+			(self.field_mask("app_eth_3", "!=", ""))|(self.field_mask("app_eth_4", "!=", ""))|(self.field_mask("app_eth_5", "!=", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_eth_1", "app_eth_basis"))
 	def v629_3(self):
 		"""
 		An invalid Ethnicity data field was reported. 
@@ -922,9 +1554,10 @@ class rules_engine(object):
         """
 		field = "app ethnicity basis"
 		edit_name = "v629_3"
-		fail_df = self.lar_df[(self.lar_df.app_eth_basis=="2")&(~self.lar_df.app_eth_1.isin(("1", "11", "12", "13", "14", "2", "3")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("app_eth_basis", "==", "2"))&(~self.field_mask("app_eth_1", "isin", ("1", "11", "12", "13", "14", "2", "3")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_eth_1", "app_eth_basis"))
 	def v630(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -933,9 +1566,10 @@ class rules_engine(object):
 		"""
 		field = "app ethnicity basis"
 		edit_name = "v630"
-		fail_df = self.lar_df[(self.lar_df.app_eth_basis!="3")&(self.lar_df.app_eth_1=="4")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("app_eth_basis", "!=", "3"))&(self.field_mask("app_eth_1", "==", "4"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_eth_1", "co_app_eth_free"))
 	def v631_1(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -946,9 +1580,10 @@ class rules_engine(object):
 		"""
 		field = "co-app ethnicities"
 		edit_name = "v631_1"
-		fail_df = self.lar_df[(self.lar_df.co_app_eth_free=="")&(~self.lar_df.co_app_eth_1.isin(("1","11","12","13", "14", "2", "3", "4", "5")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("co_app_eth_free", "==", ""))&(~self.field_mask("co_app_eth_1", "isin", ("1","11","12","13", "14", "2", "3", "4", "5")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_eth_2", "co_app_eth_3", "co_app_eth_4", "co_app_eth_5"))
 	def v631_2(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -957,10 +1592,11 @@ class rules_engine(object):
 		"""
 		field = "co-app ethnicities"
 		edit_name = "v631_2"
-		fail_df = self.lar_df[(~self.lar_df.co_app_eth_2.isin(("1", "11", "12", "13", "14", "2", "")))|(~self.lar_df.co_app_eth_3.isin(("1", "11", "12", "13", "14", "2", "")))|
-			(~self.lar_df.co_app_eth_4.isin(("1", "11", "12", "13", "14", "2", "")))|(~self.lar_df.co_app_eth_5.isin(("1", "11", "12", "13", "14", "2", "")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((~self.field_mask("co_app_eth_2", "isin", ("1", "11", "12", "13", "14", "2", "")))|(~self.field_mask("co_app_eth_3", "isin", ("1", "11", "12", "13", "14", "2", "")))|
+			(~self.field_mask("co_app_eth_4", "isin", ("1", "11", "12", "13", "14", "2", "")))|(~self.field_mask("co_app_eth_5", "isin", ("1", "11", "12", "13", "14", "2", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_eth_1", "co_app_eth_2", "co_app_eth_3", "co_app_eth_4", "co_app_eth_5"))
 	def v631_3(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -969,9 +1605,10 @@ class rules_engine(object):
 		field = "Co-App Ethnicities"
 		edit_name = "v631_3"
 		dupe_fields = ["co_app_eth_1", "co_app_eth_2", "co_app_eth_3", "co_app_eth_4", "co_app_eth_5"]
-		fail_df = self.lar_df[(self.lar_df.apply(lambda x: self.check_dupes(x, fields=dupe_fields), axis=1)=="fail")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.check_dupes(fields=dupe_fields)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_eth_1", "co_app_eth_2", "co_app_eth_3", "co_app_eth_4", "co_app_eth_5"))
 	def v631_4(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -981,11 +1618,11 @@ class rules_engine(object):
 		"""
 		field = "Co-App Ethnicities"
 		edit_name = "v631_4"
-		fail_df = self.lar_df[(self.lar_df.co_app_eth_1.isin(("3", "4", "5")))].copy()
-		fail_df = fail_df[((fail_df.co_app_eth_2!="")|(fail_df.co_app_eth_3!="")|
-			(fail_df.co_app_eth_4!="")|(fail_df.co_app_eth_5!=""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("co_app_eth_1", "isin", ("3", "4", "5")))&((self.field_mask("co_app_eth_2", "!=", ""))|(self.field_mask("co_app_eth_3", "!=", ""))|
+			(self.field_mask("co_app_eth_4", "!=", ""))|(self.field_mask("co_app_eth_5", "!=", "")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_eth_basis",))
 	def v632_1(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -993,9 +1630,10 @@ class rules_engine(object):
 		"""
 		field = "Co-App Ethnicity Basis"
 		edit_name = "v632_1"
-		fail_df = self.lar_df[~(self.lar_df.co_app_eth_basis.isin(("1", "2", "3", "4")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("co_app_eth_basis", "isin", ("1", "2", "3", "4")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_eth_1", "co_app_eth_2", "co_app_eth_3", "co_app_eth_4", "co_app_eth_5", "co_app_eth_basis"))
 	def v632_2(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -1005,10 +1643,11 @@ class rules_engine(object):
 		"""
 		field = "Co-App Ethnicity Basis"
 		edit_name = "v632_2"
-		fail_df = self.lar_df[(self.lar_df.co_app_eth_basis=="1")&(~(self.lar_df.co_app_eth_1.isin(("1", "2")))|(~self.lar_df.co_app_eth_2.isin(("1", "2")))|
-			(self.lar_df.co_app_eth_3!="")|(self.lar_df.co_app_eth_4!="")|(self.lar_df.co_app_eth_5!=""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("co_app_eth_basis", "==", "1"))&(~(self.field_mask("co_app_eth_1", "isin", ("1", "2")))|(~self.field_mask("co_app_eth_2", "isin", ("1", "2")))|
+			(self.field_mask("co_app_eth_3", "!=", ""))|(self.field_mask("co_app_eth_4", "!=", ""))|(self.field_mask("co_app_eth_5", "!=", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_eth_1", "co_app_eth_basis"))
 	def v632_3(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -1017,9 +1656,10 @@ class rules_engine(object):
 		"""
 		field = "Co-App Ethnicity Basis"
 		edit_name = "v632_3"
-		fail_df = self.lar_df[(self.lar_df.co_app_eth_basis=="2")&(~self.lar_df.co_app_eth_1.isin(("1", "11", "12", "13", "14", "2", "3")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("co_app_eth_basis", "==", "2"))&(~self.field_mask("co_app_eth_1", "isin", ("1", "11", "12", "13", "14", "2", "3")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_eth_1", "co_app_eth_basis"))
 	def v633(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -1028,9 +1668,10 @@ class rules_engine(object):
 		"""
 		field = "Co-App Ethnicity basis"
 		edit_name = "v633"
-		fail_df = self.lar_df[(self.lar_df.co_app_eth_1=="4")&(self.lar_df.co_app_eth_basis!="3")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("co_app_eth_1", "==", "4"))&(self.field_mask("co_app_eth_basis", "!=", "3"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_eth_1", "co_app_eth_basis"))
 	def v634(self):
 		"""
 		An invalid Ethnicity data field was reported.
@@ -1039,10 +1680,11 @@ class rules_engine(object):
 		"""
 		field = "Co-App Ethnicity Basis"
 		edit_name = "v634"
-		fail_df = self.lar_df[((self.lar_df.co_app_eth_1=="5")&(self.lar_df.co_app_eth_basis!="4"))|
-		((self.lar_df.co_app_eth_basis=="4")&(self.lar_df.co_app_eth_1!="5"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df) 
+		fail_mask = (((self.field_mask("co_app_eth_1", "==", "5"))&(self.field_mask("co_app_eth_basis", "!=", "4")))|
+		((self.field_mask("co_app_eth_basis", "==", "4"))&(self.field_mask("co_app_eth_1", "!=", "5"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask) 
 
+	@edit_rules.register(row_type="LAR", fields=("app_race_1", "app_race_native_text", "app_race_asian_text", "app_race_islander_text"))
 	def v635_1(self):
 		"""
 		An invalid Race data field was reported.
@@ -1052,10 +1694,11 @@ class rules_engine(object):
 		"""
 		field = "App Race 1"
 		edit_name = "v635_1"
-		fail_df = self.lar_df[(~self.lar_df.app_race_1.isin(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6", "7")))|
-		((self.lar_df.app_race_1=="")&((self.lar_df.app_race_native_text=="")&(self.lar_df.app_race_islander_text=="")&(self.lar_df.app_race_asian_text=="")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((~self.field_mask("app_race_1", "isin", ("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6", "7")))|
+		((self.field_mask("app_race_1", "==", ""))&((self.field_mask("app_race_native_text", "==", ""))&(self.field_mask("app_race_islander_text", "==", ""))&(self.field_mask("app_race_asian_text", "==", "")))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_race_2", "app_race_3", "app_race_4", "app_race_5"))
 	def v635_2(self):
 		"""
 		An invalid Race data field was reported.
@@ -1064,12 +1707,13 @@ class rules_engine(object):
 		"""
 		field = "App Race 2 - 5"
 		edit_name = "v635_2"
-		fail_df = self.lar_df[~(self.lar_df.app_race_2.isin(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))|
-			~(self.lar_df.app_race_3.isin(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))|
-			~(self.lar_df.app_race_4.isin(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))|
-			~(self.lar_df.app_race_5.isin(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~(self.field_mask("app_race_2", "isin", ("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))|
+			~(self.field_mask("app_race_3", "isin", ("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))|
+			~(self.field_mask("app_race_4", "isin", ("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))|
+			~(self.field_mask("app_race_5", "isin", ("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_race_1", "app_race_2", "app_race_3", "app_race_4", "app_race_5"))
 	def v635_3(self):
 		"""
 		An invalid Race data field was reported.
@@ -1078,9 +1722,10 @@ class rules_engine(object):
 		field = "Applicant Races"
 		edit_name = "v635_3"
 		race_fields = ["app_race_1", "app_race_2", "app_race_3", "app_race_4", "app_race_5"]
-		fail_df = self.lar_df[(self.lar_df.apply(lambda x: self.check_dupes(x, fields=race_fields), axis=1)=="fail")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.check_dupes(fields=race_fields)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_race_1", "app_race_2", "app_race_3", "app_race_4", "app_race_5"))
 	def v635_4(self):
 		"""
 		An invalid Race data field was reported.
@@ -1089,10 +1734,11 @@ class rules_engine(object):
 		"""
 		field = "Applicant Races"
 		edit_name = "v635_4"
-		fail_df = self.lar_df[(self.lar_df.app_race_1.isin(("6", "7")))&((self.lar_df.app_race_2!="")|(self.lar_df.app_race_3!="")|(self.lar_df.app_race_4!="")
-			|(self.lar_df.app_race_5!=""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("app_race_1", "isin", ("6", "7")))&((self.field_mask("app_race_2", "!=", ""))|(self.field_mask("app_race_3", "!=", ""))|(self.field_mask("app_race_4", "!=", ""))
+			|(self.field_mask("app_race_5", "!=", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_race_basis",))
 	def v636_1(self):
 		"""
 		An invalid Race data field was reported.
@@ -1100,9 +1746,10 @@ class rules_engine(object):
 		"""
 		field = "Applicant Race Basis"
 		edit_name = "v636_1"
-		fail_df = self.lar_df[~(self.lar_df.app_race_basis.isin(("1", "2", "3")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("app_race_basis", "isin", ("1", "2", "3")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_race_1", "app_race_2", "app_race_3", "app_race_4", "app_race_5", "app_race_basis"))
 	def v636_2(self):
 		"""
 		An invalid Race data field was reported.
@@ -1112,11 +1759,12 @@ class rules_engine(object):
 		"""
 		field = "Applicant Race Basis"
 		edit_name = "v636_2"
-		fail_df = self.lar_df[(self.lar_df.app_race_basis=="1")&((~self.lar_df.app_race_1.isin(("1", "2", "3", "4", "5")))|
-			(~self.lar_df.app_race_2.isin(("1", "2", "3", "4", "5","")))|(~self.lar_df.app_race_3.isin(("1", "2", "3", "4", "5","")))|
-			(~self.lar_df.app_race_4.isin(("1", "2", "3", "4", "5","")))|(~self.lar_df.app_race_5.isin(("1", "2", "3", "4", "5",""))))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("app_race_basis", "==", "1"))&((~self.field_mask("app_race_1", "isin", ("1", "2", "3", "4", "5")))|
+			(~self.field_mask("app_race_2", "isin", ("1", "2", "3", "4", "5","")))|(~self.field_mask("app_race_3", "isin", ("1", "2", "3", "4", "5","")))|
+			(~self.field_mask("app_race_4", "isin", ("1", "2", "3", "4", "5","")))|(~self.field_mask("app_race_5", "isin", ("1", "2", "3", "4", "5","")))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_race_1", "app_race_2", "app_race_3", "app_race_4", "app_race_basis"))
 	def v636_3(self):
 		"""
 		An invalid Race data field was reported.
@@ -1130,11 +1778,12 @@ class rules_engine(object):
 		app_1_races = ["1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6"]
 		app_n_races = app_1_races[:-1]
 		app_n_races.append("")
-		fail_df = self.lar_df[(self.lar_df.app_race_basis=="2")&((~self.lar_df.app_race_1.isin(app_1_races))|
-			(~self.lar_df.app_race_2.isin(app_n_races))|(~self.lar_df.app_race_3.isin(app_n_races))|
-			(~self.lar_df.app_race_4.isin(app_n_races))|(~self.lar_df.app_race_4.isin(app_n_races)))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("app_race_basis", "==", "2"))&((~self.field_mask("app_race_1", "isin", app_1_races))|
+			(~self.field_mask("app_race_2", "isin", app_n_races))|(~self.field_mask("app_race_3", "isin", app_n_races))|
+			(~self.field_mask("app_race_4", "isin", app_n_races))|(~self.field_mask("app_race_4", "isin", app_n_races))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_race_1", "app_race_basis"))
 	def v637(self):
 		"""
 		An invalid Race data field was reported.
@@ -1143,9 +1792,10 @@ class rules_engine(object):
 		"""
 		field = "Applicant Race Basis"
 		edit_name = "v637"
-		fail_df = self.lar_df[(self.lar_df.app_race_1=="7")&(self.lar_df.app_race_basis!="3")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("app_race_1", "==", "7"))&(self.field_mask("app_race_basis", "!=", "3"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_race_1", "co_app_race_native_text", "co_app_race_asian_text", "co_app_race_islander_text"))
 	def v638_1(self):
 		"""
 		An invalid Race data field was reported.
@@ -1156,11 +1806,12 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Race 1"
 		edit_name = "v638_1"
-		fail_df = self.lar_df[(~self.lar_df.co_app_race_1.isin(("1", "2", "21", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6", "7", "8")))&
-			((self.lar_df.co_app_race_1=="")&((self.lar_df.co_app_race_native_text=="")&(self.lar_df.co_app_race_islander_text=="")&
-			(self.lar_df.co_app_race_asian_text=="")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((~self.field_mask("co_app_race_1", "isin", ("1", "2", "21", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6", "7", "8")))&
+			((self.field_mask("co_app_race_1", "==", ""))&((self.field_mask("co_app_race_native_text", "==", ""))&(self.field_mask("co_app_race_islander_text", "==", ""))&
+			(self.field_mask("co_app_race_asian_text", "==", "")))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_race_2", "co_app_race_3", "co_app_race_4", "co_app_race_5"))
 	def v638_2(self):
 		"""
 		An invalid Race data field was reported.
@@ -1170,12 +1821,13 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Race 2-5"
 		edit_name = "v638_2"
-		fail_df = self.lar_df[~(self.lar_df.co_app_race_2.isin(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))|
-			~(self.lar_df.co_app_race_3.isin(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))|
-			~(self.lar_df.co_app_race_4.isin(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))|
-			~(self.lar_df.co_app_race_5.isin(("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~(self.field_mask("co_app_race_2", "isin", ("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))|
+			~(self.field_mask("co_app_race_3", "isin", ("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))|
+			~(self.field_mask("co_app_race_4", "isin", ("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "")))|
+			~(self.field_mask("co_app_race_5", "isin", ("1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_race_1", "co_app_race_2", "co_app_race_3", "co_app_race_4", "co_app_race_5"))
 	def v638_3(self):
 		"""
 		An invalid Race data field was reported.
@@ -1184,9 +1836,10 @@ class rules_engine(object):
 		field = "Co-Applicant Races"
 		edit_name = "v638_3"
 		race_fields = ["co_app_race_1", "co_app_race_2", "co_app_race_3", "co_app_race_4", "co_app_race_5"]
-		fail_df = self.lar_df[(self.lar_df.apply(lambda x: self.check_dupes(x, fields=race_fields), axis=1)=="fail")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.check_dupes(fields=race_fields)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_race_1", "co_app_race_2", "co_app_race_3", "co_app_race_4", "co_app_race_5"))
 	def v638_4(self):
 		"""
 		An invalid Race data field was reported.
@@ -1195,10 +1848,11 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Races"
 		edit_name = "v638_4"
-		fail_df = self.lar_df[(self.lar_df.co_app_race_1.isin(("6", "7", "8")))&((self.lar_df.co_app_race_2!="")|(self.lar_df.co_app_race_3!="")|(self.lar_df.co_app_race_4!="")
-			|(self.lar_df.co_app_race_5!=""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("co_app_race_1", "isin", ("6", "7", "8")))&((self.field_mask("co_app_race_2", "!=", ""))|(self.field_mask("co_app_race_3", "!=", ""))|(self.field_mask("co_app_race_4", "!=", ""))
+			|(self.field_mask("co_app_race_5", "!=", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_race_basis",))
 	def v639_1(self):
 		"""
 		An invalid Race data field was reported.
@@ -1206,9 +1860,10 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Race Basis"
 		edit_name = "v639_1"
-		fail_df = self.lar_df[(~self.lar_df.co_app_race_basis.isin(("1", "2", "3", "4")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~self.field_mask("co_app_race_basis", "isin", ("1", "2", "3", "4"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_race_1", "co_app_race_2", "co_app_race_3", "co_app_race_4", "co_app_race_5", "co_app_race_basis"))
 	def v639_2(self):
 		"""
 		An invalid Race data field was reported.
@@ -1219,11 +1874,12 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Race Basis"
 		edit_name = "v639_2"
-		fail_df = self.lar_df[(self.lar_df.co_app_race_basis=="1")&((~self.lar_df.co_app_race_1.isin(("1", "2", "3", "4", "5", "")))|
-		(~self.lar_df.co_app_race_2.isin(("1", "2", "3", "4", "5", "")))|(~self.lar_df.co_app_race_3.isin(("1", "2", "3", "4", "5", "")))|
-		(~self.lar_df.co_app_race_4.isin(("1", "2", "3", "4", "5", "")))|(~self.lar_df.co_app_race_5.isin(("1", "2", "3", "4", "5", ""))))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("co_app_race_basis", "==", "1"))&((~self.field_mask("co_app_race_1", "isin", ("1", "2", "3", "4", "5", "")))|
+		(~self.field_mask("co_app_race_2", "isin", ("1", "2", "3", "4", "5", "")))|(~self.field_mask("co_app_race_3", "isin", ("1", "2", "3", "4", "5", "")))|
+		(~self.field_mask("co_app_race_4", "isin", ("1", "2", "3", "4", "5", "")))|(~self.field_mask("co_app_race_5", "isin", ("1", "2", "3", "4", "5", "")))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_race_1", "co_app_race_2", "co_app_race_3", "co_app_race_4", "co_app_race_5", "co_app_race_basis"))
 	def v639_3(self):
 		"""
 		An invalid Race data field was reported.
@@ -1237,11 +1893,12 @@ class rules_engine(object):
 		race_1 = ["1", "2", "21", "22", "23", "24", "25", "26", "27", "3", "4", "41", "42", "43", "44", "5", "6"]
 		race_n = race_1[:-1]
 		race_n.append("")
-		fail_df = self.lar_df[(self.lar_df.co_app_race_basis=="2")&((~self.lar_df.co_app_race_1.isin(race_1))|
-		(~self.lar_df.co_app_race_2.isin(race_n))|(~self.lar_df.co_app_race_3.isin(race_n))|(~self.lar_df.co_app_race_4.isin(race_n))|
-		(~self.lar_df.co_app_race_5.isin(race_n)))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("co_app_race_basis", "==", "2"))&((~self.field_mask("co_app_race_1", "isin", race_1))|
+		(~self.field_mask("co_app_race_2", "isin", race_n))|(~self.field_mask("co_app_race_3", "isin", race_n))|(~self.field_mask("co_app_race_4", "isin", race_n))|
+		(~self.field_mask("co_app_race_5", "isin", race_n))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_race_1", "co_app_race_basis"))
 	def v640(self):
 		"""
 		An invalid Race data field was reported.
@@ -1250,9 +1907,10 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Race Basis"
 		edit_name = "v640"
-		fail_df = self.lar_df[(self.lar_df.co_app_race_1=="7")&(self.lar_df.co_app_race_basis!="3")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("co_app_race_1", "==", "7"))&(self.field_mask("co_app_race_basis", "!=", "3"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_race_1", "co_app_race_basis"))
 	def v641(self):
 		"""
 		An invalid Race data field was reported.
@@ -1261,10 +1919,11 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Race Basis"
 		edit_name = "v641"
-		fail_df = self.lar_df[((self.lar_df.co_app_race_1=="8")&(self.lar_df.co_app_race_basis!="4"))|
-		((self.lar_df.co_app_race_basis=="4")&(self.lar_df.co_app_race_1!="8"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("co_app_race_1", "==", "8"))&(self.field_mask("co_app_race_basis", "!=", "4")))|
+		((self.field_mask("co_app_race_basis", "==", "4"))&(self.field_mask("co_app_race_1", "!=", "8"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_sex",))
 	def v642_1(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1272,9 +1931,10 @@ class rules_engine(object):
 		"""
 		field = "Applicant Sex"
 		edit_name = "v642_1"
-		fail_df = self.lar_df[(~self.lar_df.app_sex.isin(("1", "2", "3", "4", "6")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~self.field_mask("app_sex", "isin", ("1", "2", "3", "4", "6"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_sex_basis",))
 	def v642_2(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1282,9 +1942,10 @@ class rules_engine(object):
 		"""
 		field = "Applicant Sex Basis"
 		edit_name = "v642_2"
-		fail_df = self.lar_df[(~self.lar_df.app_sex_basis.isin(("1", "2", "3")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~self.field_mask("app_sex_basis", "isin", ("1", "2", "3"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_sex", "app_sex_basis"))
 	def v643(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1293,9 +1954,10 @@ class rules_engine(object):
 		"""
 		field = "Applicant Sex Basis"
 		edit_name = "v643"
-		fail_df = self.lar_df[(self.lar_df.app_sex_basis=="1")&(~self.lar_df.app_sex.isin(("1", "2")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("app_sex_basis", "==", "1"))&(~self.field_mask("app_sex", "isin", ("1", "2")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_sex", "app_sex_basis"))
 	def v644_1(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1304,9 +1966,10 @@ class rules_engine(object):
 		"""
 		field = "Applicant Sex"
 		edit_name = "v644_1"
-		fail_df = self.lar_df[(self.lar_df.app_sex_basis=="2")&(~self.lar_df.app_sex.isin(("1", "2", "3", "6")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("app_sex_basis", "==", "2"))&(~self.field_mask("app_sex", "isin", ("1", "2", "3", "6")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_sex", "app_sex_basis"))
 	def v644_2(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1315,9 +1978,10 @@ class rules_engine(object):
 		"""
 		field = "Applicant Sex Basis"
 		edit_name = "v644_2"
-		fail_df = self.lar_df[(self.lar_df.app_sex=="6")&(~self.lar_df.app_sex_basis.isin(("2", "3")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("app_sex", "==", "6"))&(~self.field_mask("app_sex_basis", "isin", ("2", "3")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_sex", "app_sex_basis"))
 	def v645(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1325,9 +1989,10 @@ class rules_engine(object):
 		"""
 		field = "Applicant Sex Basis"
 		edit_name = "v645"
-		fail_df = self.lar_df[(self.lar_df.app_sex=="4")&(self.lar_df.app_sex_basis!="3")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("app_sex", "==", "4"))&(self.field_mask("app_sex_basis", "!=", "3"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_sex",))
 	def v646_1(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1335,9 +2000,10 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Sex"
 		edit_name = "v646_1"
-		fail_df = self.lar_df[(~self.lar_df.co_app_sex.isin(("1", "2", "3", "4", "5", "6")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~self.field_mask("co_app_sex", "isin", ("1", "2", "3", "4", "5", "6"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_sex_basis",))
 	def v646_2(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1346,9 +2012,10 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Sex Basis"
 		edit_name = "v646_2"
-		fail_df = self.lar_df[~(self.lar_df.co_app_sex_basis.isin(("1", "2", "3", "4")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("co_app_sex_basis", "isin", ("1", "2", "3", "4")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_sex", "co_app_sex_basis"))
 	def v647(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1357,9 +2024,10 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Sex"
 		edit_name = "v647"
-		fail_df = self.lar_df[(self.lar_df.co_app_sex_basis=="1")&(~self.lar_df.co_app_sex.isin(("1", "2")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("co_app_sex_basis", "==", "1"))&(~self.field_mask("co_app_sex", "isin", ("1", "2")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_sex", "co_app_sex_basis"))
 	def v648_1(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1368,9 +2036,10 @@ class rules_engine(object):
 		"""
 		field = "Co Applicant Sex"
 		edit_name = "v648_1"
-		fail_df = self.lar_df[(self.lar_df.co_app_sex_basis=="2")&(~self.lar_df.co_app_sex.isin(("1","2", "3", "6")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("co_app_sex_basis", "==", "2"))&(~self.field_mask("co_app_sex", "isin", ("1","2", "3", "6")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_sex", "co_app_sex_basis"))
 	def v648_2(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1381,9 +2050,10 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Sex Basis"
 		edit_name = "v648_2"
-		fail_df = self.lar_df[(self.lar_df.co_app_sex=="6")&(~self.lar_df.co_app_sex_basis.isin(("2","3")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("co_app_sex", "==", "6"))&(~self.field_mask("co_app_sex_basis", "isin", ("2","3")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_sex", "co_app_sex_basis"))
 	def v649(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1392,9 +2062,10 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Sex Basis"
 		edit_name = "v649"
-		fail_df = self.lar_df[(self.lar_df.co_app_sex=="4")&(self.lar_df.co_app_sex_basis!="3")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("co_app_sex", "==", "4"))&(self.field_mask("co_app_sex_basis", "!=", "3"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_sex", "co_app_sex_basis"))
 	def v650(self):
 		"""
 		An invalid Sex data field was reported.
@@ -1403,10 +2074,11 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Sex"
 		edit_name = "v650"
-		fail_df = self.lar_df[((self.lar_df.co_app_sex_basis=="4")&(self.lar_df.co_app_sex!="5"))|
-			((self.lar_df.co_app_sex=="5")&(self.lar_df.co_app_sex_basis!="4"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("co_app_sex_basis", "==", "4"))&(self.field_mask("co_app_sex", "!=", "5")))|
+			((self.field_mask("co_app_sex", "==", "5"))&(self.field_mask("co_app_sex_basis", "!=", "4"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_age",))
 	def v651_1(self):
 		"""
 		An invalid Age of Applicant or Borrower was reported.
@@ -1414,9 +2086,10 @@ class rules_engine(object):
 		"""
 		field = "Applicant Age"
 		edit_name = "v651_1"
-		fail_df = self.lar_df[(self.lar_df.app_age.map(lambda x: self.check_number(field=x, min_val=0))==False)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_view("numeric", "app_age") > 0)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "app_eth_1", "app_race_1", "app_sex", "app_age"))
 	def v651_2(self):
 		"""
 		An invalid Age of Applicant or Borrower was reported.
@@ -1426,10 +2099,11 @@ class rules_engine(object):
 		"""
 		field = "Applicant Age"
 		edit_name = "v651_2"
-		fail_df = self.lar_df[((self.lar_df.app_eth_1=="4")&(self.lar_df.app_race_1=="7")&(self.lar_df.app_sex=="4"))&
-					(self.lar_df.app_age!="8888")&(self.lar_df.action_taken!="6")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("app_eth_1", "==", "4"))&(self.field_mask("app_race_1", "==", "7"))&(self.field_mask("app_sex", "==", "4")))&
+					(self.field_mask("app_age", "!=", "8888"))&(self.field_mask("action_taken", "!=", "6")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_age",))
 	def v652_1(self):
 		"""
 		An invalid Age of Co-Applicant or Co-Borrower was reported.
@@ -1437,9 +2111,10 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Age"
 		edit_name = "v652_1"
-		fail_df = self.lar_df[(self.lar_df.co_app_age.map(lambda x: self.check_number(field=x, min_val=0))==False)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_view("numeric", "co_app_age") > 0)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "co_app_eth_1", "co_app_race_1", "co_app_sex", "co_app_age"))
 	def v652_2(self):
 		"""
 		An invalid Age of Co-Applicant or Co-Borrower was reported.
@@ -1449,10 +2124,11 @@ class rules_engine(object):
 		"""
 		field = "Co-Applicant Age"
 		edit_name = "v652_2"
-		fail_df = self.lar_df[((self.lar_df.co_app_eth_1=="4")&(self.lar_df.co_app_race_1=="7")&(self.lar_df.co_app_sex=="4"))&
-					(self.lar_df.co_app_age!="8888")&(self.lar_df.action_taken!="6")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("co_app_eth_1", "==", "4"))&(self.field_mask("co_app_race_1", "==", "7"))&(self.field_mask("co_app_sex", "==", "4")))&
+					(self.field_mask("co_app_age", "!=", "8888"))&(self.field_mask("action_taken", "!=", "6")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("income",))
 	def v654_1(self):
 		"""
 		An invalid Income was reported.
@@ -1460,9 +2136,10 @@ class rules_engine(object):
 		"""
 		field = "Income"
 		edit_name = "v654_1"
-		fail_df = self.lar_df[(self.lar_df.income!="NA")&(self.lar_df.income.map(lambda x: x.isdigit())==False)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("income", "!=", "NA"))&(~self.field_view("digits", "income"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("income", "affordable_units"))
 	def v654_2(self):
 		"""
 		An invalid Income was reported.
@@ -1470,9 +2147,10 @@ class rules_engine(object):
 		"""
 		field = "Income"
 		edit_name = "v654_2"
-		fail_df = self.lar_df[(self.lar_df.affordable_units.map(lambda x: x.isdigit())==True)&(self.lar_df.income!="NA")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.field_view("digits", "affordable_units")&(self.field_mask("income", "!=", "NA"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "app_eth_1", "app_race_1", "app_sex", "income"))
 	def v655_1(self):
 		"""
 		An invalid income was reported.
@@ -1481,10 +2159,11 @@ class rules_engine(object):
 		"""
 		field = "Income"
 		edit_name = "v655_1"
-		fail_df = self.lar_df[((self.lar_df.app_eth_1=="4")&(self.lar_df.app_race_1=="7")&(self.lar_df.app_sex=="4"))&
-					(self.lar_df.income!="NA")&(self.lar_df.action_taken!="6")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("app_eth_1", "==", "4"))&(self.field_mask("app_race_1", "==", "7"))&(self.field_mask("app_sex", "==", "4")))&
+					(self.field_mask("income", "!=", "NA"))&(self.field_mask("action_taken", "!=", "6")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "co_app_eth_1", "co_app_race_1", "co_app_sex", "income"))
 	def v655_2(self):
 		"""
 		An invalid income was reported.
@@ -1493,10 +2172,11 @@ class rules_engine(object):
 		"""
 		field = "Income"
 		edit_name = "v655_2"
-		fail_df = self.lar_df[((self.lar_df.co_app_eth_1=="4")&(self.lar_df.co_app_race_1=="7")&(self.lar_df.co_app_sex=="4"))&
-					(self.lar_df.income!="NA")&(self.lar_df.action_taken!="6")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("co_app_eth_1", "==", "4"))&(self.field_mask("co_app_race_1", "==", "7"))&(self.field_mask("co_app_sex", "==", "4")))&
+					(self.field_mask("income", "!=", "NA"))&(self.field_mask("action_taken", "!=", "6")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("purchaser_type",))
 	def v656_1(self):
 		"""
 		An invalid Type of Purchaser was reported.
@@ -1504,9 +2184,10 @@ class rules_engine(object):
 		"""
 		field = "Type of Purchaser"
 		edit_name = "v656_1"
-		fail_df = self.lar_df[~(self.lar_df.purchaser_type.isin(("0", "1", "2", "3", "4", "5", "6", "71", "72", "8", "9")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("purchaser_type", "isin", ("0", "1", "2", "3", "4", "5", "6", "71", "72", "8", "9")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "purchaser_type"))
 	def v656_2(self):
 		"""
 		An invalid Type of Purchaser was reported.
@@ -1514,9 +2195,10 @@ class rules_engine(object):
 		"""
 		field = "Type of Purchaser"
 		edit_name = "v656_2"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("2", "3", "4", "5", "7","8")))&(self.lar_df.purchaser_type!="0")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_taken", "isin", ("2", "3", "4", "5", "7","8")))&(self.field_mask("purchaser_type", "!=", "0"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("rate_spread",))
 	def v657_1(self):
 		"""
 		An invalid Rate Spread was reported.
@@ -1525,10 +2207,11 @@ class rules_engine(object):
 
 		field = "Rate Spread"
 		edit_name = "v657_1"
-		fail_df = self.lar_df[~(self.lar_df.rate_spread.isin(["NA", "Exempt"]))&
-			(self.lar_df.rate_spread.map(lambda x: self.check_number(x))==False)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~(self.field_mask("rate_spread", "isin", ["NA", "Exempt"]))&
+			(~self.field_view("number", "rate_spread")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "rate_spread"))
 	def v657_2(self):
 		"""
 		An invalid Rate Spread was reported.
@@ -1536,10 +2219,11 @@ class rules_engine(object):
 		"""
 		field = "Rate Spread"
 		edit_name = "v657_2"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("3", "4", "5", "6", "7")))&
-			(~self.lar_df.rate_spread.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("action_taken", "isin", ("3", "4", "5", "6", "7")))&
+			(~self.field_mask("rate_spread", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("rate_spread", "reverse_mortgage"))
 	def v657_3(self):
 		"""
 		An invalid Rate Spread was reported.
@@ -1547,9 +2231,10 @@ class rules_engine(object):
 		"""
 		field = "Rate Spread"
 		edit_name = "v657_3"
-		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&(~self.lar_df.rate_spread.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("reverse_mortgage", "==", "1"))&(~self.field_mask("rate_spread", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("hoepa",))
 	def v658_1(self):
 		"""
 		An invalid HOEPA Status was reported.
@@ -1557,9 +2242,10 @@ class rules_engine(object):
 		"""
 		field = "HOEPA"
 		edit_name  = "v658_1"
-		fail_df = self.lar_df[~(self.lar_df.hoepa.isin(("1", "2", "3")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("hoepa", "isin", ("1", "2", "3")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "hoepa"))
 	def v658_2(self):
 		"""
 		An invalid HOEPA Status was reported.
@@ -1567,9 +2253,10 @@ class rules_engine(object):
 		"""
 		field = "HOEPA"
 		edit_name = "v658_2"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("2", "3", "4", "5", "7", "8")))&(self.lar_df.hoepa!="3")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_taken", "isin", ("2", "3", "4", "5", "7", "8")))&(self.field_mask("hoepa", "!=", "3"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("lien",))
 	def v659(self):
 		"""
 		An invalid Lien Status was reported.
@@ -1577,9 +2264,10 @@ class rules_engine(object):
 		"""
 		field = "Lien Status"
 		edit_name = "v659"
-		fail_df = self.lar_df[~(self.lar_df.lien.isin(("1", "2")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("lien", "isin", ("1", "2")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_credit_score",))
 	def v660_1(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1587,9 +2275,10 @@ class rules_engine(object):
 		"""
 		field = "App Credit Score"
 		edit_name = "v660_1"
-		fail_df = self.lar_df[(self.lar_df.app_credit_score.map(lambda x: self.check_number(x))==False)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~self.field_view("number", "app_credit_score")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_score_name",))
 	def v660_2(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1597,9 +2286,10 @@ class rules_engine(object):
 		"""
 		field = "App Credit Score"
 		edit_name = "v660_2"
-		fail_df = self.lar_df[(~self.lar_df.app_score_name.isin(("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~self.field_mask("app_score_name", "isin", ("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_credit_score", "app_score_name"))
 	def v661(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1608,10 +2298,11 @@ class rules_engine(object):
 		"""
 		field = "App Credit Score"
 		edit_name = "v661"
-		fail_df = self.lar_df[((self.lar_df.app_credit_score=="8888")&(self.lar_df.app_score_name!="9"))|
-			((self.lar_df.app_score_name=="9")&(self.lar_df.app_credit_score!="8888"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("app_credit_score", "==", "8888"))&(self.field_mask("app_score_name", "!=", "9")))|
+			((self.field_mask("app_score_name", "==", "9"))&(self.field_mask("app_credit_score", "!=", "8888"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_score_name", "app_score_code_8"))
 	def v662_1(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1621,12 +2312,13 @@ class rules_engine(object):
 		"""
 		field = "App Score Name"
 		edit_name = "v662_1"
-		fail_df = self.lar_df[((self.lar_df.app_score_name.isin(("1111", "1", "2", "3", "4", "5", "6", "7", "9")))&
-			(self.lar_df.app_score_code_8!=""))|
-			((self.lar_df.app_score_code_8=="")&
-				(~self.lar_df.app_score_name.isin(("1", "2", "3", "4", "5", "6", "7", "9"))))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("app_score_name", "isin", ("1111", "1", "2", "3", "4", "5", "6", "7", "9")))&
+			(self.field_mask("app_score_code_8", "!=", "")))|
+			((self.field_mask("app_score_code_8", "==", ""))&
+				(~self.field_mask("app_score_name", "isin", ("1", "2", "3", "4", "5", "6", "7", "9")))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_score_name", "app_score_code_8"))
 	def v662_2(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1637,10 +2329,11 @@ class rules_engine(object):
 		"""
 		field = "App Score Name"
 		edit_name= "v662_2"
-		fail_df = self.lar_df[((self.lar_df.app_score_name=="8")&(self.lar_df.app_score_code_8==""))|
-			((self.lar_df.app_score_code_8!="")&(self.lar_df.app_score_name!="8"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("app_score_name", "==", "8"))&(self.field_mask("app_score_code_8", "==", "")))|
+			((self.field_mask("app_score_code_8", "!=", ""))&(self.field_mask("app_score_name", "!=", "8"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "app_credit_score", "app_score_name", "app_score_code_8"))
 	def v663(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1651,12 +2344,13 @@ class rules_engine(object):
 		"""
 		field = "App Credit Score"
 		edit_name = "v663"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("4", "5", "6")))&
-			((~self.lar_df.app_credit_score.isin(["8888", "Exempt"]))|
-			(~self.lar_df.app_score_name.isin(["9", "Exempt"]))|
-			(self.lar_df.app_score_code_8!=""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("action_taken", "isin", ("4", "5", "6")))&
+			((~self.field_mask("app_credit_score", "isin", ["8888", "Exempt"]))|
+			(~self.field_mask("app_score_name", "isin", ["9", "Exempt"]))|
+			(self.field_mask("app_score_code_8", "!=", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "co_app_credit_score", "co_app_score_name", "co_app_score_code_8"))
 	def v664(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1668,10 +2362,11 @@ class rules_engine(object):
 		"""
 		field = "Co-App Credit Score"
 		edit_name = "v664"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("4", "5", "6")))&((~self.lar_df.co_app_credit_score.isin(["8888", "Exempt"]))|
-			(~self.lar_df.co_app_score_name.isin(["9", "Exempt"]))|(self.lar_df.co_app_score_code_8!=""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("action_taken", "isin", ("4", "5", "6")))&((~self.field_mask("co_app_credit_score", "isin", ["8888", "Exempt"]))|
+			(~self.field_mask("co_app_score_name", "isin", ["9", "Exempt"]))|(self.field_mask("co_app_score_code_8", "!=", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_credit_score",))
 	def v665_1(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1679,9 +2374,10 @@ class rules_engine(object):
 		"""
 		field = "Co-App Credit Score"
 		edit_name = "v665_1"
-		fail_df = self.lar_df[(self.lar_df.co_app_credit_score.map(lambda x: self.check_number(x))==False)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~self.field_view("number", "co_app_credit_score")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_score_name",))
 	def v665_2(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1691,9 +2387,10 @@ class rules_engine(object):
 		"""
 		field = "Co-App Score Name"
 		edit_name = "v665_2"
-		fail_df = self.lar_df[~(self.lar_df.co_app_score_name.isin(("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("co_app_score_name", "isin", ("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_credit_score", "co_app_score_name"))
 	def v666_1(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1702,10 +2399,11 @@ class rules_engine(object):
 		"""
 		field = "Co-App Credit Score"
 		edit_name = "v666_1"
-		fail_df = self.lar_df[((self.lar_df.co_app_credit_score=="8888")&(self.lar_df.co_app_score_name!="9"))|
-			((self.lar_df.co_app_score_name=="9")&(self.lar_df.co_app_credit_score!="8888"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("co_app_credit_score", "==", "8888"))&(self.field_mask("co_app_score_name", "!=", "9")))|
+			((self.field_mask("co_app_score_name", "==", "9"))&(self.field_mask("co_app_credit_score", "!=", "8888"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_credit_score", "co_app_score_name"))
 	def v666_2(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1714,10 +2412,11 @@ class rules_engine(object):
 		"""
 		field = "Co-App Credit Score"
 		edit_name = "v666_2"
-		fail_df = self.lar_df[((self.lar_df.co_app_credit_score=="9999")&(self.lar_df.co_app_score_name!="10"))|
-			((self.lar_df.co_app_score_name=="10")&(self.lar_df.co_app_credit_score!="9999"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("co_app_credit_score", "==", "9999"))&(self.field_mask("co_app_score_name", "!=", "10")))|
+			((self.field_mask("co_app_score_name", "==", "10"))&(self.field_mask("co_app_credit_score", "!=", "9999"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_score_name", "co_app_score_code_8"))
 	def v667_1(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1727,11 +2426,12 @@ class rules_engine(object):
 		"""
 		field = "Co-App Credit Score Text"
 		edit_name = "v667_1"
-		fail_df = self.lar_df[((self.lar_df.co_app_score_name.isin(("1111", "1", "2", "3", "4", "5", "6", "7", "9", "10")))&
-			(self.lar_df.co_app_score_code_8!=""))|
-			((self.lar_df.co_app_score_code_8=="")&(~self.lar_df.co_app_score_name.isin(("1111", "1", "2", "3", "4", "5", "6", "7", "9", "10"))))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("co_app_score_name", "isin", ("1111", "1", "2", "3", "4", "5", "6", "7", "9", "10")))&
+			(self.field_mask("co_app_score_code_8", "!=", "")))|
+			((self.field_mask("co_app_score_code_8", "==", ""))&(~self.field_mask("co_app_score_name", "isin", ("1111", "1", "2", "3", "4", "5", "6", "7", "9", "10")))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_score_name", "co_app_score_code_8"))
 	def v667_2(self):
 		"""
 		An invalid Credit Score data field was reported.
@@ -1742,10 +2442,11 @@ class rules_engine(object):
 		"""
 		field = "Co-App Credit Score Text"
 		edit_name = "v667_2"
-		fail_df = self.lar_df[((self.lar_df.co_app_score_name=="8")&(self.lar_df.co_app_score_code_8==""))|
-			((self.lar_df.co_app_score_code_8!="")&(self.lar_df.co_app_score_name!="8"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("co_app_score_name", "==", "8"))&(self.field_mask("co_app_score_code_8", "==", "")))|
+			((self.field_mask("co_app_score_code_8", "!=", ""))&(self.field_mask("co_app_score_name", "!=", "8"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_eth_1", "app_race_1", "app_sex", "app_credit_score"))
 	def v668_1(self):
 		"""
 		An invalid Credit Score data point was reported.
@@ -1756,10 +2457,11 @@ class rules_engine(object):
 		"""
 		field = "App Credit Score"
 		edit_name = "v668_1"
-		fail_df = self.lar_df[((self.lar_df.app_eth_1=="4")&(self.lar_df.app_race_1=="7")&(self.lar_df.app_sex=="4"))&
-		(~self.lar_df.app_credit_score.isin(["8888", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("app_eth_1", "==", "4"))&(self.field_mask("app_race_1", "==", "7"))&(self.field_mask("app_sex", "==", "4")))&
+		(~self.field_mask("app_credit_score", "isin", ["8888", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_eth_1", "co_app_race_1", "co_app_sex", "co_app_credit_score"))
 	def v668_2(self):
 		"""
 		An invalid Credit Score data point was reported.
@@ -1770,10 +2472,11 @@ class rules_engine(object):
 		"""
 		field = "Co-App Credit Score"
 		edit_name = "v668_2"
-		fail_df = self.lar_df[(self.lar_df.co_app_eth_1=="4")&(self.lar_df.co_app_race_1=="7")&(self.lar_df.co_app_sex=="4")&
-		(~self.lar_df.co_app_credit_score.isin(["8888", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("co_app_eth_1", "==", "4"))&(self.field_mask("co_app_race_1", "==", "7"))&(self.field_mask("co_app_sex", "==", "4"))&
+		(~self.field_mask("co_app_credit_score", "isin", ["8888", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("denial_1",))
 	def v669_1(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1782,9 +2485,10 @@ class rules_engine(object):
 		"""
 		field = "Denial Reason 1"
 		edit_name = "v669_1"
-		fail_df = self.lar_df[(~self.lar_df.denial_1.isin(("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~self.field_mask("denial_1", "isin", ("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("denial_2", "denial_3", "denial_4"))
 	def v669_2(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1793,9 +2497,10 @@ class rules_engine(object):
 		field = "Denial Reason 2-4"
 		edit_name = "v669_2"
 		denials = ["1", "2", "3", "4", "5", "6", "7", "8", "9", ""]
-		fail_df = self.lar_df[~(self.lar_df.denial_2.isin(denials))|(~self.lar_df.denial_3.isin(denials))|(~self.lar_df.denial_4.isin(denials))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("denial_2", "isin", denials))|(~self.field_mask("denial_3", "isin", denials))|(~self.field_mask("denial_4", "isin", denials))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("denial_1", "denial_2", "denial_3", "denial_4"))
 	def v669_3(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1804,9 +2509,10 @@ class rules_engine(object):
 		field = "Denial Reasons 1-4"
 		edit_name = "v669_3"
 		dupe_fields = ["denial_1", "denial_2", "denial_3", "denial_4"]
-		fail_df = self.lar_df[(self.lar_df.apply(lambda x: self.check_dupes(x, fields=dupe_fields), axis=1)=="fail")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.check_dupes(fields=dupe_fields)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("denial_1", "denial_2", "denial_3", "denial_4"))
 	def v669_4(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1817,10 +2523,11 @@ class rules_engine(object):
 		"""
 		field = "Denial Reasons 1-4"
 		edit_name = "v669_4"
-		fail_df = self.lar_df[(self.lar_df.denial_1.isin(["1111", "10"]))&
-			((self.lar_df.denial_2!="")|(self.lar_df.denial_3!="")|(self.lar_df.denial_4!=""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("denial_1", "isin", ["1111", "10"]))&
+			((self.field_mask("denial_2", "!=", ""))|(self.field_mask("denial_3", "!=", ""))|(self.field_mask("denial_4", "!=", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "denial_1"))
 	def v670_1(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1829,10 +2536,11 @@ class rules_engine(object):
 		"""
 		field = "Denial Reason 1"
 		edit_name = "v670_1"
-		fail_df = self.lar_df[((self.lar_df.action_taken.isin(("3","7")))&
-							  (~self.lar_df.denial_1.isin(("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9"))))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("action_taken", "isin", ("3","7")))&
+							  (~self.field_mask("denial_1", "isin", ("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "denial_1"))
 	def v670_2(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1840,30 +2548,33 @@ class rules_engine(object):
 		"""
 		field = "Denial Reason 1"
 		edit_name = "v670_2"
-		fail_df = self.lar_df[((self.lar_df.denial_1.isin(("1", "2", "3", "4", "5", "6", "7", "8", "9")))&
-							  (~self.lar_df.action_taken.isin(["3", "7"])))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("denial_1", "isin", ("1", "2", "3", "4", "5", "6", "7", "8", "9")))&
+							  (~self.field_mask("action_taken", "isin", ["3", "7"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "denial_1"))
 	def v670_3(self):
 		"""
 		3) If Action Taken equals 1, 2, 4, 5, 6, or 8, then Reason for Denial: 1 must equal 1111 or 10.
 		"""
 		field = "Denial Reason 1"
 		edit_name = "v670_3"
-		fail_df = self.lar_df[((self.lar_df.action_taken.isin(("1", "2", "4", "5", "6", "8")))&
-							  (~self.lar_df.denial_1.isin(["1111", "10"])))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("action_taken", "isin", ("1", "2", "4", "5", "6", "8")))&
+							  (~self.field_mask("denial_1", "isin", ["1111", "10"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "denial_1"))
 	def v670_4(self):
 		"""
 		4) If Reason for Denial: 1 equals 10, then Action Taken must equal 1, 2, 4, 5, 6, or 8
 		""" 
 		field = "Denial Reason 1"
 		edit_name = "v670_4"
-		fail_df = self.lar_df[(self.lar_df.denial_1.isin(["1111", "10"]))&
-							  (~self.lar_df.action_taken.isin(("1", "2", "4", "5", "6", "8")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("denial_1", "isin", ["1111", "10"]))&
+							  (~self.field_mask("action_taken", "isin", ("1", "2", "4", "5", "6", "8"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("denial_1", "denial_2", "denial_3", "denial_4", "denial_code_9"))
 	def v671_1(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1873,10 +2584,11 @@ class rules_engine(object):
 		"""
 		field = "Denail Reasons 1-4"
 		edit_name = "v671_1"
-		fail_df = self.lar_df[((self.lar_df.denial_1=="9")|(self.lar_df.denial_2=="9")|(self.lar_df.denial_3=="9")|(self.lar_df.denial_4=="9"))&
-			(self.lar_df.denial_code_9=="")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("denial_1", "==", "9"))|(self.field_mask("denial_2", "==", "9"))|(self.field_mask("denial_3", "==", "9"))|(self.field_mask("denial_4", "==", "9")))&
+			(self.field_mask("denial_code_9", "==", "")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("denial_1", "denial_2", "denial_3", "denial_4", "denial_code_9"))
 	def v671_2(self):
 		"""
 		An invalid Reason for Denial data field was reported.
@@ -1885,10 +2597,11 @@ class rules_engine(object):
 		"""
 		field = "Denial Reasons 1-4"
 		edit_name = "v671_2"
-		fail_df = self.lar_df[((self.lar_df.denial_1!="9")&(self.lar_df.denial_2!="9")&(self.lar_df.denial_3!="9")&(self.lar_df.denial_4!="9"))&
-			(self.lar_df.denial_code_9!="")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("denial_1", "!=", "9"))&(self.field_mask("denial_2", "!=", "9"))&(self.field_mask("denial_3", "!=", "9"))&(self.field_mask("denial_4", "!=", "9")))&
+			(self.field_mask("denial_code_9", "!=", "")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_costs",))
 	def v672_1(self):
 		"""
 		An invalid Total Loan Costs or Total Points and Fees data field was reported.
@@ -1897,10 +2610,10 @@ class rules_engine(object):
 		"""
 		field = "Loan Costs"
 		edit_name = "v672_1"
-		fail_df = self.lar_df[(~self.lar_df.loan_costs.isin(["NA", "Exempt"]))].copy()
-		fail_df = fail_df[(fail_df.loan_costs.map(lambda x: self.check_number(x, min_val=0))==False)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~self.field_mask("loan_costs", "isin", ["NA", "Exempt"]))&(~(self.field_view("numeric", "loan_costs") > 0))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_costs", "points_fees"))
 	def v672_2(self):
 		"""
 		An invalid Total Loan Costs or Total Points and Fees data field was reported.
@@ -1908,10 +2621,10 @@ class rules_engine(object):
 		"""
 		field = "Loan Costs"
 		edit_name = "v672_2"
-		fail_df = self.lar_df[(self.lar_df.loan_costs!="NA")].copy()
-		fail_df = fail_df[(fail_df.points_fees.map(lambda x: self.check_number(x, min_val=0))==True)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("loan_costs", "!=", "NA"))&(self.field_view("numeric", "points_fees") > 0)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_costs", "reverse_mortgage"))
 	def v672_3(self):
 		"""
 		An invalid Total Loan Costs or Total Points and Fees data field was reported.
@@ -1920,9 +2633,10 @@ class rules_engine(object):
 		"""
 		field = "Loan Costs"
 		edit_name = "v672_3"
-		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&(~self.lar_df.loan_costs.isin(["NA","Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("reverse_mortgage", "==", "1"))&(~self.field_mask("loan_costs", "isin", ["NA","Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_costs", "open_end_credit"))
 	def v672_4(self):
 		"""
 		An invalid Total Loan Costs or Total Points and Fees data field was reported.
@@ -1931,9 +2645,10 @@ class rules_engine(object):
 		"""
 		field = "Loan Costs"
 		edit_name = "v672_4"
-		fail_df = self.lar_df[(self.lar_df.open_end_credit=="1")&(~self.lar_df.loan_costs.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("open_end_credit", "==", "1"))&(~self.field_mask("loan_costs", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_costs", "business_purpose"))
 	def v672_5(self):
 		"""
 		An invalid Total Loan Costs or Total Points and Fees data field was reported.
@@ -1942,9 +2657,10 @@ class rules_engine(object):
 		"""
 		field = "Loan Costs"
 		edit_name = "v672_5"
-		fail_df = self.lar_df[(self.lar_df.business_purpose=="1")&(~self.lar_df.loan_costs.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("business_purpose", "==", "1"))&(~self.field_mask("loan_costs", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "loan_costs"))
 	def v672_6(self):
 		"""
 		An invalid Total Loan Costs or Total Points and Fees data field was reported.
@@ -1954,9 +2670,10 @@ class rules_engine(object):
 		"""
 		field = "Loan Costs"
 		edit_name = "v672_6"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("2", "3", "4", "5", "7", "8"))&(~self.lar_df.loan_costs.isin(["NA", "Exempt"])))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.field_mask("action_taken", "isin", ("2", "3", "4", "5", "7", "8"))&(~self.field_mask("loan_costs", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("points_fees",))
 	def v673_1(self):
 		"""
 		An invalid Total Points and Fees was reported.
@@ -1964,10 +2681,10 @@ class rules_engine(object):
 		"""
 		field = "Points and Fees"
 		edit_name = "v673_1"
-		fail_df = self.lar_df[~self.lar_df.points_fees.isin(["NA", "Exempt"])].copy()
-		fail_df = fail_df[(fail_df.points_fees.map(lambda x: self.check_number(x, min_val=0))==False)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~self.field_mask("points_fees", "isin", ["NA", "Exempt"]))&(~(self.field_view("numeric", "points_fees") > 0))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "points_fees"))
 	def v673_2(self):
 		"""
 		An invalid Total Points and Fees was reported.
@@ -1976,10 +2693,11 @@ class rules_engine(object):
 		"""
 		field = "Points and Fees"
 		edit_name = "v673_2"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("2", "3", "4", "5", "6", "7", "8")))&
-							 (~self.lar_df.points_fees.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("action_taken", "isin", ("2", "3", "4", "5", "6", "7", "8")))&
+							 (~self.field_mask("points_fees", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("points_fees", "reverse_mortgage"))
 	def v673_3(self):
 		"""
 		An invalid Total Points and Fees was reported.
@@ -1988,10 +2706,11 @@ class rules_engine(object):
 		"""
 		field = "Points and Fees"
 		edit_name = "v673_3"
-		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&
-					          (~self.lar_df.points_fees.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("reverse_mortgage", "==", "1"))&
+					          (~self.field_mask("points_fees", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("points_fees", "business_purpose"))
 	def v673_4(self):
 		"""
 		An invalid Total Points and Fees was reported.
@@ -1999,9 +2718,10 @@ class rules_engine(object):
 		"""
 		field = "Points and Fees"
 		edit_name = "v673_4"
-		fail_df = self.lar_df[(self.lar_df.business_purpose=="1")&(~self.lar_df.points_fees.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("business_purpose", "==", "1"))&(~self.field_mask("points_fees", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_costs", "points_fees"))
 	def v673_5(self):
 		"""
 		An invalid Total Points and Fees was reported.
@@ -2009,11 +2729,10 @@ class rules_engine(object):
 		"""
 		field = "Points and Fees"
 		edit_name = "v673_5"
-		fail_df = self.lar_df[(self.lar_df.points_fees!="NA")].copy()
-		fail_df = fail_df[(fail_df.loan_costs.map(lambda x: self.check_number(x, min_val=0))==True)]
-							  
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("points_fees", "!=", "NA"))&(self.field_view("numeric", "loan_costs") > 0)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("origination_fee",))
 	def v674_1(self):
 		"""
 		An invalid Origination Charges was reported.
@@ -2022,11 +2741,10 @@ class rules_engine(object):
 		"""
 		field = "Origination Charges"
 		edit_name = "v674_1"
-		fail_df = self.lar_df[(~self.lar_df.origination_fee.isin(["NA", "Exempt"]))].copy()
-		fail_df = fail_df[(fail_df.origination_fee.map(lambda x: self.check_number(x, min_val=0))==False)]
-							 
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~self.field_mask("origination_fee", "isin", ["NA", "Exempt"]))&(~(self.field_view("numeric", "origination_fee") > 0))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("origination_fee", "reverse_mortgage"))
 	def v674_2(self):
 		"""
 		An invalid Origination Charges was reported.
@@ -2034,20 +2752,22 @@ class rules_engine(object):
 		"""
 		field = "Origination Charges"
 		edit_name = "v674_2"
-		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&
-							 (~self.lar_df.origination_fee.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("reverse_mortgage", "==", "1"))&
+							 (~self.field_mask("origination_fee", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("origination_fee", "open_end_credit"))
 	def v674_3(self):
 		"""An invalid Origination Charges was reported.
 		3) If Open-End Line of Credit equals 1, then Origination Charges must be NA or Exempt.
 		"""
 		field = "Origination Charges"
 		edit_name = "v674_3"
-		fail_df = self.lar_df[(self.lar_df.open_end_credit=="1")&
-							 (~self.lar_df.origination_fee.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("open_end_credit", "==", "1"))&
+							 (~self.field_mask("origination_fee", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("origination_fee", "business_purpose"))
 	def v674_4(self):
 		"""
 		An invalid Origination Charges was reported.
@@ -2055,10 +2775,11 @@ class rules_engine(object):
 		"""
 		field = "Origination Charges"
 		edit_name = "v674_4"
-		fail_df = self.lar_df[(self.lar_df.business_purpose=="1")&
-							 (~self.lar_df.origination_fee.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("business_purpose", "==", "1"))&
+							 (~self.field_mask("origination_fee", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "origination_fee"))
 	def v674_5(self):
 		"""
 		An invalid Origination Charges was reported.
@@ -2066,10 +2787,11 @@ class rules_engine(object):
 		"""
 		field = "Origination Charges"
 		edit_name = "v674_5"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("2", "3", "4", "5", "7", "8")))&
-							 (~self.lar_df.origination_fee.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("action_taken", "isin", ("2", "3", "4", "5", "7", "8")))&
+							 (~self.field_mask("origination_fee", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("discount_points",))
 	def v675_1(self):
 		"""
 		An invalid Discount Points was reported.
@@ -2077,11 +2799,10 @@ class rules_engine(object):
 		"""
 		field = "Discount Points"
 		edit_name = "v675_1"
-		fail_df = self.lar_df[(~self.lar_df.discount_points.isin(["NA", "Exempt", ""]))].copy()
-		fail_df = fail_df[(fail_df.discount_points.map(lambda x: self.check_number(x, min_val=0))==False)]
-		  
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~self.field_mask("discount_points", "isin", ["NA", "Exempt", ""]))&(~(self.field_view("numeric", "discount_points") > 0))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("discount_points", "reverse_mortgage"))
 	def v675_2(self):
 		"""
 		An invalid Discount Points was reported.
@@ -2089,10 +2810,11 @@ class rules_engine(object):
 		"""
 		field = "Discount Points"
 		edit_name = "v675_2"
-		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&
-							 (~self.lar_df.discount_points.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("reverse_mortgage", "==", "1"))&
+							 (~self.field_mask("discount_points", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("discount_points", "open_end_credit"))
 	def v675_3(self):
 		"""
 		An invalid Discount Points was reported.
@@ -2100,10 +2822,11 @@ class rules_engine(object):
 		"""
 		field = "Discount Points"
 		edit_name = "v675_3"
-		fail_df = self.lar_df[(self.lar_df.open_end_credit=="1")&
-							 (~self.lar_df.discount_points.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("open_end_credit", "==", "1"))&
+							 (~self.field_mask("discount_points", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("discount_points", "business_purpose"))
 	def v675_4(self):
 		"""
 		An invalid Discount Points was reported.
@@ -2111,10 +2834,11 @@ class rules_engine(object):
 		"""
 		field = "Discount Points"
 		edit_name = "v675_4"
-		fail_df = self.lar_df[(self.lar_df.business_purpose=="1")&
-							 (~self.lar_df.discount_points.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("business_purpose", "==", "1"))&
+							 (~self.field_mask("discount_points", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "discount_points"))
 	def v675_5(self):
 		"""
 		An invalid Discount Points was reported.
@@ -2122,10 +2846,11 @@ class rules_engine(object):
 		"""
 		field = "Discount Points"
 		edit_name = "v675_5"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("2", "3", "4", "5", "7", "8")))&
-							 (~self.lar_df.discount_points.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("action_taken", "isin", ("2", "3", "4", "5", "7", "8")))&
+							 (~self.field_mask("discount_points", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("lender_credits",))
 	def v676_1(self):
 		"""
 		An invalid Lender Credits was reported.
@@ -2133,10 +2858,10 @@ class rules_engine(object):
 		"""
 		field = "Lender Credits"
 		edit_name = "v676_1"
-		fail_df = self.lar_df[(~self.lar_df.lender_credits.isin(["NA", "Exempt", ""]))].copy()
-		fail_df = fail_df[(fail_df.lender_credits.map(lambda x: self.check_number(x, min_val=0))==False)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~self.field_mask("lender_credits", "isin", ["NA", "Exempt", ""]))&(~(self.field_view("numeric", "lender_credits") > 0))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("lender_credits", "reverse_mortgage"))
 	def v676_2(self):
 		"""
 		An invalid Lender Credits was reported.
@@ -2144,9 +2869,10 @@ class rules_engine(object):
 		"""
 		field = "Lender Credits"
 		edit_name = "v676_2"
-		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&(~self.lar_df.lender_credits.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("reverse_mortgage", "==", "1"))&(~self.field_mask("lender_credits", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("lender_credits", "open_end_credit"))
 	def v676_3(self):
 		"""
 		An invalid Lender Credits was reported.
@@ -2154,9 +2880,10 @@ class rules_engine(object):
 		"""
 		field = "Lender Credits"
 		edit_name = "v676_3"
-		fail_df = self.lar_df[(self.lar_df.open_end_credit=="1")&(~self.lar_df.lender_credits.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("open_end_credit", "==", "1"))&(~self.field_mask("lender_credits", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("lender_credits", "business_purpose"))
 	def v676_4(self):
 		"""
 		An invalid Lender Credits was reported.
@@ -2164,9 +2891,10 @@ class rules_engine(object):
 		"""
 		field = "Lender Credits"
 		edit_name = "v676_4"
-		fail_df = self.lar_df[(self.lar_df.business_purpose=="1")&(~self.lar_df.lender_credits.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("business_purpose", "==", "1"))&(~self.field_mask("lender_credits", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "lender_credits"))
 	def v676_5(self):
 		"""
 		An invalid Lender Credits was reported.
@@ -2175,10 +2903,11 @@ class rules_engine(object):
 		"""
 		field = "Lender Credits"
 		edit_name = "v676_5"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("2", "3", "4", "5", "7", "8")))&
-							 (~self.lar_df.lender_credits.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("action_taken", "isin", ("2", "3", "4", "5", "7", "8")))&
+							 (~self.field_mask("lender_credits", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("interest_rate",))
 	def v677_1(self):
 		"""
 		An invalid Interest Rate was reported.
@@ -2187,11 +2916,10 @@ class rules_engine(object):
 		"""
 		field = "Interest Rate"
 		edit_name = "v677_1"
-		fail_df = self.lar_df[(~self.lar_df.interest_rate.isin(["NA", "Exempt"]))].copy()
-		fail_df = fail_df[(fail_df.interest_rate.map(lambda x: self.check_number(x, min_val=0))==False)]
-			
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~self.field_mask("interest_rate", "isin", ["NA", "Exempt"]))&(~(self.field_view("numeric", "interest_rate") > 0))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "interest_rate"))
 	def v677_2(self):
 		"""
 		An invalid Interest Rate was reported.
@@ -2200,10 +2928,11 @@ class rules_engine(object):
 		"""
 		field = "Interest Rate"
 		edit_name = "v677_2"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("3", "4", "5", "7")))&
-							 (~self.lar_df.interest_rate.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("action_taken", "isin", ("3", "4", "5", "7")))&
+							 (~self.field_mask("interest_rate", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("prepayment_penalty",))
 	def v678_1(self):
 		"""
 		An invalid Prepayment Penalty Term was reported.
@@ -2212,11 +2941,10 @@ class rules_engine(object):
 		"""
 		field = "Prepayment Term"
 		edit_name = "v678_1"
-		fail_df = self.lar_df[(~self.lar_df.prepayment_penalty.isin(["NA", "Exempt"]))].copy()
-		fail_df = fail_df[(fail_df.prepayment_penalty.map(lambda x: self.check_number(x, min_val=0))==False)]
-							 
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~self.field_mask("prepayment_penalty", "isin", ["NA", "Exempt"]))&(~(self.field_view("numeric", "prepayment_penalty") > 0))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "prepayment_penalty"))
 	def v678_2(self):
 		"""
 		An invalid Prepayment Penalty Term was reported.
@@ -2224,9 +2952,10 @@ class rules_engine(object):
 		"""
 		field = "Prepayment Term"
 		edit_name = "v678_2"
-		fail_df = self.lar_df[(self.lar_df.action_taken=="6")&(~self.lar_df.prepayment_penalty.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_taken", "==", "6"))&(~self.field_mask("prepayment_penalty", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("prepayment_penalty", "reverse_mortgage"))
 	def v678_3(self):
 		"""
 		An invalid Prepayment Penalty Term was reported.
@@ -2234,9 +2963,10 @@ class rules_engine(object):
 		"""
 		field = "Prepayment Term"
 		edit_name = "v678_3"
-		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&(~self.lar_df.prepayment_penalty.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("reverse_mortgage", "==", "1"))&(~self.field_mask("prepayment_penalty", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("prepayment_penalty", "business_purpose"))
 	def v678_4(self):
 		"""
 		An invalid Prepayment Penalty Term was reported.
@@ -2244,9 +2974,10 @@ class rules_engine(object):
 		"""
 		field = "Prepayment Term"
 		edit_name = "v678_4"
-		fail_df = self.lar_df[(self.lar_df.business_purpose=="1")&(~self.lar_df.prepayment_penalty.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("business_purpose", "==", "1"))&(~self.field_mask("prepayment_penalty", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("prepayment_penalty", "loan_term"))
 	def v678_5(self):
 		"""
 		An invalid Prepayment Penalty Term was reported.
@@ -2255,9 +2986,10 @@ class rules_engine(object):
 		field = "Prepayment Term"
 		edit_name = "v678_5"
 		fields = ["prepayment_penalty", "loan_term"]
-		fail_df = self.lar_df[(self.lar_df.apply(lambda x: self.compare_nums(x, fields=fields), axis=1)==True)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.field_view("float", fields[0]) > self.field_view("float", fields[1])
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("dti",))
 	def v679_1(self):
 		"""
 		An invalid Debt-to-Income Ratio was reported.
@@ -2265,9 +2997,10 @@ class rules_engine(object):
 		"""
 		field = "DTI"
 		edit_name = "v679_1"
-		fail_df = self.lar_df[(self.lar_df.dti.map(lambda x: self.check_number(x))==False)&(~self.lar_df.dti.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~self.field_view("number", "dti"))&(~self.field_mask("dti", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "dti"))
 	def v679_2(self):
 		"""
 		An invalid Debt-to-Income Ratio was reported.
@@ -2275,9 +3008,10 @@ class rules_engine(object):
 		"""
 		field = "DTI"
 		edit_name = "v679_2"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("4", "5", "6")))&(~self.lar_df.dti.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_taken", "isin", ("4", "5", "6")))&(~self.field_mask("dti", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("dti", "affordable_units"))
 	def v679_3(self):
 		"""
 		An invalid Debt-to-Income Ratio was reported.
@@ -2285,9 +3019,10 @@ class rules_engine(object):
 		"""
 		field = "DTI"
 		edit_name = "v679_3"
-		fail_df = self.lar_df[(self.lar_df.affordable_units.map(lambda x: self.check_number(x))==True)&(~self.lar_df.dti.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.field_view("number", "affordable_units")&(~self.field_mask("dti", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_eth_1", "co_app_eth_1", "app_race_1", "co_app_race_1", "app_sex", "co_app_sex", "dti"))
 	def v680_1(self):
 		"""
 		An invalid Debt-to-Income Ratio was reported.
@@ -2300,11 +3035,12 @@ class rules_engine(object):
 		"""
 		field = "DTI"
 		edit_name = "v680_1"
-		fail_df = self.lar_df[(self.lar_df.app_eth_1=="4")&(self.lar_df.app_race_1=="7")&(self.lar_df.app_sex=="4")&
-			(self.lar_df.co_app_eth_1=="5")&(self.lar_df.co_app_race_1=="8")&(self.lar_df.co_app_sex=="5")&
-			(~self.lar_df.dti.isin(["NA","Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("app_eth_1", "==", "4"))&(self.field_mask("app_race_1", "==", "7"))&(self.field_mask("app_sex", "==", "4"))&
+			(self.field_mask("co_app_eth_1", "==", "5"))&(self.field_mask("co_app_race_1", "==", "8"))&(self.field_mask("co_app_sex", "==", "5"))&
+			(~self.field_mask("dti", "isin", ["NA","Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_eth_1", "co_app_eth_1", "app_race_1", "co_app_race_1", "app_sex", "co_app_sex", "dti"))
 	def v680_2(self):
 		"""
 		An invalid Debt-to-Income Ratio was reported.
@@ -2315,11 +3051,12 @@ class rules_engine(object):
 		"""
 		field = "DTI"
 		edit_name = "v680_2"
-		fail_df = self.lar_df[(self.lar_df.app_eth_1=="4")&(self.lar_df.app_race_1=="7")&(self.lar_df.app_sex=="4")&
-			(self.lar_df.co_app_eth_1=="4")&(self.lar_df.co_app_race_1=="7")&(self.lar_df.co_app_sex=="4")&
-			(~self.lar_df.dti.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("app_eth_1", "==", "4"))&(self.field_mask("app_race_1", "==", "7"))&(self.field_mask("app_sex", "==", "4"))&
+			(self.field_mask("co_app_eth_1", "==", "4"))&(self.field_mask("co_app_race_1", "==", "7"))&(self.field_mask("co_app_sex", "==", "4"))&
+			(~self.field_mask("dti", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("cltv",))
 	def v681_1(self):
 		"""
 		An invalid Combined Loan-to-Value Ratio was reported.
@@ -2327,10 +3064,11 @@ class rules_engine(object):
 		"""
 		field = "CLTV"
 		edit_name = "v681_1"
-		fail_df = self.lar_df[(self.lar_df.cltv.map(lambda x: self.check_number(x, min_val=0))==False)&
-							 (~self.lar_df.cltv.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((~(self.field_view("numeric", "cltv") > 0))&
+							 (~self.field_mask("cltv", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "cltv"))
 	def v681_2(self):
 		"""
 		An invalid Combined Loan-to-Value Ratio was reported.
@@ -2338,9 +3076,10 @@ class rules_engine(object):
 		"""
 		field = "CLTV"
 		edit_name = "v681_2"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("4", "5", "6")))&(~self.lar_df.cltv.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_taken", "isin", ("4", "5", "6")))&(~self.field_mask("cltv", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_term",))
 	def v682_1(self):
 		"""
 		An invalid Loan Term was reported.
@@ -2348,10 +3087,11 @@ class rules_engine(object):
 		"""
 		field = "Loan Term"
 		edit_name = "v682_1"
-		fail_df = self.lar_df[(self.lar_df.loan_term.map(lambda x: self.check_number(x, min_val=0))==False)&
-			(~self.lar_df.loan_term.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((~(self.field_view("numeric", "loan_term") > 0))&
+			(~self.field_mask("loan_term", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_term", "reverse_mortgage"))
 	def v682_2(self):
 		"""
 		An invalid Loan Term was reported.
@@ -2360,9 +3100,10 @@ class rules_engine(object):
 		"""
 		field = "Loan Term"
 		edit_name = "v682_2"
-		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&(~self.lar_df.loan_term.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("reverse_mortgage", "==", "1"))&(~self.field_mask("loan_term", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("intro_rate",))
 	def v683(self):
 		"""
 		An invalid Introductory Rate Period was reported.
@@ -2372,10 +3113,10 @@ class rules_engine(object):
 		field = "Introductory Rate"
 		edit_name = "v683"
 
-		fail_df = self.lar_df[(~self.lar_df.intro_rate.isin(["NA", "Exempt"]))].copy()
-		fail_df = fail_df[(fail_df.intro_rate.map(lambda x: self.check_number(x, min_val=0))==False)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~self.field_mask("intro_rate", "isin", ["NA", "Exempt"]))&(~(self.field_view("numeric", "intro_rate") > 0))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("balloon",))
 	def v684(self):
 		"""
 		An invalid Balloon Payment was reported.
@@ -2383,9 +3124,10 @@ class rules_engine(object):
 		"""
 		field = "Balloon Payment"
 		edit_name = "v684"
-		fail_df = self.lar_df[~(self.lar_df.balloon.isin(("1111", "1", "2")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("balloon", "isin", ("1111", "1", "2")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("int_only_pmts",))
 	def v685(self):
 		"""
 		An invalid Interest Only Payments was reported.
@@ -2393,9 +3135,10 @@ class rules_engine(object):
 		"""
 		field = "Interest Only Payments"
 		edit_name = "v685"
-		fail_df = self.lar_df[(~self.lar_df.int_only_pmts.isin(("1111", "1", "2")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~self.field_mask("int_only_pmts", "isin", ("1111", "1", "2"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("neg_amort",))
 	def v686(self):
 		"""
 		An invalid Negative Amortization was reported.
@@ -2403,9 +3146,10 @@ class rules_engine(object):
 		"""
 		field = "Negative Amortization"
 		edit_name = "v686"
-		fail_df = self.lar_df[~(self.lar_df.neg_amort.isin(("1111", "1", "2")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("neg_amort", "isin", ("1111", "1", "2")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("non_amort_features",))
 	def v687(self):
 		"""
 		An invalid Other Non-amortizing Features was reported.
@@ -2413,9 +3157,10 @@ class rules_engine(object):
 		"""
 		field = "Non-amortizing Features"
 		edit_name = "v687"
-		fail_df = self.lar_df[~(self.lar_df.non_amort_features.isin(("1111", "1", "2")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("non_amort_features", "isin", ("1111", "1", "2")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("property_value",))
 	def v688_1(self):
 		"""
 		An invalid Property Value was reported.
@@ -2424,10 +3169,10 @@ class rules_engine(object):
 		"""
 		field = "Property Value"
 		edit_name = "v688_1"
-		fail_df = self.lar_df[(~self.lar_df.property_value.isin(["NA", "Exempt"]))].copy()
-		fail_df = fail_df[(fail_df.property_value.map(lambda x: self.check_number(x, min_val=0)==False))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~self.field_mask("property_value", "isin", ["NA", "Exempt"]))&(~(self.field_view("numeric", "property_value") > 0))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "property_value"))
 	def v688_2(self):
 		"""
 		An invalid Property Value was reported.
@@ -2436,10 +3181,11 @@ class rules_engine(object):
 		"""
 		field = "Property Value"
 		edit_name = "v688_2"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(("4", "5")))&
-							 (~self.lar_df.property_value.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("action_taken", "isin", ("4", "5")))&
+							 (~self.field_mask("property_value", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("manufactured_type",))
 	def v689_1(self):
 		"""
 		An invalid Manufactured Home Secured Property Type was reported.
@@ -2448,9 +3194,10 @@ class rules_engine(object):
 		"""
 		field = "Manufactured Property Type"
 		edit_name = "v689_1"
-		fail_df = self.lar_df[~(self.lar_df.manufactured_type.isin(("1111", "1", "2", "3")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("manufactured_type", "isin", ("1111", "1", "2", "3")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("manufactured_type", "affordable_units"))
 	def v689_2(self):
 		"""
 		An invalid Manufactured Home Secured Property Type was reported.
@@ -2459,10 +3206,11 @@ class rules_engine(object):
 		"""
 		field = "Manufactured Property Type"
 		edit_name = "v689_2"
-		fail_df = self.lar_df[(self.lar_df.affordable_units.map(lambda x: x.isdigit())==True)&
-			(~self.lar_df.manufactured_type.isin(["1111", "3"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_view("digits", "affordable_units")&
+			(~self.field_mask("manufactured_type", "isin", ["1111", "3"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("const_method", "manufactured_type"))
 	def v689_3(self):
 		"""
 		An invalid Manufactured Home Secured Property Type was reported.
@@ -2470,9 +3218,10 @@ class rules_engine(object):
 		"""
 		field = "Manufactured Property Type"
 		edit_name = "v689_3"
-		fail_df = self.lar_df[(self.lar_df.const_method=="1")&(~self.lar_df.manufactured_type.isin(["3", "1111"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("const_method", "==", "1"))&(~self.field_mask("manufactured_type", "isin", ["3", "1111"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("manufactured_interest",))
 	def v690_1(self):
 		"""
 		An invalid Manufactured Home Land Property Interest was reported.
@@ -2482,9 +3231,10 @@ class rules_engine(object):
 
 		field = "Manufactured Land Interest"
 		edit_name = "v690_1"
-		fail_df = self.lar_df[~(self.lar_df.manufactured_interest.isin(("1111", "1", "2", "3", "4", "5")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("manufactured_interest", "isin", ("1111", "1", "2", "3", "4", "5")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("manufactured_interest", "affordable_units"))
 	def v690_2(self):
 		"""
 		An invalid Manufactured Home Land Property Interest was reported.
@@ -2492,10 +3242,11 @@ class rules_engine(object):
 		"""
 		field = "Manufactured Land Interest"
 		edit_name = "v690_2"
-		fail_df = self.lar_df[(self.lar_df.affordable_units.map(lambda x: x.isdigit())==True)&
-			(~self.lar_df.manufactured_interest.isin(["5", "1111"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_view("digits", "affordable_units")&
+			(~self.field_mask("manufactured_interest", "isin", ["5", "1111"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("const_method", "manufactured_interest"))
 	def v690_3(self):
 		"""
 		An invalid Manufactured Home Land Property Interest was reported.
@@ -2503,9 +3254,10 @@ class rules_engine(object):
 		"""
 		field = "Manufactured Land Interest"
 		edit_name = "v690_3"
-		fail_df = self.lar_df[(self.lar_df.const_method=="1")&(~self.lar_df.manufactured_interest.isin(["5", "1111"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("const_method", "==", "1"))&(~self.field_mask("manufactured_interest", "isin", ["5", "1111"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("total_units",))
 	def v691(self):
 		"""
 		An invalid Total Units was reported.
@@ -2513,9 +3265,10 @@ class rules_engine(object):
 		"""
 		field = "Total Units"
 		edit_name = "v691"
-		fail_df = self.lar_df[(self.lar_df.total_units.map(lambda x: self.check_number(x, min_val=0))==False)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_view("numeric", "total_units") > 0)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("affordable_units",))
 	def v692_1(self):
 		"""
 		An invalid Multifamily Affordable Units was reported.
@@ -2523,10 +3276,11 @@ class rules_engine(object):
 			"""
 		field = "Affordable Units"
 		edit_name = "v692_1"
-		fail_df = self.lar_df[(self.lar_df.affordable_units.map(lambda x: self.check_number(x))==False)&
-							 (~self.lar_df.affordable_units.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((~self.field_view("number", "affordable_units"))&
+							 (~self.field_mask("affordable_units", "isin", ["NA", "Exempt"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("total_units", "affordable_units"))
 	def v692_2(self):
 		"""
 		An invalid Multifamily Affordable Units was reported.
@@ -2534,9 +3288,10 @@ class rules_engine(object):
 		"""
 		field = "Affordable Units"
 		edit_name = "v692_2"
-		fail_df = self.lar_df[(self.lar_df.total_units.map(lambda x: int(x)<5))&(~self.lar_df.affordable_units.isin(["NA", "Exempt"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.lar_df.total_units.map(lambda x: int(x)<5))&(~self.field_mask("affordable_units", "isin", ["NA", "Exempt"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("total_units", "affordable_units"))
 	def v692_3(self):
 		"""
 		An invalid Multifamily Affordable Units was reported.
@@ -2547,10 +3302,10 @@ class rules_engine(object):
 		field = "Affordable Units"
 		edit_name = "v692_3"
 		fields = ["affordable_units", "total_units"]
-		fail_df = self.lar_df[~self.lar_df.affordable_units.isin(["Exempt", "NA"])]
-		fail_df = fail_df[fail_df.apply(lambda x: self.compare_nums(x, fields=fields), axis=1)==True]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~self.field_mask("affordable_units", "isin", ["Exempt", "NA"]))&(self.field_view("float", fields[0]) > self.field_view("float", fields[1]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_submission",))
 	def v693_1(self):
 		"""
 		An invalid Application Channel data field was reported.
@@ -2558,9 +3313,10 @@ class rules_engine(object):
 		"""
 		field = "Applicaiton Submission"
 		edit_name = "v693_1"
-		fail_df = self.lar_df[~(self.lar_df.app_submission.isin(("1111", "1", "2", "3")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("app_submission", "isin", ("1111", "1", "2", "3")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "app_submission"))
 	def v693_2(self):
 		"""
 		An invalid Application Channel data field was reported.
@@ -2568,9 +3324,10 @@ class rules_engine(object):
 		"""
 		field = "Applicaiton Channel"
 		edit_name = "v693_2"
-		fail_df = self.lar_df[((self.lar_df.action_taken=="6")&(~self.lar_df.app_submission.isin(["3", "1111"])))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_taken", "==", "6"))&(~self.field_mask("app_submission", "isin", ["3", "1111"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "app_submission"))
 	def v693_3(self):
 		"""
 		Impact of S2155: Update to: 
@@ -2578,9 +3335,10 @@ class rules_engine(object):
 		"""
 		field = "Application Channel"
 		edit_name = "v693_3"
-		fail_df = self.lar_df[((self.lar_df.app_submission=="3")&(self.lar_df.action_taken!="6"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("app_submission", "==", "3"))&(self.field_mask("action_taken", "!=", "6"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("initially_payable",))
 	def v694_1(self):
 		"""
 		An invalid Application Channel data field was reported.
@@ -2588,9 +3346,10 @@ class rules_engine(object):
 		"""
 		field = "initially_payable"
 		edit_name = "v694_1"
-		fail_df = self.lar_df[~(self.lar_df.initially_payable.isin(("1111", "1", "2", "3")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("initially_payable", "isin", ("1111", "1", "2", "3")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "initially_payable"))
 	def v694_2(self):
 		"""
 		An invalid Application Channel data field was reported.
@@ -2599,9 +3358,10 @@ class rules_engine(object):
 		"""
 		field = "initially_payable"
 		edit_name = "v694_2"
-		fail_df = self.lar_df[(self.lar_df.action_taken=="6")&(~self.lar_df.initially_payable.isin(["1111", "3"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_taken", "==", "6"))&(~self.field_mask("initially_payable", "isin", ["1111", "3"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "initially_payable"))
 	def v694_3(self):
 		"""
 		An invalid Application Channel data field was reported.
@@ -2610,9 +3370,10 @@ class rules_engine(object):
 		"""
 		field = "initially_payable"
 		edit_name = "v694_3"
-		fail_df = self.lar_df[(self.lar_df.action_taken=="1")&(~self.lar_df.initially_payable.isin(("1111", "1", "2")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_taken", "==", "1"))&(~self.field_mask("initially_payable", "isin", ("1111", "1", "2")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("mlo_id",))
 	def v695(self):
 		"""
 		An invalid NMLSR Identifier was reported.
@@ -2620,9 +3381,10 @@ class rules_engine(object):
 		"""
 		field = "NMLS ID"
 		edit_name = "v695"
-		fail_df = self.lar_df[(self.lar_df.mlo_id=="")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.field_mask("mlo_id", "==", "")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("aus_1", "aus_2", "aus_3", "aus_4", "aus_5"))
 	def v696_1(self):
 		"""
 		An invalid Automated Underwriting System data field was reported. 
@@ -2632,13 +3394,14 @@ class rules_engine(object):
 		"""
 		field = "AUS 1-5"
 		edit_name = "v696_1"
-		fail_df = self.lar_df[~(self.lar_df.aus_1.isin(("1111", "1", "2", "3", "4", "5", "6")))|
-			(~self.lar_df.aus_2.isin(("1", "2", "3", "4", "5","")))|
-			(~self.lar_df.aus_3.isin(("1", "2", "3", "4", "5","")))|
-			(~self.lar_df.aus_4.isin(("1", "2", "3", "4", "5","")))|
-			(~self.lar_df.aus_5.isin(("1", "2", "3", "4", "5","")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
-
+		fail_mask = (~(self.field_mask("aus_1", "isin", ("1111", "1", "2", "3", "4", "5", "6")))|
+			(~self.field_mask("aus_2", "isin", ("1", "2", "3", "4", "5","")))|
+			(~self.field_mask("aus_3", "isin", ("1", "2", "3", "4", "5","")))|
+			(~self.field_mask("aus_4", "isin", ("1", "2", "3", "4", "5","")))|
+			(~self.field_mask("aus_5", "isin", ("1", "2", "3", "4", "5",""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
+
+	@edit_rules.register(row_type="LAR", fields=("aus_result_1", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5"))
 	def v696_2(self):
 		"""
 		2) Automated Underwriting System Result: 1 must equal 1111, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14,
@@ -2655,10 +3418,11 @@ class rules_engine(object):
 		aus_n_results = ["1", "2", "3", "4", "5", "6", "7", 
 		"8", "9", "10", "11", "12", "13", "14", "15", "16", "17", "18", "19", "20",
 		"21", "22", "23","24", ""]
-		fail_df = self.lar_df[~(self.lar_df.aus_result_1.isin(aus_1_results))|(~self.lar_df.aus_result_2.isin(aus_n_results))|(~self.lar_df.aus_result_3.isin(aus_n_results))
-		|(~self.lar_df.aus_result_4.isin(aus_n_results))|(~self.lar_df.aus_result_5.isin(aus_n_results))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~(self.field_mask("aus_result_1", "isin", aus_1_results))|(~self.field_mask("aus_result_2", "isin", aus_n_results))|(~self.field_mask("aus_result_3", "isin", aus_n_results))
+		|(~self.field_mask("aus_result_4", "isin", aus_n_results))|(~self.field_mask("aus_result_5", "isin", aus_n_results)))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("aus_1", "aus_2", "aus_3", "aus_4", "aus_5", "aus_result_1", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5"))
 	def v696_3(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2671,10 +3435,11 @@ class rules_engine(object):
 		vals_1 = ("1111", "1", "2", "3", "4", "5", "6")
 		vals_2 = ("1111", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12", "13", "14", "15", 
 			"16", "17", "18", "19", "20", "21", "22", "23", "24")
-		fail_df = self.lar_df[(self.lar_df.apply(lambda x: self.check_counts(x, fields_1=fields_1, fields_2=fields_2, vals_1=vals_1, 
-			vals_2=vals_2),axis=1)==False)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.lar_df.apply(lambda x: self.check_counts(x, fields_1=fields_1, fields_2=fields_2, vals_1=vals_1, 
+			vals_2=vals_2),axis=1)==False)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("aus_1", "aus_2", "aus_3", "aus_4", "aus_5", "aus_result_1", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5"))
 	def v699(self):
 		"""
 		If Automated Underwriting System: 1; Automated Underwriting System: 2; Automated Underwriting
@@ -2688,13 +3453,14 @@ class rules_engine(object):
 		edit_name = "v699"
 		aus_results = ("1","2","3", "4", "5", "6", "7", "8", "9", "10", 
 			"11", "12","13", "14","15", "16", "18", "19", "20", "21", "22", "23", "24")
-		fail_df = self.lar_df[((self.lar_df.aus_1=="5")&(~self.lar_df.aus_result_1.isin(aus_results)))|
-			((self.lar_df.aus_2=="5")&(~self.lar_df.aus_result_2.isin(aus_results)))|
-			((self.lar_df.aus_3=="5")&(~self.lar_df.aus_result_3.isin(aus_results)))|
-			((self.lar_df.aus_4=="5")&(~self.lar_df.aus_result_4.isin(aus_results)))|
-			((self.lar_df.aus_5=="5")&(~self.lar_df.aus_result_5.isin(aus_results)))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
-
+		fail_mask = (((self.field_mask("aus_1", "==", "5"))&(~self.field_mask("aus_result_1", "isin", aus_results)))|
+			((self.field_mask("aus_2", "==", "5"))&(~self.field_mask("aus_result_2", "isin", aus_results)))|
+			((self.field_mask("aus_3", "==", "5"))&(~self.field_mask("aus_result_3", "isin", aus_results)))|
+			((self.field_mask("aus_4", "==", "5"))&(~self.field_mask("aus_result_4", "isin", aus_results)))|
+			((self.field_mask("aus_5", "==", "5"))&(~self.field_mask("aus_result_5", "isin", aus_results))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
+
+	@edit_rules.register(row_type="LAR", fields=("aus_1", "aus_2", "aus_3", "aus_4", "aus_5", "aus_result_1", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5"))
 	def v700_1(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2705,11 +3471,12 @@ class rules_engine(object):
 		"""
 		field = "AUS and Results"
 		edit_name = "v700_1"
-		fail_df = self.lar_df[(self.lar_df.aus_1=="6")&((self.lar_df.aus_result_1!="17")|(self.lar_df.aus_result_2!="")|(self.lar_df.aus_result_3!="")|
-			(self.lar_df.aus_result_4!="")|(self.lar_df.aus_result_5!="")|(self.lar_df.aus_2!="")|(self.lar_df.aus_3!="")|(self.lar_df.aus_3!="")|
-			(self.lar_df.aus_4!="")|(self.lar_df.aus_5!=""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("aus_1", "==", "6"))&((self.field_mask("aus_result_1", "!=", "17"))|(self.field_mask("aus_result_2", "!=", ""))|(self.field_mask("aus_result_3", "!=", ""))|
+			(self.field_mask("aus_result_4", "!=", ""))|(self.field_mask("aus_result_5", "!=", ""))|(self.field_mask("aus_2", "!=", ""))|(self.field_mask("aus_3", "!=", ""))|(self.field_mask("aus_3", "!=", ""))|
+			(self.field_mask("aus_4", "!=", ""))|(self.field_mask("aus_5", "!=", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("aus_1", "aus_2", "aus_3", "aus_4", "aus_5", "aus_result_1", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5"))
 	def v700_2(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2720,11 +3487,12 @@ class rules_engine(object):
 		"""
 		field = "AUS and Results"
 		edit_name = "v700_2"
-		fail_df = self.lar_df[(self.lar_df.aus_result_1=="17")&((self.lar_df.aus_1!="6")|(self.lar_df.aus_result_2!="")|(self.lar_df.aus_result_3!="")|
-			(self.lar_df.aus_result_4!="")|(self.lar_df.aus_result_5!="")|(self.lar_df.aus_2!="")|(self.lar_df.aus_3!="")|(self.lar_df.aus_3!="")|
-			(self.lar_df.aus_4!="")|(self.lar_df.aus_5!=""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("aus_result_1", "==", "17"))&((self.field_mask("aus_1", "!=", "6"))|(self.field_mask("aus_result_2", "!=", ""))|(self.field_mask("aus_result_3", "!=", ""))|
+			(self.field_mask("aus_result_4", "!=", ""))|(self.field_mask("aus_result_5", "!=", ""))|(self.field_mask("aus_2", "!=", ""))|(self.field_mask("aus_3", "!=", ""))|(self.field_mask("aus_3", "!=", ""))|
+			(self.field_mask("aus_4", "!=", ""))|(self.field_mask("aus_5", "!=", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("aus_2", "aus_3", "aus_4", "aus_5", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5"))
 	def v701(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2735,12 +3503,13 @@ class rules_engine(object):
 		"""
 		field = "AUS and Results"
 		edit_name = "v701"
-		fail_df = self.lar_df[((self.lar_df.aus_2=="")&(self.lar_df.aus_result_2!=""))|
-			((self.lar_df.aus_3=="")&(self.lar_df.aus_result_3!=""))|
-			((self.lar_df.aus_4=="")&(self.lar_df.aus_result_4!=""))|
-			((self.lar_df.aus_5=="")&(self.lar_df.aus_result_5!=""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("aus_2", "==", ""))&(self.field_mask("aus_result_2", "!=", "")))|
+			((self.field_mask("aus_3", "==", ""))&(self.field_mask("aus_result_3", "!=", "")))|
+			((self.field_mask("aus_4", "==", ""))&(self.field_mask("aus_result_4", "!=", "")))|
+			((self.field_mask("aus_5", "==", ""))&(self.field_mask("aus_result_5", "!=", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("aus_1", "aus_2", "aus_3", "aus_4", "aus_5", "aus_code_5"))
 	def v702_1(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2750,10 +3519,11 @@ class rules_engine(object):
 		"""
 		field = "AUS"
 		edit_name = "v702_1"
-		fail_df = self.lar_df[((self.lar_df.aus_1=="5")|(self.lar_df.aus_2=="5")|(self.lar_df.aus_3=="5")|(self.lar_df.aus_4=="5")|(self.lar_df.aus_5=="5"))&
-			(self.lar_df.aus_code_5=="")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("aus_1", "==", "5"))|(self.field_mask("aus_2", "==", "5"))|(self.field_mask("aus_3", "==", "5"))|(self.field_mask("aus_4", "==", "5"))|(self.field_mask("aus_5", "==", "5")))&
+			(self.field_mask("aus_code_5", "==", "")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("aus_1", "aus_2", "aus_3", "aus_4", "aus_5", "aus_code_5"))
 	def v702_2(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2763,10 +3533,11 @@ class rules_engine(object):
 		"""
 		field = "AUS"
 		edit_name = "v702_2"
-		fail_df = self.lar_df[((self.lar_df.aus_1!="5")&(self.lar_df.aus_2!="5")&(self.lar_df.aus_3!="5")&(self.lar_df.aus_4!="5")&(self.lar_df.aus_5!="5"))&
-			(self.lar_df.aus_code_5!="")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("aus_1", "!=", "5"))&(self.field_mask("aus_2", "!=", "5"))&(self.field_mask("aus_3", "!=", "5"))&(self.field_mask("aus_4", "!=", "5"))&(self.field_mask("aus_5", "!=", "5")))&
+			(self.field_mask("aus_code_5", "!=", "")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("aus_result_1", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5", "aus_code_16"))
 	def v703_1(self):
 		"""
 		An invalid Automated Underwriting System Result data field was reported.
@@ -2776,10 +3547,11 @@ class rules_engine(object):
 		"""
 		field = "AUS Results"
 		edit_name = "v703_1"
-		fail_df = self.lar_df[((self.lar_df.aus_result_1=="16")|(self.lar_df.aus_result_2=="16")|(self.lar_df.aus_result_3=="16")|
-			(self.lar_df.aus_result_4=="16")|(self.lar_df.aus_result_5=="16"))&(self.lar_df.aus_code_16=="")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("aus_result_1", "==", "16"))|(self.field_mask("aus_result_2", "==", "16"))|(self.field_mask("aus_result_3", "==", "16"))|
+			(self.field_mask("aus_result_4", "==", "16"))|(self.field_mask("aus_result_5", "==", "16")))&(self.field_mask("aus_code_16", "==", "")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("aus_result_1", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5", "aus_code_16"))
 	def v703_2(self):
 		"""
 		An invalid Automated Underwriting System Result data field was reported.
@@ -2789,10 +3561,11 @@ class rules_engine(object):
 		"""
 		field = "AUS Results"
 		edit_name = "v703_2"
-		fail_df = self.lar_df[(self.lar_df.aus_code_16!="")&((self.lar_df.aus_result_1!="16")&(self.lar_df.aus_result_2!="16")&
-			(self.lar_df.aus_result_3!="16")&(self.lar_df.aus_result_4!="16")&(self.lar_df.aus_result_5!="16"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("aus_code_16", "!=", ""))&((self.field_mask("aus_result_1", "!=", "16"))&(self.field_mask("aus_result_2", "!=", "16"))&
+			(self.field_mask("aus_result_3", "!=", "16"))&(self.field_mask("aus_result_4", "!=", "16"))&(self.field_mask("aus_result_5", "!=", "16"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "aus_1"))
 	def v704_1(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2800,9 +3573,10 @@ class rules_engine(object):
 		"""
 		field = "AUS"
 		edit_name = "v704_1"
-		fail_df = self.lar_df[(self.lar_df.action_taken=="6")&(~self.lar_df.aus_1.isin(["6", "1111"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_taken", "==", "6"))&(~self.field_mask("aus_1", "isin", ["6", "1111"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "aus_result_1"))
 	def v704_2(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2811,9 +3585,10 @@ class rules_engine(object):
 		"""
 		field = "AUS Result"
 		edit_name = "v704_2"
-		fail_df = self.lar_df[(self.lar_df.action_taken=="6")&(~self.lar_df.aus_result_1.isin(["17", "1111"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_taken", "==", "6"))&(~self.field_mask("aus_result_1", "isin", ["17", "1111"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_eth_1", "co_app_eth_1", "app_race_1", "co_app_race_1", "app_sex", "co_app_sex", "aus_1", "aus_result_1"))
 	def v705_1(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2826,11 +3601,12 @@ class rules_engine(object):
 		"""
 		field = "AUS and Results"
 		edit_name = "v705_1"
-		fail_df = self.lar_df[((self.lar_df.app_eth_1=="4")&(self.lar_df.app_race_1=="7")&(self.lar_df.app_sex=="4"))&
-			((self.lar_df.co_app_eth_1=="5")&(self.lar_df.co_app_race_1=="8")&(self.lar_df.co_app_sex=="5"))&
-			((~self.lar_df.aus_1.isin(["1111","6"]))|(~self.lar_df.aus_result_1.isin(["17", "1111"])))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("app_eth_1", "==", "4"))&(self.field_mask("app_race_1", "==", "7"))&(self.field_mask("app_sex", "==", "4")))&
+			((self.field_mask("co_app_eth_1", "==", "5"))&(self.field_mask("co_app_race_1", "==", "8"))&(self.field_mask("co_app_sex", "==", "5")))&
+			((~self.field_mask("aus_1", "isin", ["1111","6"]))|(~self.field_mask("aus_result_1", "isin", ["17", "1111"]))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_eth_1", "co_app_eth_1", "app_race_1", "co_app_race_1", "app_sex", "co_app_sex", "aus_1", "aus_result_1"))
 	def v705_2(self):
 		"""
 		An invalid Automated Underwriting System data field was reported.
@@ -2844,11 +3620,12 @@ class rules_engine(object):
 		"""
 		field = "AUS and Results"
 		edit_name = "v705_2"
-		fail_df = self.lar_df[((self.lar_df.app_eth_1=="4")&(self.lar_df.app_race_1=="7")&(self.lar_df.app_sex=="4"))&
-			((self.lar_df.co_app_eth_1=="4")&(self.lar_df.co_app_race_1=="7")&(self.lar_df.co_app_sex=="4"))&
-			((~self.lar_df.aus_1.isin(["6", "1111"]))|(~self.lar_df.aus_result_1.isin(["17","1111"])))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("app_eth_1", "==", "4"))&(self.field_mask("app_race_1", "==", "7"))&(self.field_mask("app_sex", "==", "4")))&
+			((self.field_mask("co_app_eth_1", "==", "4"))&(self.field_mask("co_app_race_1", "==", "7"))&(self.field_mask("co_app_sex", "==", "4")))&
+			((~self.field_mask("aus_1", "isin", ["6", "1111"]))|(~self.field_mask("aus_result_1", "isin", ["17","1111"]))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("reverse_mortgage",))
 	def v706(self):
 		"""
 		An invalid Reverse Mortgage was reported.
@@ -2856,9 +3633,10 @@ class rules_engine(object):
 		"""
 		field = "Reverse Mortgage"
 		edit_name = "v706"
-		fail_df = self.lar_df[~(self.lar_df.reverse_mortgage.isin(("1111", "1", "2")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("reverse_mortgage", "isin", ("1111", "1", "2")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("open_end_credit",))
 	def v707(self):
 		"""
 		An invalid Open-End Line of Credit was reported.
@@ -2867,9 +3645,10 @@ class rules_engine(object):
 		"""
 		field = "Open End Credit"
 		edit_name = "v707"
-		fail_df = self.lar_df[~(self.lar_df.open_end_credit.isin(("1111", "1", "2")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("open_end_credit", "isin", ("1111", "1", "2")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("business_purpose",))
 	def v708(self):
 		"""
 		An invalid Business or Commercial Purpose was reported.
@@ -2878,9 +3657,10 @@ class rules_engine(object):
 		"""
 		field = "Business Purpose"
 		edit_name = "v708"
-		fail_df = self.lar_df[~(self.lar_df.business_purpose.isin(("1111", "1", "2")))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ~(self.field_mask("business_purpose", "isin", ("1111", "1", "2")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("street_address", "city", "zip_code"))
 	def v709(self):
 		"""
 		An invalid Property Address was reported. Please review the information below and update your file accordingly.
@@ -2889,10 +3669,11 @@ class rules_engine(object):
 
 		field = "Property Address"
 		edit_name = "v709"
-		fail_df = self.lar_df[((self.lar_df.street_address == "Exempt")|(self.lar_df.city == "Exempt")|(self.lar_df.zip_code == "Exempt")) &
-			((self.lar_df.street_address != "Exempt") | (self.lar_df.city != "Exempt") | (self.lar_df.zip_code != "Exempt"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("street_address", "==", "Exempt"))|(self.field_mask("city", "==", "Exempt"))|(self.field_mask("zip_code", "==", "Exempt"))) &
+			((self.field_mask("street_address", "!=", "Exempt")) | (self.field_mask("city", "!=", "Exempt")) | (self.field_mask("zip_code", "!=", "Exempt"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_credit_score", "co_app_credit_score", "app_score_name", "co_app_score_name"))
 	def v710_1(self):
 		"""
 		If the Credit Score exemption election is taken:
@@ -2903,10 +3684,11 @@ class rules_engine(object):
 		""" 
 		field = "Credit Score"
 		edit_name = "v710_1"
-		fail_df = self.lar_df[(self.lar_df.app_credit_score == "1111") & ((self.lar_df.co_app_credit_score !="1111") |
-				(self.lar_df.app_score_name != "1111") | (self.lar_df.co_app_score_name != "1111"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("app_credit_score", "==", "1111")) & ((self.field_mask("co_app_credit_score", "!=", "1111")) |
+				(self.field_mask("app_score_name", "!=", "1111")) | (self.field_mask("co_app_score_name", "!=", "1111"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 	
+	@edit_rules.register(row_type="LAR", fields=("app_credit_score", "app_score_name", "app_score_code_8", "co_app_score_name", "co_app_score_code_8"))
 	def v710_2(self):
 		"""
 		If the Credit Score exemption election is taken:
@@ -2917,10 +3699,11 @@ class rules_engine(object):
 		"""
 		field = "Credit Score"
 		edit_name = "v710_2"
-		fail_df = self.lar_df[(self.lar_df.app_credit_score == "1111") & ((self.lar_df.app_score_name != "") |
-				(self.lar_df.app_score_code_8 != "") | (self.lar_df.co_app_score_name != "") | (self.lar_df.co_app_score_code_8 != ""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("app_credit_score", "==", "1111")) & ((self.field_mask("app_score_name", "!=", "")) |
+				(self.field_mask("app_score_code_8", "!=", "")) | (self.field_mask("co_app_score_name", "!=", "")) | (self.field_mask("co_app_score_code_8", "!=", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("denial_1", "denial_2", "denial_3", "denial_4", "denial_code_9"))
 	def v711(self):
 		"""
 		1) If the Reason for Denial exemption election is taken, Reason for Denial: 1 must be reported 1111;
@@ -2931,20 +3714,22 @@ class rules_engine(object):
 
 		field = "Reason for Denial"
 		edit_name = "v711"
-		fail_df = self.lar_df[(self.lar_df.denial_1 == "1111") & ((self.lar_df.denial_2 != "") | (self.lar_df.denial_3 != "")
-					| (self.lar_df.denial_4 != "") | (self.lar_df.denial_code_9 != ""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("denial_1", "==", "1111")) & ((self.field_mask("denial_2", "!=", "")) | (self.field_mask("denial_3", "!=", ""))
+					| (self.field_mask("denial_4", "!=", "")) | (self.field_mask("denial_code_9", "!=", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_costs", "points_fees"))
 	def v712(self):
 		"""
 		1) If the Total Loan Costs or Total Points and Fees exemption election is taken, Total Loan Costs and Total Points and Fees must be reported Exempt.
 		"""
 		field = "Total Loan Costs/Points and Fees"
 		edit_name = "v712"
-		fail_df = self.lar_df[((self.lar_df.loan_costs == "Exempt") | (self.lar_df.points_fees == "Exempt")) & ((self.lar_df.loan_costs != "Exempt")
-					| (self.lar_df.points_fees != "Exempt"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("loan_costs", "==", "Exempt")) | (self.field_mask("points_fees", "==", "Exempt"))) & ((self.field_mask("loan_costs", "!=", "Exempt"))
+					| (self.field_mask("points_fees", "!=", "Exempt"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("aus_1", "aus_result_1"))
 	def v713_1(self):
 		"""
 		If the Automated Underwriting System exemption election is taken,
@@ -2952,9 +3737,10 @@ class rules_engine(object):
 		"""
 		field = "Automated Underwriting System"
 		edit_name = "v713_1"
-		fail_df = self.lar_df[(self.lar_df.aus_1 == "1111") & (self.lar_df.aus_result_1 != "1111")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("aus_1", "==", "1111")) & (self.field_mask("aus_result_1", "!=", "1111"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 	
+	@edit_rules.register(row_type="LAR", fields=("aus_1", "aus_2", "aus_3", "aus_4", "aus_5", "aus_code_5", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5", "aus_code_16"))
 	def v713_2(self):
 		"""
 		If the Automated Underwriting System exemptionmelection is taken,
@@ -2967,21 +3753,23 @@ class rules_engine(object):
 		"""
 		field = "Automated Underwriting System"
 		edit_name = "v713_2"
-		fail_df = self.lar_df[(self.lar_df.aus_1 == "1111") & ((self.lar_df.aus_2 != "") | (self.lar_df.aus_3 != "") | (self.lar_df.aus_4 != "") | 
-			(self.lar_df.aus_5 != "") | (self.lar_df.aus_code_5 != "") | (self.lar_df.aus_result_2 != "") | (self.lar_df.aus_result_3 != "") 
-			| (self.lar_df.aus_result_4 != "") | (self.lar_df.aus_result_5 != "") | (self.lar_df.aus_code_16 != ""))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("aus_1", "==", "1111")) & ((self.field_mask("aus_2", "!=", "")) | (self.field_mask("aus_3", "!=", "")) | (self.field_mask("aus_4", "!=", "")) | 
+			(self.field_mask("aus_5", "!=", "")) | (self.field_mask("aus_code_5", "!=", "")) | (self.field_mask("aus_result_2", "!=", "")) | (self.field_mask("aus_result_3", "!=", "")) 
+			| (self.field_mask("aus_result_4", "!=", "")) | (self.field_mask("aus_result_5", "!=", "")) | (self.field_mask("aus_code_16", "!=", ""))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_submission", "initially_payable"))
 	def v714(self):
 		"""
 		1) If the Application Channel exemption election isntaken, Submission of Application and Initially Payable to Your Institution must be reported 1111.
 		"""
 		field = "Application Channel"
 		edit_name = "v714"
-		fail_df = self.lar_df[((self.lar_df.app_submission == "1111") | (self.lar_df.initially_payable == "1111")) &
-		((self.lar_df.app_submission != "1111") | (self.lar_df.initially_payable != "1111"))]  
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (((self.field_mask("app_submission", "==", "1111")) | (self.field_mask("initially_payable", "==", "1111"))) &
+		((self.field_mask("app_submission", "!=", "1111")) | (self.field_mask("initially_payable", "!=", "1111"))))  
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 	
+	@edit_rules.register(row_type="LAR", fields=("balloon", "int_only_pmts", "neg_amort", "non_amort_features"))
 	def v715(self):
 		"""
 		1) If the Non-Amortizing Features exemption electionn is taken, Balloon Payment, Interest-Only Payments,
@@ -2989,15 +3777,16 @@ class rules_engine(object):
 		"""
 		field = "Non-Amortizing Features"
 		edit_name = "v715"
-		fail_df = self.lar_df[(
-			(self.lar_df.non_amort_features == "1111") | (self.lar_df.balloon == "1111") | (self.lar_df.int_only_pmts == "1111")|
-			(self.lar_df.neg_amort == "1111")) 
-			& ((self.lar_df.balloon != "1111") 
-			| (self.lar_df.int_only_pmts != "1111") 
-			| (self.lar_df.neg_amort != "1111") 
-			| (self.lar_df.non_amort_features != "1111"))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
-
+		fail_mask = ((
+			(self.field_mask("non_amort_features", "==", "1111")) | (self.field_mask("balloon", "==", "1111")) | (self.field_mask("int_only_pmts", "==", "1111"))|
+			(self.field_mask("neg_amort", "==", "1111"))) 
+			& ((self.field_mask("balloon", "!=", "1111")) 
+			| (self.field_mask("int_only_pmts", "!=", "1111")) 
+			| (self.field_mask("neg_amort", "!=", "1111")) 
+			| (self.field_mask("non_amort_features", "!=", "1111"))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
+
+	@edit_rules.register(row_type="LAR", fields=("state", "county"))
 	def v716(self):
 		"""
 		The reported State and County are not a valid combination. If neither State nor County were
@@ -3007,12 +3796,12 @@ class rules_engine(object):
 		field = "state, county"
 		#note state is a 2 letter code, county is a length 5 string of numerals
 
-		fail_df = self.lar_df.copy()
-		#set state letter codes based on first 2 county digits
-		fail_df["state_from_county"] = fail_df.apply(lambda x: self.state_codes_rev[x.county[:2]], axis=1)
-		fail_df = fail_df[fail_df.state!=fail_df.state_from_county]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		#set state letter codes based on first 2 county digits, counties with unknown state codes fail
+		state_from_county = self.lar_df.county.astype(str).str[:2].map(self.state_codes_rev)
+		fail_mask = (self.field_mask("state", "!=", "NA"))&(self.field_mask("county", "!=", "NA"))&(self.lar_df.state!=state_from_county)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="TS")
 	def v717(self):
 		"""
 		The required format for the Contact Person’s Email Address is name@example.com, and it cannot be left blank.
@@ -3023,36 +3812,42 @@ class rules_engine(object):
 		fail_df = self.ts_df[~self.ts_df.contact_email.apply(lambda x: "@" in x and "." in x)]
 		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df, row_type="TS")
 
+	@edit_rules.register(row_type="LAR", fields=("uli",), file_level=True)
 	def q600(self):
 		"""
 		1) A duplicate ULI was reported. 
 		"""
 		field = "ULI"
 		edit_name = "q600"
-		fail_df = self.lar_df[self.lar_df.duplicated(keep=False, subset='uli')==True]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.duplicate_mask(["uli"])
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_date", "action_date"))
 	def q601(self):
 		"""
 		1) Application Date occurs more than two years prior to Action Taken Date. 
 		"""
 		field = "Application Date"
 		edit_name = "q601"
-		fail_df = self.lar_df[self.lar_df.app_date!="NA"].copy()
-		#true return in years_between() indicates that the delta between years is greater than threshold
-		fail_df = fail_df[fail_df.apply(lambda x: self.years_between(x.app_date, x.action_date, thresh=2.0)==True, axis=1)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
-
+		app_dates = self.parsed_dates("app_date")
+		action_dates = self.parsed_dates("action_date")
+		#rows fail if the delta between dates is greater than 2 years or if either date is invalid
+		delta_years = (action_dates - app_dates).dt.days.abs() / 365
+		fail_mask = (self.field_mask("app_date", "!=", "NA"))&((delta_years > 2.0)|(app_dates.isna())|(action_dates.isna()))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
+
+	@edit_rules.register(row_type="LAR", fields=("street_address", "city", "state", "zip_code"))
 	def q602(self):
 		"""
 		Street Address was reported NA, however City, State and Zip Code were provided. 
 		"""
 		field = "Street Address"
 		edit_name = "q602"
-		fail_df = self.lar_df[(self.lar_df.street_address=="NA")&
-			(self.lar_df.city!="NA")&(self.lar_df.state!="NA")&(self.lar_df.zip_code!="NA")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("street_address", "==", "NA"))&
+			(self.field_mask("city", "!=", "NA"))&(self.field_mask("state", "!=", "NA"))&(self.field_mask("zip_code", "!=", "NA")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("county", "tract"))
 	def q603(self):
 		"""
 		1) The County has a population of greater than 30,000 according to the most recent decennial census and
@@ -3060,37 +3855,40 @@ class rules_engine(object):
 		"""
 		field = "County/Census Tract"
 		edit_name = "q603"
-		fail_df = self.lar_df[(self.lar_df.tract=="NA")&(~self.lar_df.county.isin(self.geographic_data[self.geographic_data.small_county=="1"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("tract", "==", "NA"))&(self.lar_df.county.isin(self.geo.big_counties))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_type", "purchaser_type"))
 	def q605_1(self):
 		"""
 		If Type of Purchaser equals 1 or 3, then Loan Type generally should equal 1.
 		"""
 		field = "Purchaser Type"
 		edit_name = "q605_1"
-		fail_df = self.lar_df[(self.lar_df.purchaser_type.isin(["1","3"]))&(self.lar_df.loan_type!="1")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("purchaser_type", "isin", ["1","3"]))&(self.field_mask("loan_type", "!=", "1"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_type", "purchaser_type"))
 	def q605_2(self):
 		"""
 		If Type of Purchaser equals 2, then Loan Type generally should equal 2, 3 or 4.
 		"""
 		field = "Purhaser Type"
 		edit_name = "q605_2"
-		fail_df = self.lar_df[(self.lar_df.purchaser_type=="2")&(~self.lar_df.loan_type.isin(["2", "3", "4"]))].copy()
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("purchaser_type", "==", "2"))&(~self.field_mask("loan_type", "isin", ["2", "3", "4"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("income",))
 	def q606(self):
 		"""
 		If Income is a number, then it generally should be less than $10 million (entered as 10000).
 		"""
 		field = "Income"
 		edit_name = "q606"
-		fail_df = self.lar_df[(self.lar_df.income!="NA")].copy()
-		fail_df = fail_df[(fail_df.income.apply(lambda x: float(x)>=10000))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.masked_apply(self.field_mask("income", "!=", "NA"), lambda x: float(x)>=10000, "income")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_amount", "lien"))
 	def q607(self):
 		"""
 		If Lien Status equals 2, 
@@ -3098,19 +3896,20 @@ class rules_engine(object):
 		"""
 		field = "Loan Amount/Lien Status"
 		edit_name = "q607"
-		fail_df = self.lar_df[(self.lar_df.loan_amount!="NA")].copy()
-		fail_df = fail_df[(fail_df.lien=="2")&(fail_df.loan_amount.apply(lambda x: int(x)>250000))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("lien", "==", "2"))&self.masked_apply(self.field_mask("loan_amount", "!=", "NA"), lambda x: int(x)>250000, "loan_amount")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_date", "action_taken", "action_date"))
 	def q608(self):
 		"""
 		If Action Taken equals 1, then the Action Taken Date generally should occur after the Application Date.
 		"""
 		field = "Action Taken/Action Taken Date/Application Date"
 		edit_name = "q608"
-		fail_df = self.lar_df[(self.lar_df.action_taken=="1")&(self.lar_df.action_date <= self.lar_df.app_date)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_taken", "==", "1"))&(self.lar_df.action_date <= self.lar_df.app_date)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("purchaser_type", "rate_spread"))
 	def q609(self):
 		"""
 		1) If Type of Purchaser equals 1, 2, 3, or 4, 
@@ -3118,10 +3917,11 @@ class rules_engine(object):
 		"""
 		field = "Purchaser Type/Rate Spread"
 		edit_name = "q609"
-		fail_df = self.lar_df[(~self.lar_df.rate_spread.isin(["NA", "Exempt",""]))].copy()
-		fail_df = fail_df[fail_df.purchaser_type.isin(["1","2","3","4"])&(fail_df.rate_spread.apply(lambda x: float(x)>10))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)	
+		fail_mask = (self.field_mask("purchaser_type", "isin", ["1","2","3","4"])&
+			self.masked_apply(~self.field_mask("rate_spread", "isin", ["NA", "Exempt",""]), lambda x: float(x)>10, "rate_spread"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)	
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "rate_spread", "hoepa", "lien"))
 	def q610(self):
 		"""
 		If Action Taken equals 1, Lien Status equals 1, and Rate Spread is greater than 6.5%, 
@@ -3129,11 +3929,11 @@ class rules_engine(object):
 		"""
 		field = "Action Taken/Lien Status/Rate Spread/HOEPA Status"
 		edit_name = "q610"
-		fail_df = self.lar_df[~self.lar_df.rate_spread.isin(["NA", "Exempt", ""])].copy()
-		fail_df = fail_df[(fail_df.action_taken=="1")&(fail_df.lien=="1")&
-			(fail_df.rate_spread.apply(lambda x: float(x)>6.5))&(fail_df.hoepa!="1")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("action_taken", "==", "1"))&(self.field_mask("lien", "==", "1"))&
+			self.masked_apply(~self.field_mask("rate_spread", "isin", ["NA", "Exempt", ""]), lambda x: float(x)>6.5, "rate_spread")&(self.field_mask("hoepa", "!=", "1")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "rate_spread", "hoepa", "lien"))
 	def q611(self):
 		"""
 		If Action Taken equals 1, Lien Status equals 2, and Rate Spread is greater than 8.5%, 
@@ -3141,30 +3941,32 @@ class rules_engine(object):
 		"""
 		field = "Action Taken, Lien Status, Rate Spread/HOEPA Status"
 		edit_name = "q611"
-		fail_df = self.lar_df[~self.lar_df.rate_spread.isin(["NA", "Exempt", ""])]
-		fail_df = fail_df[(fail_df.action_taken=="1")&(fail_df.lien=="2")&(fail_df.hoepa!="1")&
-			(fail_df.rate_spread.apply(lambda x: float(x)>8.5))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("action_taken", "==", "1"))&(self.field_mask("lien", "==", "2"))&(self.field_mask("hoepa", "!=", "1"))&
+			self.masked_apply(~self.field_mask("rate_spread", "isin", ["NA", "Exempt", ""]), lambda x: float(x)>8.5, "rate_spread"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("purchaser_type", "hoepa"))
 	def q612(self):
 		"""
 		If Type of Purchaser equals 1 or 3, then HOEPA Status generally should be 2 or 3.
 		"""
 		field = "Type of Purchaser/HOEPA Status"
 		edit_name = "q612"
-		fail_df = self.lar_df[(self.lar_df.purchaser_type.isin(["1", "3"]))&
-		(~self.lar_df.hoepa.isin(["2","3"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("purchaser_type", "isin", ["1", "3"]))&
+		(~self.field_mask("hoepa", "isin", ["2","3"])))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 		
+	@edit_rules.register(row_type="LAR", fields=("loan_purpose", "business_purpose"))
 	def q613(self):
 		"""
 		If Business or Commercial Purpose equals 1, then Loan Purpose generally should equal 1, 2, 31, 32, or 5.
 		"""
 		field = "Business or Commercial Purpose/Loan Purpose"
 		edit_name = "q613"
-		fail_df = self.lar_df[(self.lar_df.business_purpose=="1")&(~self.lar_df.loan_purpose.isin(["1","2","31","32","5"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("business_purpose", "==", "1"))&(~self.field_mask("loan_purpose", "isin", ["1","2","31","32","5"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_age",))
 	def q614_1(self):
 		"""
 		The Age of Applicant or Borrower generally should be between 18 and 100 unless the Age of Applicant or Borrower 
@@ -3172,11 +3974,10 @@ class rules_engine(object):
 		"""
 		field = "Age of Applicant or Borrower"
 		edit_name = "q614_1"
-		fail_df = self.lar_df[self.lar_df.app_age!="NA"].copy()
-		fail_df = fail_df[fail_df.app_age!="8888"]
-		fail_df = fail_df[~(fail_df.app_age.apply(lambda x: 18 <= int(x) <= 100))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.masked_apply((self.field_mask("app_age", "!=", "NA"))&(self.field_mask("app_age", "!=", "8888")), lambda x: not 18 <= int(x) <= 100, "app_age")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_age",))
 	def q614_2(self):
 		"""
 		The Age of Co-Applicant or Co-Borrower generally should be between 18 and 100 unless the Age of CoApplicant 
@@ -3184,11 +3985,10 @@ class rules_engine(object):
 		"""
 		field = "Age of Co Applicant or Co Borrower"
 		edit_name = "q614_2"
-		fail_df = self.lar_df[self.lar_df.co_app_age!="NA"].copy()
-		fail_df = fail_df[fail_df.co_app_age!="8888"]
-		fail_df = fail_df[~(fail_df.co_app_age.apply(lambda x: 18 <= int(x) <= 100))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.masked_apply((self.field_mask("co_app_age", "!=", "NA"))&(self.field_mask("co_app_age", "!=", "8888")), lambda x: not 18 <= int(x) <= 100, "co_app_age")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_costs", "origination_fee"))
 	def q615_1(self):
 		"""
 		1) If Total Loan Costs and Origination Charges are not reported NA or Exempt, 
@@ -3196,10 +3996,11 @@ class rules_engine(object):
 		"""
 		field = "Origination Charges/Total Loan Costs/Total Points and Fees"
 		edit_name = "q615_1"
-		fail_df = self.lar_df[(~self.lar_df.origination_fee.isin(["NA", "Exempt"]))&(~self.lar_df.loan_costs.isin(["NA", "Exempt"]))].copy()
-		fail_df = fail_df[(fail_df.loan_costs<fail_df.origination_fee)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((~self.field_mask("origination_fee", "isin", ["NA", "Exempt"]))&(~self.field_mask("loan_costs", "isin", ["NA", "Exempt"]))&
+			(self.lar_df.loan_costs<self.lar_df.origination_fee))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("points_fees", "origination_fee"))
 	def q615_2(self):
 		"""
 		2) If Total Points and Fees and Origination Charges are not reported NA or Exempt, then Total Points and Fees
@@ -3207,17 +4008,14 @@ class rules_engine(object):
 		"""
 		field = "Origination Charges/Total Loan Costs/Total Points and Fees"
 		edit_name = "q615_2"
-		fail_df = self.lar_df[(~self.lar_df.origination_fee.isin(["NA", "Exempt", ""]))&
-							  (~self.lar_df.points_fees.isin(["NA", "Exempt"]))].copy()
-		#remove blanks to allow float conversion in failure test
-		blanks = fail_df[fail_df.points_fees.isin([""])].copy()
-		fail_df = fail_df[~fail_df.points_fees.isin([""])]
-		fail_df.origination_fee = fail_df.origination_fee.apply(lambda x: float(x))
-		fail_df.points_fees = fail_df.points_fees.apply(lambda x: float(x))
-		fail_df = fail_df[fail_df.points_fees < fail_df.origination_fee]
-		fail_df = pd.concat([fail_df, blanks]) #add blanks back to fail_df for results reporting
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
-
+		checked = (~self.field_mask("origination_fee", "isin", ["NA", "Exempt", ""]))&(~self.field_mask("points_fees", "isin", ["NA", "Exempt"]))
+		#blank points and fees fail, other values are converted to float in the failure test
+		blanks = checked&(self.field_mask("points_fees", "==", ""))
+		fail_mask = blanks|self.masked_apply(checked&~blanks, lambda points_fees, origination_fee: float(points_fees) < float(origination_fee),
+			"points_fees", "origination_fee")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
+
+	@edit_rules.register(row_type="LAR", fields=("loan_costs", "discount_points"))
 	def q616_1(self):
 		"""
 		1) If Total Loan Costs and Discount Points are not reported NA or Exempt, 
@@ -3225,17 +4023,11 @@ class rules_engine(object):
 		"""
 		field = "Discount Points; Total Loan Costs; Total Points and Fees"
 		edit_name = "q616_1"
-		fail_df = self.lar_df[(~self.lar_df.loan_costs.isin(["NA", "Exempt"]))&
-				(~self.lar_df.discount_points.isin(["NA", "Exempt"]))].copy()
-		
-		#fail_df.loan_costs = fail_df.loan_costs.map({"": 0.0})
-		#fail_df.discount_points = fail_df.discount_points.map({"": 0.0})
-
-		fail_df.loan_costs = fail_df.loan_costs.apply(lambda x: float(x))
-		fail_df.discount_points = fail_df.discount_points.apply(lambda x: float(x))
-		fail_df = fail_df[(fail_df.loan_costs<fail_df.discount_points)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.masked_apply((~self.field_mask("loan_costs", "isin", ["NA", "Exempt"]))&(~self.field_mask("discount_points", "isin", ["NA", "Exempt"])),
+			lambda loan_costs, discount_points: float(loan_costs) < float(discount_points), "loan_costs", "discount_points")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("points_fees", "discount_points"))
 	def q616_2(self):
 		"""
 		2) If Total Points and Fees and Discount Points are not reported NA or Exempt, 
@@ -3243,17 +4035,14 @@ class rules_engine(object):
 		"""
 		field = "Discount Points; Total Loan Costs; Total Points and Fees"
 		edit_name = "q616_2"
-		fail_df = self.lar_df[(~self.lar_df.points_fees.isin(["Exempt", "NA"]))&
-							  (~self.lar_df.discount_points.isin(["NA", "Exempt"]))].copy()
-		#remove blanks to allow float conversion in failure test
-		blanks = fail_df[fail_df.points_fees.isin([""])].copy()
-		fail_df = fail_df[~fail_df.points_fees.isin([""])]
-		fail_df.points_fees = fail_df.points_fees.apply(lambda x: float(x))
-		fail_df.discount_points = fail_df.discount_points.apply(lambda x: float(x))
-		fail_df = fail_df[(fail_df.discount_points>fail_df.points_fees)]
-		fail_df = pd.concat([fail_df, blanks]) #add blanks back to fail_df for results reporting
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		checked = (~self.field_mask("points_fees", "isin", ["Exempt", "NA"]))&(~self.field_mask("discount_points", "isin", ["NA", "Exempt"]))
+		#blank points and fees fail, other values are converted to float in the failure test
+		blanks = checked&(self.field_mask("points_fees", "==", ""))
+		fail_mask = blanks|self.masked_apply(checked&~blanks, lambda discount_points, points_fees: float(discount_points) > float(points_fees),
+			"discount_points", "points_fees")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 		
+	@edit_rules.register(row_type="LAR", fields=("loan_amount", "cltv", "property_value"))
 	def q617(self):
 		"""
 		If Loan Type equals 1 and Combined Loan-to-Value Ratio and Property Value are not reported NA or Exempt, 
@@ -3262,40 +4051,44 @@ class rules_engine(object):
 		"""
 		field = "cltv, Loan Amount, and Property Value"
 		edit_name = "q617"
-		fail_df = self.lar_df[(~self.lar_df.cltv.isin(["NA", "Exempt", ""]))&
-							  (~self.lar_df.property_value.isin(["NA", "Exempt",""]))].copy()
-		fail_df.cltv = fail_df.cltv.apply(lambda x: float(x))
-		fail_df["ltv"] = (fail_df.loan_amount.apply(lambda x: float(x)) / fail_df.property_value.apply(lambda x: float(x))) *100
-		fail_df = fail_df[fail_df.cltv < fail_df.ltv]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
-
+		fail_mask = ((~self.lar_df.cltv.isin(["NA", "Exempt", ""]))&(~self.lar_df.property_value.isin(["NA", "Exempt",""]))).to_numpy()
+		#convert only the columns of checked rows to float
+		cltv = self.lar_df.cltv[fail_mask].apply(lambda x: float(x))
+		ltv = (self.lar_df.loan_amount[fail_mask].apply(lambda x: float(x)) / self.lar_df.property_value[fail_mask].apply(lambda x: float(x))) *100
+		fail_mask[fail_mask] = cltv < ltv
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
+
+	@edit_rules.register(row_type="LAR", fields=("const_method", "manufactured_type"))
 	def q618(self):
 		"""
 		If Construction Method equals 2, then Manufactured Home Secured Property Type generally should not be 3.
 		"""
 		field = "Manufactured Home Secured Property Type"
 		edit_name = "q618"
-		fail_df = self.lar_df[(self.lar_df.const_method=="2")&(self.lar_df.manufactured_type=="3")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("const_method", "==", "2"))&(self.field_mask("manufactured_type", "==", "3"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("const_method", "manufactured_interest"))
 	def q619(self):
 		"""
 		If Construction Method equals 2, then Manufactured Home Land Property Interest generally should not be 5.
 		"""
 		field = "Construction Method; Manufactured Home Land Property Interest"
 		edit_name = "q619"
-		fail_df = self.lar_df[(self.lar_df.const_method=="2")&(self.lar_df.manufactured_interest=="5")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("const_method", "==", "2"))&(self.field_mask("manufactured_interest", "==", "5"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("mlo_id", "business_purpose"))
 	def q620(self):
 		"""
 		If Business or Commercial Purpose equals 2, then NMLSR ID generally should not be NA.
 		"""
 		field = "Business or Commercial Purpose; NMLSR ID"
 		edit_name = "q620"
-		fail_df = self.lar_df[(self.lar_df.business_purpose=="2")&(self.lar_df.mlo_id=="NA")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("business_purpose", "==", "2"))&(self.field_mask("mlo_id", "==", "NA"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("mlo_id",))
 	def q621(self):
 		"""
 		The NMLSR ID should be alphanumeric up to 12 characters. Your data indicates a number outside of this range.
@@ -3303,10 +4096,11 @@ class rules_engine(object):
 		field = "NMLSR ID"
 		edit_name = "q621"
 		invalid_chars = set(string.punctuation)
-		fail_df = self.lar_df[(self.lar_df.mlo_id.apply(lambda x: len(x)>12))|
-				 			  (self.lar_df.mlo_id.apply(lambda x: any(char in invalid_chars for char in x)==True))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.lar_df.mlo_id.apply(lambda x: len(x)>12))|
+				 			  (self.lar_df.mlo_id.apply(lambda x: any(char in invalid_chars for char in x)==True)))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_age", "reverse_mortgage"))
 	def q622(self):
 		"""
 		If Reverse Mortgage equals 1, 
@@ -3315,9 +4109,10 @@ class rules_engine(object):
 		"""
 		field = "Reverse Mortgage; Age of Applicant or Borrower"
 		edit_name = "q622"
-		fail_df = self.lar_df[(self.lar_df.reverse_mortgage=="1")&(self.lar_df.app_age.apply(lambda x: int(x)<62))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df) 
+		fail_mask = (self.field_mask("reverse_mortgage", "==", "1"))&(self.lar_df.app_age.apply(lambda x: int(x)<62))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask) 
 
+	@edit_rules.register(row_type="LAR", fields=("loan_amount", "income", "total_units"))
 	def q623(self):
 		"""
 		If Total Units is less than or equal to 4, and Income is less than or equal to $200,000 (reported as 200), 
@@ -3325,12 +4120,12 @@ class rules_engine(object):
 		"""
 		field = "Loan Amount; Total Units; Income"
 		edit_name = "q623"
-		fail_df = self.lar_df[self.lar_df.income!="NA"]
-		fail_df = fail_df[(fail_df.total_units.apply(lambda x: int(x)<=4))&
-				 (fail_df.income.apply(lambda x: float(x) <=200))&
-			 	 (fail_df.loan_amount.apply(lambda x: int(x)>=2000000))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.masked_apply(self.field_mask("income", "!=", "NA"),
+			lambda total_units, income, loan_amount: int(total_units)<=4 and float(income) <=200 and int(loan_amount)>=2000000,
+			"total_units", "income", "loan_amount")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_type", "loan_amount", "total_units"))
 	def q624(self):
 		"""
 		If Loan Type equals 2, and Total Units equals 1, 
@@ -3338,11 +4133,12 @@ class rules_engine(object):
 		"""
 		field = "Loan Type; Total Units; Loan Amount"
 		edit_name = "q624"
-		fail_df = self.lar_df[(self.lar_df.loan_type=="2")&
-			     (self.lar_df.total_units=="1")&
-				 (self.lar_df.loan_amount.apply(lambda x: int(x)>637000))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("loan_type", "==", "2"))&
+			     (self.field_mask("total_units", "==", "1"))&
+				 (self.lar_df.loan_amount.apply(lambda x: int(x)>637000)))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_type", "loan_amount", "total_units"))
 	def q625(self):
 		"""
 		If Loan Type equals 3, and Total Units is less than or equal to 4, 
@@ -3350,11 +4146,12 @@ class rules_engine(object):
 		"""
 		field = "Loan Type; Total Units; Loan Amount"
 		edit_name = "q625"
-		fail_df = self.lar_df[(self.lar_df.loan_type=="3")&
+		fail_mask = ((self.field_mask("loan_type", "==", "3"))&
 				 (self.lar_df.total_units.apply(lambda x: int(x)<=4))&
-				 (self.lar_df.loan_amount.apply(lambda x: int(x)>1050000))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+				 (self.lar_df.loan_amount.apply(lambda x: int(x)>1050000)))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_amount", "purchaser_type", "total_units"))
 	def q626(self):
 		"""
 		If Type of Purchaser equals 1, 2, 3, or 4, and Total Units is less than or equal to 4, 
@@ -3362,11 +4159,12 @@ class rules_engine(object):
 		"""
 		field = "Type of Purchaser; Total Units; Loan Amount"
 		edit_name = "q626"
-		fail_df = self.lar_df[(self.lar_df.purchaser_type.isin(["1","2","3","4"]))&
+		fail_mask = ((self.field_mask("purchaser_type", "isin", ["1","2","3","4"]))&
 							  (self.lar_df.total_units.apply(lambda x: int(x)<=4))&
-							  (self.lar_df.loan_amount.apply(lambda x: int(x)>1225000))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+							  (self.lar_df.loan_amount.apply(lambda x: int(x)>1225000)))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_amount", "total_units"))
 	def q627(self):
 		"""
 		If Total Units is greater than or equal to 5, 
@@ -3374,11 +4172,12 @@ class rules_engine(object):
 		"""
 		field = "Total Units; Loan Amount"
 		edit_name = "q627"
-		fail_df = self.lar_df[(self.lar_df.total_units.apply(lambda x: int(x)>=5))&
+		fail_mask = ((self.lar_df.total_units.apply(lambda x: int(x)>=5))&
 							  (self.lar_df.loan_amount.apply(lambda x: int(x)<=100000))|
-							  (self.lar_df.loan_amount.apply(lambda x: int(x)>=10000000))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+							  (self.lar_df.loan_amount.apply(lambda x: int(x)>=10000000)))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_purpose", "loan_amount", "total_units"))
 	def q628(self):
 		"""
 		If Loan Purpose equals 1, and Total Units is less than or equal to 4, 
@@ -3386,10 +4185,11 @@ class rules_engine(object):
 		"""
 		field = "Loan Purpose; Loan Amount; Total Units"
 		edit_name = "q628"
-		fail_df = self.lar_df[(self.lar_df.loan_purpose=="1")&(self.lar_df.total_units.apply(lambda x: int(x)<=4))&
-							  (self.lar_df.loan_amount.apply(lambda x: int(x)<=10000))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("loan_purpose", "==", "1"))&(self.lar_df.total_units.apply(lambda x: int(x)<=4))&
+							  (self.lar_df.loan_amount.apply(lambda x: int(x)<=10000)))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_purpose", "action_taken", "income", "total_units"))
 	def q629(self):
 		"""
 		If Action Taken equals 1, 2, 3, 4, 5, 7, or 8, and Total Units is less than or equal to 4, 
@@ -3397,31 +4197,34 @@ class rules_engine(object):
 		"""
 		field = "Action Taken; Total Units; Loan Purpose; Income"
 		edit_name = "q629"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(["1","2","3","4","5","7","8"]))&
-							  (self.lar_df.total_units.apply(lambda x: int(x)<=4))&(self.lar_df.loan_purpose.isin(["1","2","4"]))&
-							  (self.lar_df.income=="NA")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("action_taken", "isin", ["1","2","3","4","5","7","8"]))&
+							  (self.lar_df.total_units.apply(lambda x: int(x)<=4))&(self.field_mask("loan_purpose", "isin", ["1","2","4"]))&
+							  (self.field_mask("income", "==", "NA")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("hoepa", "total_units"))
 	def q630(self):
 		"""
 		If Total Units is greater than or equal to 5, then HOEPA Status generally should equal 3.
 		"""
 		field = "Total Units; HOEPA Status"
 		edit_name = "q630"
-		fail_df = self.lar_df[(self.lar_df.total_units.apply(lambda x: int(x)>=5))&
-							  (self.lar_df.hoepa!="3")]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.lar_df.total_units.apply(lambda x: int(x)>=5))&
+							  (self.field_mask("hoepa", "!=", "3")))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_type", "total_units"))
 	def q631(self):
 		"""
 		If Loan Type equals 2, 3 or 4, then Total Units generally should be less than or equal to 4.
 		"""
 		field = "Loan Type; Total Units"
 		edit_name = "q631"
-		fail_df = self.lar_df[(self.lar_df.loan_type.isin(["2","3","4"]))&
-							  (self.lar_df.total_units.apply(lambda x: int(x)>4))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.field_mask("loan_type", "isin", ["2","3","4"]))&
+							  (self.lar_df.total_units.apply(lambda x: int(x)>4)))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("aus_1", "aus_2", "aus_3", "aus_4", "aus_5", "aus_result_1", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5"))
 	def q632(self):
 		"""
 		1) If Automated Underwriting System: 1; Automated Underwriting System: 2; Automated Underwriting
@@ -3432,14 +4235,14 @@ class rules_engine(object):
 		"""
 		field = "AUS1; AUS2; AUS3; AUS4; AUS5; AUS_Result1; AUS_Result2; AUS_Result3; AUS_Result4; AUS_Result5"
 		edit_name = "q632"
-		fail_df = self.lar_df[
-			((self.lar_df.aus_1=="3")&(~self.lar_df.aus_result_1.isin(["1","2","3","4","8","13","16","18","19"])))|
-			((self.lar_df.aus_2=="3")&(~self.lar_df.aus_result_2.isin(["1","2","3","4","8","13","16","18","19"])))|
-			((self.lar_df.aus_3=="3")&(~self.lar_df.aus_result_3.isin(["1","2","3","4","8","13","16","18","19"])))|
-			((self.lar_df.aus_4=="3")&(~self.lar_df.aus_result_4.isin(["1","2","3","4","8","13","16","18","19"])))|
-			((self.lar_df.aus_5=="3")&(~self.lar_df.aus_result_5.isin(["1","2","3","4","8","13","16","18","19"])))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
-
+		fail_mask = (((self.field_mask("aus_1", "==", "3"))&(~self.field_mask("aus_result_1", "isin", ["1","2","3","4","8","13","16","18","19"])))|
+			((self.field_mask("aus_2", "==", "3"))&(~self.field_mask("aus_result_2", "isin", ["1","2","3","4","8","13","16","18","19"])))|
+			((self.field_mask("aus_3", "==", "3"))&(~self.field_mask("aus_result_3", "isin", ["1","2","3","4","8","13","16","18","19"])))|
+			((self.field_mask("aus_4", "==", "3"))&(~self.field_mask("aus_result_4", "isin", ["1","2","3","4","8","13","16","18","19"])))|
+			((self.field_mask("aus_5", "==", "3"))&(~self.field_mask("aus_result_5", "isin", ["1","2","3","4","8","13","16","18","19"]))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
+
+	@edit_rules.register(row_type="LAR", fields=("aus_1", "aus_2", "aus_3", "aus_4", "aus_5", "aus_result_1", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5"))
 	def q633(self):
 		"""
 		1) If Automated Underwriting System: 1; Automated Underwriting System: 2; Automated Underwriting
@@ -3450,19 +4253,19 @@ class rules_engine(object):
 		"""
 		field = "AUS1; AUS2; AUS3; AUS4; AUS5; AUS_Result1; AUS_Result2; AUS_Result3; AUS_Result4; AUS_Result5"
 		edit_name = "q633"
-		fail_df = self.lar_df[
-			((self.lar_df.aus_1=="4")&(~self.lar_df.aus_result_1.isin(["3","4","10","15","16","18","19","20",
+		fail_mask = (((self.field_mask("aus_1", "==", "4"))&(~self.lar_df.aus_result_1.isin(["3","4","10","15","16","18","19","20",
 				"21", "22", "23", "24"])))|
-			((self.lar_df.aus_2=="4")&(~self.lar_df.aus_result_2.isin(["3","4","10","15","16","18","19","20",
+			((self.field_mask("aus_2", "==", "4"))&(~self.lar_df.aus_result_2.isin(["3","4","10","15","16","18","19","20",
 				"21", "22", "23", "24"])))|
-			((self.lar_df.aus_3=="4")&(~self.lar_df.aus_result_3.isin(["3","4","10","15","16","18","19","20",
+			((self.field_mask("aus_3", "==", "4"))&(~self.lar_df.aus_result_3.isin(["3","4","10","15","16","18","19","20",
 				"21", "22", "23", "24"])))|
-			((self.lar_df.aus_4=="4")&(~self.lar_df.aus_result_4.isin(["3","4","10","15","16","18","19","20",
+			((self.field_mask("aus_4", "==", "4"))&(~self.lar_df.aus_result_4.isin(["3","4","10","15","16","18","19","20",
 				"21", "22", "23", "24"])))|
-			((self.lar_df.aus_5=="4")&(~self.lar_df.aus_result_5.isin(["3","4","10","15","16","18","19","20",
-				"21", "22", "23", "24"])))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+			((self.field_mask("aus_5", "==", "4"))&(~self.lar_df.aus_result_5.isin(["3","4","10","15","16","18","19","20",
+				"21", "22", "23", "24"]))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_purpose", "action_taken"), file_level=True)
 	def m634(self):
 		"""
 		If more than 25 loans reported Action Taken equals 1 and Loan Purpose equals 1, 
@@ -3471,14 +4274,15 @@ class rules_engine(object):
 		"""
 		field = "Action Taken; Loan Purpose"
 		edit_name = "q634"
-		action_1 = len(self.lar_df[(self.lar_df.action_taken=="1")&(self.lar_df.loan_purpose=="1")])
+		action_1 = self.macro_count(action_taken="1", loan_purpose="1")
 		denom_count = len(self.lar_df)
 		if (action_1 * 1.0) / denom_count > .95 and len(self.lar_df)>25:
-			fail_df = self.lar_df[(self.lar_df.action_taken=="1")&(self.lar_df.loan_purpose=="1")]
+			fail_mask = (self.field_mask("action_taken", "==", "1"))&(self.field_mask("loan_purpose", "==", "1"))
+			self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 		else:
-			fail_df = fail_df = []
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+			self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=[])
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken",), file_level=True)
 	def m635(self):
 		"""
 		No more than 15% of the loans in the file should report Action Taken equals 2. 
@@ -3486,14 +4290,14 @@ class rules_engine(object):
 		"""
 		field = "Action Taken; Total Number of Entries Contained in Submission"
 		edit_name = "q635"
-		action_2 = len(self.lar_df[self.lar_df.action_taken=="2"])
+		action_2 = self.macro_count(action_taken="2")
 		denom_count = len(self.lar_df)
 		if (action_2 * 1.0) / denom_count > .15:
-			fail_df = self.lar_df[(self.lar_df.action_taken=="2")]
+			self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=self.field_mask("action_taken", "==", "2"))
 		else:
-			fail_df = []
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+			self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=[])
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken",), file_level=True)
 	def m636(self):
 		"""
 		No more than 30% of the loans in the file should report Action Taken equals 4. 
@@ -3501,14 +4305,14 @@ class rules_engine(object):
 		"""
 		field = "Action Taken; Total Number of Entries Contained in Submission"
 		edit_name = "q636"
-		action_4 = len(self.lar_df[self.lar_df.action_taken=="4"])
+		action_4 = self.macro_count(action_taken="4")
 		denom_count = len(self.lar_df)
 		if (action_4 * 1.0) / denom_count > .30:
-			fail_df = self.lar_df[self.lar_df.action_taken=="4"]
+			self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=self.field_mask("action_taken", "==", "4"))
 		else:
-			fail_df = []
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+			self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=[])
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken",), file_level=True)
 	def m637(self):
 		"""
 		No more than 15% of the loans in the file should report Action Taken equals 5. 
@@ -3516,14 +4320,14 @@ class rules_engine(object):
 		"""
 		field = "Action Taken; Total Number of Entries Contained in Submission"
 		edit_name = "q637"
-		action_5 = len(self.lar_df[self.lar_df.action_taken=="5"])
+		action_5 = self.macro_count(action_taken="5")
 		denom_count = len(self.lar_df)
 		if (action_5 * 1.0) / denom_count > .15:
-			fail_df = self.lar_df[self.lar_df.action_taken=="5"]
+			self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=self.field_mask("action_taken", "==", "5"))
 		else:
-			fail_df = []
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+			self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=[])
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken",), file_level=True)
 	def m638(self):
 		"""
 		The number of loans in the file that reported Action Taken equals 1 should be greater than or equal to 20% 
@@ -3532,17 +4336,15 @@ class rules_engine(object):
 		"""
 		field = "Action Taken"
 		edit_name = "q638"
-		action_1 = len(self.lar_df[self.lar_df.action_taken=="1"])
-		denom_count = len(self.lar_df[self.lar_df.action_taken.isin(["1","2","3","4","5","6"])])
-		if denom_count > 0:
-			if ((action_1 * 1.0) / denom_count) < .20:
-				fail_df = self.lar_df[self.lar_df.action_taken.isin(["1","2","3","4","5","6"])]
-			else:
-				fail_df = []
+		action_1 = self.macro_count(action_taken="1")
+		denom_count = self.macro_count(action_taken=["1","2","3","4","5","6"])
+		if denom_count > 0 and ((action_1 * 1.0) / denom_count) < .20:
+			fail_mask = self.field_mask("action_taken", "isin", ["1","2","3","4","5","6"])
+			self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 		else:
-			fail_df = []
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+			self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=[])
 
+	@edit_rules.register(row_type="LAR", fields=("preapproval", "action_taken"), file_level=True)
 	def m639(self):
 		"""
 		If more than 1000 loans were reported with Preapproval equals 1, 
@@ -3551,13 +4353,13 @@ class rules_engine(object):
 		"""
 		field = "Action Taken; Preapproval"
 		edit_name = "q639"
-		preapprovals = len(self.lar_df[self.lar_df.preapproval=="1"])
-		if preapprovals > 1000 and len(self.lar_df[self.lar_df.action_taken=="7"])<1:
-			fail_df = self.lar_df[self.lar_df.preapproval=="1"]
+		preapprovals = self.macro_count(preapproval="1")
+		if preapprovals > 1000 and self.macro_count(action_taken="7")<1:
+			self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=self.field_mask("preapproval", "==", "1"))
 		else:
-			fail_df = []
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+			self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=[])
 
+	@edit_rules.register(row_type="LAR", fields=("income",), file_level=True)
 	def m640(self):
 		"""
 		No more than 20% of the loans in the file should report Income less than $10 thousand (entered as 10). 
@@ -3565,15 +4367,15 @@ class rules_engine(object):
 		"""
 		field = "Income; Total Number of Entries Contained in Submission"
 		edit_name = "q640"
-		income_less_10k = self.lar_df[self.lar_df.income!="NA"].copy()
-		income_less_10k_ct = len(income_less_10k[income_less_10k.income.apply(lambda x: float(x)<10)])
+		income_reported = self.field_mask("income", "!=", "NA")
+		income_less_10k_ct = self.masked_apply(income_reported, lambda x: float(x)<10, "income").sum()
 		denom_count = len(self.lar_df)
 		if (income_less_10k_ct * 1.0) / denom_count > .20:
-			fail_df = income_less_10k
+			self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=income_reported)
 		else:
-			fail_df = []
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+			self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=[])
 
+	@edit_rules.register(row_type="LAR", fields=("app_credit_score", "app_score_name"))
 	def q642_1(self):
 		"""
 		1) If Credit Score of Applicant or Borrower equals 7777 indicating a credit score that is not a number, 
@@ -3581,9 +4383,10 @@ class rules_engine(object):
 		"""
 		field = "app credit score/model"
 		edit_name = "q642_1"
-		fail_df = self.lar_df[(self.lar_df.app_credit_score=="7777")&(~self.lar_df.app_score_name.isin(["7","8"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("app_credit_score", "==", "7777"))&(~self.field_mask("app_score_name", "isin", ["7","8"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_credit_score", "co_app_score_name"))
 	def q642_2(self):
 		"""
 		If Credit Score of Co-Applicant or Co-Borrower equals 7777 indicating a credit score that is not a number, 
@@ -3591,9 +4394,10 @@ class rules_engine(object):
 		"""
 		field = "co app credit score/model"
 		edit_name = "q642_2"
-		fail_df = self.lar_df[(self.lar_df.co_app_credit_score=="7777")&(~self.lar_df.co_app_score_name.isin(["7","8"]))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("co_app_credit_score", "==", "7777"))&(~self.field_mask("co_app_score_name", "isin", ["7","8"]))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("aus_1", "aus_2", "aus_3", "aus_4", "aus_5", "aus_result_1", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5"))
 	def q643(self):
 		"""
 		If Automated Underwriting System: 1;
@@ -3611,14 +4415,14 @@ class rules_engine(object):
 			"""
 		field = "AUS1; AUS2; AUS3; AUS4; AUS5; AUS_Result1; AUS_Result2; AUS_Result3; AUS_Result4; AUS_Result5"
 		edit_name = "q643"
-		fail_df = self.lar_df[
-				((self.lar_df.aus_1=="1")&(~self.lar_df.aus_result_1.isin(["1","2","3","4","5","6","7","15", "16"])))|
-				((self.lar_df.aus_2=="1")&(~self.lar_df.aus_result_2.isin(["1","2","3","4","5","6","7","15", "16"])))|
-				((self.lar_df.aus_3=="1")&(~self.lar_df.aus_result_3.isin(["1","2","3","4","5","6","7","15", "16"])))|
-				((self.lar_df.aus_4=="1")&(~self.lar_df.aus_result_4.isin(["1","2","3","4","5","6","7","15", "16"])))|
-				((self.lar_df.aus_5=="1")&(~self.lar_df.aus_result_5.isin(["1","2","3","4","5","6","7","15", "16"])))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
-
+		fail_mask = (((self.field_mask("aus_1", "==", "1"))&(~self.field_mask("aus_result_1", "isin", ["1","2","3","4","5","6","7","15", "16"])))|
+				((self.field_mask("aus_2", "==", "1"))&(~self.field_mask("aus_result_2", "isin", ["1","2","3","4","5","6","7","15", "16"])))|
+				((self.field_mask("aus_3", "==", "1"))&(~self.field_mask("aus_result_3", "isin", ["1","2","3","4","5","6","7","15", "16"])))|
+				((self.field_mask("aus_4", "==", "1"))&(~self.field_mask("aus_result_4", "isin", ["1","2","3","4","5","6","7","15", "16"])))|
+				((self.field_mask("aus_5", "==", "1"))&(~self.field_mask("aus_result_5", "isin", ["1","2","3","4","5","6","7","15", "16"]))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
+
+	@edit_rules.register(row_type="LAR", fields=("aus_1", "aus_2", "aus_3", "aus_4", "aus_5", "aus_result_1", "aus_result_2", "aus_result_3", "aus_result_4", "aus_result_5"))
 	def q644(self):
 		"""
 		1) If Automated Underwriting System: 1; Automated Underwriting System: 2; Automated Underwriting
@@ -3629,14 +4433,14 @@ class rules_engine(object):
 		"""
 		field = "AUS1; AUS2; AUS3; AUS4; AUS5; AUS_Result1; AUS_Result2; AUS_Result3; AUS_Result4; AUS_Result5"
 		edit_name = "q644"
-		fail_df = self.lar_df[
-				((self.lar_df.aus_1=="2")&(~self.lar_df.aus_result_1.isin(["8","9","10","11","12","13","16"])))|
-				((self.lar_df.aus_2=="2")&(~self.lar_df.aus_result_2.isin(["8","9","10","11","12","13","16"])))|
-				((self.lar_df.aus_3=="2")&(~self.lar_df.aus_result_3.isin(["8","9","10","11","12","13","16"])))|
-				((self.lar_df.aus_4=="2")&(~self.lar_df.aus_result_4.isin(["8","9","10","11","12","13","16"])))|
-				((self.lar_df.aus_5=="2")&(~self.lar_df.aus_result_5.isin(["8","9","10","11","12","13","16"])))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
-
+		fail_mask = (((self.field_mask("aus_1", "==", "2"))&(~self.field_mask("aus_result_1", "isin", ["8","9","10","11","12","13","16"])))|
+				((self.field_mask("aus_2", "==", "2"))&(~self.field_mask("aus_result_2", "isin", ["8","9","10","11","12","13","16"])))|
+				((self.field_mask("aus_3", "==", "2"))&(~self.field_mask("aus_result_3", "isin", ["8","9","10","11","12","13","16"])))|
+				((self.field_mask("aus_4", "==", "2"))&(~self.field_mask("aus_result_4", "isin", ["8","9","10","11","12","13","16"])))|
+				((self.field_mask("aus_5", "==", "2"))&(~self.field_mask("aus_result_5", "isin", ["8","9","10","11","12","13","16"]))))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
+
+	@edit_rules.register(row_type="LAR", fields=("loan_amount",))
 	def q645_1(self):
 		"""
 		1) Loan Amount should generally be greater than or equal to $500 (reported 500).
@@ -3644,19 +4448,21 @@ class rules_engine(object):
 
 		field = "Loan Amount"
 		edit_name = "q645_1"
-		fail_df = self.lar_df[((self.lar_df.loan_amount.apply(lambda x: int(x) < 500)))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.lar_df.loan_amount.apply(lambda x: int(x) < 500)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("loan_purpose", "loan_amount"))
 	def q645_2(self):
 		"""
 		2) If Loan Purpose equals 1, then Loan Amount should generally be greater than or equal to $1,000 (reported 1000).
 		"""
 		field = "Loan Amount"
 		edit_name = "q645_2"
-		fail_df = self.lar_df[(self.lar_df.loan_purpose == '1') &
-		(self.lar_df.loan_amount.apply(lambda x: int(x) <= 1000))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((self.lar_df.loan_purpose == '1') &
+		(self.lar_df.loan_amount.apply(lambda x: int(x) <= 1000)))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=ALL_FIELDS)
 	def m646(self):
 		"""
 		Your file indicates that at least one exemption code was used. 
@@ -3665,10 +4471,11 @@ class rules_engine(object):
 		"""
 		field = "Any data point eligible for an exemption code."
 		edit_name = "q646"
-		fail_df = self.lar_df.copy()
-		fail_df = fail_df[(fail_df.values == 'Exempt').any(1) | (fail_df.values == '1111').any(1)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		values = self.lar_df.to_numpy(dtype=object)
+		fail_mask = (values == 'Exempt').any(1) | (values == '1111').any(1)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="TS/LAR", fields=ALL_FIELDS)
 	def m647(self):
 		"""
 		If Federal Agency equals 7, indicating a non-depository institution, exemption codes should not be used in the
@@ -3683,17 +4490,19 @@ class rules_engine(object):
 		else:
 			self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=[])
 
+	@edit_rules.register(row_type="LAR", fields=("lei", "uli", "action_taken"))
 	def q648(self):
 		"""
 		If Action Taken equals 1, 2, 3, 4, 5, 7, or 8, the first 20 characters of the ULI should match the reported LEI.
 		"""
 		edit_name = "q648"
 		field = "uli"
-		fail_df = self.lar_df[(self.lar_df.action_taken.isin(["1", "2", "3", "4", "5", "7", "8"]))&
-							  (self.lar_df.apply(lambda x: x.uli[:20] != x.lei, axis=1))]
+		fail_mask = ((self.field_mask("action_taken", "isin", ["1", "2", "3", "4", "5", "7", "8"]))&
+							  (self.lar_df.apply(lambda x: x.uli[:20] != x.lei, axis=1)))
 		
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("app_credit_score",))
 	def q649_1(self):
 		"""
 		If Credit Score of Applicant or Borrower does not equal 7777, 8888, or 1111, Credit Score should
@@ -3701,13 +4510,11 @@ class rules_engine(object):
 		"""
 		field = "app credit score"
 		edit_name = "q649_1"
-		fail_df = self.lar_df[~self.lar_df.app_credit_score.isin(["7777", "8888", "1111"])].copy()
-		#fail_df.app_credit_score = fail_df.app_credit_score.apply(lambda x: int(x))
-		fail_df = fail_df[fail_df.app_credit_score.apply(lambda x: self.check_number(x, 
-			min_val=301, max_val=901)==False)]
-		#fail_df = fail_df[fail_df.apply(self.check_number(fail_df.app_credit_score, min_val=301, max_val=901)==False, axis=1)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = ((~self.field_mask("app_credit_score", "isin", ["7777", "8888", "1111"]))&
+			(self.lar_df.app_credit_score.apply(lambda x: self.check_number(x, min_val=301, max_val=901)==False)))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("co_app_credit_score",))
 	def q649_2(self):
 		"""
 		If Credit Score of Co-Applicant or Co-Borrower does not equal 7777, 8888, 9999, or 1111, 
@@ -3715,63 +4522,64 @@ class rules_engine(object):
 		"""
 		field = "co app credit score"
 		edit_name = "q649_2"
-		fail_df = self.lar_df[~self.lar_df.co_app_credit_score.isin(["7777", "8888", "1111"])].copy()
-		#fail_df = fail_df[~fail_df.app_credit_score.apply(lambda x: 300 < float(x) < 900)]
-		fail_df = fail_df[fail_df.co_app_credit_score.apply(lambda x: self.check_number(x, 
-			min_val=301, max_val=901)==False)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)		
+		fail_mask = ((~self.field_mask("co_app_credit_score", "isin", ["7777", "8888", "1111"]))&
+			(self.lar_df.co_app_credit_score.apply(lambda x: self.check_number(x, min_val=301, max_val=901)==False)))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)		
 
+	@edit_rules.register(row_type="LAR", fields=("interest_rate",))
 	def q650(self):
 		"""
 		The Interest Rate reported is greater than 0 but less than 0.5, which may indicate a misplaced decimal point
 		"""
 		field = "interest rate"
 		edit_name = "q650"
-		fail_df = self.lar_df[~self.lar_df.interest_rate.isin(["Exempt", "NA"])]
-		fail_df = fail_df[fail_df.interest_rate.apply(lambda x: 0 < float(x) < 0.5)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.masked_apply(~self.field_mask("interest_rate", "isin", ["Exempt", "NA"]), lambda x: 0 < float(x) < 0.5, "interest_rate")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("cltv",))
 	def q651(self):
 		"""
 		The CLTV reported is greater than 0 but less than 1, which may indicate a misplaced decimal point.
 		"""
 		field = "cltv"
 		edit_name = "q651"
-		fail_df = self.lar_df[~self.lar_df.cltv.isin(["NA", "Exempt"])].copy()
-		fail_df = fail_df[fail_df.cltv.apply(lambda x: 0 < float(x) < 1)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = self.masked_apply(~self.field_mask("cltv", "isin", ["NA", "Exempt"]), lambda x: 0 < float(x) < 1, "cltv")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("dti",))
 	def q652(self):
 		"""
 		The DTI reported is greater than 0 but less than 1, which may indicate a misplaced decimal point.
 		"""
 		field = "dti"
 		edit_name = "q652"
-		fail_df = self.lar_df[~self.lar_df.dti.isin(["NA", "Exempt"])].copy()
-		fail_df = fail_df[fail_df.dti.apply(lambda x: self.check_number(x, min_val=0, max_val=1)==False)]
-		#fail_df = fail_df[fail_df.dti.apply(lambda x: 0 < float(x) < 1)]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (~self.field_mask("dti", "isin", ["NA", "Exempt"]))&(self.lar_df.dti.apply(lambda x: self.check_number(x, min_val=0, max_val=1)==False))
+		#fail_mask = self.masked_apply(~self.lar_df.dti.isin(["NA", "Exempt"]), lambda x: 0 < float(x) < 1, "dti")
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "cltv"))
 	def q653_1(self):
 		"""
 		If Action Taken equals 1, 2, or 8, the CLTV should generally be between 0 and 250.
 		"""
 		field = "cltv"
 		edit_name = "q653_1"
-		fail_df = self.lar_df[~self.lar_df.cltv.isin(["NA", "Exempt"])].copy()
-		fail_df = fail_df[((fail_df.action_taken.isin(["1", "2", "8"])&~(fail_df.cltv.apply(lambda x: 0.0 < float(x) < 250))))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_taken", "isin", ["1", "2", "8"])&
+			self.masked_apply(~self.field_mask("cltv", "isin", ["NA", "Exempt"]), lambda x: not 0.0 < float(x) < 250, "cltv"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "cltv"))
 	def q653_2(self):
 		"""
 		If Action Taken equals 3, 4, 5, 6, or 7, the CLTV should generally be between 0 and 1,000.
 		"""
 		field = "cltv"
 		edit_name = "q653_2"
-		fail_df = self.lar_df[~self.lar_df.cltv.isin(["NA", "Exempt"])].copy()
-		fail_df = fail_df[((fail_df.action_taken.isin(("3", "4", "5", "6", "7")))&~(fail_df.cltv.apply(lambda x: 0 < float(x) < 1000)))]
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		fail_mask = (self.field_mask("action_taken", "isin", ("3", "4", "5", "6", "7"))&
+			self.masked_apply(~self.field_mask("cltv", "isin", ["NA", "Exempt"]), lambda x: not 0 < float(x) < 1000, "cltv"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
 
+	@edit_rules.register(row_type="LAR", fields=("action_taken", "income", "dti"))
 	def q654(self):
 		"""
 		1) If Income is greater than $5,000 (reported as 5) and Action Taken equals 1, 2, or 8, 
@@ -3781,14 +4589,11 @@ class rules_engine(object):
 		"""
 		field = "DTI"
 		edit_name = "q654"
-		fail_df = self.lar_df.copy()
-		fail_df = fail_df[~fail_df.dti.isin(["NA", "Exempt"])].copy() #filter exemptions
-		fail_df = fail_df[fail_df.income!="NA"]
-		fail_df = fail_df[(fail_df.income.apply(lambda x: float(x)>5))&
-						  (fail_df.action_taken.isin(["1","2","8"]))&
-						  (fail_df.dti.apply(lambda x: self.check_number(x, min_val=0.0, max_val=80)))]
-		#fail_df = fail_df[(fail_df.income.apply(lambda x: float(x)>5))&
-		#				  (fail_df.action_taken.isin(["1","2","8"]))&
-		#				 ~(fail_df.dti.apply(lambda x: 0.0 < float(x) < 80))]
-
-		self.results_wrapper(edit_name=edit_name, field_name=field, fail_df=fail_df)
+		checked = (~self.field_mask("dti", "isin", ["NA", "Exempt"]))&(self.field_mask("income", "!=", "NA")) #filter exemptions
+		fail_mask = (self.masked_apply(checked, lambda x: float(x)>5, "income")&
+						  (self.field_mask("action_taken", "isin", ["1","2","8"]))&
+						  ((self.field_view("numeric", "dti") > 0.0)&(self.field_view("numeric", "dti") < 80)))
+		#fail_mask = (self.masked_apply(checked, lambda x: float(x)>5, "income")&
+		#				  (self.lar_df.action_taken.isin(["1","2","8"]))&
+		#				 ~self.masked_apply(checked, lambda x: 0.0 < float(x) < 80, "dti"))
+		self.results_wrapper(edit_name=edit_name, field_name=field, fail_mask=fail_mask)
@@ -1,17 +1,24 @@
 import json
 import os
+import numpy as np
 import pandas as pd
 import random
-import string
 import yaml
+
+from edit_registry import edit_registry
+from geo_index import geo_index
 import utils
 
+#registry of test file functions, populated by the register decorator on each function
+file_edits = edit_registry()
+
 class test_data_creator(object):
 	"""This class alters clean synthetic data files in order to cause the 
 	altered file to fail the specified edit. Modified files may fail other 
 	edits as well."""
+	registry = file_edits
 
-	def __init__(self, state_codes, county_df, bank_config_data, filepath_config="configurations/test_filepaths.yaml",
+	def __init__(self, state_codes, geographic_data, bank_config_data, filepath_config="configurations/test_filepaths.yaml",
 		lar_schema_file="../schemas/lar_schema.json", ts_schema_file="../schemas/ts_schema.json"):
 		"""Set initial class variables.
 
@@ -22,7 +29,7 @@ class test_data_creator(object):
 		is located in "dependencies/census_2018_MSAMD_name.txt."
 
 		state_codes: dictionary of state letter codes to FIPS code
-		county_list: dataframe of of 5 digit county codes and a small county indicator
+		geographic_data: the HMDA Ops cut of the FFIEC Census Flat File, or a geo_index built from it
 		"""
 		with open(lar_schema_file, 'r') as f:
 			lar_schema_json = json.load(f)
@@ -40,7 +47,7 @@ class test_data_creator(object):
 				self.bank_config_data = yaml.safe_load(f)
 
 		self.state_codes = state_codes
-		self.county_df = county_df
+		self.geo = geo_index.load(geographic_data)
 
 		self.bank_config_data = bank_config_data
 		self.name_prefix = "{bank_name}_{line_count}_".format(bank_name=self.bank_config_data["name"]["value"], 
@@ -51,11 +58,8 @@ class test_data_creator(object):
 		self.syntax_path = filepaths['syntax_filepath'].format(bank_name=self.bank_config_data["name"]["value"])
 		self.quality_path = filepaths['quality_filepath'].format(bank_name=self.bank_config_data["name"]["value"])
 
-		self.test_file_funcs = []
-		for func in dir(self): 
-			#Checks if function is a numbered syntax, validity, or quality edit.
-			if func[:1] in ("s", "v", "q") and func[1:4].isdigit()==True: 
-				self.test_file_funcs.append(func)
+		#numbered syntax, validity, and quality edit functions
+		self.test_file_funcs = self.registry.select(edit_types=("s", "v", "q"))
 
 		del filepaths
 
@@ -96,6 +100,7 @@ class test_data_creator(object):
 	#edits will be broken out into sub parts as in the rules_engine.py class. 
 	#This will allow test files to be generated that fail conditions inside each edit.
 
+	@file_edits.register()
 	def s300_1(self):
 		"""
 		Sets the first character of the first row of the file to 3.
@@ -107,6 +112,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=self.syntax_path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def s300_2(self):
 		""""
 		Sets the first character of each LAR row to 3.
@@ -119,6 +125,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def s301(self):
 		"""
 		Changes the LEI of a LAR file such that it does not match the TS.
@@ -131,6 +138,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def s302(self):
 		"""
 		Sets the year of submission to 2017
@@ -144,6 +152,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def s306(self):
 		"""
 		Create duplicate ULIs in LAR data
@@ -156,6 +165,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v600(self):
 		"""
 		Modifies the LEI of TS and LAR so that they do not meed schema requirements
@@ -164,11 +174,12 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		ts.lei = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(10))
-		lar.lei = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(10))
+		ts.lei = utils.char_string_gen(10)
+		lar.lei = utils.char_string_gen(10)
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def s304(self):
 		"""
 		Changes the number of entries data so that it does not match the number of LAR rows in the file.
@@ -181,6 +192,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v601_1(self):
 		"""
 		Modifies the TS to blank the FI name.
@@ -194,6 +206,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v601_2(self):
 		"""
 		Modify the TS by blanking out the contact person's name.
@@ -207,6 +220,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v601_3(self):
 		"""
 		Modify the TS by blanking the contact person's E-mail address.
@@ -219,6 +233,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v601_4(self):
 		"""
 		Modify the TS so to blank out the contact person's office street address.
@@ -231,6 +246,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v601_5(self):
 		"""
 		"""
@@ -242,6 +258,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v602(self):
 		"""
 		Changes TS calendar quarter to 5.
@@ -254,6 +271,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v603(self):
 		"""
 		Changes contact number to alphanumeric string.
@@ -262,10 +280,11 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		ts.contact_tel = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(10))
+		ts.contact_tel = utils.char_string_gen(10)
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v604(self):
 		"""
 		Converts contact person's office state to two digit number.
@@ -278,6 +297,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v605(self):
 		"""
 		Convert contact person's ZIP to string of letters.
@@ -286,10 +306,11 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		ts.office_zip = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(5))
+		ts.office_zip = utils.char_string_gen(5)
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v606(self):
 		"""
 		Convert number of entries to a negative number.
@@ -302,6 +323,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v607(self):
 		"""
 		Changes tax ID to string of letters.
@@ -310,11 +332,12 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		ts.tax_id = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(10))
+		ts.tax_id = utils.char_string_gen(10)
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
 
+	@file_edits.register()
 	def v608_1(self):
 		"""
 		Set a ULI to be a random choice of 22 characters or 49 characters
@@ -334,6 +357,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v608_2(self):
 		"""
 		Set a NULI to be 29 characters.
@@ -350,6 +374,7 @@ class test_data_creator(object):
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
 
+	@file_edits.register()
 	def v609(self):
 		"""
 		Change check digit on each row. Ensure that the new check digit fails.
@@ -359,10 +384,11 @@ class test_data_creator(object):
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
 		#lar.uli = lar.uli.map(lambda x: x[:-2] + "xy")
-		lar.uli = lar.lei.map(lambda x: x + ''.join(random.choice(string.ascii_uppercase+string.digits) for _ in range(10)))
+		lar.uli = lar.lei + utils.char_string_batch(np.full(len(lar), 10))
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v610_1(self):
 		"""
 		Change application date to nine 2's.
@@ -375,6 +401,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v610_2(self):
 		"""
 		Set each row to action taken = 3 and application date = NA.
@@ -388,6 +415,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def s305(self):
 		"""
 		Copies the first line of the file into all subsequent lines.
@@ -403,6 +431,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v611(self):
 		"""
 		Sets loan type to 5.
@@ -415,6 +444,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v612_1(self):
 		"""
 		Set loan purpose to 3.
@@ -427,6 +457,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v612_2(self):
 		"""
 		Set preapproval to 1 and loan purpose to a random enumeration that is not 1.
@@ -440,6 +471,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v613_1(self):
 		"""
 		Set preapproval to 3.
@@ -452,6 +484,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v613_2(self):
 		"""
 		Set action to 7 or 8, set preapproval to 2.
@@ -465,6 +498,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v613_3(self):
 		"""
 		Set action to random 3, 4, 5, or 6 and preapproval to 1.
@@ -478,6 +512,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v613_4(self):
 		"""
 		Set preapproval to 1 and action taken to random 0, 3, 4, 5, 6.
@@ -491,6 +526,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v614_1(self):
 		"""
 		Set loan purpose to random 2, 4, 31, 32, or 5 and preapproval to 1.
@@ -504,6 +540,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v614_2(self):
 		"""
 		Set affordable units to 1 and preapproval to 1.
@@ -517,6 +554,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v614_3(self):
 		"""
 		Set reverse mortgage to 1 and preapproval to 1.
@@ -530,6 +568,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v614_4(self):
 		"""Set open end credit to 1 and preapproval to 1."""
 		name = "v614_4.txt"
@@ -542,6 +581,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v615_1(self):
 		"""Set construction method to 3."""
 		name = "v615_1.txt"
@@ -553,6 +593,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v615_2(self):
 		"""Set manufactured interest to random 1, 2, 3 or 4 and construction method to 1."""
 		name = "v615_2.txt"
@@ -565,6 +606,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v615_3(self):
 		"""Set manufactured type to 1 or 2 and construction method to 1."""
 		name = "v615_3.txt"
@@ -577,6 +619,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v616(self):
 		"""Set occupancy to 4."""
 		name = "v616.txt"
@@ -588,6 +631,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v617(self):
 		"""Set loan amount to 0."""
 		name = "v617.txt"
@@ -599,6 +643,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v618(self):
 		"""Set action taken to 0 or NA."""
 		name = "v618.txt"
@@ -610,6 +655,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v619_1(self):
 		"""Set action taken date to NA."""
 		name = "v619_1.txt"
@@ -621,6 +667,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v619_2(self):
 		"""Set action taken date to 20160101."""
 		name = "v619_2.txt"
@@ -632,6 +679,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v619_3(self):
 		"""Set action taken date to 20160101"""
 		name = "v619_3.txt"
@@ -644,6 +692,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v620(self):
 		"""Set street address to blank."""
 		name = "v620.txt"
@@ -655,6 +704,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v621(self):
 		"""Set city to blank."""
 		name = "v621.txt"
@@ -666,6 +716,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v622_1(self):
 		"""Set street address to random string, set City to NA."""
 		name = "v622_1.txt"
@@ -673,11 +724,12 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		lar.street_address = lar.street_address.map(lambda x: "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(10)))
+		lar.street_address = utils.char_string_batch(np.full(len(lar), 10))
 		lar.city = "NA"
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v622_2(self):
 		"""Set street address to random string, set State to NA."""
 		name = "v622_2.txt"
@@ -685,11 +737,12 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		lar.street_address = lar.street_address.map(lambda x: "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(10)))
+		lar.street_address = utils.char_string_batch(np.full(len(lar), 10))
 		lar.state = "NA"
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v622_3(self):
 		"""Set street address to random string, set ZIP code to NA."""
 		name = "v622_3.txt"
@@ -697,12 +750,13 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		street_addy = "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(10))
+		street_addy = utils.char_string_gen(10)
 		lar.street_address = lar.street_address.map(lambda x: random.choice([street_addy, street_addy, "Exempt"]))
 		lar.zip_code = "NA"
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v623(self):
 		"""Set state code to blank or 11."""
 		name = "v623.txt"
@@ -714,6 +768,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v624(self):
 		"""Set ZIP code to blank or random string of letters.
 
@@ -724,11 +779,12 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		zip_code = "".join(str(random.choice(string.ascii_uppercase + string.digits)) for _ in range(5))
+		zip_code = utils.char_string_gen(5)
 		lar.zip_code = lar.zip_code.map(lambda x: random.choice([zip_code, ""]))
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v625_1(self):
 		"""Set Census Tract to blank or 11 digit letter string."""
 		name = "v625_1.txt"
@@ -736,10 +792,11 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		lar.tract = lar.tract.map(lambda x: "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(11)))
+		lar.tract = utils.char_string_batch(np.full(len(lar), 11))
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v625_2(self):
 		"""Set Census Tract to 12345679012."""
 		name = "v625_2.txt"
@@ -751,6 +808,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v626(self):
 		"""Set County to 6 digit number."""
 		name = "v626.txt"
@@ -762,6 +820,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v627(self):
 		"""Set County and Tract to strings of 5 and 11 digit length."""
 		name = "v627.txt"
@@ -769,11 +828,12 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		counties = list(self.county_df.county_fips[self.county_df.county_fips.isin(list(lar.county))])
+		counties = list(set(lar.county) & self.geo.county_set)
 		lar.county = random.choice(counties)
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v628_1(self):
 		"""Set all applicant ethnicity fields to blank."""
 		name = "v628_1.txt"
@@ -790,6 +850,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v628_2(self):
 		"""Set app ethnicity 2-5 to 3."""
 		name = "v628_2.txt"
@@ -804,6 +865,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v628_3(self):
 		"""Set all applicant ethnicity codes to 1."""
 		name = "v628_3.txt"
@@ -819,6 +881,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v628_4(self):
 		"""Set applicant ethnicity 1 to 3 or 4. Set all other applicant ethnicities to 1."""
 		name = "v628_4.txt"
@@ -834,6 +897,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v629_1(self):
 		"""Set applicant ethnicity basis to 4."""
 		name = "v629_1.txt"
@@ -845,6 +909,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v629_2(self):
 		"""Set applicant ethnicity basis to 1. Set applicant ethnicity 1 = 3. Set all other applicant ethnicities to 1."""
 		name = "v629_2.txt"
@@ -861,6 +926,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v629_3(self):
 		"""
 		Set applicant ethnicity basis to 2. Set applicant ethnicity 1 to 4.
@@ -874,6 +940,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v630(self):
 		"""
 		1) If Ethnicity of Applicant or Borrower: 1 equals 4, 
@@ -890,6 +957,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v631_1(self):
 		"""
 		Set co-app ethnicity 1 to blank. Set co-app ethnicity free text to blank.
@@ -903,6 +971,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v631_2(self):
 		"""Set co-app ethnicity 2-5 to 3."""
 		name = "v631_2.txt"
@@ -917,6 +986,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v631_3(self):
 		"""Set all co-app ethnicities to 1."""
 		name = "v631_3.txt"
@@ -932,6 +1002,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v631_4(self):
 		"""Set co-app ethnicity 1 to random choice of 3, 4, 5. Set co-app ethnicity 2-5 to 1."""
 		name = "v631_4.txt"
@@ -947,6 +1018,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v632_1(self):
 		"""Set co-app ethnicity basis to 5"""
 		name = "v632_1.txt"
@@ -958,6 +1030,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v632_2(self):
 		"""Set co-app ethnicity basis to 1. Set co-app ethnicity 1 to 3. 
 		Set co-app ethnicity 2 to 3. Set co-app ethnicity 3-5 to 1"""
@@ -975,6 +1048,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v632_3(self):
 		"""Set co-app ethnicity basis to 2. Set co-app ethnicity 1 to 4."""
 		name = "v632_3.txt"
@@ -987,6 +1061,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v633(self):
 		"""Set co-app ethnicity 1 to 4. Set co-app ethnicity basis to 1."""
 		name = "v633.txt"
@@ -999,6 +1074,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v634(self):
 		"""For the first half of the file:
 		Set co-app ethnicity 1 to 5.
@@ -1019,6 +1095,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v635_1(self):
 		"""Set app race 1 to blank. Set all race text fields to blank."""
 		name = "v635_1.txt"
@@ -1033,6 +1110,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v635_2(self):
 		"""Set app races 2-5 to 6."""
 		name = "v635_2.txt"
@@ -1047,6 +1125,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v635_3(self):
 		"""Set all applicant race fields to 1."""
 		name = "v635_3.txt"
@@ -1062,6 +1141,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v635_4(self):
 		"""Set app race to 6 or 7. 
 		Set app races 2-5 to random choice of 1-5."""
@@ -1078,6 +1158,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v636_1(self):
 		"""Set app race basis to 4."""
 		name = "v636_1.txt"
@@ -1089,6 +1170,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v636_2(self):
 		"""Set app race basis to 1. Set app race 1 to blank. Set app races 2-5 to 6."""
 		name = "v636_2.txt"
@@ -1105,6 +1187,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v636_3(self):
 		"""Set app race basis to 2. Set app race 1 to blank. Set app races 2-5 to 6."""
 		name = "v636_3.txt"
@@ -1121,6 +1204,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v637(self):
 		"""Set app race 1 to 7. Set app race basis to 1 or 2."""
 		name = "v637.txt"
@@ -1133,6 +1217,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v638_1(self):
 		"""Set co-app race 1 to blank. Set all co-app race text fields to blank."""
 		name = "v638_1.txt"
@@ -1147,6 +1232,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v638_2(self):
 		"""Set co-applicant races 2-5 to 6."""
 		name = "v638_2.txt"
@@ -1161,6 +1247,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v638_3(self):
 		"""Set all co-applicant race codes to 1."""
 		name = "v638_3.txt"
@@ -1176,6 +1263,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v638_4(self):
 		"""Set co-applicant race 1 to random choice of 6, 7, 8. Set co-applicant races 2-5 to 1."""
 		name = "v638_4.txt"
@@ -1191,6 +1279,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v639_1(self):
 		"""Set co-applicant race basis to 5."""
 		name = "v639_1.txt"
@@ -1202,6 +1291,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v639_2(self):
 		"""Set co_app race basis to 1. Set co-app race 1 to 21. Set co-app races 2-5 to 21."""
 		name = "v639_2.txt"
@@ -1218,6 +1308,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v639_3(self):
 		"""Set co-app race basis to 2. Set co-app race 1 to blank. Set co-app races 2-5 to 6."""
 		name = "v639_3.txt"
@@ -1234,6 +1325,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v640(self):
 		"""Set co-app race 1 to 7. Set co-app race basis to 1 or 2."""
 		name = "v640.txt"
@@ -1246,6 +1338,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v641(self):
 		"""Set co-app race 1 = 8. Set co-app race basis to random choice of 1-3."""
 		name = "v641.txt"
@@ -1258,6 +1351,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v642_1(self):
 		"""Set applicant sex to 5."""
 		name = "v642_1.txt"
@@ -1269,6 +1363,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v642_2(self):
 		"""Set applicant sex basis to 5."""
 		name = "v642_2.txt"
@@ -1280,6 +1375,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v643(self):
 		"""
 		Set applicant sex basis to 1. Set applicant sex to 3.
@@ -1293,6 +1389,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v644_1(self):
 		"""Set applicant sex basis to 2. Set applicant sex to 4 or 5."""
 		name = "v644_1.txt"
@@ -1305,6 +1402,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v644_2(self):
 		"""Set applicant sex to 6. Set applicant sex basis to 1."""
 		name = "v644_2.txt"
@@ -1317,6 +1415,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v645(self):
 		"""Set applicant sex to 4. Set applicant sex basis to 1 or 2."""
 		name = "v645.txt"
@@ -1329,6 +1428,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v646_1(self):
 		"""Set co-applicant sex to 5."""
 		name = "v646_1.txt"
@@ -1340,6 +1440,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v646_2(self):
 		"""Set co-applicant sex basis to 5."""
 		name = "v646_2.txt"
@@ -1351,6 +1452,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v647(self):
 		"""
 		Set co-app sex basis to 1. Set co-app sex to 3 or 4.
@@ -1364,6 +1466,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v648_1(self):
 		"""Set co-app sex basis to 2. Set co-app sex to 4 or 5."""
 		name = "v648_1.txt"
@@ -1376,6 +1479,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v648_2(self):
 		"""
 		Set co-app sex to 6. Set co app sex basis to random choice of 1, 4.
@@ -1392,6 +1496,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v649(self):
 		"""Set co-app sex to 4. Set co-app sex basis to 1 or 2."""
 		name = "v649.txt"
@@ -1404,6 +1509,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v650(self):
 		"""Set co-app sex basis to 4. Set co-app sex to random choice of 1-4."""
 		name = "v650.txt"
@@ -1416,6 +1522,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v651_1(self):
 		"""Set app age to 0."""
 		name = "v651_1.txt"
@@ -1427,6 +1534,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v651_2(self):
 		"""Set app ethnicity 1 to 4. Set app race 1 to 7. Set app sex to 4. Set app age to 42."""
 		name = "v651_2.txt"
@@ -1441,6 +1549,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v652_1(self):
 		"""Set co-app age to 0."""
 		name = "v652_1.txt"
@@ -1452,6 +1561,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v652_2(self):
 		"""Set co-app ethnicity 1 to 4. Set co-app race 1 to 7. Set co-app sex to 4. Set co-app age to 42."""
 		name = "v652_2.txt"
@@ -1466,6 +1576,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v654_1(self):
 		"""Set income to 1.5."""
 		name = "v654_1.txt"
@@ -1477,6 +1588,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v654_2(self):
 		"""Set affordable units to 5. Set income to 42."""
 		name = "v654_2.txt"
@@ -1489,6 +1601,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v655_1(self):
 		"""Set app ethnicity 1 to 4. Set app race 1 to 7. Set app sex to 4. Set income to 42."""
 		name = "v655_1.txt"
@@ -1503,6 +1616,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v655_2(self):
 		"""Set co-app ethnicity 1 to 4. Set co-app race 1 to 7. Set co-app sex to 4. Set income to 42."""
 		name = "v655_2.txt"
@@ -1517,6 +1631,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v656_1(self):
 		"""Set purchaser type to 10."""
 		name = "v656_1.txt"
@@ -1528,6 +1643,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v656_2(self):
 		"""Set action taken to random choice of 2, 3, 4, 5, 7, 8. Set purchaser type to random 1-9."""
 		name = "v656_2.txt"
@@ -1540,6 +1656,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v657_1(self):
 		"""Set rate spread to blank."""
 		name = "v657_1.txt"
@@ -1551,6 +1668,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v657_2(self):
 		"""Set action taken to random choice of 3, 4, 5, 6, 7. Set rate spread to 5.0."""
 		name = "v657_2.txt"
@@ -1563,6 +1681,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v657_3(self):
 		"""Set reverse mortgage to 1. Set rate spread to 5.0."""
 		name = "v657_3.txt"
@@ -1575,6 +1694,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v658_1(self):
 		"""Set HOEPA status to 5."""
 		name = "v658_1.txt"
@@ -1586,6 +1706,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v658_2(self):
 		"""Set action taken to random choice of 2, 3, 4, 5, 7, 8. Set HOEPA to 1 or 2."""
 		name = "v658_2.txt"
@@ -1598,6 +1719,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v659(self):
 		"""Set lien status to 3."""
 		name = "v659.txt"
@@ -1609,6 +1731,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v660_1(self):
 		"""Set app credit score to "aaa".
 		Set action taken to a random choice of 2, 3, 4, 5, 7, or 8."""
@@ -1622,6 +1745,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v660_2(self):
 		"""Set app credit score model to 10."""
 		name = "v660_2.txt"
@@ -1633,6 +1757,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v661(self):
 		"""Set app credit score to 8888. Set app score model to random of 1-8."""
 		name = "v661.txt"
@@ -1645,6 +1770,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v662_1(self):
 		"""Set app credit score model to random of 1-7, 9. Set app score model text field to random string."""
 		name = "v662_1.txt"
@@ -1652,11 +1778,12 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		lar.app_score_code_8 = lar.app_score_code_8.map(lambda x: ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(20)))
+		lar.app_score_code_8 = utils.char_string_batch(np.full(len(lar), 20))
 		lar.app_score_name = lar.app_score_name.map(lambda x: random.choice(["-1", "1", "2", "3", "4", "5", "6", "7", "9"]))
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v662_2(self):
 		"""Set app score model to 8. Set app score model text field to blank."""
 		name = "v662_2.txt"
@@ -1669,6 +1796,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v663(self):
 		""" Set action taken to random of 4, 5, 6. 
 		Set app credit score to 700. 
@@ -1682,10 +1810,11 @@ class test_data_creator(object):
 		lar.action_taken = lar.action_taken.map(lambda x: random.choice(["4", "5", "6"]))
 		lar.app_credit_score = "700"
 		lar.app_score_name = lar.app_score_name.map(lambda x: random.choice(["1", "2", "3", "4", "5", "6", "7", "8"]))
-		lar.app_score_code_8 = lar.app_score_code_8.map(lambda x: "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(20)))
+		lar.app_score_code_8 = utils.char_string_batch(np.full(len(lar), 20))
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v664(self):
 		"""Set action taken to random of 4, 5, 6. 
 		Set co-app score to 700. 
@@ -1699,10 +1828,11 @@ class test_data_creator(object):
 		lar.action_taken = lar.action_taken.map(lambda x: random.choice(["4", "5", "6"]))
 		lar.co_app_credit_score = "700"
 		lar.co_app_score_name = lar.co_app_score_name.map(lambda x: random.choice(["1", "2", "3", "4", "5", "6", "7", "8"]))
-		lar.co_app_score_code_8 = lar.co_app_score_code_8.map(lambda x: "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(20)))
+		lar.co_app_score_code_8 = utils.char_string_batch(np.full(len(lar), 20))
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v665_1(self):
 		"""Set co-app score to 'aaa'."""
 		name = "v665_1.txt"
@@ -1714,6 +1844,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v665_2(self):
 		"""Set co-app score name to 0."""
 		name = "v665_2.txt"
@@ -1725,6 +1856,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v666_1(self):
 		"""Set co-app credit score to 8888. Set co app score name to random 1-8."""
 		name = "v666_1.txt"
@@ -1737,6 +1869,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v666_2(self):
 		"""Set co-app score to 9999. Set co app score name to random 1-9."""
 		name = "v666_2.txt"
@@ -1749,6 +1882,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v667_1(self):
 		"""Set co-app score name to 1-7, 9, 10. Set co-app score text to random string."""
 		name = "v667_1.txt"
@@ -1756,11 +1890,12 @@ class test_data_creator(object):
 		path = self.validity_path
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
-		lar.co_app_score_code_8 = lar.co_app_score_code_8.map(lambda x: "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(20)))
+		lar.co_app_score_code_8 = utils.char_string_batch(np.full(len(lar), 20))
 		lar.co_app_score_name = lar.co_app_score_name.map(lambda x: random.choice(["1", "2", "3", "4", "5", "6", "7", "9", "10"]))
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v667_2(self):
 		"""Set co-app score name to 8. Set co-app score text to blank."""
 		name = "v667_2.txt"
@@ -1773,6 +1908,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v668_1(self):
 		"""Set app ethnicity 1 to 4. Set app race 1 to 7. Set app sex to 4. Set app credit score to 700."""
 		name = "v668_1.txt"
@@ -1787,6 +1923,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v668_2(self):
 		"""Set co-app ethnicity to 4. Set co-app race to 7. Set co-app sex to 4. Set co-app credit score to 700."""
 		name = "v668_2.txt"
@@ -1801,6 +1938,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v669_1(self):
 		"""Set denial reason 1 to 25."""
 		name = "v669_1.txt"
@@ -1812,6 +1950,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v669_2(self):
 		"""Set denial reason 2-4 to 10 or blank."""
 		name = "v669_2.txt"
@@ -1825,6 +1964,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v669_3(self):
 		"""Set all reasons for denial to 1."""
 		name = "v669_3.txt"
@@ -1839,6 +1979,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v669_4(self):
 		"""Set denial reason 1 to 10. Set denial reasons 2-4 to 2,3,4."""
 		name = "v669_4.txt"
@@ -1853,6 +1994,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v670_1(self):
 		"""
 		Set action taken to 3 or 7. 
@@ -1870,6 +2012,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v670_2(self):
 		"""
 		Set action taken to random 1-6, 8. 
@@ -1887,6 +2030,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v670_3(self):
 		"""
 		Set Denial 1 to random of 1, 2, 3, 4, 5, 6, 7, 8, or 9
@@ -1904,6 +2048,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v670_4(self):
 		"""
 
@@ -1919,6 +2064,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v671_1(self):
 		"""Set denial 1-4 to code 9. Set denial text to blank."""
 		name = self.name_prefix + "v671_1.txt"
@@ -1933,6 +2079,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v671_2(self):
 		"""Set denial 1-4 to random 1-8. Set denial text to random string."""
 		name = "v671_2.txt"
@@ -1944,10 +2091,11 @@ class test_data_creator(object):
 		lar.denial_2 = lar.denial_2.map(lambda x: random.choice(str(random.randrange(1,9))))
 		lar.denial_3 = lar.denial_3.map(lambda x: random.choice(str(random.randrange(1,9))))
 		lar.denial_4 = lar.denial_4.map(lambda x: random.choice(str(random.randrange(1,9))))
-		lar.denial_code_9 = "".join(random.choice(string.ascii_uppercase + string.digits) for _ in range(20))
+		lar.denial_code_9 = utils.char_string_gen(20)
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v672_1(self):
 		"""Set loan costs to -1."""
 		name = "v672_1.txt"
@@ -1959,6 +2107,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v672_2(self):
 		"""Set points and fees to 1. Set loan costs to 500."""
 		name = "v672_2.txt"
@@ -1971,6 +2120,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v672_3(self):
 		"""Set reverse mortgage to 1. Set loan costs to 500."""
 		name = "v672_3.txt"
@@ -1983,6 +2133,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v672_4(self):
 		"""Set open-end-credit to 1. Set loan costs to 500."""
 		name = "v672_4.txt"
@@ -1995,6 +2146,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v672_5(self):
 		"""Set business purpose to 1. Set loan costs to 500."""
 		name = "v672_5.txt"
@@ -2007,6 +2159,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v672_6(self):
 		""" Set action taken to random of 2, 3, 4, 5, 7, 8. Set loan costs to 500."""
 		name = "v672_6.txt"
@@ -2019,6 +2172,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v673_1(self):
 		"""Set points and fees to -1 or blank."""
 		name = "v673_1.txt"
@@ -2030,6 +2184,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v673_2(self):
 		"""Set action taken to random of 2, 3, 4, 5, 6, 7 or 8. Set points and fees to 500."""
 		name = "v673_2.txt"
@@ -2042,6 +2197,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v673_3(self):
 		"""Set reverse mortgage to 1. Set points and fees to 500."""
 		name = "v673_3.txt"
@@ -2054,6 +2210,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v673_4(self):
 		"""Set business purpose to 1. Set points and fees to 500."""
 		name = "v673_4.txt"
@@ -2066,6 +2223,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v673_5(self):
 		"""Set loan costs to 1. Set points and fees to 500."""
 		name = "v673_5.txt"
@@ -2078,6 +2236,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v674_1(self):
 		"""Set origination charges to '-1.'"""
 		name = "v674_1.txt"
@@ -2089,6 +2248,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v674_2(self):
 		"""Set reverse mortgage to 1. Set origination charges to 500."""
 		name = "v674_2.txt"
@@ -2101,6 +2261,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v674_3(self):
 		"""set open-end-credit to 1. Set origination charges to 500."""
 		name = "v674_3.txt"
@@ -2113,6 +2274,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v674_4(self):
 		"""Set business purpose to 1. Set origination charges to 500."""
 		name = "v674_4.txt"
@@ -2125,6 +2287,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v674_5(self):
 		"""Set action taken to random of 2, 3, 4, 5, 7 or 8. Set origination charges to 500."""
 		name = "v674_5.txt"
@@ -2137,6 +2300,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v675_1(self):
 		"""Set discount points to 0."""
 		name = "v675_1.txt"
@@ -2148,6 +2312,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v675_2(self):
 		"""Set reverse mortgage to 1. Set discount points to 500."""
 		name = "v675_2.txt"
@@ -2160,6 +2325,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v675_3(self):
 		"""Set open end credit to 1. Set discount points to 500."""
 		name = "v675_3.txt"
@@ -2172,6 +2338,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v675_4(self):
 		"""Set business purpose to 1. Set discount points to 500."""
 		name = "v675_4.txt"
@@ -2184,6 +2351,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v675_5(self):
 		"""Set action taken to random of 2, 3, 4, 5, 7 or 8. Set discount points to 500."""
 		name = "v675_5.txt"
@@ -2196,6 +2364,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v676_1(self):
 		"""Set lender credits to 0 or -1."""
 		name = "v676_1.txt"
@@ -2207,6 +2376,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v676_2(self):
 		"""Set reverse mortgage to 1. Set lender credits to 500."""
 		name = "v676_2.txt"
@@ -2219,6 +2389,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v676_3(self):
 		"""Set open end credit to 1. Set lender credits to 500."""
 		name = "v676_3.txt"
@@ -2231,6 +2402,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v676_4(self):
 		"""Set business purpose to 1. Set lender credits to 500."""
 		name = "v676_4.txt"
@@ -2243,6 +2415,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v676_5(self):
 		"""Set action taken to random of 2, 3, 4, 5, 7 or 8. Set lender credits to 500."""
 		name = "v676_5.txt"
@@ -2255,6 +2428,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v677_1(self):
 		"""Set interest rate to -1."""
 		name = "v677_1.txt"
@@ -2266,6 +2440,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v677_2(self):
 		"""Set action taken to 3, 4, 5, or 7. Set interest rate to 10.0."""
 		name = "v677_2.txt"
@@ -2278,6 +2453,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v678_1(self):
 		"""Set penalty term to 0 or -1."""
 		name = "v678_1.txt"
@@ -2289,6 +2465,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v678_2(self):
 		"""Set action taken to 6. Set penalty term to 30."""
 		name = "v678_2.txt"
@@ -2301,6 +2478,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v678_3(self):
 		"""Set reverse mortgage to 1. Set penalty term to 30."""
 		name = "v678_3.txt"
@@ -2313,6 +2491,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v678_4(self):
 		"""Set business purpose to 1. Set penalty term to 30."""
 		name = "v678_4.txt"
@@ -2325,6 +2504,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v678_5(self):
 		"""Set penalty term to 360. Set loan term to 30."""
 		name = "v678_5.txt"
@@ -2337,6 +2517,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v679_1(self):
 		"""Set DTI to AA."""
 		name = "v679_1.txt"
@@ -2348,6 +2529,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v679_2(self):
 		"""Set action taken to random of 4, 5, 6. Set DTI to 15."""
 		name = "v679_2.txt"
@@ -2360,6 +2542,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v679_3(self):
 		"""Set affordable units to 1. Set DTI to 15."""
 		name = "v679_3.txt"
@@ -2372,6 +2555,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v680_1(self):
 		"""Set app eth 1 to 4. Set app race 1 to 7. Set app sex to 4. Set co-app eth 1 to 5.
 		Set co-app race 1 to 8. Set co-app sex to 5. Set DTI to 15."""
@@ -2390,6 +2574,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v680_2(self):
 		"""Set app eth 1 to 4. Set app race 1 to 7. Set app sex to 4. Set co-app eth 1 to 4.
 		Set co-app race 1 to 7. Set co-app sex to 4. Set DTI to 15."""
@@ -2408,6 +2593,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v681_1(self):
 		"""Set CLTV to 0 or -1."""
 		name = "v681_1.txt"
@@ -2419,6 +2605,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v681_2(self):
 		"""Set action taken to random of 4, 5, 6. Set CLTV to 15."""
 		name = "v681_2.txt"
@@ -2431,6 +2618,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v682_1(self):
 		"""Set loan term to 0."""
 		name = "v682_1.txt"
@@ -2442,6 +2630,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v682_2(self):
 		"""Set reverse mortgage to 1. Set loan term to 30."""
 		name = "v682_2.txt"
@@ -2454,6 +2643,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v683(self):
 		"""Set introductory rate period to 0 or -1."""
 		name = "v683.txt"
@@ -2465,6 +2655,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v684(self):
 		"""Set balloon payment to "3" """
 		name = "v684.txt"
@@ -2476,6 +2667,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v685(self):
 		"""Set interest only payments to 0."""
 		name = "v685.txt"
@@ -2487,6 +2679,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v686(self):
 		"""Set negative amortization to 0 or blank."""
 		name = "v686.txt"
@@ -2498,6 +2691,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v687(self):
 		"""Set Other Non-Amortizing features to 0."""
 		name = "v687.txt"
@@ -2509,6 +2703,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v688_1(self):
 		"""Set property value to 0."""
 		name = "v688_1.txt"
@@ -2520,6 +2715,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v688_2(self):
 		"""Set action taken to 4 or 5. Set property value to 1."""
 		name = "v688_2.txt"
@@ -2532,6 +2728,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v689_1(self):
 		"""Set manufactured type to 0."""
 		name = "v689_1.txt"
@@ -2543,6 +2740,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v689_2(self):
 		"""Set affordable units to 1.
 		   Set manufactured type to 1 or 2."""
@@ -2556,6 +2754,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v689_3(self):
 		"""Set construction method to 1.
 		   Set manufactured type to 1 or 2."""
@@ -2569,6 +2768,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v690_1(self):
 		"""Set manufactured interest to 0."""
 		name = "v690_1.txt"
@@ -2580,6 +2780,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v690_2(self):
 		"""Set affordable units to 1.
 		   Set manufactured interest to random 1-4."""
@@ -2593,6 +2794,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v690_3(self):
 		"""Set construction method to 1.
 		   Set manufactured interest to random 1-4."""
@@ -2606,6 +2808,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v691(self):
 		"""Set total units to 0."""
 		name = "v691.txt"
@@ -2617,6 +2820,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v692_1(self):
 		"""Set affordable units to 40.5."""
 		name = "v692_1.txt"
@@ -2628,6 +2832,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v692_2(self):
 		"""Set total units to random 1-4.
 		   Set affordable units to 0."""
@@ -2641,6 +2846,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 	
+	@file_edits.register()
 	def v692_3(self):
 		"""
 		Set total units to 6.
@@ -2656,6 +2862,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v693_1(self):
 		"""
 		Set app submission to 0.
@@ -2668,6 +2875,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v693_2(self):
 		"""
 		Set action taken to 6.
@@ -2682,6 +2890,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v693_3(self):
 		"""
 		Set app submission to 3 and action taken to != 6
@@ -2695,6 +2904,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 		
+	@file_edits.register()
 	def v694_1(self):
 		"""Set initially payable to 0."""
 		name = "v694_1.txt"
@@ -2706,6 +2916,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v694_2(self):
 		"""Set action taken to 6 and initially payable to 1 or 2."""
 		name = "v694_2.txt"
@@ -2718,6 +2929,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v694_3(self):
 		"""Set action taken to 1 and initially payable to 3."""
 		name = "v694_3.txt"
@@ -2730,6 +2942,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v695(self):
 		"""Set NMLSR ID to blank."""
 		name = "v695.txt"
@@ -2741,6 +2954,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v696_1(self):
 		"""Set AUS 1 to blank or set AUS 2-5 to 6."""
 		name = "v696_1.txt"
@@ -2755,6 +2969,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v696_2(self):
 		"""Set AUS result 1 to blank and set AUS 2-5 to 25."""
 		name = "v696_2.txt"
@@ -2769,6 +2984,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v696_3(self):
 		"""Set AUS 1 to 1 and AUS 2-5 to blank.
 		   Set AUS Result: 1 to 9, AUS Result: 2 to 10,
@@ -2791,6 +3007,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v699(self):
 		"""Set AUS 1 to 5, set AUS Result 1 to 25."""
 		name = "v699.txt"
@@ -2803,6 +3020,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 		
+	@file_edits.register()
 	def v700_1(self):
 		"""Set AUS 1 to 6 and AUS Result 1-5 to 1-16."""
 		name = "v700_1.txt"
@@ -2819,6 +3037,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 		
+	@file_edits.register()
 	def v700_2(self):
 		"""Set AUS Result 1 to 17 and set AUS 1 to 1-5.
 		   Set AUS Result 2-5 to 1-16."""
@@ -2836,6 +3055,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 		
+	@file_edits.register()
 	def v701(self):
 		"""Set AUS 2 to blank and set AUS Result 2 to 1-16."""
 		name = "v701.txt"
@@ -2848,6 +3068,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v702_1(self):
 		"""Set AUS 1 to 5 and set AUS: conditional text to blank."""
 		name = "v702_1.txt"
@@ -2860,6 +3081,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v702_2(self):
 		"""Set AUS conditional text to a non-empty string and set AUS 1-5 != 5."""
 		name = "v702_2.txt"
@@ -2876,6 +3098,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v703_1(self):
 		"""Set AUS Result 1 to 16 and set AUS Result free form text to blank."""
 		name = "v703_1.txt"
@@ -2888,6 +3111,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 		
+	@file_edits.register()
 	def v703_2(self):
 		"""Set AUS Result free form text to non-empty string 
 		   and set AUS Result 1-5 != 16."""
@@ -2905,6 +3129,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v704_1(self):
 		"""Set action taken = 6 and set AUS 1 to 1-5."""
 		name = "v704_1.txt"
@@ -2917,6 +3142,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v704_2(self):
 		"""Set action taken = 6 and set AUS Result 1 to 1-16."""
 		name = "v704_2.txt"
@@ -2929,6 +3155,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v705_1(self):
 		"""Set app ethnicity 1 = 4 and app race 1 = 7 and app sex = 4 (non-natural person).
 			Set co-app ethnicity 1 = 5 and co app race 1 = 8 and co app sex = 5.
@@ -2950,6 +3177,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v705_2(self):
 		"""Set app ethnicity 1 = 4 and app race 1 = 7 and app sex = 4.
 			Set co-app ethnicity 1 = 5 and co app race 1 = 8 and co app sex = 5.
@@ -2970,6 +3198,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v706(self):
 		"""Set reverse mortgage to 0."""
 		name = "v706.txt"
@@ -2981,6 +3210,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v707(self):
 		"""Set Open-End Line of Credit to 0."""
 		name = "v707.txt"
@@ -2992,6 +3222,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v708(self):
 		"""Set Business or Commercial Purpose to 0."""
 		name = "v708.txt"
@@ -3003,6 +3234,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v709(self):
 		"""Set City and Zip Code to Exempt and Street Address to not Exempt"""
 		name = "v709.txt"
@@ -3016,6 +3248,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v710_1(self):
 		"""Set Applicant Credit Score to Exempt ("1111"), and set Co-Applicant Credit Score,
 		Applicant Score Name, and Co-Applicant Score Name to 650, 1, and 1 
@@ -3032,6 +3265,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v710_2(self):
 		"""Set Applicant Credit Score to Exempt("1111"), and set
 		Applicant Score Name, Co-Applicant Score Name, Applicant Score Code 8
@@ -3050,6 +3284,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v711(self):
 		"""Set Denial 1 to Exempt ("1111"), and set
 		Denial 2, Denial 3, Denial 4
@@ -3068,6 +3303,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v712_a(self):
 		"""Set Loan Costs to Exempt, and set
 		Points and Fees to 1000."""
@@ -3081,6 +3317,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v712_b(self):
 		"""Set Points and Fees to Exempt, and set
 		Loan Costs to 1000."""
@@ -3095,6 +3332,7 @@ class test_data_creator(object):
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
 
+	@file_edits.register()
 	def v713_1(self):
 		"""Set AUS 1 to Exempt ("1111"), and AUS Result 1 to 1."""
 		name = "v713_1.txt"
@@ -3107,6 +3345,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 	
+	@file_edits.register()
 	def v713_2(self):
 		"""Set AUS 1 to Exempt ("1111"), AUS 2-5, AUS Result 2-5, 
 		AUS Code 5, and AUS Code 16 to 1."""
@@ -3130,6 +3369,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 		
+	@file_edits.register()
 	def v714_a(self):
 		"""Set Submission of Application to Exempt ("1111") and Initially Payable
 			to Your Institution to 1."""
@@ -3143,6 +3383,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v714_b(self):
 		"""Set Initially Payable to Your Institution to Exempt ("1111") and 
 		Submission of Application to 1."""
@@ -3156,6 +3397,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v715_a(self):
 		"""Set Balloon Payments to Exempt ("1111"); set 
 		Interest-Only Payments, Negative Amortizing Features, and Other Non-Amortizing Features 
@@ -3172,6 +3414,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v715_b(self):
 		"""Set Other Non-Amortizing Features to Exempt ("1111"); set 
 		Interest-Only Payments, Negative Amortizing Features, and Balloon Payments 
@@ -3188,6 +3431,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v715_c(self):
 		"""
 		Set Interest-Only Payments to Exempt ("1111"); set 
@@ -3205,6 +3449,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v715_d(self):
 		"""
 		Set Negative Amortizing Features to Exempt ("1111"); set 
@@ -3222,6 +3467,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v716(self):
 		"""
 		Set state and county to invalid combination
@@ -3237,6 +3483,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v717_a(self):
 		"""
 		Set email address to blank
@@ -3250,6 +3497,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def v717_b(self):
 		"""
 		Remove @ symbol from email address
@@ -3262,6 +3510,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 		
+	@file_edits.register()
 	def v717_c(self):
 		"""
 		Remove . symbol from email address
@@ -3274,6 +3523,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 		
+	@file_edits.register()
 	def q600(self):
 		"""
 		Set all ULIs to same value.
@@ -3287,6 +3537,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q601(self):
 		"""Set all application dates to 2 or more years prior to action taken date."""
 		name = "q601.txt"
@@ -3298,6 +3549,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q602(self):
 		"""Set street address to NA. Set city and zip code to not NA"""
 		name = "q602.txt"
@@ -3311,6 +3563,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q603(self):
 		"""Set county to non-small county.
 			Set census tract = NA."""
@@ -3320,12 +3573,12 @@ class test_data_creator(object):
 		ts = self.ts_df.copy()
 		lar = self.lar_df.copy()
 		lar.tract = "NA"
-		big_counties = list(self.county_df.county_fips[self.county_df.small_county!="1"])
-		lar.county = lar.county.map(lambda x: random.choice(big_counties))
+		lar.county = lar.county.map(lambda x: random.choice(self.geo.big_counties))
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
 
+	@file_edits.register()
 	def q605_1(self):
 		"""Set purchaser to 1 or 3.
 		Set loan type != 1."""
@@ -3339,6 +3592,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q605_2(self):
 		"""Set purchaser to 2.
 		Set loan type to 1."""
@@ -3352,6 +3606,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q606(self):
 		"""Set income to 40000."""
 		name = "q606.txt"
@@ -3363,6 +3618,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q607(self):
 		"""Set lien status = 2.
 		Set loan amount to 300,000."""
@@ -3376,6 +3632,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q608(self):
 		"""Set action taken to 1.
 		Set action taken date the same day as the application date."""
@@ -3390,6 +3647,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q609(self):
 		"""Set purchaser to 1-4.
 		Set rate spread to 15%."""
@@ -3403,6 +3661,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q610(self):
 		"""Set action taken to 1.
 		Set lien status to 1.
@@ -3420,6 +3679,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q611(self):
 		"""Set action taken to 1.
 		Set lien status to 2.
@@ -3436,6 +3696,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)		
 
+	@file_edits.register()
 	def q612(self):
 		"""Set purchaser to 1 or 3.
 		Set HOEPA Status to 1."""
@@ -3449,6 +3710,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q613(self):
 		"""
 		Set business purpose to 1.
@@ -3463,6 +3725,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q614_1(self):
 		"""Set borrower age to 240"""
 		name = self.name_prefix + "q614_1.txt"
@@ -3473,6 +3736,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q614_2(self):
 		"""
 		Set co_borrower age to 240
@@ -3485,6 +3749,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q615_1(self):
 		"""
 		Set total loan costs to 1000 and origination charges to 500.
@@ -3498,6 +3763,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q615_2(self):
 		"""Set origination charges to 1000 and points and fees to 500."""
 		name = "q615_2.txt"
@@ -3510,6 +3776,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q616_1(self):
 		"""Set total loan costs lower than discount points."""
 		name = "q616_1.txt"
@@ -3522,6 +3789,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q616_2(self):
 		"""Set total points and fees lower than discount points."""
 		name = "q616_2.txt"
@@ -3534,6 +3802,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q617(self):
 		"""
 		Set CLTV lower than LTV (using loan_amount/property_value).
@@ -3553,6 +3822,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q618(self):
 		"""Set construction method to 2 and manufactured home secured property type to 3."""
 		name = "q618.txt"
@@ -3565,6 +3835,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q619(self):
 		"""Set construction method to 2 and manufactured home land property interest to 5"""
 		name = "q619.txt"
@@ -3577,6 +3848,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q620(self):
 		"""Set business or commercial purpose to 2 and NMLSR ID to not NA."""
 		name = "q620.txt"
@@ -3589,6 +3861,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q621(self):
 		"""Set NMLSR to length > 12 characters (1/2 file)
 		Set NMLSR to 12 characters with special characters (1/2 file)"""
@@ -3604,6 +3877,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q622(self):
 		"""Set reverse mortgage to 1 and age to 15."""
 		name = "q622.txt"
@@ -3616,6 +3890,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q623(self):
 		"""Set total units to <= 4.
 		Set income to <200.
@@ -3631,6 +3906,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q624(self):
 		"""Set loan type to 2.
 		Set total units to 1.
@@ -3646,6 +3922,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q625(self):
 		"""Set loan type to 3.
 		Set total units <= 4.
@@ -3661,6 +3938,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q626(self):
 		"""Set purchaser to 1-4.
 		Set total units to <= 4.
@@ -3676,6 +3954,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q627(self):
 		"""Set total units to >=5.
 		Set loan amount to random of 90000 and 11000000."""
@@ -3689,6 +3968,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q628(self):
 		"""Set loan purpose to 1.
 		Set total units <= 4.
@@ -3704,6 +3984,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q629(self):
 		"""Set action taken to random choice of 1,2,3,4,5,7,8.
 		Set total units <=4.
@@ -3721,6 +4002,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q630(self):
 		"""Set total units to 5 or more.
 		Set HOEPA status to 1 or 2."""
@@ -3734,6 +4016,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q631(self):
 		"""Set loan type to 2, 3, or 4.
 		Set total units to 5 or more."""
@@ -3747,6 +4030,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q632(self):
 		"""Set all AUS systems to 5.
 		Set all AUS results to 5-7."""
@@ -3768,6 +4052,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q633(self):
 		"""Set all AUS systems to 4.
 		Set all AUS results to 1-2, 5-9, 11-14, or 17."""
@@ -3789,6 +4074,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def m634(self):
 		"""Set action taken to 1.
 		Set loan purpose to 1.
@@ -3803,6 +4089,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def m635(self):
 		"""Set action taken = 2."""
 		name = "q635.txt"
@@ -3814,6 +4101,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def m636(self):
 		"""Set action taken = 4."""
 		name = "q636.txt"
@@ -3825,6 +4113,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def m637(self):
 		"""Set action taken = 5."""
 		name = "q637.txt"
@@ -3836,6 +4125,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def m638(self):
 		"""Set action taken = 2."""
 		name = "q638.txt"
@@ -3847,6 +4137,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def m639(self):
 		"""
 		Set preapproval = 1.
@@ -3865,6 +4156,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def m640(self):
 		"""Set income to 9."""
 		name = "q640.txt"
@@ -3876,6 +4168,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q642_1(self):
 		"""Set borrower credit score to 7777.
 		Set borrower score model to 1-6."""
@@ -3889,6 +4182,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q642_2(self):
 		"""Set co-borrower credit score to 7777.
 		Set co-orrower score model to 1-6."""
@@ -3902,6 +4196,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q643(self):
 		"""Set AUS systems to 1.
 		Set AUS results to 8-14, 17-24."""
@@ -3928,6 +4223,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)		
 
+	@file_edits.register()
 	def q644(self):
 		"""Set all AUS systems to 2.
 		Set AUS results to 1-7, 14-15, 17-24."""
@@ -3954,6 +4250,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q645_1(self):
 		"""
 		Set loan amount to $400.
@@ -3969,6 +4266,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q645_2(self):
 		"""
 		Set loan purpose to 1 and loan amount to $900. 
@@ -3985,6 +4283,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def m646_a(self):
 		"""
 		This tests the TS data condition
@@ -4004,6 +4303,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def m646_b(self):
 		"""
 		This tests the LAR data condition
@@ -4021,6 +4321,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def m647_a(self):
 		"""
 		Set Agency code for TS to 7. Set Street Address, City, and 
@@ -4038,6 +4339,7 @@ class test_data_creator(object):
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
 
+	@file_edits.register()
 	def m647_b(self):
 		"""
 		Set Agency code for TS to 7. 
@@ -4053,6 +4355,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q648(self):
 		"""
 		Set action taken to 6 and set the first 20 characters of the ULI to != the LEI
@@ -4069,6 +4372,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q649_1(self):
 		"""
 		Set app credit score to random choice of 200 or 1000
@@ -4084,6 +4388,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q649_2(self):
 		"""
 		Set co app credit score to random choice of 200 or 1000
@@ -4099,6 +4404,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q650(self):
 		"""
 		Set interest rate to .1
@@ -4113,6 +4419,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q651(self):
 		"""
 		Set CLTV to .1
@@ -4129,6 +4436,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q652(self):
 		"""
 		Set DTI to 0.1
@@ -4143,6 +4451,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q653_1(self):
 		"""
 		Set action taken to random choice of 1, 2, or 8 and CLTV to random choice of 0 or 300
@@ -4158,6 +4467,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q653_2(self):
 		"""
 		Set action taken to random choice of 3, 4, 5, 6, or 7 and CLTV to 0 or 1100
@@ -4173,6 +4483,7 @@ class test_data_creator(object):
 		print("writing {name}".format(name=name))
 		utils.write_file(name=name, path=path, ts_input=ts, lar_input=lar)
 
+	@file_edits.register()
 	def q654(self):
 		"""
 		Set income to 6000, Action Taken to random choice of 1, 2, or 8 and DTI to 0 or 90
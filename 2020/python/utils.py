@@ -2,11 +2,13 @@
 #in order to generate clean and failing synthetic data files.
 
 #Imports the necessary libraries.
+import csv
 import math
 import json
 import os
 import random
 import string
+import numpy as np
 import pandas as pd
 import yaml
 import utils
@@ -55,10 +57,11 @@ def write_file(path=None, ts_input=None, lar_input=None, name="test_file.txt"):
 			final_file.write("{line}".format(line=line))
 
 
-def read_data_file(path, data_file, lar_schema=None, ts_schema=None):
+def read_data_file(path, data_file, lar_schema=None, ts_schema=None, lar_fields=None):
 	"""
 	Reads a complete file (includes LAR and TS rows) into a pandas 
 	dataframe and returns them.
+	lar_fields: optional list of LAR fields to read. If passed, only these LAR columns are parsed.
 	"""
 	if lar_schema is None:
 		lar_schema = pd.DataFrame(json.load(open("../schemas/lar_schema.json", "r")))
@@ -74,41 +77,137 @@ def read_data_file(path, data_file, lar_schema=None, ts_schema=None):
 			ts_data = []
 			ts_data.append(ts_row.split("|"))
 
+			#create dataframes of TS and LAR data
+			ts_df = pd.DataFrame(data=ts_data, dtype=object, columns=ts_schema.field)
+			if lar_fields is not None:
+				lar_df = read_lar_columns(path+data_file, lar_fields=lar_fields, all_fields=list(lar_schema.field))
+				return ts_df, lar_df
+
 			#split LAR rows from file
 			lar_rows = infile.readlines()
 			lar_data = [line.strip("\n").split("|") for line in lar_rows]
-
-			#create dataframes of TS and LAR data
-			ts_df = pd.DataFrame(data=ts_data, dtype=object, columns=ts_schema.field)
 			lar_df  = pd.DataFrame(data=lar_data, dtype=object, columns=lar_schema.field)
 
 			return ts_df, lar_df
 	else:
 		raise ValueError("A data file must be passed.")
 
+def read_lar_columns(data_file, lar_fields, all_fields, skip_rows=1, dtypes=None):
+	"""
+	Reads only the passed LAR fields from a pipe delimited file and returns them as a dataframe of strings.
+	Columns are returned in file (schema) order. The TS row is skipped with skip_rows.
+	data_file: full path to the file
+	lar_fields: LAR fields to parse
+	all_fields: all LAR fields in file order, used to locate the columns to parse
+	dtypes: optional dictionary of field to pandas dtype (for example "category"), other fields are read as strings
+	"""
+	lar_fields = [field for field in all_fields if field in set(lar_fields)]
+	field_dtypes = {field: object for field in lar_fields}
+	if dtypes is not None:
+		field_dtypes.update(dtypes)
+	try:
+		lar_df = pd.read_csv(data_file, sep="|", header=None, names=all_fields, usecols=lar_fields, skiprows=skip_rows,
+			dtype=field_dtypes, na_filter=False, quoting=csv.QUOTE_NONE)
+	except pd.errors.EmptyDataError:
+		lar_df = pd.DataFrame([], columns=lar_fields, dtype=object)
+	return lar_df[lar_fields]
+
+def read_lar_chunks(data_file, lar_fields, all_fields, chunk_rows, skip_rows=1, dtypes=None):
+	"""
+	Generator version of read_lar_columns that yields the LAR rows of a file as dataframes of at most chunk_rows rows.
+	The index of each chunk continues from the previous chunk so that it holds the row position in the LAR data.
+	A file with no LAR rows yields a single empty dataframe.
+	"""
+	lar_fields = [field for field in all_fields if field in set(lar_fields)]
+	field_dtypes = {field: object for field in lar_fields}
+	if dtypes is not None:
+		field_dtypes.update(dtypes)
+	chunk_count = 0
+	try:
+		reader = pd.read_csv(data_file, sep="|", header=None, names=all_fields, usecols=lar_fields, skiprows=skip_rows,
+			dtype=field_dtypes, na_filter=False, quoting=csv.QUOTE_NONE, chunksize=chunk_rows)
+	except pd.errors.EmptyDataError:
+		reader = None
+	if reader is not None:
+		#TextFileReader is not a context manager before pandas 1.2, so the file is closed explicitly
+		try:
+			for lar_df in reader:
+				chunk_count += 1
+				yield lar_df[lar_fields]
+		except pd.errors.EmptyDataError:
+			pass
+		finally:
+			reader.close()
+	if chunk_count == 0:
+		yield pd.DataFrame([], columns=lar_fields, dtype=object)
+
+def load_census_data(census_file, file_columns, header=0, cache_dir=None):
+	"""
+	Loads the HMDA Ops cut of the FFIEC Census Flat File as a dataframe of strings and adds
+	county_fips (2 digit state + 3 digit county) and tract_fips (5 digit county + 6 digit tract) columns.
+	census_file: path to the pipe delimited census file
+	file_columns: column names for the census file, usually file_columns from geographic_data.yaml
+	header: passed to read_csv, 0 replaces the first row with file_columns, None reads the first row as data
+	cache_dir: optional directory, usually census_cache_filepath from test_filepaths.yaml, where the processed
+		dataframe is pickled and reused while the census file size and modification time are unchanged.
+		If None, or the cache cannot be written, the census file is loaded without a cache.
+	"""
+	stat = os.stat(census_file)
+	cache_key = (stat.st_size, stat.st_mtime_ns, header, tuple(file_columns))
+	cache_file = None
+	if cache_dir is not None:
+		cache_file = os.path.join(cache_dir, os.path.basename(census_file) + ".pkl")
+
+	if cache_file is not None and os.path.isfile(cache_file):
+		try:
+			cached = pd.read_pickle(cache_file)
+			if cached["key"] == cache_key:
+				return cached["data"]
+		except Exception as e:
+			print("unable to read census cache {file}: {error}".format(file=cache_file, error=e))
+
+	geographic_data = pd.read_csv(census_file, delimiter='|', header=header, names=file_columns, dtype=object)
+	#create 5 digit County Codes from 2 digit state and 3 digit county
+	geographic_data["county_fips"] = geographic_data["state_code"].astype(str) + geographic_data["county"].astype(str)
+	#create 11 digit Census Tract codes from 5 digit county and 6 digit tract
+	geographic_data["tract_fips"] = geographic_data["county_fips"] + geographic_data["tracts"].astype(str)
+
+	if cache_file is not None:
+		#the pickle is written to a temporary file and moved into place so a failed write does not leave a partial cache
+		temp_file = cache_file + ".tmp"
+		try:
+			if not os.path.exists(cache_dir):
+				os.makedirs(cache_dir)
+			pd.to_pickle({"key": cache_key, "data": geographic_data}, temp_file)
+			os.replace(temp_file, cache_file)
+		except Exception as e:
+			print("unable to write census cache {file}: {error}".format(file=cache_file, error=e))
+			if os.path.exists(temp_file):
+				try:
+					os.remove(temp_file)
+				except OSError:
+					pass
+	return geographic_data
+
 def unique_uli(new_lar_df=None, lei=None):
     """
     Generates a set of unique ULI's for a LAR dataframe.
     """
 
-    #Copy over ULIs with the LEI
-    new_lar_df["uli"] = new_lar_df["uli"].apply(lambda x: lei)  
-    
     #Generates a loan ID as a random 23-character string for each LEI
-    new_lar_df["uli"] = new_lar_df["uli"].apply(lambda x: x + utils.char_string_gen(23)) 
-    
+    uli_bodies = lei + pd.Series(utils.char_string_batch(np.full(len(new_lar_df), 23)), index=new_lar_df.index, dtype=object)
+
     #Adds a check digit to each ULI
-    new_lar_df['uli'] = new_lar_df["uli"].apply(lambda x: x + utils.check_digit_gen(ULI=x))
+    new_lar_df["uli"] = uli_bodies + utils.check_digit_batch(uli_bodies)
 
-    #If ULIs are duplicated, the unique_uli function is applied again.  
-    #FIXME: remove recursion and replace with nexted loops:
-    	#for loop for length of new lar file size
-    	#while loop to create new ULIs and check against an established list for duplication
-    if len(new_lar_df['uli']) > len(set(new_lar_df['uli'])):
+    #If ULIs are duplicated, new loan IDs are generated for the duplicates until all ULIs are unique.
+    dupes = new_lar_df["uli"].duplicated()
+    while dupes.any():
         print("Re-Running")
-        self.unique_uli(new_lar_df)
-    else:
-        print("Unique ULIs Assigned")
+        uli_bodies = lei + pd.Series(utils.char_string_batch(np.full(dupes.sum(), 23)), index=new_lar_df.index[dupes], dtype=object)
+        new_lar_df.loc[dupes, "uli"] = uli_bodies + utils.check_digit_batch(uli_bodies)
+        dupes = new_lar_df["uli"].duplicated()
+    print("Unique ULIs Assigned")
 
     return new_lar_df
 
@@ -201,7 +300,22 @@ def change_bank(ts_data=None, lar_data=None, new_bank_name=None, new_lei=None, n
 
 def char_string_gen(length):
 	"""Generates a string of chosen length using ascii uppercase and numerical characters"""
-	return ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(length))
+	return ''.join(random.choices(string.ascii_uppercase + string.digits, k=length))
+
+def char_string_batch(lengths, rng=None):
+	"""Generates a numpy object array of strings of the passed lengths using the same characters as char_string_gen.
+	The characters for all strings are drawn with numpy as one block of bytes, which is decoded once and sliced
+	into the strings. If rng is None a numpy Generator seeded from the random module is used."""
+	if rng is None:
+		rng = np.random.default_rng(random.getrandbits(64))
+	lengths = np.asarray(lengths, dtype=np.int64)
+	alphabet = np.frombuffer((string.ascii_uppercase + string.digits).encode("ascii"), dtype=np.uint8)
+	ends = np.cumsum(lengths)
+	total = int(ends[-1]) if len(ends) > 0 else 0
+	text = alphabet[rng.integers(0, len(alphabet), size=total, dtype=np.uint8)].tobytes().decode("ascii")
+	strings = np.empty(len(lengths), dtype=object)
+	strings[:] = [text[start:end] for start, end in zip((ends - lengths).tolist(), ends.tolist())]
+	return strings
 
 def check_digit_gen(valid=True, ULI=None):
 	"""Generates a check digit for a ULI in accordance with
@@ -249,6 +363,51 @@ def check_digit_gen(valid=True, ULI=None):
 	else:
 		return str(check_digit+6).zfill(2)[:2] #return a bad check digit (used in edit testing)
 
+def check_digit_batch(ULIs, valid=True, chunk_rows=500000):
+	"""Generates check digits for an array or Series of ULIs (without check digits) using the same
+	calculation as check_digit_gen. Letters are converted to their 2 digit values and mod 97 is carried
+	over one character column at a time so the ULI is never built into a large integer.
+	Returns a numpy array of 2 character check digits. ULIs containing characters other than letters
+	and digits get an empty string, as no check digit can be calculated for them."""
+	ULIs = np.asarray(ULIs, dtype=str)
+	check_digits = np.empty(len(ULIs), dtype=object)
+	#character values: 0-9 for digits, 10-35 for letters, -1 for anything else.
+	#the shift is how far the running number moves left for a character: 1 digit for digits, 2 for letters
+	#and none for the padding (code 0) at the end of ULIs shorter than the longest one in the array.
+	char_vals = np.full(129, -1, dtype=np.int32)
+	char_vals[0] = 0
+	char_vals[ord("0"):ord("9")+1] = np.arange(10)
+	char_vals[ord("A"):ord("Z")+1] = np.arange(10, 36)
+	char_vals[ord("a"):ord("z")+1] = np.arange(10, 36)
+	char_shift = np.where(char_vals >= 10, 100, 10).astype(np.int32)
+	char_shift[0] = 1
+	digit_strings = np.array([str(digit).zfill(2)[:2] for digit in range(105)], dtype=object)
+
+	for start in range(0, len(ULIs), chunk_rows):
+		chunk = ULIs[start:start+chunk_rows]
+		width = chunk.dtype.itemsize // 4
+		modulo = np.zeros(len(chunk), dtype=np.int32)
+		bad_chars = np.zeros(len(chunk), dtype=bool)
+		if width > 0:
+			#unicode array as a characters x rows array of code points, non-ascii characters map to 128
+			codes = chunk.view(np.uint32).reshape(len(chunk), width)
+			bad_chars = (codes > 127).any(axis=1)
+			codes = codes.astype(np.uint8).T.copy()
+			codes[:, bad_chars] = 128
+			vals = char_vals[codes]
+			shifts = char_shift[codes]
+			bad_chars |= (vals < 0).any(axis=0)
+			for col in range(width):
+				modulo = (modulo * shifts[col] + vals[col]) % 97
+		modulo = (modulo * 100) % 97 #append '00' to the right of the string
+		check_digit = 98 - modulo
+		if not valid:
+			check_digit = check_digit + 6 #return a bad check digit (used in edit testing)
+		digits = digit_strings[check_digit]
+		digits[bad_chars] = ""
+		check_digits[start:start+chunk_rows] = digits
+	return check_digits
+
 def validate_state_codes(path, lar_file):
 	"""Parses through an existing test file and replaces the state code 
 	abbreviation with one that maps to the FIPS state code indicated 
@@ -0,0 +1,97 @@
+#This file contains the value_sampler class used by the LAR generator to draw values for fields that take a number
+#in a range or a schema code such as NA or Exempt. Values are drawn by position in the combined list of codes,
+#numbers and blank without building the list, so wide ranges such as property value cost the same as narrow ones.
+
+import random
+
+import numpy as np
+import pandas as pd
+
+
+class value_sampler(object):
+	"""
+	Draws string values from schema codes, a range of numbers and an optional blank.
+	codes: schema values listed before the numbers (for example NA and Exempt)
+	rng_min, rng_max: range of integers drawn, rng_max is exclusive
+	dtype: "int" for integers or "float" for the integers multiplied by step
+	step: multiplier for float values
+	decimals: number of decimal places for float values, if None floats are formatted with str
+	empty: if True a blank is listed after the numbers
+	weights: optional weights for drawing a code, a number or the blank. If None every listed value is equally likely,
+		as when choosing from the list built by lar_gen.range_and_enum.
+	"""
+
+	def __init__(self, codes=(), rng_min=1, rng_max=100, dtype="int", step=1.01, decimals=None, empty=False, weights=None):
+		self.codes = np.array([str(code) for code in codes], dtype=object)
+		self.rng_min = rng_min
+		self.rng_max = rng_max
+		self.dtype = dtype
+		self.step = step
+		self.decimals = decimals
+		self.empty = empty
+		self.weights = weights
+
+	def group_sizes(self, rng_max):
+		"""Returns the number of codes, numbers (an array if rng_max is an array) and blanks listed."""
+		return len(self.codes), np.maximum(np.asarray(rng_max) - self.rng_min, 0), 1 if self.empty else 0
+
+	def format_number(self, number):
+		"""Returns an integer from the range as a value string."""
+		if self.dtype != "float":
+			return str(number)
+		if self.decimals is not None:
+			return "{value:.{decimals}f}".format(value=number * self.step, decimals=self.decimals)
+		return str(number * self.step)
+
+	def format_numbers(self, numbers):
+		"""Returns an object array of the passed integers as value strings."""
+		numbers = np.asarray(numbers)
+		if self.dtype != "float":
+			return numbers.astype(str).astype(object)
+		values = numbers * self.step
+		if self.decimals is not None:
+			return np.array(["{value:.{decimals}f}".format(value=value, decimals=self.decimals) for value in values], dtype=object)
+		return pd.Series(values).astype(str).to_numpy(dtype=object)
+
+	def choice(self, rng_max=None):
+		"""Returns one value drawn with the random module. rng_max overrides the sampler's range maximum."""
+		code_count, number_count, blank_count = self.group_sizes(self.rng_max if rng_max is None else rng_max)
+		number_count = int(number_count)
+		if self.weights is None:
+			pick = random.randrange(code_count + number_count + blank_count)
+		else:
+			group = random.choices((0, 1, 2), weights=self.group_weights(code_count, number_count, blank_count))[0]
+			pick = (0, code_count, code_count + number_count)[group] + random.randrange((code_count, number_count, blank_count)[group])
+		if pick < code_count:
+			return self.codes[pick]
+		if pick < code_count + number_count:
+			return self.format_number(pick - code_count + self.rng_min)
+		return ""
+
+	def sample(self, rng, num_rows, rng_max=None):
+		"""
+		Returns an object array of num_rows values drawn with the numpy Generator rng.
+		rng_max overrides the sampler's range maximum and may be an array with a maximum for each row.
+		"""
+		code_count, number_count, blank_count = self.group_sizes(self.rng_max if rng_max is None else rng_max)
+		if self.weights is None:
+			picks = (rng.random(num_rows) * (code_count + number_count + blank_count)).astype(np.int64)
+		else:
+			weights = self.group_weights(code_count, np.max(number_count, initial=0), blank_count)
+			groups = rng.choice(3, size=num_rows, p=np.asarray(weights) / sum(weights))
+			starts = np.stack(np.broadcast_arrays(0, code_count, code_count + number_count))
+			sizes = np.stack(np.broadcast_arrays(code_count, number_count, blank_count))
+			rows = np.arange(num_rows)
+			group_starts = starts[groups] if starts.ndim == 1 else starts[groups, rows]
+			group_sizes = sizes[groups] if sizes.ndim == 1 else sizes[groups, rows]
+			picks = group_starts + (rng.random(num_rows) * group_sizes).astype(np.int64)
+		values = self.format_numbers(picks - code_count + self.rng_min)
+		is_code = picks < code_count
+		values[is_code] = self.codes[picks[is_code]]
+		if self.empty:
+			values[picks >= code_count + number_count] = ""
+		return values
+
+	def group_weights(self, code_count, number_count, blank_count):
+		"""Returns the weights for codes, numbers and blank, with no weight for groups that have no values."""
+		return [weight if count > 0 else 0 for weight, count in zip(self.weights, (code_count, number_count, blank_count))]